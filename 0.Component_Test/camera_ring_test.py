@@ -0,0 +1,24 @@
+import os
+import sys
+import time
+from findee import crop_image, image_to_ascii
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.framering import FrameReader
+
+# 카메라를 다시 열지 않고 실행 중인 서버(FINDEE_KIT_FRAME_RING=findee-camera)가 내보내는 프레임 사용
+reader = FrameReader(os.environ.get('FINDEE_KIT_FRAME_RING', 'findee-camera'))
+
+print("공유 메모리 카메라 테스트 시작!")
+
+number = 0
+while True:
+    frame = reader.wait(number, timeout=5.0)
+    if frame is None:
+        print("서버에서 새 프레임이 오지 않습니다.")
+        continue
+    number = frame.number
+    cropped_frame = crop_image(frame.array, 0.5)
+    ascii_image = image_to_ascii(cropped_frame, 100, 10, False)
+    print(ascii_image)
+    time.sleep(1)
@@ -0,0 +1,352 @@
+"""
+키트 하드웨어 성능 측정 (sonic_test / camera_test / motor_test의 측정판)
+
+컴포넌트 테스트가 "동작하는지"를 본다면, 이 스크립트는 키트 한 대의 실제 한계를 잰다.
+- ultrasonic: 측정 주기를 올려 가며 (10 ~ 100 Hz) 실제 측정률, 측정 시간, 실패율, 노이즈 - 안정적인 최대 측정률
+  노이즈는 연속 측정값 차이의 표준편차 / √2 (로봇이 천천히 움직여도 커지지 않음), 로봇과 벽을 고정하고 측정
+- camera: 사용 가능한 해상도마다 실제로 새 프레임이 나오는 fps (get_frame()이 새 배열을 돌려준 횟수)
+- jpeg: 카메라 프레임의 JPEG 인코딩 시간 / 크기 (품질별, /video_feed 스트림과 같은 cv2.imencode)
+- motor: 명령별 모터 호출 → GPIO 호출 반환까지의 시간 (latency 추적의 'gpio' 단계와 같은 구간)
+  ※ 모터가 실제로 움직임 - 바퀴를 띄워 두고 실행 (명령마다 바로 stop)
+
+결과는 JSON 보고서로 저장하고, 장치별 기준값(baselines/<장치>.json)과 비교해 나빠진 항목이 있으면 종료 코드 1.
+--fake는 가짜 Findee(findee_kit/fake.py)로 측정 - CI에서 스크립트와 비교 로직 확인용 (기준값 baselines/fake.json)
+
+사용법:
+    python capability_test.py                          # 측정 + 이 장치(호스트 이름)의 기준값과 비교
+    python capability_test.py --save-baseline          # 측정 결과를 이 장치의 기준값으로 저장
+    python capability_test.py --only ultrasonic,motor --output report.json
+    python capability_test.py --fake --sonic-seconds 0.3 --camera-seconds 1 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import socket
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.hardware import SUBSYSTEMS, RobotProvider
+
+SECTIONS = ('ultrasonic', 'camera', 'jpeg', 'motor')
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+SONIC_RATES = (10, 20, 30, 40, 50, 60, 80, 100)  # 시험할 측정 주기 (Hz)
+SONIC_MIN_SAMPLES = 20  # 주기마다 최소 측정 수
+SONIC_MAX_FAILURES = 0.02  # 안정: 실패(None / 0 이하) 비율 이하
+SONIC_MIN_ACHIEVED = 0.95  # 안정: 목표 측정률 대비 실제 측정률 이상
+SONIC_NOISE_MARGIN = 1.0  # 안정: 노이즈가 가장 느린 주기의 2배 또는 +1 cm 이하
+CAMERA_READY_TIMEOUT = 5.0  # 해상도를 바꾼 뒤 그 크기의 첫 프레임을 기다리는 시간 (초)
+JPEG_QUALITIES = (50, 60, 70, 80, 90, 95)
+MOTOR_COMMANDS = ('move_forward', 'move_backward', 'turn_left', 'turn_right', 'stop')
+
+# 기준값 비교 항목의 방향과 최소 차이 (측정 잡음보다 작은 차이는 무시)
+HIGHER, LOWER = 'higher', 'lower'
+TOLERANCE = 0.2  # 기준값보다 20% 넘게 나빠지면 실패
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def timings(samples_ms) -> dict:
+    return {'p50_ms': round(percentile(samples_ms, 50), 3), 'p95_ms': round(percentile(samples_ms, 95), 3),
+            'max_ms': round(max(samples_ms), 3)}
+
+
+def parse_resolution(resolution) -> tuple:
+    """get_available_resolutions() 항목 ({'value': '640x480'} / (640, 480) / {'width', 'height'}) → (가로, 세로)"""
+    if isinstance(resolution, dict):
+        if 'width' in resolution and 'height' in resolution:
+            return int(resolution['width']), int(resolution['height'])
+        resolution = resolution.get('value', '')
+    if isinstance(resolution, str):
+        width, height = resolution.lower().split('x')
+        return int(width), int(height)
+    return int(resolution[0]), int(resolution[1])
+
+
+def device_info(fake: bool) -> dict:
+    model = 'fake'
+    if not fake:
+        try:
+            with open('/proc/device-tree/model') as f:
+                model = f.read().strip('\x00\n')
+        except OSError:
+            model = platform.machine()
+    return {'hostname': socket.gethostname(), 'model': model, 'cpus': os.cpu_count(),
+            'python': platform.python_version()}
+
+
+#-측정-#
+def measure_ultrasonic(ultrasonic, seconds: float) -> dict:
+    """측정 주기를 올려 가며 측정 - 목표 주기를 못 맞추면 중단"""
+    rates = []
+    base_noise = None
+    max_stable = 0
+    for target in SONIC_RATES:
+        count = max(SONIC_MIN_SAMPLES, int(target * seconds))
+        period = 1.0 / target
+        values, reads, failures = [], [], 0
+        start = next_time = time.perf_counter()
+        for _ in range(count):
+            before = time.perf_counter()
+            distance = ultrasonic.get_distance()
+            reads.append((time.perf_counter() - before) * 1000)
+            if isinstance(distance, (int, float)) and distance > 0:
+                values.append(float(distance))
+            else:
+                failures += 1
+            next_time += period
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        achieved = count / (time.perf_counter() - start)
+
+        noise = None
+        if len(values) >= 3:
+            noise = statistics.stdev(b - a for a, b in zip(values, values[1:])) / math.sqrt(2)
+        if base_noise is None:
+            base_noise = noise
+        stable = (failures / count <= SONIC_MAX_FAILURES and achieved >= target * SONIC_MIN_ACHIEVED
+                  and noise is not None and base_noise is not None
+                  and noise <= max(base_noise * 2, base_noise + SONIC_NOISE_MARGIN))
+        rates.append({
+            'target_hz': target, 'achieved_hz': round(achieved, 2), 'samples': count, 'failures': failures,
+            'read': timings(reads),
+            'mean_cm': round(statistics.fmean(values), 2) if values else None,
+            'noise_cm': round(noise, 3) if noise is not None else None,
+            'stable': stable,
+        })
+        if stable:
+            max_stable = target
+        if achieved < target * SONIC_MIN_ACHIEVED:
+            break  # 측정 시간 때문에 이보다 빠른 주기는 불가능
+    return {'max_stable_hz': max_stable, 'noise_cm': rates[0]['noise_cm'], 'rates': rates}
+
+
+def measure_camera(camera, seconds: float) -> dict:
+    """해상도별 실제 fps - 측정이 끝나면 원래 해상도로 되돌림"""
+    original = parse_resolution(camera.get_current_resolution())
+    results = []
+    camera.start_frame_capture()
+    try:
+        for resolution in camera.get_available_resolutions():
+            width, height = parse_resolution(resolution)
+            camera.configure_resolution((width, height))
+            frame, deadline = None, time.monotonic() + CAMERA_READY_TIMEOUT
+            while time.monotonic() < deadline:
+                frame = camera.get_frame()
+                if frame is not None and frame.shape[:2] == (height, width):
+                    break
+                time.sleep(0.01)
+            else:
+                results.append({'resolution': f"{width}x{height}", 'fps': None, 'error': 'no frame'})
+                continue
+
+            frames, first, last = 0, None, None
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                current = camera.get_frame()
+                if current is not frame and current is not None:
+                    now = time.perf_counter()
+                    first = first or now
+                    last = now
+                    frames += 1
+                    frame = current
+                time.sleep(0.001)  # 캡처 스레드가 CPU를 쓸 수 있도록
+            fps = (frames - 1) / (last - first) if frames > 1 and last > first else None
+            results.append({'resolution': f"{width}x{height}", 'fps': round(fps, 2) if fps else None,
+                            'reported_fps': camera.get_fps()})
+    finally:
+        camera.configure_resolution(original)
+    return {'resolutions': results}
+
+
+def measure_jpeg(camera, encodes: int) -> dict:
+    """현재 해상도 프레임의 품질별 JPEG 인코딩 시간 / 크기"""
+    import cv2
+
+    camera.start_frame_capture()
+    deadline = time.monotonic() + CAMERA_READY_TIMEOUT
+    frame = camera.get_frame()
+    while frame is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+        frame = camera.get_frame()
+    if frame is None:
+        return {'error': 'no frame'}
+
+    qualities = []
+    for quality in JPEG_QUALITIES:
+        samples, size = [], 0
+        for _ in range(encodes):
+            start = time.perf_counter()
+            ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            samples.append((time.perf_counter() - start) * 1000)
+            size = len(encoded) if ok else 0
+        qualities.append({'quality': quality, 'encode': timings(samples), 'kb': round(size / 1024, 1)})
+    return {'resolution': f"{frame.shape[1]}x{frame.shape[0]}", 'qualities': qualities}
+
+
+def measure_motor(motor, speed: int, samples: int) -> dict:
+    """명령별 호출 → 반환 시간 (명령 뒤에는 바로 stop - 로봇이 거의 움직이지 않음)"""
+    commands = {}
+    stops = []
+    for name in MOTOR_COMMANDS:
+        if name == 'stop':
+            continue
+        command = getattr(motor, name)
+        calls = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            command(speed)
+            calls.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            motor.stop()
+            stops.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.02)
+        commands[name] = timings(calls)
+    commands['stop'] = timings(stops)
+    return {'speed': speed, 'commands': commands}
+
+
+#-기준값 비교-#
+def metrics(report: dict) -> dict:
+    """비교할 값: 이름 → (값, 방향, 최소 차이)"""
+    values = {}
+    sonic = report.get('ultrasonic')
+    if sonic:
+        values['ultrasonic.max_stable_hz'] = (sonic['max_stable_hz'], HIGHER, 10)
+        if sonic['noise_cm'] is not None:
+            values['ultrasonic.noise_cm'] = (sonic['noise_cm'], LOWER, 0.5)
+    for entry in (report.get('camera') or {}).get('resolutions', []):
+        if entry.get('fps'):
+            values[f"camera.{entry['resolution']}.fps"] = (entry['fps'], HIGHER, 1.0)
+    for entry in (report.get('jpeg') or {}).get('qualities', []):
+        values[f"jpeg.q{entry['quality']}.p50_ms"] = (entry['encode']['p50_ms'], LOWER, 0.5)
+    for name, entry in ((report.get('motor') or {}).get('commands') or {}).items():
+        values[f"motor.{name}.p95_ms"] = (entry['p95_ms'], LOWER, 0.5)
+    return values
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """기준값과 비교 - 항목별 {'metric', 'baseline', 'value', 'change', 'regressed'}"""
+    current = metrics(report)
+    results = []
+    for name, (old, direction, floor) in metrics(baseline).items():
+        if name not in current:
+            continue
+        value = current[name][0]
+        worse = old - value if direction == HIGHER else value - old
+        results.append({
+            'metric': name, 'baseline': old, 'value': value,
+            'change': round((value - old) / old * 100, 1) if old else None,
+            'regressed': worse > floor and worse > abs(old) * tolerance,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키트 하드웨어 성능 측정 + 장치별 기준값 비교')
+    parser.add_argument('--fake', action='store_true', default=os.environ.get('FINDEE_KIT_FAKE', '').lower() in ('1', 'true'),
+                        help='가짜 Findee로 측정 (CI)')
+    parser.add_argument('--only', default=','.join(SECTIONS), help=f"측정할 항목 (쉼표 구분: {', '.join(SECTIONS)})")
+    parser.add_argument('--device', help='기준값 이름 (기본: 호스트 이름, --fake는 fake)')
+    parser.add_argument('--baseline', help='기준값 파일 (기본: baselines/<장치>.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='기준값보다 이 비율 넘게 나빠지면 실패')
+    parser.add_argument('--output', help='보고서(JSON) 저장 경로')
+    parser.add_argument('--sonic-seconds', type=float, default=1.0, help='측정 주기별 초음파 측정 시간 (초)')
+    parser.add_argument('--camera-seconds', type=float, default=3.0, help='해상도별 fps 측정 시간 (초)')
+    parser.add_argument('--jpeg-encodes', type=int, default=30, help='품질별 JPEG 인코딩 횟수')
+    parser.add_argument('--motor-samples', type=int, default=20, help='모터 명령별 호출 수')
+    parser.add_argument('--motor-speed', type=int, default=30, help='모터 측정 속도')
+    parser.add_argument('--json', action='store_true', help='보고서를 JSON으로 출력')
+    args = parser.parse_args()
+
+    sections = [name for name in args.only.split(',') if name]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f"unknown section: {', '.join(sorted(unknown))}")
+    device = args.device or ('fake' if args.fake else socket.gethostname())
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f'{device}.json')
+
+    robot = RobotProvider(SUBSYSTEMS, fake=args.fake)
+    report = {'device': device, 'info': device_info(args.fake), 'fake': args.fake,
+              'created': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+    try:
+        if 'ultrasonic' in sections:
+            report['ultrasonic'] = measure_ultrasonic(robot.ultrasonic(), args.sonic_seconds)
+        if 'camera' in sections:
+            report['camera'] = measure_camera(robot.camera(), args.camera_seconds)
+        if 'jpeg' in sections:
+            report['jpeg'] = measure_jpeg(robot.camera(), args.jpeg_encodes)
+        if 'motor' in sections:
+            report['motor'] = measure_motor(robot.motor(), args.motor_speed, args.motor_samples)
+    finally:
+        if robot.initialized:
+            robot.camera().stop_frame_capture()
+        robot.cleanup()
+
+    baseline = None
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+    report['comparison'] = compare(report, baseline, args.tolerance) if baseline else None
+    regressed = [r for r in report['comparison'] or [] if r['regressed']]
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if regressed else 0)
+
+    print(f"{device} ({report['info']['model']}, {report['info']['cpus']} CPU(s))")
+    if 'ultrasonic' in report:
+        sonic = report['ultrasonic']
+        print(f"\nultrasonic: max stable {sonic['max_stable_hz']} Hz, noise {sonic['noise_cm']} cm")
+        print(f"{'target':>8}{'achieved':>10}{'read p50':>10}{'read p95':>10}{'fail':>6}{'noise':>8}{'stable':>8}")
+        for r in sonic['rates']:
+            noise = f"{r['noise_cm']:.2f}" if r['noise_cm'] is not None else '-'
+            print(f"{r['target_hz']:>8}{r['achieved_hz']:>10.1f}{r['read']['p50_ms']:>10.2f}{r['read']['p95_ms']:>10.2f}"
+                  f"{r['failures']:>6}{noise:>8}{'yes' if r['stable'] else 'no':>8}")
+    if 'camera' in report:
+        print(f"\ncamera\n{'resolution':>12}{'fps':>8}")
+        for r in report['camera']['resolutions']:
+            print(f"{r['resolution']:>12}{r['fps'] if r['fps'] is not None else '-':>8}")
+    if 'jpeg' in report and 'qualities' in report['jpeg']:
+        print(f"\njpeg ({report['jpeg']['resolution']})\n{'quality':>8}{'p50':>8}{'p95':>8}{'KB':>8}  (ms)")
+        for r in report['jpeg']['qualities']:
+            print(f"{r['quality']:>8}{r['encode']['p50_ms']:>8.2f}{r['encode']['p95_ms']:>8.2f}{r['kb']:>8.1f}")
+    if 'motor' in report:
+        print(f"\nmotor call → GPIO return (speed {report['motor']['speed']})\n{'command':>14}{'p50':>8}{'p95':>8}{'max':>8}  (ms)")
+        for name, r in report['motor']['commands'].items():
+            print(f"{name:>14}{r['p50_ms']:>8.3f}{r['p95_ms']:>8.3f}{r['max_ms']:>8.3f}")
+
+    if args.save_baseline:
+        print(f"\nbaseline saved: {baseline_path}")
+    elif baseline is None:
+        print(f"\nno baseline for {device} ({baseline_path}) - save one with --save-baseline")
+    else:
+        print(f"\ncompared with {baseline_path} (tolerance {args.tolerance:.0%})")
+        for r in report['comparison']:
+            change = f"{r['change']:+.1f}%" if r['change'] is not None else '-'
+            print(f"{'REGRESSED' if r['regressed'] else 'ok':>10}  {r['metric']:<28}{r['baseline']:>10}{r['value']:>10}{change:>10}")
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,11 @@ class FindeeRobotController {
         this.keyPressOrder = [];
         this.isConnected = false;
 
+        // 델타 인코딩 대시보드 상태
+        this.dashboardState = {};
+        this.dashboardVersion = null;
+        this.resyncPending = false;
+
         this.init();
     }
 
@@ -79,12 +84,26 @@ class FindeeRobotController {
             this.addLog('🔌 Socket connected to server', 'system');
             this.isConnected = true;
             this.updateConnectionStatus(true);
+
+            // 대시보드 구독 - 응답으로 dashboard_snapshot, 이후 dashboard_delta 수신 (재접속 시 다시 구독)
+            this.socket.emit('subscribe', {topics: ['system']});
         });
 
         this.socket.on('disconnect', () => {
             this.addLog('🔌 Socket disconnected from server', 'warning');
             this.isConnected = false;
             this.updateConnectionStatus(false);
+
+            // 재접속 시 새 스냅샷부터 다시 시작 (서버 재시작 시 버전 초기화 대비)
+            this.dashboardVersion = null;
+            this.resyncPending = false;
+        });
+
+        // 서버가 틱 단위로 묶어 보낸 이벤트를 원래 이벤트 핸들러로 전달
+        this.socket.on('batch', (messages) => {
+            messages.forEach(([event, data]) => {
+                this.socket.listeners(event).forEach((handler) => handler(data));
+            });
         });
 
         // 서버 응답 이벤트
@@ -110,24 +129,64 @@ class FindeeRobotController {
             }
         });
 
-        // 🚀 실시간 대시보드 업데이트 수신
-        this.socket.on('dashboard_update', (data) => {
-            try {
-                if (data.system_info && !data.system_info.error) {
-                    this.updateSystemInfo(data.system_info);
-                }
-                if (data.robot_status) {
-                    this.updateRobotStatus(data.robot_status);
+        // 🚀 실시간 대시보드 업데이트 수신 (접속 시 전체 스냅샷, 이후 변경분만)
+        this.socket.on('dashboard_snapshot', (data) => {
+            // 늦게 도착한 오래된 스냅샷은 무시
+            if (this.dashboardVersion !== null && data.version < this.dashboardVersion) return;
+
+            this.dashboardState = data.state || {};
+            this.dashboardVersion = data.version;
+            this.resyncPending = false;
+            this.renderDashboard();
+        });
+
+        this.socket.on('dashboard_delta', (data) => {
+            if (data.base !== this.dashboardVersion) {
+                // 중간 버전 누락 - 전체 스냅샷 재요청
+                if (!this.resyncPending) {
+                    this.resyncPending = true;
+                    this.socket.emit('dashboard_resync', {version: this.dashboardVersion});
                 }
+                return;
+            }
 
-                // 디버그용 - 실시간 업데이트 확인
-                console.log('📡 Real-time dashboard update received:', new Date(data.timestamp * 1000).toLocaleTimeString());
-            } catch (error) {
-                console.error('Dashboard update error:', error);
+            this.applyDelta(this.dashboardState, data.changes || {});
+            (data.removed || []).forEach(path => this.removePath(this.dashboardState, path));
+            this.dashboardVersion = data.version;
+            this.renderDashboard();
+        });
+    }
+
+    applyDelta(target, changes) {
+        Object.entries(changes).forEach(([key, value]) => {
+            if (value && typeof value === 'object' && !Array.isArray(value)
+                && target[key] && typeof target[key] === 'object' && !Array.isArray(target[key])) {
+                this.applyDelta(target[key], value);
+            } else {
+                target[key] = value;
             }
         });
     }
 
+    removePath(target, path) {
+        const parent = path.slice(0, -1).reduce((obj, key) => (obj ? obj[key] : undefined), target);
+        if (parent) delete parent[path[path.length - 1]];
+    }
+
+    renderDashboard() {
+        try {
+            const data = this.dashboardState;
+            if (data.system_info && !data.system_info.error) {
+                this.updateSystemInfo(data.system_info);
+            }
+            if (data.robot_status) {
+                this.updateRobotStatus(data.robot_status);
+            }
+        } catch (error) {
+            console.error('Dashboard update error:', error);
+        }
+    }
+
     setupLogPanel() {
         const clearBtn = document.getElementById('clearLogBtn');
         clearBtn.addEventListener('click', () => {
@@ -139,14 +139,14 @@ function loadAvailableResolutions() {
             const select = document.getElementById('resolutionSelect');
             select.innerHTML = '';
 
-            data.forEach(resolution => {
+            data.resolutions.forEach(resolution => {
                 const option = document.createElement('option');
                 option.value = resolution.value;
                 option.textContent = resolution.label;
                 select.appendChild(option);
             });
 
-            console.log(`✅ ${data.length}개 해상도 로드됨`);
+            console.log(`✅ ${data.resolutions.length}개 해상도 로드됨`);
             
             // 현재 해상도를 드롭다운에 반영
             updateCurrentResolutionInDropdown();
@@ -200,7 +200,7 @@ function changeResolution() {
     })
     .then(response => response.json())
     .then(data => {
-        if (data.status === 'success') {
+        if (data.success) {
             showToast('성공', `✅ ${data.message}`, 'success');
             // 해상도 변경 후 현재 해상도 업데이트
             updateCurrentResolutionInDropdown();
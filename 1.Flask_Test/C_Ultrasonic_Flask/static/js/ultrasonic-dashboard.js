@@ -40,7 +40,7 @@ async function apiCall(endpoint, method = 'GET', data = null) {
             options.body = JSON.stringify(data);
         }
 
-        const response = await fetch(`/api/${endpoint}`, options);
+        const response = await fetch(`/api/ultrasonic/${endpoint}`, options);
         return await response.json();
     } catch (error) {
         console.error(`API 호출 실패 (${endpoint}):`, error);
@@ -5,12 +5,18 @@ let isConnected = false;
 let activeDirection = null;
 let ultrasonicRunning = false;
 
+// 제어 지연 시간 추적
+let clockOffset = 0;       // 서버 시각 - 클라이언트 시각 (ms)
+let traceCounter = 0;
+const pendingTraces = {};  // trace id → 클라이언트 emit 시각
+
 // 초기화
 document.addEventListener('DOMContentLoaded', function() {
     initializeSocket();
     initializeControls();
     loadResolutions();
     startSystemInfoUpdates();
+    startLatencyUpdates();
     updateTime();
     setInterval(updateTime, 1000);
 });
@@ -23,6 +29,10 @@ function initializeSocket() {
         console.log('Connected to server');
         isConnected = true;
         showSuccess('서버에 연결되었습니다.');
+        syncClock();
+
+        // 초음파 측정값은 구독한 클라이언트에게만 전송됨 (재접속 시 다시 구독)
+        socket.emit('subscribe', {topics: ['ultrasonic']});
     });
 
     socket.on('disconnect', function() {
@@ -43,6 +53,13 @@ function initializeSocket() {
     socket.on('ultrasonic_data', function(data) {
         updateUltrasonicData(data);
     });
+
+    // 서버가 틱 단위로 묶어 보낸 이벤트를 원래 이벤트 핸들러로 전달
+    socket.on('batch', function(messages) {
+        messages.forEach(function([event, data]) {
+            socket.listeners(event).forEach(function(handler) { handler(data); });
+        });
+    });
 }
 
 // 컨트롤 초기화
@@ -85,9 +102,22 @@ function sendMotorCommand(direction, speed) {
         return;
     }
 
+    const traceId = `${Date.now()}-${traceCounter++}`;
+    const emitTime = performance.now();
+    pendingTraces[traceId] = emitTime;
+
+    // 피드백을 받지 못한 오래된 추적 정리
+    Object.keys(pendingTraces).forEach(id => {
+        if (emitTime - pendingTraces[id] > 10000) delete pendingTraces[id];
+    });
+
     socket.emit('motor_control', {
         direction: direction,
-        speed: speed
+        speed: speed,
+        trace: {
+            id: traceId,
+            client_ts: Date.now() + clockOffset
+        }
     });
 
     updateActiveDirection(direction);
@@ -121,6 +151,12 @@ function resetActiveDirection() {
 
 // 모터 피드백 처리
 function handleMotorFeedback(data) {
+    if (data.trace && data.trace.id in pendingTraces) {
+        const roundTrip = performance.now() - pendingTraces[data.trace.id];
+        delete pendingTraces[data.trace.id];
+        socket.emit('latency_report', {id: data.trace.id, round_trip: roundTrip});
+    }
+
     if (!data.success) {
         showError(data.error || '명령 실행에 실패했습니다.');
         resetActiveDirection();
@@ -198,9 +234,9 @@ function updateRobotStatus(data) {
     const ultrasonicStatus = document.getElementById('ultrasonicStatus');
 
     // 상태 점 업데이트
-    updateStatusDot(motorStatus, data.motor_available);
-    updateStatusDot(cameraStatus, data.camera_available);
-    updateStatusDot(ultrasonicStatus, data.ultrasonic_available);
+    updateStatusDot(motorStatus, data.motor_status);
+    updateStatusDot(cameraStatus, data.camera_status);
+    updateStatusDot(ultrasonicStatus, data.ultrasonic_status);
 }
 
 function updateStatusDot(element, isAvailable) {
@@ -224,12 +260,12 @@ async function loadResolutions() {
         if (data.resolutions && Array.isArray(data.resolutions)) {
             data.resolutions.forEach(resolution => {
                 const option = document.createElement('option');
-                option.value = resolution;
-                option.textContent = resolution;
+                option.value = resolution.value;
+                option.textContent = resolution.label;
                 
                 // 현재 해상도와 비교
                 const currentResolution = data.current || '';
-                if (resolution === currentResolution) {
+                if (resolution.value === currentResolution) {
                     option.selected = true;
                 }
                 
@@ -390,9 +426,9 @@ async function updateSystemInfo() {
         
         if (data && !data.error) {
             // 각 필드별로 데이터 확인 및 업데이트
-            const cpuUsage = data.cpu_usage || data.cpu || 0;
-            const cpuTemp = data.cpu_temp || data.temperature || 0;
-            const memoryUsage = data.memory_usage || data.memory || data.ram || 0;
+            const cpuUsage = data.cpu_percent || 0;
+            const cpuTemp = data.cpu_temperature || 0;
+            const memoryUsage = data.memory_percent || 0;
             const ipAddress = data.ip_address || data.ip || '--';
             const cameraFps = data.camera_fps || '--';
             
@@ -413,6 +449,49 @@ function startSystemInfoUpdates() {
     setInterval(updateSystemInfo, 3000);
 }
 
+// 서버 시계 보정 (NTP 방식, 왕복 시간이 가장 짧은 샘플 사용)
+function syncClock(samples = 5) {
+    let bestRoundTrip = Infinity;
+
+    for (let i = 0; i < samples; i++) {
+        setTimeout(() => {
+            const t0 = Date.now();
+            socket.emit('latency_sync', {client_ts: t0}, function(response) {
+                const t1 = Date.now();
+                if (!response || t1 - t0 >= bestRoundTrip) return;
+                bestRoundTrip = t1 - t0;
+                clockOffset = response.server_ts - (t0 + t1) / 2;
+            });
+        }, i * 200);
+    }
+}
+
+// 제어 지연 시간 통계 업데이트
+async function updateLatencyStats() {
+    try {
+        const response = await fetch('/api/latency');
+        const data = await response.json();
+
+        if (data.success && data.stages) {
+            Object.entries(data.stages).forEach(([stage, stats]) => {
+                const row = document.querySelector(`.latency-row[data-stage="${stage}"]`);
+                if (!row) return;
+                ['p50', 'p95', 'p99'].forEach(key => {
+                    const cell = row.querySelector(`[data-key="${key}"]`);
+                    cell.textContent = stats[key] === null ? '--' : stats[key].toFixed(1);
+                });
+            });
+        }
+    } catch (error) {
+        console.error('지연 시간 통계 업데이트 실패:', error);
+    }
+}
+
+function startLatencyUpdates() {
+    updateLatencyStats();
+    setInterval(updateLatencyStats, 3000);
+}
+
 // 시간 업데이트
 function updateTime() {
     const now = new Date();
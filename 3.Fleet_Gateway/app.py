@@ -0,0 +1,29 @@
+"""
+Findee Fleet Gateway
+
+여러 대의 통합 대시보드(2.Integrated_Flask) 로봇을 한 화면에서 보는 게이트웨이
+- 로봇마다 Socket.IO 연결 1개를 유지하며 상태 / 시스템 정보 / 초음파 값을 수집
+- 플릿 상태 델타와 축소 썸네일을 시청자에게 팬아웃 (시청자 수와 무관하게 로봇 부하 일정)
+
+로봇 목록은 FINDEE_KIT_FLEET_ROBOTS 환경 변수로 지정한다.
+    FINDEE_KIT_FLEET_ROBOTS='["robot-1=http://192.168.0.11:5000", "http://192.168.0.12:5000"]' python app.py
+"""
+
+import os
+import sys
+
+#-Findee Kit 공용 모듈 경로 추가-#
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.fleet import create_gateway, run_gateway
+
+
+app, socketio = create_gateway(
+    root_path=os.path.dirname(os.path.abspath(__file__)),
+    SECRET_KEY='Findee-Fleet-Gateway',
+    SERVER_TITLE='Findee Fleet',
+    PORT=5050
+)
+
+
+if __name__ == '__main__':
+    run_gateway(app, socketio)
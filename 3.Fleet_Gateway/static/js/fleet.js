@@ -0,0 +1,158 @@
+// 전역 변수
+let socket;
+let fleetState = {robots: {}};
+let fleetVersion = null;
+let resyncPending = false;
+const cards = {};  // 로봇 이름 → 카드 요소
+
+// 초기화
+document.addEventListener('DOMContentLoaded', function() {
+    initializeSocket();
+    document.getElementById('thumbnailToggle').addEventListener('change', function() {
+        setThumbnails(this.checked);
+    });
+});
+
+// Socket.IO 초기화
+function initializeSocket() {
+    socket = io();
+
+    socket.on('connect', function() {
+        document.getElementById('gatewayStatus').className = 'status-dot';
+        // 플릿 상태 구독 - 응답으로 fleet_snapshot, 이후 fleet_delta 수신 (재접속 시 다시 구독)
+        const topics = ['fleet'];
+        if (document.getElementById('thumbnailToggle').checked) topics.push('thumbnails');
+        socket.emit('subscribe', {topics: topics});
+    });
+
+    socket.on('disconnect', function() {
+        document.getElementById('gatewayStatus').className = 'status-dot error';
+        fleetVersion = null;
+        resyncPending = false;
+    });
+
+    // 서버가 틱 단위로 묶어 보낸 이벤트를 원래 이벤트 핸들러로 전달
+    socket.on('batch', function(messages) {
+        messages.forEach(function([event, data]) {
+            socket.listeners(event).forEach(function(handler) { handler(data); });
+        });
+    });
+
+    socket.on('fleet_snapshot', function(data) {
+        // 늦게 도착한 오래된 스냅샷은 무시
+        if (fleetVersion !== null && data.version < fleetVersion) return;
+
+        fleetState = data.state || {robots: {}};
+        fleetVersion = data.version;
+        resyncPending = false;
+        renderFleet();
+    });
+
+    socket.on('fleet_delta', function(data) {
+        if (data.base !== fleetVersion) {
+            // 중간 버전 누락 - 전체 스냅샷 재요청
+            if (!resyncPending) {
+                resyncPending = true;
+                socket.emit('fleet_resync', {version: fleetVersion});
+            }
+            return;
+        }
+
+        applyDelta(fleetState, data.changes || {});
+        (data.removed || []).forEach(path => removePath(fleetState, path));
+        fleetVersion = data.version;
+        renderFleet();
+    });
+
+    socket.on('thumbnail', function(data) {
+        updateThumbnail(data.robot, data.jpeg);
+    });
+}
+
+function setThumbnails(enabled) {
+    socket.emit(enabled ? 'subscribe' : 'unsubscribe', {topics: ['thumbnails']});
+    if (!enabled) {
+        Object.keys(cards).forEach(name => updateThumbnail(name, null));
+    }
+}
+
+function applyDelta(target, changes) {
+    Object.entries(changes).forEach(([key, value]) => {
+        if (value && typeof value === 'object' && !Array.isArray(value)
+            && target[key] && typeof target[key] === 'object' && !Array.isArray(target[key])) {
+            applyDelta(target[key], value);
+        } else {
+            target[key] = value;
+        }
+    });
+}
+
+function removePath(target, path) {
+    const parent = path.slice(0, -1).reduce((obj, key) => (obj ? obj[key] : undefined), target);
+    if (parent) delete parent[path[path.length - 1]];
+}
+
+// 화면 갱신
+function renderFleet() {
+    const robots = fleetState.robots || {};
+    document.getElementById('robotsConnected').textContent = fleetState.connected || 0;
+    document.getElementById('robotsTotal').textContent = fleetState.total || 0;
+
+    Object.entries(robots).forEach(([name, robot]) => renderRobot(name, robot));
+    Object.keys(cards).forEach(name => {
+        if (!(name in robots)) {
+            cards[name].remove();
+            delete cards[name];
+        }
+    });
+}
+
+function renderRobot(name, robot) {
+    let card = cards[name];
+    if (!card) {
+        card = document.getElementById('robotCardTemplate').content.firstElementChild.cloneNode(true);
+        card.querySelector('.robot-name').textContent = name;
+        document.getElementById('robotGrid').appendChild(card);
+        cards[name] = card;
+    }
+
+    const system = robot.system || {};
+    const status = robot.robot_status || {};
+    const ultrasonic = robot.ultrasonic;
+
+    card.classList.toggle('offline', !robot.connected);
+    card.querySelector('.robot-header .status-dot').className = 'status-dot' + (robot.connected ? '' : ' error');
+    card.querySelector('.robot-link').href = robot.url;
+    setField(card, 'cpu', formatNumber(system.cpu_percent, '%'));
+    setField(card, 'temp', formatNumber(system.cpu_temperature, '°C'));
+    setField(card, 'memory', formatNumber(system.memory_percent, '%'));
+    setField(card, 'distance', ultrasonic ? formatNumber(ultrasonic.distance, ' cm') : '-- cm');
+
+    card.querySelectorAll('[data-subsystem]').forEach(element => {
+        element.classList.toggle('active', Boolean(robot.connected && status[element.dataset.subsystem]));
+    });
+    card.querySelector('.robot-error').textContent = robot.connected ? '' : (robot.error || '연결 중...');
+}
+
+function setField(card, field, text) {
+    card.querySelector(`[data-field="${field}"]`).textContent = text;
+}
+
+function formatNumber(value, unit) {
+    return (value === null || value === undefined) ? `--${unit}` : `${Number(value).toFixed(1)}${unit}`;
+}
+
+// jpeg: base64 문자열 (null이면 썸네일 숨김)
+function updateThumbnail(name, jpeg) {
+    const card = cards[name];
+    if (!card) return;
+
+    const img = card.querySelector('.robot-thumbnail img');
+    if (jpeg) {
+        img.src = 'data:image/jpeg;base64,' + jpeg;
+        card.classList.add('has-thumbnail');
+    } else {
+        img.removeAttribute('src');
+        card.classList.remove('has-thumbnail');
+    }
+}
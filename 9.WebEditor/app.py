@@ -1,13 +1,58 @@
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit
-import subprocess
+import atexit
+import codecs
+import json
+import selectors
 import sys
-import tempfile
-import threading
 import os
 
+#-Findee Kit 공용 모듈 경로 추가-#
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.broker import HardwareBroker
+from findee_kit.completion import CompletionService
+from findee_kit.executor import BlockingExecutor
+from findee_kit.hardware import SUBSYSTEMS, RobotProvider, get_logger
+from findee_kit.interpreters import InterpreterPool
+from findee_kit.kernels import KernelManager
+from findee_kit.metrics import instrument_flask, instrument_socketio
+from findee_kit.output import OutputStream, SessionRateLimits
+from findee_kit.precheck import CodeChecker, describe, has_errors
+from findee_kit.profiler import MODES as PROFILE_MODES
+from findee_kit.runs import RunLimits, RunRejected, RunScheduler
+
+MAX_CONCURRENT_RUNS = 4  # 동시에 실행되는 사용자 코드 프로세스 수
+MAX_QUEUED_RUNS = 4  # 실행을 기다릴 수 있는 요청 수 (초과 시 거부)
+MAX_SESSION_QUEUE = 2  # 세션별로 실행 중인 코드 외에 기다릴 수 있는 요청 수
+RUN_LIMITS = RunLimits(
+    cpu_seconds=300,  # CPU 시간 (넘으면 종료)
+    memory_mb=1024,  # 주소 공간 (넘는 할당은 MemoryError)
+    file_mb=64,  # 사용자 코드가 쓰는 파일 크기
+    output_mb=10,  # stdout + stderr 총량 (넘으면 중지)
+    wall_seconds=None,  # 실행 시간 (None이면 중지할 때까지)
+    nice=10,  # 제어 서버보다 낮은 CPU 우선순위
+)
+STOP_GRACE = 2.0  # 중지 시 KeyboardInterrupt 후 강제 종료까지 기다리는 시간 (초)
+CAMERA_RESOLUTION = (640, 480)  # 사용자 코드가 함께 쓰는 서버 카메라 해상도
+ROBOT_FAKE = os.environ.get('FINDEE_KIT_FAKE', 'false').lower() in ('1', 'true')  # 하드웨어 없는 PC에서 가짜 로봇
+PRELOAD_MODULES = ('findee', 'numpy', 'cv2')  # 포크 서버가 미리 import하는 모듈
+OUTPUT_WINDOW = 0.05  # 출력을 모아 한 번에 보내는 최대 시간 (초)
+OUTPUT_MAX_BYTES = 16 * 1024  # output 묶음 하나의 최대 크기 (도달하면 바로 전송, 더 긴 줄은 나눔)
+OUTPUT_RATE = 1000  # 세션별 초당 출력 줄 수 (넘으면 'N줄 생략')
+OUTPUT_BURST = 5000  # 세션별 연속으로 허용하는 출력 줄 수
+COMPLETION_DEBOUNCE = 0.03  # 마지막 자동완성 요청 후 Jedi 처리를 시작하기까지 기다리는 시간 (초)
+COMPLETION_SESSIONS = 8  # Jedi 프로젝트와 파싱 결과를 유지하는 세션 수
+KERNEL_IDLE_SECONDS = 600  # 커널 모드: 이 시간 동안 실행하지 않은 커널은 종료 (초)
+KERNEL_MEMORY_MB = 768  # 커널 모드: 전체 커널 메모리 합계 (넘으면 오래 쓰지 않은 커널부터 종료)
+MAX_KERNELS = 4  # 커널 모드: 동시에 유지하는 커널 수
+PROFILE_INTERVAL = 0.005  # 프로파일러(sampling) 샘플 간격 (초)
+PROFILE_REPORT = 1.0  # 프로파일러 중간 결과 전송 간격 (초)
+HARDWARE_WORKERS = 2  # 브로커의 블로킹 Findee 호출(카메라, 초음파, 상태 조회)을 실행하는 스레드 수
+MAX_BROKER_CLIENTS = MAX_CONCURRENT_RUNS + MAX_KERNELS  # 동시에 로봇을 쓰는 사용자 코드 수 (실행 + 커널)
+
 app = Flask(__name__, static_folder='static', template_folder='templates')
 app.config['SECRET_KEY'] = 'findee-secret-key'
+instrument_flask(app)  # 라우트별 요청 시간 + /metrics
 # Socket.IO 초기화
 socketio = SocketIO(
     app,
@@ -17,8 +62,78 @@ socketio = SocketIO(
     engineio_logger=False,
     ping_timeout=60,
     ping_interval=10,
+    async_handlers=False,  # 이벤트마다 스레드를 만들지 않음 (실행은 runs 스케줄러의 'subprocess' 풀에서)
     transports=['websocket', 'polling']
 )
+instrument_socketio(socketio)  # emit 시간 + 대기 중인 emit 수
+
+# 출력은 줄마다 보내지 않고 실행별 output 묶음으로 전송 (세션별 줄 수 제한)
+output_limits = SessionRateLimits(OUTPUT_RATE, OUTPUT_BURST)
+
+# 무거운 모듈을 미리 import한 포크 서버 - 실행마다 새 인터프리터를 띄우지 않고 fork
+# (첫 클라이언트 접속 시 시작: debug 리로더의 감시 프로세스에서는 띄우지 않음)
+interpreters = InterpreterPool(preload=PRELOAD_MODULES)
+atexit.register(interpreters.close)
+
+# 서버가 Findee 하나를 가지고 사용자 코드에는 브로커로 제공 (실행마다 GPIO / 카메라를 다시 초기화하지 않음)
+# 사용자 코드의 `from findee import Findee`는 브로커 프록시 - 실행이 끝나거나 중지되면 모터 정지
+# 하드웨어 호출은 제한된 워커 풀에서, 모터 명령 / 정지는 카메라 프레임 뒤에서 기다리지 않도록 전용 워커에서 실행
+hardware = BlockingExecutor(max_workers=HARDWARE_WORKERS)
+control = BlockingExecutor(max_workers=1, max_queue=16, name='control')
+atexit.register(hardware.shutdown)
+atexit.register(control.shutdown)
+robot = RobotProvider(SUBSYSTEMS, CAMERA_RESOLUTION, fake=ROBOT_FAKE, logger=get_logger(), executor=hardware)
+atexit.register(robot.cleanup)
+broker = HardwareBroker(robot, executor=hardware, control=control, max_clients=MAX_BROKER_CLIENTS)
+atexit.register(broker.close)
+
+# 실행 전 사전 검사 (문법 / 최상위 import) - 오류가 있으면 실행 프로세스를 띄우지 않음, 입력 중 편집기 마커에도 사용
+# findee는 설치되어 있지 않아도 브로커 프록시로 제공되므로 통과
+checker = CodeChecker(provided=('findee',))
+
+# 실행 1건 = 'subprocess' 풀 워커 스레드 1개 (프로세스 실행 + stdout/stderr 읽기)
+# 세션마다 한 번에 하나씩 실행하고, 중지 / 자원 제한 / 대기 시간 메트릭은 스케줄러가 처리
+def _notify_run(event, run):
+    if event == 'queued':
+        socketio.emit('execution_queued', {'run': run.id, 'message': '앞선 실행이 끝나면 시작합니다...'}, to=run.sid)
+    elif event == 'started':
+        socketio.emit('execution_started', {'run': run.id, 'message': '코드 실행을 시작합니다...'}, to=run.sid)
+    else:
+        socketio.emit('finished', run.info(), to=run.sid)
+
+# 커널 모드: 세션마다 커널 하나가 변수 / import / Findee()를 실행 사이에 유지 (노트북처럼 고쳐서 다시 실행)
+_KERNEL_MESSAGES = {
+    'restart': '커널을 재시작했습니다.',
+    'idle': '오래 사용하지 않아 커널을 종료했습니다.',
+    'memory': '메모리가 부족해 커널을 종료했습니다.',
+    'capacity': '다른 사용자의 커널을 위해 커널을 종료했습니다.',
+    'died': '커널이 종료되었습니다.',
+}
+
+def _notify_kernel(sid, event):
+    if event['state'] == 'started':
+        event['message'] = '새 커널을 시작했습니다.'
+    else:
+        event['message'] = f"{_KERNEL_MESSAGES.get(event['reason'], '커널이 종료되었습니다.')} 변수는 초기화됩니다."
+    socketio.emit('kernel', event, to=sid)
+
+kernels = KernelManager(
+    interpreters, _notify_kernel, limits=RUN_LIMITS, broker=broker,
+    idle_seconds=KERNEL_IDLE_SECONDS, memory_budget_mb=KERNEL_MEMORY_MB, max_kernels=MAX_KERNELS
+)
+atexit.register(kernels.shutdown)
+
+runs = RunScheduler(
+    interpreters, lambda run: _stream_output(run), _notify_run, limits=RUN_LIMITS,
+    max_concurrent=MAX_CONCURRENT_RUNS, max_queued=MAX_QUEUED_RUNS, max_session_queue=MAX_SESSION_QUEUE,
+    stop_grace=STOP_GRACE, broker=broker, kernels=kernels
+)
+
+# Jedi 자동완성 (complete / signature / goto) - 결과는 'completion' 이벤트로 전송
+completions = CompletionService(
+    lambda sid, reply: socketio.emit('completion', reply, to=sid),
+    preload=PRELOAD_MODULES, debounce=COMPLETION_DEBOUNCE, max_sessions=COMPLETION_SESSIONS
+)
 
 
 @app.route('/')
@@ -26,56 +141,91 @@ def index():
     return render_template('index.html')
 
 
+@app.route('/api/runs')
+def run_stats():
+    """실행 중인 코드, 대기 수, 자원 제한, 대기 시간(p50 / p95 / p99, ms)"""
+    return runs.stats()
+
+
+@app.route('/api/kernels')
+def kernel_stats():
+    """세션별 커널 (실행 수, 유휴 시간, 메모리)과 메모리 예산"""
+    return kernels.stats()
+
+
+@app.route('/api/completion/stats')
+def completion_stats():
+    """Jedi 처리 시간(p50 / p95 / p99, ms)과 캐시 적중률"""
+    return completions.stats()
+
+
 #region 코드 실행 부분분
-def _stream_lines(pipe, sid, stream_type):
-    """파이프에서 라인을 읽어서 클라이언트에 전송"""
+def _stream_output(run):
+    """
+    stdout / stderr 두 파이프를 스레드 하나에서 읽어 output 묶음으로 클라이언트에 전송
+    프로파일러로 실행하면 프로파일 파이프도 함께 읽어 보고(JSON 줄)마다 profile 이벤트로 전송
+    """
+    process = run.process
+    output = OutputStream(
+        lambda message, ack: socketio.emit('output', message, to=run.sid, callback=ack), run.id,
+        limiter=output_limits.get(run.sid), window=OUTPUT_WINDOW, max_bytes=OUTPUT_MAX_BYTES
+    )
+    selector = selectors.DefaultSelector()
+    for pipe, stream_type in ((process.stdout, 'stdout'), (process.stderr, 'stderr'), (process.profile, 'profile')):
+        if pipe is None:
+            continue
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        selector.register(pipe, selectors.EVENT_READ, [stream_type, decoder, ''])
+
     try:
-        for line in iter(pipe.readline, ''):
-            if line:
-                # stdout, stderr 핸들러 실행
-                socketio.emit(stream_type, {'output': line.strip()}, room=sid)
+        while selector.get_map():
+            # 쌓인 출력이 있으면 묶음 전송 시각까지만 대기
+            for key, _ in selector.select(output.due()):
+                stream_type, decoder, pending = key.data
+                chunk = os.read(key.fd, 65536 if stream_type == 'profile' else 4096)
+                if stream_type != 'profile':
+                    runs.add_output(run, len(chunk))  # output_mb를 넘으면 중지
+                if chunk:
+                    pending += decoder.decode(chunk)
+                else:
+                    # EOF - 줄바꿈 없이 끝난 마지막 출력까지 전송
+                    pending += decoder.decode(b'', final=True)
+                    if pending:
+                        pending += '\n'
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+
+                *lines, pending = pending.split('\n')
+                if stream_type == 'profile':
+                    for line in lines:
+                        if line:
+                            _send_profile(run, line)
+                    key.data[2] = pending
+                    continue
+                for line in lines:
+                    output.add(stream_type, line.rstrip('\r'))
+                # 줄바꿈 없이 계속 출력하는 경우 (print(..., end=''))
+                while len(pending) >= OUTPUT_MAX_BYTES:
+                    output.add(stream_type, pending[:OUTPUT_MAX_BYTES])
+                    pending = pending[OUTPUT_MAX_BYTES:]
+                key.data[2] = pending
+            output.flush_due()
     except Exception as e:
-        socketio.emit('stderr', {'output': f'스트리밍 오류: {str(e)}'}, room=sid)
+        output.add('stderr', f'스트리밍 오류: {str(e)}')
     finally:
-        pipe.close()
+        selector.close()
+        output.close()
 
 
-def execute_code(code: str, sid: str):
-    # 임시 파일 생성
-    with tempfile.NamedTemporaryFile(
-        mode='w', suffix='.py', delete=False, encoding='utf-8'
-    ) as tmp:
-        tmp.write(code)
-        tmp_path = tmp.name
-
+def _send_profile(run, line):
+    """프로파일 보고 1건 전송 (중간 보고는 PROFILE_REPORT초마다 누적 결과, 마지막 보고는 final=True)"""
     try:
-        # 파이프 생성 (임시 파일 사용)
-        process = subprocess.Popen(
-            [sys.executable, '-u', tmp_path],  # 임시 파일 경로 사용
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0  # 버퍼링 완전 비활성화
-        )
-
-        threading.Thread(target=_stream_lines,
-                         args=(process.stdout, sid, 'stdout'),
-                         daemon=True).start()
-        threading.Thread(target=_stream_lines,
-                         args=(process.stderr, sid, 'stderr'),
-                         daemon=True).start()
-
-        process.wait()
-
-    finally:
-        # 임시 파일 정리
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        report = json.loads(line)
+    except ValueError:
+        return
+    report['run'] = run.id
+    socketio.emit('profile', report, to=run.sid)
 
-    # 코드 실행 완료 알림
-    socketio.emit('finished', {}, room=sid)
 
 @socketio.on('execute_code')
 def handle_execute_code(data):
@@ -85,28 +235,77 @@ def handle_execute_code(data):
             emit('execution_error', {'error': '코드가 제공되지 않았습니다.'})
             return
 
-        # 실행 시작 알림
-        emit('execution_started', {'message': '코드 실행을 시작합니다...'})
+        # 사전 검사 - 결과는 편집기 마커로, 오류가 있으면 실행하지 않음
+        kernel = bool(data.get('kernel'))
+        diagnostics = checker.check(code, kernel=kernel, op='run')
+        emit('diagnostics', {'id': None, 'diagnostics': diagnostics})
+        if has_errors(diagnostics):
+            emit('execution_error', {'error': '코드에 오류가 있어 실행하지 않았습니다.',
+                                     'details': [describe(d) for d in diagnostics if d['severity'] == 'error']})
+            return
 
-        # 현재 세션 ID 가져오기
-        sid = request.sid
+        profile = None
+        if data.get('profile'):
+            if data['profile'] not in PROFILE_MODES:
+                emit('execution_error', {'error': f"알 수 없는 프로파일러입니다: {data['profile']}"})
+                return
+            profile = {'mode': data['profile'], 'interval': PROFILE_INTERVAL, 'report': PROFILE_REPORT}
 
-        # 별도 스레드에서 코드 실행
-        thread = threading.Thread(
-            target=execute_code,
-            args=(code, sid)
-        )
-        thread.daemon = True
-        thread.start()
+        # 세션 대기열에 추가 (앞선 실행이 끝나면 시작, 대기열이 가득 차면 거부)
+        try:
+            runs.submit(request.sid, code, kernel=kernel, profile=profile)
+        except RunRejected as e:
+            emit('execution_error', {'error': str(e)})
 
     except Exception as e:
         emit('execution_error', {'error': f'코드 실행 중 오류가 발생했습니다: {str(e)}'})
+
+@socketio.on('stop_code')
+def handle_stop_code(data=None):
+    """실행 중인 코드 중지 (프로세스 그룹에 KeyboardInterrupt → STOP_GRACE초 뒤 강제 종료) + 대기 중인 실행 취소"""
+    run_id = (data or {}).get('run')
+    if not runs.stop(request.sid, run_id):
+        emit('execution_error', {'error': '실행 중인 코드가 없습니다.'})
+
+@socketio.on('restart_kernel')
+def handle_restart_kernel(data=None):
+    """커널 재시작 - 실행 중인 코드는 중지하고, 다음 커널 모드 실행은 새 네임스페이스에서 시작"""
+    runs.stop(request.sid)
+    if not kernels.restart(request.sid):
+        emit('kernel', {'state': 'none', 'message': '실행 중인 커널이 없습니다.'})
+#endregion
+
+#region 자동완성 / 사전 검사 부분
+@socketio.on('complete')
+def handle_complete(data):
+    completions.request(request.sid, 'complete', data or {})
+
+@socketio.on('signature')
+def handle_signature(data):
+    completions.request(request.sid, 'signature', data or {})
+
+@socketio.on('goto')
+def handle_goto(data):
+    completions.request(request.sid, 'goto', data or {})
+
+@socketio.on('check')
+def handle_check(data):
+    """입력 중 사전 검사 (편집기가 입력이 멈출 때마다 요청) - 결과는 diagnostics 이벤트"""
+    data = data or {}
+    code = data.get('code', '')
+    if not isinstance(code, str):
+        return
+    emit('diagnostics', {'id': data.get('id'), 'diagnostics': checker.check(code, kernel=bool(data.get('kernel')))})
 #endregion
 
 @socketio.on('connect')
 def handle_connect():
     """클라이언트가 연결되었을 때 호출"""
     print('클라이언트가 연결되었습니다.')
+    interpreters.start()  # 실행 버튼을 누르기 전에 미리 데워 둠
+    broker.start()
+    completions.warm_up()  # findee / numpy / cv2 분석 (첫 자동완성이 수 초 걸리지 않도록)
+    checker.warm_up()  # 실행 프로세스의 모듈 검색 경로
     emit('connected', {'message': '서버에 연결되었습니다.'})
 
 
@@ -114,6 +313,10 @@ def handle_connect():
 def handle_disconnect():
     """클라이언트가 연결을 해제했을 때 호출"""
     print('클라이언트가 연결을 해제했습니다.')
+    runs.discard(request.sid)  # 실행 중인 코드 중지, 대기 중인 실행 취소
+    kernels.discard(request.sid)
+    output_limits.discard(request.sid)
+    completions.discard(request.sid)
 
 
 if __name__ == '__main__':
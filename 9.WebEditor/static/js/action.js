@@ -1,6 +1,21 @@
 // Monaco Editor 인스턴스 (전역 변수)
 let monacoEditor = null;
 
+// 출력 패널에 유지하는 최대 줄 수
+const MAX_OUTPUT_ITEMS = 2000;
+
+// finished 이벤트의 reason별 메시지
+const FINISH_MESSAGES = {
+    ok: '코드 실행이 완료되었습니다.',
+    error: '코드 실행 중 오류가 발생했습니다.',
+    stopped: '코드 실행을 중지했습니다.',
+    cancelled: '대기 중인 실행을 취소했습니다.',
+    timeout: '실행 시간 제한을 넘어 중지했습니다.',
+    output: '출력이 너무 많아 중지했습니다.',
+    cpu: 'CPU 시간 제한을 넘어 종료되었습니다.',
+    killed: '코드가 강제 종료되었습니다 (메모리 부족 등).'
+};
+
 // Monaco Editor 설정 함수에서 에디터 인스턴스 저장
 function setMonacoEditor(editor) {
     monacoEditor = editor;
@@ -25,7 +40,14 @@ function handleRunButtonClick() {
 
 
     if (window.socket && window.socket.connected) {
-        window.socket.emit('execute_code', {code: code});
+        const kernelMode = document.getElementById('kernelMode');
+        const profileMode = document.getElementById('profileMode');
+        resetProfile();
+        window.socket.emit('execute_code', {
+            code: code,
+            kernel: Boolean(kernelMode && kernelMode.checked),
+            profile: profileMode ? profileMode.value : ''
+        });
     } else {
         console.error('Socket.IO가 초기화되지 않았거나 연결되지 않았습니다.');
         showToast('연결이 준비되지 않았습니다. 잠시 후 다시 시도해주세요.', 'error');
@@ -40,6 +62,24 @@ function handleRunButtonClick() {
     }
 }
 
+// Stop 버튼 클릭 이벤트 핸들러 (실행 중인 코드 중지 + 대기 중인 실행 취소)
+function handleStopButtonClick() {
+    if (!window.socket || !window.socket.connected) {
+        showToast('연결이 준비되지 않았습니다.', 'error');
+        return;
+    }
+    window.socket.emit('stop_code', {});
+}
+
+// Restart 버튼 클릭 이벤트 핸들러 (커널 모드 - 실행 중인 코드 중지 + 변수 초기화)
+function handleRestartKernelClick() {
+    if (!window.socket || !window.socket.connected) {
+        showToast('연결이 준비되지 않았습니다.', 'error');
+        return;
+    }
+    window.socket.emit('restart_kernel', {});
+}
+
 // 출력 패널 초기화
 function clearOutput() {
     const outputContent = document.querySelector('.output-content');
@@ -50,19 +90,48 @@ function clearOutput() {
 
 // 출력 메시지 추가
 function addOutputMessage(message, type = 'info') {
+    addOutputLines([message], type);
+}
+
+// 여러 줄을 한 번에 추가 (output 묶음 하나 = DOM 갱신 + 스크롤 한 번)
+function addOutputLines(lines, type = 'info') {
     const outputContent = document.querySelector('.output-content');
     if (!outputContent) return;
 
-    const outputItem = document.createElement('div');
-    outputItem.className = `output-item ${type}`;
-    outputItem.textContent = message;
+    const fragment = document.createDocumentFragment();
+    lines.forEach(function(message) {
+        const outputItem = document.createElement('div');
+        outputItem.className = `output-item ${type}`;
+        outputItem.textContent = message;
+        fragment.appendChild(outputItem);
+    });
+    outputContent.appendChild(fragment);
 
-    outputContent.appendChild(outputItem);
+    // 오래된 출력은 지워 DOM 크기 유지
+    while (outputContent.childElementCount > MAX_OUTPUT_ITEMS) {
+        outputContent.removeChild(outputContent.firstElementChild);
+    }
 
     // 자동 스크롤
     outputContent.scrollTop = outputContent.scrollHeight;
 }
 
+// 실행 출력 묶음 처리 - chunks: [[seq, stream, text], ...] (stream: stdout | stderr | dropped)
+const lastOutputSeq = {};  // 실행 ID → 마지막으로 표시한 청크 순번
+
+function handleOutput(message) {
+    message.chunks.forEach(function([seq, stream, text]) {
+        if (seq <= (lastOutputSeq[message.run] || 0)) return;  // 이미 표시한 청크
+        lastOutputSeq[message.run] = seq;
+
+        if (stream === 'dropped') {
+            addOutputMessage(`... 출력이 너무 많아 ${text}줄을 생략했습니다.`, 'warning');
+        } else {
+            addOutputLines(text.split('\n'), stream === 'stderr' ? 'error' : 'info');
+        }
+    });
+}
+
 // Socket.IO 이벤트 리스너 설정
 function setupSocketListeners() {
     if (!window.socket) {
@@ -70,37 +139,56 @@ function setupSocketListeners() {
         return;
     }
 
-    // 실행 시작 이벤트
-    window.socket.on('execution_started', function(data) {
+    // 앞선 실행이 끝나기를 기다리는 중
+    window.socket.on('execution_queued', function(data) {
         addOutputMessage(`System: ${data.message}`, 'system');
     });
 
-    // 표준 출력 이벤트
-    window.socket.on('stdout', function(data) {
-        addOutputMessage(data.output, 'info');
+    // 실행 시작 이벤트
+    window.socket.on('execution_started', function(data) {
+        addOutputMessage(`System: ${data.message}`, 'system');
     });
 
-    // 표준 에러 이벤트
-    window.socket.on('stderr', function(data) {
-        addOutputMessage(data.output, 'error');
+    // 표준 출력 / 표준 에러 묶음 (ack로 다음 묶음 전송 허용)
+    window.socket.on('output', function(message, ack) {
+        handleOutput(message);
+        if (ack) ack();
     });
 
     // 실행 완료 이벤트
     window.socket.on('finished', function(data) {
-        addOutputMessage('System: 코드 실행이 완료되었습니다.', 'system');
-        showToast('코드 실행이 완료되었습니다.', 'success');
+        delete lastOutputSeq[data.run];
+        const message = FINISH_MESSAGES[data.reason] || '코드 실행이 완료되었습니다.';
+        const detail = data.error ? ` (${data.error})` : '';
+        addOutputMessage(`System: ${message}${detail}`, data.reason === 'ok' ? 'system' : 'error');
+        showToast(message, data.reason === 'ok' ? 'success' : 'warning');
+    });
+
+    // 프로파일러 결과 (중간 보고 + 마지막 보고)
+    window.socket.on('profile', function(report) {
+        handleProfile(report);
+    });
+
+    // 커널 시작 / 종료 (재시작, 유휴, 메모리 부족 등)
+    window.socket.on('kernel', function(data) {
+        addOutputMessage(`System: ${data.message}`, data.state === 'closed' && data.reason !== 'restart' ? 'warning' : 'system');
     });
 
     // 실행 에러 이벤트
     window.socket.on('execution_error', function(data) {
         addOutputMessage(`Error: ${data.error}`, 'error');
+        // 사전 검사 오류 ('3번째 줄, 5열: SyntaxError: ...') - 편집기에도 마커로 표시됨
+        if (data.details) addOutputLines(data.details, 'error');
         showToast(`실행 오류: ${data.error}`, 'error');
     });
 }
 
 // 전역 함수로 노출 (다른 파일에서 사용 가능)
 window.handleRunButtonClick = handleRunButtonClick;
+window.handleStopButtonClick = handleStopButtonClick;
+window.handleRestartKernelClick = handleRestartKernelClick;
 window.setMonacoEditor = setMonacoEditor;
 window.addOutputMessage = addOutputMessage;
+window.addOutputLines = addOutputLines;
 window.showToast = showToast;
 window.setupSocketListeners = setupSocketListeners;
@@ -4,9 +4,117 @@
  * Monaco Editor Initialization
  * Editor Configuration
  * IntelliSense Configuration
+ * Jedi Completion (complete / signature / goto)
+ * Pre-check Markers (check / diagnostics)
  * Editor Event Handlers
  */
 
+const JEDI_TIMEOUT_MS = 3000;  // 응답이 없으면 기본 키워드 자동완성 사용
+let jediRequestId = 0;
+const jediPending = {};  // 요청 ID → resolve
+
+// Jedi 요청 (결과는 'completion' 이벤트로 받음, 실패 / 취소 / 시간 초과 시 null)
+function requestJedi(op, model, position, token) {
+    const socket = window.socket;
+    if (!socket || !socket.connected) {
+        return Promise.resolve(null);
+    }
+    if (!socket.jediListener) {
+        socket.jediListener = true;
+        socket.on('completion', function(reply) {
+            const resolve = jediPending[reply.id];
+            if (!resolve) return;
+            delete jediPending[reply.id];
+            resolve(reply.cancelled || reply.error ? null : reply.result);
+        });
+    }
+
+    const id = ++jediRequestId;
+    return new Promise(resolve => {
+        jediPending[id] = resolve;
+        const settle = () => {
+            if (jediPending[id]) {
+                delete jediPending[id];
+                resolve(null);
+            }
+        };
+        setTimeout(settle, JEDI_TIMEOUT_MS);
+        if (token) token.onCancellationRequested(settle);
+        // Monaco는 줄 / 열이 1부터, Jedi는 줄 1부터 / 열 0부터
+        socket.emit(op, {
+            id: id,
+            code: model.getValue(),
+            line: position.lineNumber,
+            column: position.column - 1
+        });
+    });
+}
+
+// 사전 검사 마커 - 입력이 멈추면 서버가 문법 / 최상위 import를 검사해 diagnostics 이벤트로 응답
+// (실행 버튼을 눌렀을 때의 검사 결과도 같은 이벤트로 옴, id 없음)
+const CHECK_DELAY_MS = 400;  // 마지막 입력 후 검사 요청까지 기다리는 시간
+let checkRequestId = 0;
+let checkTimer = null;
+
+function scheduleCheck() {
+    clearTimeout(checkTimer);
+    checkTimer = setTimeout(requestCheck, CHECK_DELAY_MS);
+}
+
+function requestCheck() {
+    const socket = window.socket;
+    const editor = window.monacoEditor;
+    if (!socket || !editor) return;
+    if (!socket.checkListener) {
+        socket.checkListener = true;
+        socket.on('diagnostics', function(reply) {
+            // 입력 중 검사는 가장 최근 요청의 결과만 표시
+            if (reply.id === null || reply.id === checkRequestId) {
+                setDiagnostics(reply.diagnostics);
+            }
+        });
+        socket.on('connect', scheduleCheck);  // 연결 / 재연결 시 현재 코드 검사
+    }
+    if (!socket.connected) return;
+
+    const kernelMode = document.getElementById('kernelMode');
+    socket.emit('check', {
+        id: ++checkRequestId,
+        code: editor.getValue(),
+        kernel: Boolean(kernelMode && kernelMode.checked)
+    });
+}
+
+// 진단(줄 / 열은 1부터, 끝 열 제외) → Monaco 마커
+function setDiagnostics(diagnostics) {
+    const model = window.monacoEditor && window.monacoEditor.getModel();
+    if (!model) return;
+    monaco.editor.setModelMarkers(model, 'precheck', diagnostics.map(d => ({
+        startLineNumber: d.line,
+        startColumn: d.column,
+        endLineNumber: d.end_line,
+        endColumn: d.end_column,
+        message: d.message,
+        source: d.source,
+        severity: d.severity === 'error' ? monaco.MarkerSeverity.Error : monaco.MarkerSeverity.Warning
+    })));
+}
+
+function jediCompletionKind(type) {
+    const kinds = monaco.languages.CompletionItemKind;
+    return {
+        module: kinds.Module,
+        class: kinds.Class,
+        function: kinds.Function,
+        property: kinds.Property,
+        keyword: kinds.Keyword,
+        path: kinds.File,
+        instance: kinds.Variable,
+        param: kinds.Variable,
+        statement: kinds.Variable
+    }[type] || kinds.Text;  // 목록이 길면 종류 없이 옴
+}
+
 // Initialize Monaco Editor
 function initializeMonacoEditor() {
     require.config({
@@ -105,52 +213,117 @@ function initializeMonacoEditor() {
             'pandas'
         ];
 
-        // 자동완성 프로바이더 등록
+        // Jedi를 쓸 수 없을 때의 기본 자동완성 목록
+        function staticSuggestions() {
+            return [
+                // 키워드들
+                ...pythonKeywords.map(keyword => ({
+                    label: keyword,
+                    insertText: keyword,
+                    kind: monaco.languages.CompletionItemKind.Keyword,
+                    documentation: `Python keyword: ${keyword}`
+                })),
+
+                // 함수들
+                ...pythonFunctions.map(func => ({
+                    label: func,
+                    insertText: func,
+                    kind: monaco.languages.CompletionItemKind.Function,
+                    documentation: `Built-in function: ${func}`
+                })),
+
+                // 클래스들
+                ...pythonClasses.map(cls => ({
+                    label: cls,
+                    insertText: cls,
+                    kind: monaco.languages.CompletionItemKind.Class,
+                    documentation: `Built-in class: ${cls}`
+                })),
+
+                // Valuables
+                ...pythonValuables.map(valuable => ({
+                    label: valuable,
+                    insertText: valuable,
+                    kind: monaco.languages.CompletionItemKind.Variable,
+                    documentation: `Python valuable: ${valuable}`
+                })),
+
+                // 모듈들
+                ...pythonModules.map(module => ({
+                    label: module,
+                    insertText: module,
+                    kind: monaco.languages.CompletionItemKind.Module,
+                    documentation: `Python module: ${module}`
+                }))
+            ];
+        }
+
+        // 자동완성 프로바이더 등록 (Jedi 결과, 실패 시 기본 목록)
         monaco.languages.registerCompletionItemProvider('python', {
-            provideCompletionItems: function(model, position) {
-                const suggestions = [
-                    // 키워드들
-                    ...pythonKeywords.map(keyword => ({
-                        label: keyword,
-                        insertText: keyword,
-                        kind: monaco.languages.CompletionItemKind.Keyword,
-                        documentation: `Python keyword: ${keyword}`
-                    })),
-
-                    // 함수들
-                    ...pythonFunctions.map(func => ({
-                        label: func,
-                        insertText: func,
-                        kind: monaco.languages.CompletionItemKind.Function,
-                        documentation: `Built-in function: ${func}`
-                    })),
-
-                    // 클래스들
-                    ...pythonClasses.map(cls => ({
-                        label: cls,
-                        insertText: cls,
-                        kind: monaco.languages.CompletionItemKind.Class,
-                        documentation: `Built-in class: ${cls}`
-                    })),
-
-                    // Valuables
-                    ...pythonValuables.map(valuable => ({
-                        label: valuable,
-                        insertText: valuable,
-                        kind: monaco.languages.CompletionItemKind.Variable,
-                        documentation: `Python valuable: ${valuable}`
-                    })),
-
-                    // 모듈들
-                    ...pythonModules.map(module => ({
-                        label: module,
-                        insertText: module,
-                        kind: monaco.languages.CompletionItemKind.Module,
-                        documentation: `Python module: ${module}`
-                    }))
-                ];
-
-                return { suggestions: suggestions };
+            triggerCharacters: ['.'],
+            provideCompletionItems: function(model, position, context, token) {
+                return requestJedi('complete', model, position, token).then(items => {
+                    if (!items) {
+                        return { suggestions: staticSuggestions() };
+                    }
+                    return {
+                        suggestions: items.map((item, index) => ({
+                            label: item.name,
+                            insertText: item.name,
+                            kind: jediCompletionKind(item.type),
+                            detail: item.type || undefined,
+                            sortText: String(index).padStart(4, '0')  // Jedi 순서 유지
+                        }))
+                    };
+                });
+            }
+        });
+
+        // 함수 인자 도움말 (Jedi signature)
+        monaco.languages.registerSignatureHelpProvider('python', {
+            signatureHelpTriggerCharacters: ['(', ','],
+            provideSignatureHelp: function(model, position, token) {
+                return requestJedi('signature', model, position, token).then(signatures => {
+                    if (!signatures || signatures.length === 0) {
+                        return null;
+                    }
+                    return {
+                        value: {
+                            signatures: signatures.map(signature => ({
+                                label: signature.label,
+                                documentation: signature.doc,
+                                parameters: signature.params.map(param => ({ label: param }))
+                            })),
+                            activeSignature: 0,
+                            activeParameter: signatures[0].index || 0
+                        },
+                        dispose: function() {}
+                    };
+                });
+            }
+        });
+
+        // 정의로 이동 (F12 / Ctrl + 클릭, 에디터 안의 정의만 이동하고 외부 모듈은 위치 표시)
+        monaco.languages.registerDefinitionProvider('python', {
+            provideDefinition: function(model, position, token) {
+                return requestJedi('goto', model, position, token).then(definitions => {
+                    if (!definitions || definitions.length === 0) {
+                        return null;
+                    }
+                    const local = definitions.filter(definition => definition.in_editor);
+                    if (local.length === 0) {
+                        const definition = definitions[0];
+                        showToast(`${definition.module}:${definition.line} (${definition.name})`, 'info');
+                        return null;
+                    }
+                    return local.map(definition => ({
+                        uri: model.uri,
+                        range: new monaco.Range(
+                            definition.line, definition.column + 1,
+                            definition.line, definition.column + 1 + definition.name.length
+                        )
+                    }));
+                });
             }
         });
 
@@ -210,6 +383,14 @@ function initializeMonacoEditor() {
 
         // 전역 변수로 에디터 인스턴스 저장
         window.monacoEditor = editor;
+
+        // 입력이 멈추거나 커널 모드를 바꾸면 사전 검사 (커널 모드에서는 못 찾은 모듈이 경고)
+        editor.onDidChangeModelContent(scheduleCheck);
+        const kernelMode = document.getElementById('kernelMode');
+        if (kernelMode) {
+            kernelMode.addEventListener('change', scheduleCheck);
+        }
+        scheduleCheck();
         
         // action.js에서 사용할 수 있도록 설정
         if (window.setMonacoEditor) {
@@ -0,0 +1,136 @@
+// 프로파일러 결과 표시 (profile 이벤트 - 표: 함수 / 줄별 시간, flame graph: sampling 모드의 스택)
+
+// 표에 보여 주는 함수 수
+const PROFILE_TABLE_ROWS = 20;
+// flame graph에 그리는 최소 폭 (%) - 더 좁은 프레임은 생략
+const FLAME_MIN_PERCENT = 0.5;
+// flame graph 한 줄 높이 (px)
+const FLAME_ROW_HEIGHT = 18;
+
+// 실행 시작 시 이전 결과 숨김
+function resetProfile() {
+    const panel = document.getElementById('profilePanel');
+    if (panel) {
+        panel.hidden = true;
+    }
+}
+
+// profile 이벤트 처리 (중간 보고는 누적 결과이므로 매번 다시 그림)
+function handleProfile(report) {
+    const panel = document.getElementById('profilePanel');
+    if (!panel) return;
+    panel.hidden = false;
+
+    const summary = document.getElementById('profileSummary');
+    if (report.mode === 'sampling') {
+        summary.textContent = `sampling · ${report.samples} samples · ${report.elapsed.toFixed(2)} s${report.final ? '' : ' (실행 중)'}`;
+    } else {
+        summary.textContent = `cProfile · ${report.elapsed.toFixed(2)} s`;
+    }
+    renderProfileTable(report);
+    renderLineTable(report);
+    renderFlameGraph(report.stacks || []);
+}
+
+// 함수별 표 - sampling은 샘플 비율, cProfile은 시간(ms)과 호출 수
+function renderProfileTable(report) {
+    const head = document.getElementById('profileTableHead');
+    const body = document.getElementById('profileTableBody');
+    const sampling = report.mode === 'sampling';
+    head.innerHTML = sampling
+        ? '<tr><th>함수</th><th>위치</th><th>자체 %</th><th>누적 %</th></tr>'
+        : '<tr><th>함수</th><th>위치</th><th>자체 ms</th><th>누적 ms</th><th>호출</th></tr>';
+
+    const total = report.samples || 1;
+    const format = sampling
+        ? (value) => (value / total * 100).toFixed(1)
+        : (value) => (value * 1000).toFixed(1);
+    body.innerHTML = '';
+    report.functions.slice(0, PROFILE_TABLE_ROWS).forEach(fn => {
+        const row = document.createElement('tr');
+        const cells = [fn.name, `${fn.file}:${fn.line}`, format(fn.self), format(fn.total)];
+        if (!sampling) cells.push(fn.calls);
+        cells.forEach(text => {
+            const cell = document.createElement('td');
+            cell.textContent = text;
+            row.appendChild(cell);
+        });
+        body.appendChild(row);
+    });
+}
+
+// 줄별 표 (sampling) - 같은 함수 안에서 sleep / 계산 / 하드웨어 호출 중 어디서 시간이 가는지
+function renderLineTable(report) {
+    const table = document.getElementById('profileLines');
+    const body = document.getElementById('profileLinesBody');
+    const lines = report.lines || [];
+    table.hidden = lines.length === 0;
+    body.innerHTML = '';
+    const total = report.samples || 1;
+    lines.slice(0, PROFILE_TABLE_ROWS).forEach(entry => {
+        const row = document.createElement('tr');
+        [`${entry.file}:${entry.line}`, entry.name, (entry.self / total * 100).toFixed(1)].forEach(text => {
+            const cell = document.createElement('td');
+            cell.textContent = text;
+            row.appendChild(cell);
+        });
+        body.appendChild(row);
+    });
+}
+
+// 'a;b;c' 스택 목록 → 트리 {name, value, children}
+function buildFlameTree(stacks) {
+    const root = {name: 'all', value: 0, children: new Map()};
+    stacks.forEach(([stack, count]) => {
+        let node = root;
+        root.value += count;
+        stack.split(';').forEach(name => {
+            if (!node.children.has(name)) {
+                node.children.set(name, {name: name, value: 0, children: new Map()});
+            }
+            node = node.children.get(name);
+            node.value += count;
+        });
+    });
+    return root;
+}
+
+// flame graph (루트가 위, 폭 = 샘플 비율)
+function renderFlameGraph(stacks) {
+    const container = document.getElementById('profileFlame');
+    container.innerHTML = '';
+    if (stacks.length === 0) {
+        container.textContent = 'flame graph는 sampling 모드에서만 표시됩니다.';
+        container.style.height = '';
+        return;
+    }
+
+    const root = buildFlameTree(stacks);
+    let depth = 0;
+    const fragment = document.createDocumentFragment();
+    const draw = (node, left, level) => {
+        const width = node.value / root.value * 100;
+        if (width < FLAME_MIN_PERCENT) return;
+        depth = Math.max(depth, level + 1);
+        const frame = document.createElement('div');
+        frame.className = 'flame-frame';
+        frame.style.left = `${left}%`;
+        frame.style.width = `${width}%`;
+        frame.style.top = `${level * FLAME_ROW_HEIGHT}px`;
+        frame.textContent = node.name;
+        frame.title = `${node.name}\n${node.value} samples (${width.toFixed(1)}%)`;
+        fragment.appendChild(frame);
+
+        let childLeft = left;
+        node.children.forEach(child => {
+            draw(child, childLeft, level + 1);
+            childLeft += child.value / root.value * 100;
+        });
+    };
+    draw(root, 0, 0);
+    container.style.height = `${depth * FLAME_ROW_HEIGHT}px`;
+    container.appendChild(fragment);
+}
+
+window.resetProfile = resetProfile;
+window.handleProfile = handleProfile;
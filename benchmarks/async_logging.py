@@ -0,0 +1,98 @@
+"""
+동기 로깅 vs 큐 기반 비동기 로깅 벤치마크
+
+느린 저장 장치(SD 카드)에 쓰는 핸들러를 흉내 내어, 자주 호출되는 경로(motor_control 등)에서
+logger.info 한 번이 호출 스레드를 얼마나 붙잡는지 비교한다.
+- sync: 핸들러가 호출 스레드에서 바로 포맷 + 기록 (기존 get_logger 방식)
+- async: findee_kit.logs.AsyncLogging (큐에 넣기만 하고 기록 스레드가 처리)
+- async+limit: 위 + 호출 위치별 속도 제한 (제어 루프처럼 같은 줄이 계속 호출되는 경우)
+
+사용법:
+    python benchmarks/async_logging.py --calls 2000 --write-ms 2
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.logs import LOG_FORMAT, AsyncLogging
+
+
+class SlowStreamHandler(logging.Handler):
+    """기록마다 write_ms만큼 걸리는 핸들러 (SD 카드 flush 시뮬레이션)"""
+
+    def __init__(self, write_ms: float):
+        super().__init__()
+        self.write_s = write_ms / 1000
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+        time.sleep(self.write_s)
+        self.written += 1
+
+
+def measure(mode: str, calls: int, write_ms: float, interval_ms: float) -> dict:
+    logger = logging.getLogger(f'benchmark.{mode}')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = SlowStreamHandler(write_ms)
+    logger.addHandler(handler)
+
+    logs = None
+    if mode != 'sync':
+        logs = AsyncLogging(logger, queue_size=calls, rate=1.0 if mode == 'async+limit' else 0)
+
+    durations = []
+    data = {'direction': 'forward', 'speed': 50}
+    for _ in range(calls):
+        start = time.perf_counter()
+        logger.info("🎮 Motor control received: %s", data)
+        durations.append(time.perf_counter() - start)
+        if interval_ms:
+            time.sleep(interval_ms / 1000)
+
+    if logs is not None:
+        logs.stop()
+    logger.removeHandler(handler)
+
+    durations.sort()
+    return {
+        'mode': mode,
+        'calls': calls,
+        'mean_us': statistics.mean(durations) * 1e6,
+        'p99_us': durations[int(len(durations) * 0.99) - 1] * 1e6,
+        'max_us': durations[-1] * 1e6,
+        'written': handler.written,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동기 로깅 vs 큐 기반 비동기 로깅 호출 비용 비교')
+    parser.add_argument('--calls', type=int, default=2000, help='logger.info 호출 수')
+    parser.add_argument('--write-ms', type=float, default=2.0, help='레코드 하나를 기록하는 시간 (ms)')
+    parser.add_argument('--interval-ms', type=float, default=0.0, help='호출 간격 (ms)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = [measure(mode, args.calls, args.write_ms, args.interval_ms)
+               for mode in ('sync', 'async', 'async+limit')]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"logger.info {args.calls}회, 기록 {args.write_ms} ms/레코드")
+    print(f"{'mode':>12}{'mean us':>10}{'p99 us':>10}{'max us':>10}{'written':>9}")
+    for r in results:
+        print(f"{r['mode']:>12}{r['mean_us']:>10.1f}{r['p99_us']:>10.1f}{r['max_us']:>10.1f}{r['written']:>9}")
+
+
+if __name__ == '__main__':
+    main()
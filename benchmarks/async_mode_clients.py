@@ -0,0 +1,188 @@
+"""
+서버 동시성 모델 비교 벤치마크 (threading vs gevent)
+
+가짜 하드웨어로 통합 앱을 띄우고 클라이언트 N개를 동시에 접속시킨다.
+클라이언트 하나 = Socket.IO 연결(motor_control을 --rate Hz로 전송) + MJPEG 뷰어 1개.
+
+측정 항목 (서버 프로세스 기준)
+- rss_mb / threads: 부하 중 최대 RSS와 OS 스레드 수
+- feedback_per_s: 초당 motor_feedback 수신 수, 제어 왕복 시간 p50 / p95
+- frames_per_s: 모든 뷰어가 받은 MJPEG 프레임 합계 (초당)
+
+사용법:
+    python benchmarks/async_mode_clients.py --clients 1,10,50 --seconds 10
+    python benchmarks/async_mode_clients.py --modes gevent --clients 50 --no-video
+
+gevent 모드는 gevent, gevent-websocket 패키지가 필요하다. 부하 생성기도 같은 장치에서
+돌면 CPU를 나눠 쓰므로 절대값보다 모드 간 상대 비교로 본다.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from startup_time import REPO_ROOT, wait_for_port
+
+
+def process_stats(pid: int) -> dict:
+    """/proc/<pid>/status의 RSS(MB)와 스레드 수"""
+    stats = {}
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                stats['rss_mb'] = int(line.split()[1]) / 1024
+            elif line.startswith('Threads:'):
+                stats['threads'] = int(line.split()[1])
+    return stats
+
+
+def percentile(values: list, p: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+class ControlClient:
+    """motor_control을 일정 주기로 보내고 motor_feedback 왕복 시간을 기록"""
+
+    def __init__(self, url: str, rate: float):
+        import socketio
+
+        self.url = url
+        self.rate = rate
+        self.sio = socketio.Client(reconnection=False)
+        self.sent = []
+        self.round_trips = []
+        self.sio.on('motor_feedback', self._on_feedback)
+
+    def _on_feedback(self, data):
+        if self.sent:
+            self.round_trips.append(time.perf_counter() - self.sent.pop(0))
+
+    def run(self, stop: threading.Event):
+        self.sio.connect(self.url, transports=['websocket'])
+        try:
+            while not stop.is_set():
+                self.sent.append(time.perf_counter())
+                self.sio.emit('motor_control', {'direction': 'forward', 'speed': 40})
+                stop.wait(1.0 / self.rate)
+        finally:
+            self.sio.disconnect()
+
+
+def view_stream(port: int, stop: threading.Event, counts: list, index: int):
+    """MJPEG 뷰어 - 받은 프레임 경계 수를 센다"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('GET', '/video_feed')
+    response = conn.getresponse()
+    tail = b''
+    try:
+        while not stop.is_set():
+            chunk = response.read1(65536)
+            if not chunk:
+                break
+            data = tail + chunk
+            counts[index] += data.count(b'--frame\r\n')
+            tail = data[-8:]
+    except (http.client.HTTPException, OSError):
+        pass  # 측정 종료 후 서버가 먼저 내려간 경우
+    finally:
+        conn.close()
+
+
+def run_case(mode: str, clients: int, args) -> dict:
+    port = args.port
+    # FINDEE_KIT_ASYNC_MODE는 import 전 gevent 패치와 app.config['ASYNC_MODE']에 모두 쓰임
+    env = dict(os.environ,
+               FINDEE_KIT_PORT=str(port), FINDEE_KIT_DEBUG='false', FINDEE_KIT_FAKE='true',
+               FINDEE_KIT_ASYNC_MODE=mode)
+    app_path = os.path.join(REPO_ROOT, args.app)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.basename(app_path)],
+        cwd=os.path.dirname(app_path), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    stop = threading.Event()
+    try:
+        if not wait_for_port(port, time.monotonic() + 30, proc):
+            raise RuntimeError(f"{mode} server did not start")
+        idle = process_stats(proc.pid)
+
+        url = f'http://127.0.0.1:{port}'
+        controllers = [ControlClient(url, args.rate) for _ in range(clients)]
+        frame_counts = [0] * clients
+        workers = [threading.Thread(target=c.run, args=(stop,), daemon=True) for c in controllers]
+        if not args.no_video:
+            workers += [threading.Thread(target=view_stream, args=(port, stop, frame_counts, i), daemon=True)
+                        for i in range(clients)]
+        for worker in workers:
+            worker.start()
+
+        time.sleep(args.warmup)
+        feedback_start = sum(len(c.round_trips) for c in controllers)
+        frames_start = sum(frame_counts)
+        peak = dict(idle)
+        deadline = time.monotonic() + args.seconds
+        while time.monotonic() < deadline:
+            stats = process_stats(proc.pid)
+            peak = {key: max(peak[key], stats[key]) for key in peak}
+            time.sleep(0.5)
+
+        round_trips = [rt for c in controllers for rt in c.round_trips]
+        return {
+            'mode': mode,
+            'clients': clients,
+            'idle_rss_mb': idle['rss_mb'],
+            'rss_mb': peak['rss_mb'],
+            'threads': peak['threads'],
+            'feedback_per_s': (len(round_trips) - feedback_start) / args.seconds,
+            'rtt_p50_ms': (percentile(round_trips, 50) or 0) * 1000,
+            'rtt_p95_ms': (percentile(round_trips, 95) or 0) * 1000,
+            'frames_per_s': (sum(frame_counts) - frames_start) / args.seconds,
+        }
+    finally:
+        stop.set()
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        time.sleep(0.5)  # 포트 해제 대기
+
+
+def main():
+    parser = argparse.ArgumentParser(description='threading vs gevent 서버 메모리 / 처리량 비교')
+    parser.add_argument('--app', default='2.Integrated_Flask/app.py', help='저장소 루트 기준 앱 경로')
+    parser.add_argument('--modes', default='threading,gevent')
+    parser.add_argument('--clients', default='1,10,50', help='동시 클라이언트 수 목록')
+    parser.add_argument('--seconds', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=2.0, help='측정 전 대기 시간 (초)')
+    parser.add_argument('--rate', type=float, default=10.0, help='클라이언트당 motor_control 전송 주기 (Hz)')
+    parser.add_argument('--no-video', action='store_true', help='MJPEG 뷰어 없이 Socket.IO만 측정')
+    parser.add_argument('--port', type=int, default=5098)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = [run_case(mode, int(n), args)
+               for mode in args.modes.split(',') for n in args.clients.split(',')]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<10}{'clients':>8}{'RSS MB':>9}{'threads':>9}{'fb/s':>9}"
+          f"{'rtt p50':>9}{'rtt p95':>9}{'frames/s':>10}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['clients']:>8}{r['rss_mb']:>9.1f}{r['threads']:>9}"
+              f"{r['feedback_per_s']:>9.1f}{r['rtt_p50_ms']:>9.1f}{r['rtt_p95_ms']:>9.1f}{r['frames_per_s']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
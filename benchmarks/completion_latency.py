@@ -0,0 +1,198 @@
+"""
+WebEditor Jedi 자동완성 지연 벤치마크
+
+Findee 예제 코드 끝에 몇 줄을 한 글자씩 입력하면서 글자마다 자동완성을 요청하고 처리 시간을 잰다.
+- cold: 새 프로세스에서 처음 'cv2.' / 'np.' 자동완성 (warm_up 없이 / warm_up 끝난 뒤)
+- naive: 요청마다 경로 / 프로젝트 없이 jedi.Script(code) (test.py 방식)
+- service: CompletionService (세션별 고정 경로 + 프로젝트 → parso 파싱 재사용, 결과 LRU 캐시)
+- typing: --intervals ms 간격으로 입력, 디바운스로 밀려난 요청은 cancelled (응답 시간은 취소되지 않은 요청 기준)
+
+사용법:
+    python benchmarks/completion_latency.py
+    python benchmarks/completion_latency.py --intervals 20,100 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.completion import CompletionService
+
+
+BASE_CODE = """\
+try:
+    from findee import Findee
+except ImportError:
+    Findee = None
+import time
+import numpy as np
+import cv2
+
+
+def find_line(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    _, mask = cv2.threshold(gray, 100, 255, cv2.THRESH_BINARY_INV)
+    moments = cv2.moments(mask)
+    if moments['m00'] == 0:
+        return None
+    return int(moments['m10'] / moments['m00'])
+
+
+frame = np.zeros((240, 320, 3), dtype=np.uint8)
+"""
+
+TYPED = """\
+edges = cv2.Canny(frame, 50, 150)
+center = np.mean(edges, axis=0)
+x = find_line(frame)
+"""
+
+
+def keystrokes():
+    """입력 중인 코드와 커서 위치 (줄 1부터, 열 0부터)"""
+    typed = ''
+    for char in TYPED:
+        typed += char
+        code = BASE_CODE + typed
+        lines = code.split('\n')
+        yield code, len(lines), len(lines[-1])
+
+
+def percentiles(samples) -> dict:
+    samples = sorted(samples)
+    result = {'count': len(samples)}
+    for q in (50, 95, 99):
+        result[f'p{q}'] = round(samples[max(1, math.ceil(q / 100 * len(samples))) - 1], 2) if samples else None
+    return result
+
+
+class SyncClient:
+    """CompletionService 응답을 요청 ID로 기다림"""
+
+    def __init__(self, debounce: float):
+        self.replies = {}
+        self.received = threading.Condition()
+        self.service = CompletionService(self._send, debounce=debounce)
+
+    def _send(self, sid, reply):
+        with self.received:
+            self.replies[reply['id']] = (time.perf_counter(), reply)
+            self.received.notify_all()
+
+    def wait(self, request_id, timeout: float = 30.0):
+        with self.received:
+            self.received.wait_for(lambda: request_id in self.replies, timeout)
+            return self.replies.get(request_id)
+
+
+def measure_service(client: SyncClient, sid: str, first_id: int) -> list:
+    samples = []
+    for request_id, (code, line, column) in enumerate(keystrokes(), first_id):
+        start = time.perf_counter()
+        client.service.request(sid, 'complete', {'id': request_id, 'code': code, 'line': line, 'column': column})
+        done, _ = client.wait(request_id)
+        samples.append((done - start) * 1000)
+    return samples
+
+
+def measure_naive() -> list:
+    import jedi
+
+    samples = []
+    for code, line, column in keystrokes():
+        start = time.perf_counter()
+        jedi.Script(code).complete(line, column)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def measure_cold(warm: bool) -> dict:
+    """새 프로세스에서 첫 'cv2.' / 'np.' 자동완성 시간 (ms)"""
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--cold-child', 'warm' if warm else 'cold'],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def cold_child(warm: bool) -> None:
+    client = SyncClient(debounce=0.0)
+    if warm:
+        client.service.warm_up()
+        client.service.pool.submit(lambda: None).result(timeout=120)  # warm_up 끝날 때까지
+    result = {}
+    for request_id, code in enumerate(('import cv2\ncv2.', 'import numpy as np\nnp.')):
+        lines = code.split('\n')
+        start = time.perf_counter()
+        client.service.request('cold', 'complete', {'id': request_id, 'code': code,
+                                                    'line': len(lines), 'column': len(lines[-1])})
+        done, _ = client.wait(request_id, timeout=120.0)
+        result[lines[-1]] = round((done - start) * 1000, 1)
+    client.service.shutdown()
+    print(json.dumps(result))
+
+
+def measure_typing(interval: float, debounce: float) -> dict:
+    client = SyncClient(debounce)
+    measure_service(client, 'warm', 0)  # 같은 조건에서 비교하도록 Jedi 상태를 데워 둠
+
+    sent = []
+    for request_id, (code, line, column) in enumerate(keystrokes(), 10000):
+        sent.append((request_id, time.perf_counter()))
+        client.service.request('typing', 'complete', {'id': request_id, 'code': code, 'line': line, 'column': column})
+        time.sleep(interval)
+    client.wait(sent[-1][0])
+
+    cancelled = sum(1 for request_id, _ in sent if client.replies[request_id][1].get('cancelled'))
+    answered = [(client.replies[request_id][0] - start) * 1000 for request_id, start in sent
+                if not client.replies[request_id][1].get('cancelled')]
+    client.service.shutdown()
+    return {'requests': len(sent), 'jedi_runs': len(sent) - cancelled, 'cancelled': cancelled,
+            'reply_ms': percentiles(answered)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WebEditor Jedi 자동완성 지연: cold / naive / service / typing')
+    parser.add_argument('--intervals', default='20,100', help='typing 모드의 입력 간격 (ms, 쉼표로 구분)')
+    parser.add_argument('--debounce', type=float, default=30.0, help='typing 모드의 디바운스 (ms)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    parser.add_argument('--cold-child', choices=('cold', 'warm'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_child:
+        cold_child(args.cold_child == 'warm')
+        return
+
+    results = {'cold': measure_cold(warm=False), 'warm_up': measure_cold(warm=True)}
+    client = SyncClient(debounce=0.0)
+    measure_service(client, 'warm', 0)  # 두 방식 모두 Jedi 상태가 데워진 뒤 측정
+    results['naive'] = percentiles(measure_naive())
+    results['service'] = percentiles(measure_service(client, 'session', 1000))
+    client.service.shutdown()
+    results['typing'] = {interval: measure_typing(float(interval) / 1000, args.debounce / 1000)
+                         for interval in args.intervals.split(',')}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("first completion in a new process (ms):")
+    for mode in ('cold', 'warm_up'):
+        print(f"{mode:>8}" + ''.join(f"{name:>8}{ms:>8.0f}" for name, ms in results[mode].items()))
+    print(f"\n{len(TYPED)} keystrokes, one completion each (warm)")
+    print(f"{'mode':>8}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for mode in ('naive', 'service'):
+        r = results[mode]
+        print(f"{mode:>8}{r['count']:>7}{r['p50']:>9.1f}{r['p95']:>9.1f}{r['p99']:>9.1f}")
+    print(f"\ntyping (debounce {args.debounce:.0f} ms)")
+    for interval, r in results['typing'].items():
+        print(f"every {interval:>4} ms: {r['requests']} requests, {r['jedi_runs']} Jedi runs, "
+              f"{r['cancelled']} cancelled, reply p50 {r['reply_ms']['p50']} ms / p95 {r['reply_ms']['p95']} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+대시보드 전송량 비교 벤치마크
+
+A_Motor_Flask의 기존 방식(매초 전체 system_info + robot_status 전송)과
+델타 인코딩 방식(접속 시 스냅샷, 이후 변경된 필드만 전송)의
+Socket.IO 전송 바이트 수를 비교한다.
+
+사용법:
+    python benchmarks/dashboard_delta_bandwidth.py --clients 10 --seconds 600
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.delta import VersionedState
+
+
+WEBSOCKET_FRAME_OVERHEAD = 4  # 서버 → 클라이언트 WebSocket 프레임 헤더 (마스킹 없음)
+
+
+def socketio_packet_size(event: str, payload: dict) -> int:
+    """Socket.IO EVENT 패킷 (42["event", {...}]) 크기 (bytes)"""
+    packet = '42' + json.dumps([event, payload])
+    return len(packet.encode('utf-8')) + WEBSOCKET_FRAME_OVERHEAD
+
+
+class FakeSystemInfo:
+    """Pi Zero 2 W 유휴 ~ 중간 부하 수준의 system_info 시뮬레이션"""
+
+    def __init__(self, seed: int = 0):
+        self._rng = random.Random(seed)
+        self.cpu_percent = 25.0
+        self.cpu_temperature = 48.0
+        self.memory_percent = 41.0
+
+    def sample(self) -> dict:
+        rng = self._rng
+        self.cpu_percent = min(100.0, max(0.0, self.cpu_percent + rng.uniform(-5, 5)))
+        self.cpu_temperature = min(85.0, max(35.0, self.cpu_temperature + rng.choice((-0.5, 0.0, 0.0, 0.5))))
+        if rng.random() < 0.2:
+            self.memory_percent = round(self.memory_percent + rng.choice((-0.1, 0.1)), 1)
+
+        return {
+            'hostname': '192.168.0.42',
+            'cpu_percent': round(self.cpu_percent, 1),
+            'cpu_temperature': round(self.cpu_temperature, 1),
+            'memory_percent': self.memory_percent,
+            'num_cpu_cores': 4,
+            'cpu_cores_percent': [round(min(100.0, max(0.0, self.cpu_percent + rng.uniform(-10, 10))), 1)
+                                  for _ in range(4)],
+        }
+
+
+def robot_status(fps: int) -> dict:
+    return {
+        'connected': True,
+        'running': True,
+        'motor_status': True,
+        'camera_status': True,
+        'ultrasonic_status': True,
+        'camera_fps': fps,
+        'speed': 60,
+        'direction': 'stop',
+    }
+
+
+def run(clients: int, seconds: int, seed: int) -> dict:
+    system = FakeSystemInfo(seed)
+    rng = random.Random(seed + 1)
+    state = VersionedState()
+
+    full_bytes = 0
+    delta_bytes = 0
+    delta_packets = 0
+
+    # 델타 방식: 접속 시 스냅샷 1회 (빈 상태가 아닌 최악의 경우를 가정해 첫 상태로 계산)
+    first = {'system_info': system.sample(), 'robot_status': robot_status(30)}
+    state.update(first)
+    delta_bytes += socketio_packet_size('dashboard_snapshot', state.snapshot()) * clients
+
+    for _ in range(seconds):
+        dashboard = {
+            'system_info': system.sample(),
+            'robot_status': robot_status(rng.choice((29, 30, 30, 30, 31)))
+        }
+
+        # 기존 방식: 매 주기 전체 페이로드
+        full_payload = dict(dashboard, timestamp=time.time())
+        full_bytes += socketio_packet_size('dashboard_update', full_payload) * clients
+
+        # 델타 방식: 변경된 필드만
+        delta = state.update(dashboard)
+        if delta:
+            delta['timestamp'] = time.time()
+            delta_bytes += socketio_packet_size('dashboard_delta', delta) * clients
+            delta_packets += clients
+
+    return {
+        'clients': clients,
+        'seconds': seconds,
+        'full_bytes': full_bytes,
+        'full_packets': seconds * clients,
+        'delta_bytes': delta_bytes,
+        'delta_packets': delta_packets + clients,
+        'full_bps': full_bytes / seconds,
+        'delta_bps': delta_bytes / seconds,
+        'saving_percent': 100.0 * (1 - delta_bytes / full_bytes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 전체 전송 vs 델타 전송 대역폭 비교')
+    parser.add_argument('--clients', type=int, default=10, help='동시 접속 대시보드 수')
+    parser.add_argument('--seconds', type=int, default=600, help='시뮬레이션 시간 (초, 1초 주기)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    result = run(args.clients, args.seconds, args.seed)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"대시보드 {result['clients']}개, {result['seconds']}초 (1초 주기)")
+    print(f"  전체 전송 : {result['full_bps']:9.1f} B/s  ({result['full_packets']} packets)")
+    print(f"  델타 전송 : {result['delta_bps']:9.1f} B/s  ({result['delta_packets']} packets)")
+    print(f"  절감률    : {result['saving_percent']:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+WebEditor 출력 스트리밍 벤치마크
+
+print를 반복하는 사용자 코드를 실행하고, 클라이언트가 받은 Socket.IO 메시지 수와 출력 줄 수,
+실행이 끝날 때까지의 시간, 서버 CPU 사용 시간을 측정한다.
+줄 단위 stdout / stderr 이벤트('batch'로 묶인 경우 포함)와 output 묶음을 모두 센다.
+
+사용법:
+    python benchmarks/editor_output.py --lines 100000
+    python benchmarks/editor_output.py --app-dir /tmp/old-tree/9.WebEditor   # 다른 버전과 비교
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from emit_batching import cpu_seconds
+from startup_time import REPO_ROOT, wait_for_port
+
+
+SERVER = ("import app; app.socketio.run(app.app, host='127.0.0.1', port={port}, "
+          "allow_unsafe_werkzeug=True)")
+
+WORKLOADS = {
+    'tight': "for i in range({lines}):\n    print(i)\n",
+    'mixed': "import sys\nfor i in range({lines} // 2):\n    print('out', i)\n    print('err', i, file=sys.stderr)\n",
+    'paced': "import time\nfor i in range({lines}):\n    print(i)\n    time.sleep(0.001)\n",
+}
+
+
+class OutputClient:
+    def __init__(self, url: str):
+        import socketio
+
+        self.sio = socketio.Client(reconnection=False)
+        self.finished = threading.Event()
+        self.reset()
+        self.sio.on('stdout', lambda data: self._line())
+        self.sio.on('stderr', lambda data: self._line())
+        self.sio.on('batch', self._on_batch)
+        self.sio.on('output', self._on_output)
+        self.sio.on('finished', lambda data: self.finished.set())
+        self.sio.connect(url, transports=['websocket'])
+
+    def reset(self):
+        self.messages = 0
+        self.lines = 0
+        self.dropped = 0
+        self.finished.clear()
+
+    def _line(self):
+        self.messages += 1
+        self.lines += 1
+
+    def _on_batch(self, messages):
+        self.messages += 1
+        self.lines += sum(1 for event, _ in messages if event in ('stdout', 'stderr'))
+        if any(event == 'finished' for event, _ in messages):
+            self.finished.set()
+
+    def _on_output(self, message):
+        self.messages += 1
+        for _, stream, text in message['chunks']:
+            if stream == 'dropped':
+                self.dropped += text
+            else:
+                self.lines += text.count('\n') + 1
+        return True  # ack
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WebEditor 출력 스트리밍: 메시지 수 / 지연 / 서버 CPU')
+    parser.add_argument('--lines', type=int, default=100000, help='사용자 코드가 출력하는 줄 수')
+    parser.add_argument('--workloads', default='tight,mixed,paced', help=f"실행할 코드 ({', '.join(WORKLOADS)})")
+    parser.add_argument('--app-dir', default=os.path.join(REPO_ROOT, '9.WebEditor'), help='WebEditor 디렉토리')
+    parser.add_argument('--port', type=int, default=5090)
+    parser.add_argument('--timeout', type=float, default=120.0, help='실행 1건 최대 대기 시간 (초)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, '-c', SERVER.format(port=args.port)], cwd=args.app_dir,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results = []
+    try:
+        if not wait_for_port(args.port, time.monotonic() + 30, server):
+            raise RuntimeError('WebEditor did not start')
+        client = OutputClient(f'http://127.0.0.1:{args.port}')
+        time.sleep(2.0)  # 포크 서버 준비
+
+        for name in args.workloads.split(','):
+            client.reset()
+            cpu_start = cpu_seconds(server.pid)
+            start = time.perf_counter()
+            client.sio.emit('execute_code', {'code': WORKLOADS[name].format(lines=args.lines)})
+            completed = client.finished.wait(args.timeout)
+            elapsed = time.perf_counter() - start
+            results.append({
+                'workload': name,
+                'completed': completed,
+                'seconds': elapsed,
+                'messages': client.messages,
+                'lines': client.lines,
+                'dropped': client.dropped,
+                'server_cpu_seconds': cpu_seconds(server.pid) - cpu_start,
+            })
+        client.sio.disconnect()
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.lines} lines per run ({args.app_dir})")
+    print(f"{'workload':>9}{'seconds':>9}{'messages':>10}{'lines':>9}{'dropped':>9}{'server CPU s':>14}")
+    for r in results:
+        print(f"{r['workload']:>9}{r['seconds']:>9.2f}{r['messages']:>10}{r['lines']:>9}{r['dropped']:>9}"
+              f"{r['server_cpu_seconds']:>14.2f}{'' if r['completed'] else '  (timeout)'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Socket.IO 묶음 전송 벤치마크
+
+가짜 하드웨어로 통합 앱을 띄우고 초음파 측정 주기를 높인 뒤(기본 200 Hz), Socket.IO 클라이언트
+N개가 ultrasonic_data를 받는 동안 묶음 전송을 켠 경우와 끈 경우를 비교한다.
+
+측정 항목
+- packets_per_s: 클라이언트 하나가 초당 받은 Socket.IO 패킷 수 ('batch' 1개 = 1패킷)
+- readings_per_s: 클라이언트 하나가 초당 받은 측정값 수 (묶음 안의 값 포함)
+- cpu_percent: 측정 구간 동안 서버 프로세스 CPU 사용률 (user + system)
+
+사용법:
+    python benchmarks/emit_batching.py --clients 10 --rate 200 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from async_mode_clients import process_stats
+from startup_time import REPO_ROOT, wait_for_port
+
+
+def cpu_seconds(pid: int) -> float:
+    """/proc/<pid>/stat의 utime + stime (초)"""
+    with open(f'/proc/{pid}/stat') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+class SensorClient:
+    """ultrasonic_data 패킷 수와 측정값 수를 센다"""
+
+    def __init__(self, url: str):
+        import socketio
+
+        self.url = url
+        self.sio = socketio.Client(reconnection=False)
+        self.packets = 0
+        self.readings = 0
+        self.sio.on('ultrasonic_data', self._on_reading)
+        self.sio.on('batch', self._on_batch)
+
+    def _on_reading(self, data):
+        self.packets += 1
+        self.readings += 1
+
+    def _on_batch(self, messages):
+        self.packets += 1
+        self.readings += sum(1 for event, _ in messages if event == 'ultrasonic_data')
+
+    def run(self, stop: threading.Event):
+        self.sio.connect(self.url, transports=['websocket'])
+        self.sio.emit('subscribe', {'topics': ['ultrasonic']})
+        try:
+            stop.wait()
+        finally:
+            self.sio.disconnect()
+
+
+def post_json(url: str, data: dict = None) -> dict:
+    request = urllib.request.Request(url, data=json.dumps(data or {}).encode(), method='POST',
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def run_case(batching: bool, args) -> dict:
+    port = args.port
+    env = dict(os.environ,
+               FINDEE_KIT_PORT=str(port), FINDEE_KIT_DEBUG='false', FINDEE_KIT_FAKE='true',
+               FINDEE_KIT_EMIT_BATCHING='true' if batching else 'false',
+               FINDEE_KIT_ULTRASONIC_MIN_INTERVAL='0.001',
+               FINDEE_FAKE_SONIC_DELAY='0')
+    app_path = os.path.join(REPO_ROOT, args.app)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.basename(app_path)],
+        cwd=os.path.dirname(app_path), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    stop = threading.Event()
+    try:
+        if not wait_for_port(port, time.monotonic() + 30, proc):
+            raise RuntimeError("server did not start")
+
+        url = f'http://127.0.0.1:{port}'
+        clients = [SensorClient(url) for _ in range(args.clients)]
+        workers = [threading.Thread(target=c.run, args=(stop,), daemon=True) for c in clients]
+        for worker in workers:
+            worker.start()
+
+        post_json(f'{url}/api/ultrasonic/config', {'interval': 1.0 / args.rate})
+        post_json(f'{url}/api/ultrasonic/start')
+        time.sleep(args.warmup)
+
+        packets_start = sum(c.packets for c in clients)
+        readings_start = sum(c.readings for c in clients)
+        cpu_start = cpu_seconds(proc.pid)
+        time.sleep(args.seconds)
+        cpu = cpu_seconds(proc.pid) - cpu_start
+        packets = sum(c.packets for c in clients) - packets_start
+        readings = sum(c.readings for c in clients) - readings_start
+
+        return {
+            'batching': batching,
+            'clients': args.clients,
+            'rate_hz': args.rate,
+            'packets_per_s': packets / args.clients / args.seconds,
+            'readings_per_s': readings / args.clients / args.seconds,
+            'cpu_percent': cpu / args.seconds * 100,
+            'threads': process_stats(proc.pid)['threads'],
+        }
+    finally:
+        stop.set()
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        time.sleep(0.5)  # 포트 해제 대기
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Socket.IO 묶음 전송 on/off 패킷 수 / CPU 비교')
+    parser.add_argument('--app', default='2.Integrated_Flask/app.py', help='저장소 루트 기준 앱 경로')
+    parser.add_argument('--clients', type=int, default=10, help='동시 Socket.IO 클라이언트 수')
+    parser.add_argument('--rate', type=float, default=200.0, help='초음파 측정 주기 (Hz)')
+    parser.add_argument('--seconds', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=2.0, help='측정 전 대기 시간 (초)')
+    parser.add_argument('--port', type=int, default=5097)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = [run_case(batching, args) for batching in (False, True)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'batching':<10}{'clients':>8}{'rate Hz':>9}{'packets/s':>11}{'readings/s':>12}{'CPU %':>8}")
+    for r in results:
+        print(f"{'on' if r['batching'] else 'off':<10}{r['clients']:>8}{r['rate_hz']:>9.0f}"
+              f"{r['packets_per_s']:>11.1f}{r['readings_per_s']:>12.1f}{r['cpu_percent']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
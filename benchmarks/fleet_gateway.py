@@ -0,0 +1,220 @@
+"""
+플릿 게이트웨이 벤치마크 / 로컬 대역 로봇
+
+가짜 하드웨어로 통합 앱(2.Integrated_Flask)을 포트만 바꿔 N개 띄우고(대역 로봇),
+그 앞에 플릿 게이트웨이(3.Fleet_Gateway)를 띄운다. 시청자 수를 늘려 가며 게이트웨이가
+팬아웃을 맡아 로봇 쪽 부하가 시청자 수와 무관하게 유지되는지 확인한다.
+
+시청자 하나 = 게이트웨이 Socket.IO 연결 1개 (fleet + thumbnails 토픽 구독)
+
+측정 항목
+- robots_connected: 게이트웨이가 연결한 로봇 수
+- robot_cpu_percent / robot_emits_per_s: 대역 로봇 전체의 CPU 사용률과 초당 Socket.IO emit 수
+- robot_clients: 로봇 한 대당 클라이언트 수 (토픽 구독자 최대값 + MJPEG 시청자, 로봇 중 최대값)
+- gateway_cpu_percent / gateway_rss_mb / gateway_threads: 게이트웨이 프로세스
+- deltas_per_s / thumbnails_per_s: 시청자 하나가 초당 받은 fleet_delta / thumbnail 수
+
+사용법:
+    python benchmarks/fleet_gateway.py --robots 10 --viewers 1,10,50
+    python benchmarks/fleet_gateway.py --robots 20 --hold   # 대역 로봇 + 게이트웨이만 띄우고 대기 (Ctrl+C로 종료)
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from async_mode_clients import process_stats
+from emit_batching import cpu_seconds
+from load_test import metric_total, parse_metrics
+from startup_time import REPO_ROOT, wait_for_port
+
+
+def start_process(app: str, port: int, **env) -> subprocess.Popen:
+    env = dict(os.environ, FINDEE_KIT_PORT=str(port), FINDEE_KIT_DEBUG='false', **env)
+    app_path = os.path.join(REPO_ROOT, app)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.basename(app_path)],
+        cwd=os.path.dirname(app_path), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    if not wait_for_port(port, time.monotonic() + 30, proc):
+        proc.kill()
+        raise RuntimeError(f"{app} did not start on port {port}")
+    return proc
+
+
+def stop_processes(procs: list) -> None:
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def fetch_json(url: str):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class Viewer:
+    """플릿 대시보드 시청자 - fleet_delta / thumbnail 수신 수를 센다"""
+
+    def __init__(self, url: str):
+        import socketio
+
+        self.url = url
+        self.sio = socketio.Client(reconnection=False)
+        self.deltas = 0
+        self.thumbnails = 0
+        self.sio.on('fleet_delta', self._on_delta)
+        self.sio.on('thumbnail', self._on_thumbnail)
+        self.sio.on('batch', self._on_batch)
+
+    def _on_delta(self, data):
+        self.deltas += 1
+
+    def _on_thumbnail(self, data):
+        self.thumbnails += 1
+
+    def _on_batch(self, messages):
+        for event, _ in messages:
+            if event == 'fleet_delta':
+                self.deltas += 1
+            elif event == 'thumbnail':
+                self.thumbnails += 1
+
+    def run(self, stop: threading.Event):
+        self.sio.connect(self.url, transports=['websocket'])
+        self.sio.emit('subscribe', {'topics': ['fleet', 'thumbnails']})
+        try:
+            stop.wait()
+        finally:
+            self.sio.disconnect()
+
+
+def robot_sample(robot_urls: list) -> dict:
+    """대역 로봇 전체 emit 수 합계와 로봇 한 대당 최대 클라이언트 수 (토픽 구독자 최대값 + MJPEG 시청자)"""
+    emits = 0.0
+    clients = 0
+    for url in robot_urls:
+        metrics = parse_metrics(urllib.request.urlopen(url + '/metrics', timeout=5).read().decode())
+        emits += metric_total(metrics, 'findee_socketio_emit_duration_seconds_count')
+        subscribers = max(fetch_json(url + '/api/topics').values(), default=0)
+        clients = max(clients, subscribers + int(metric_total(metrics, 'findee_stream_clients')))
+    return {'emits': emits, 'clients': clients}
+
+
+def run_case(viewers: int, gateway_url: str, robot_urls: list, robot_procs: list,
+             gateway: subprocess.Popen, args) -> dict:
+    stop = threading.Event()
+    clients = [Viewer(gateway_url) for _ in range(viewers)]
+    workers = [threading.Thread(target=c.run, args=(stop,), daemon=True) for c in clients]
+    for worker in workers:
+        worker.start()
+    time.sleep(args.warmup)
+
+    try:
+        deltas_start = sum(c.deltas for c in clients)
+        thumbnails_start = sum(c.thumbnails for c in clients)
+        robots_before = robot_sample(robot_urls)
+        robot_cpu_start = sum(cpu_seconds(p.pid) for p in robot_procs)
+        gateway_cpu_start = cpu_seconds(gateway.pid)
+        peak = process_stats(gateway.pid)
+
+        deadline = time.monotonic() + args.seconds
+        while time.monotonic() < deadline:
+            stats = process_stats(gateway.pid)
+            peak = {key: max(peak[key], stats[key]) for key in peak}
+            time.sleep(0.5)
+
+        robots_after = robot_sample(robot_urls)
+        robot_cpu = sum(cpu_seconds(p.pid) for p in robot_procs) - robot_cpu_start
+        gateway_cpu = cpu_seconds(gateway.pid) - gateway_cpu_start
+        deltas = sum(c.deltas for c in clients) - deltas_start
+        thumbnails = sum(c.thumbnails for c in clients) - thumbnails_start
+        fleet = fetch_json(gateway_url + '/api/robots')
+
+        return {
+            'robots': len(robot_urls),
+            'viewers': viewers,
+            'robots_connected': fleet['connected'],
+            'robot_cpu_percent': robot_cpu / args.seconds * 100,
+            'robot_emits_per_s': (robots_after['emits'] - robots_before['emits']) / args.seconds,
+            'robot_clients': robots_after['clients'],
+            'gateway_cpu_percent': gateway_cpu / args.seconds * 100,
+            'gateway_rss_mb': peak['rss_mb'],
+            'gateway_threads': peak['threads'],
+            'deltas_per_s': deltas / viewers / args.seconds,
+            'thumbnails_per_s': thumbnails / viewers / args.seconds,
+        }
+    finally:
+        stop.set()
+        time.sleep(1.0)  # 시청자 연결 종료 대기
+
+
+def main():
+    parser = argparse.ArgumentParser(description='플릿 게이트웨이 팬아웃 벤치마크 / 로컬 대역 로봇')
+    parser.add_argument('--robots', type=int, default=10, help='대역 로봇 수')
+    parser.add_argument('--viewers', default='1,10,50', help='게이트웨이 시청자 수 목록')
+    parser.add_argument('--seconds', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=3.0, help='측정 전 대기 시간 (초)')
+    parser.add_argument('--robot-port', type=int, default=5100, help='첫 대역 로봇 포트 (이후 +1씩)')
+    parser.add_argument('--port', type=int, default=5050, help='게이트웨이 포트')
+    parser.add_argument('--hold', action='store_true', help='측정 없이 띄워 두고 대기')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    robot_urls = [f'http://127.0.0.1:{args.robot_port + i}' for i in range(args.robots)]
+    procs = []
+    try:
+        for i, url in enumerate(robot_urls):
+            procs.append(start_process('2.Integrated_Flask/app.py', args.robot_port + i, FINDEE_KIT_FAKE='true'))
+        robot_procs = list(procs)
+
+        robots = [f'robot-{i + 1}={url}' for i, url in enumerate(robot_urls)]
+        gateway = start_process('3.Fleet_Gateway/app.py', args.port, FINDEE_KIT_FLEET_ROBOTS=json.dumps(robots))
+        procs.append(gateway)
+
+        gateway_url = f'http://127.0.0.1:{args.port}'
+        fetch_json(gateway_url + '/api/robots')  # 첫 요청에서 로봇 연결 시작
+        deadline = time.monotonic() + 30
+        while fetch_json(gateway_url + '/api/robots')['connected'] < args.robots and time.monotonic() < deadline:
+            time.sleep(0.5)
+
+        if args.hold:
+            print(f"Fleet dashboard: {gateway_url} ({args.robots} robots on ports "
+                  f"{args.robot_port}-{args.robot_port + args.robots - 1}), Ctrl+C to stop")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                return
+
+        results = [run_case(int(v), gateway_url, robot_urls, robot_procs, gateway, args)
+                   for v in args.viewers.split(',')]
+    finally:
+        stop_processes(procs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'viewers':>8}{'robots':>8}{'robot CPU %':>13}{'robot emit/s':>14}{'per-robot clients':>19}"
+          f"{'gw CPU %':>10}{'gw RSS MB':>11}{'gw threads':>12}{'delta/s':>9}{'thumb/s':>9}")
+    for r in results:
+        print(f"{r['viewers']:>8}{r['robots_connected']:>5}/{r['robots']:<2}{r['robot_cpu_percent']:>13.1f}"
+              f"{r['robot_emits_per_s']:>14.1f}{r['robot_clients']:>19}{r['gateway_cpu_percent']:>10.1f}"
+              f"{r['gateway_rss_mb']:>11.1f}{r['gateway_threads']:>12}{r['deltas_per_s']:>9.1f}"
+              f"{r['thumbnails_per_s']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+공유 메모리 프레임 링 벤치마크 (읽기 지연과 찢어진 읽기 비율)
+
+별도 프로세스가 FrameRing에 프레임을 쓰고(프레임마다 모든 바이트를 프레임 번호 값으로 채움),
+이 프로세스가 FrameReader로 최신 프레임을 계속 읽는다. 읽은 프레임의 바이트가 모두 같지 않으면 찢어진 읽기.
+- view: 복사 없는 뷰 (seqlock으로 쓰는 중인 슬롯을 건너뜀, 처리 후 intact()로 덮어쓰기 확인)
+- copy: 복사본 (복사 후 시퀀스가 바뀌었으면 다시 읽음)
+- naive: 슬롯 1개 + 시퀀스 확인 없이 복사 (seqlock이 없을 때의 비교 기준)
+
+사용법:
+    python benchmarks/frame_ring.py --seconds 5
+    python benchmarks/frame_ring.py --resolution 1280x720 --fps 0 --json   # fps 0: 쉬지 않고 쓰기
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.framering import SLOT_HEADER_SIZE, FrameReader, FrameRing, _slot_offset
+
+
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1] if samples else float('nan')
+
+
+def writer_child(name: str, resolution: str, slots: int, fps: float) -> None:
+    """쓰는 쪽 (서버 대신) - stdin이 닫힐 때까지 쓰기"""
+    import select
+
+    width, height = (int(n) for n in resolution.split('x'))
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    ring = FrameRing(name, frame.nbytes, slots)
+    print('ready', flush=True)
+    interval = 1.0 / fps if fps else 0.0
+    while not select.select([sys.stdin], [], [], 0)[0]:
+        frame.fill(ring.frames % 256)  # 다음 프레임 번호 값 (publish 후 번호 = frames + 1)
+        ring.publish(frame)
+        if interval:
+            time.sleep(interval)
+    ring.close()
+
+
+def uniform(array) -> bool:
+    return array.min() == array.max()
+
+
+def measure(mode: str, resolution: str, fps: float, seconds: float) -> dict:
+    # 읽는 프로세스와 resource_tracker를 나누지 않도록 별도 인터프리터로 실행 (실제 사용과 같음)
+    name = f'findee-bench-{os.getpid()}'
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--writer-child', name, '--resolution', resolution,
+         '--fps', str(fps), '--slots', '1' if mode == 'naive' else '3'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    process.stdout.readline()
+    width, height = (int(n) for n in resolution.split('x'))
+    shape = (height, width, 3)
+    reader = FrameReader(name)
+    reader.wait(timeout=5.0)
+
+    read_us, age_ms = [], []
+    reads = torn = undetected = overwritten = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        if mode == 'naive':
+            offset = _slot_offset(0, reader.slot_bytes) + SLOT_HEADER_SIZE
+            array = np.ndarray(shape, dtype=np.uint8, buffer=reader._buf, offset=offset).copy()
+            frame = None
+        else:
+            frame = reader.latest(copy=mode == 'copy')
+            if frame is None:
+                continue
+            array = frame.array
+        read_us.append((time.perf_counter() - start) * 1e6)
+        if frame is not None:
+            age_ms.append((time.time() - frame.timestamp) * 1000)
+        reads += 1
+        consistent = uniform(array)  # 프레임 처리 대신
+        # 처리가 끝난 뒤 확인 - 그동안 링이 한 바퀴 돌았으면 뷰를 쓰는 코드는 결과를 버려야 함
+        intact = frame is None or frame.intact()
+        if not intact:
+            overwritten += 1
+        if not consistent:
+            torn += 1
+            if intact:
+                undetected += 1  # 시퀀스 확인으로 알 수 없었던 찢어진 읽기
+    published = reader.latest_number
+    del array, frame
+    reader.close()
+    process.stdin.close()
+    process.wait()
+    return {
+        'mode': mode, 'reads': reads, 'published': published,
+        'read_p50_us': round(percentile(read_us, 50), 1), 'read_p95_us': round(percentile(read_us, 95), 1),
+        'age_p50_ms': round(percentile(age_ms, 50), 2) if age_ms else None,
+        'torn': torn, 'torn_rate': round(torn / reads, 5) if reads else None, 'undetected': undetected,
+        'overwritten': overwritten, 'retries': reader.torn,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공유 메모리 프레임 링: 읽기 지연 / 찢어진 읽기 비율')
+    parser.add_argument('--resolution', default='640x480', help='프레임 해상도 (3채널 uint8)')
+    parser.add_argument('--fps', type=float, default=30.0, help='쓰는 쪽 fps (0이면 쉬지 않고 쓰기)')
+    parser.add_argument('--seconds', type=float, default=5.0, help='모드별 측정 시간 (초)')
+    parser.add_argument('--modes', default='view,copy,naive', help='측정할 모드 (쉼표로 구분)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    parser.add_argument('--writer-child', metavar='NAME', help=argparse.SUPPRESS)
+    parser.add_argument('--slots', type=int, default=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.writer_child:
+        writer_child(args.writer_child, args.resolution, args.slots, args.fps)
+        return
+
+    results = [measure(mode, args.resolution, args.fps, args.seconds) for mode in args.modes.split(',')]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.resolution} frames, writer at {args.fps:g} fps ({'unthrottled' if not args.fps else 'throttled'}), "
+          f"{args.seconds:g} s per mode, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':>6}{'reads':>9}{'frames':>8}{'read p50':>10}{'read p95':>10}{'age p50':>9}"
+          f"{'torn':>7}{'rate':>9}{'undet.':>8}{'overwr.':>9}{'retries':>9}")
+    for r in results:
+        age = f"{r['age_p50_ms']:.2f}" if r['age_p50_ms'] is not None else '-'
+        print(f"{r['mode']:>6}{r['reads']:>9}{r['published']:>8}{r['read_p50_us']:>10.1f}{r['read_p95_us']:>10.1f}"
+              f"{age:>9}{r['torn']:>7}{r['torn_rate']:>9.5f}{r['undetected']:>8}{r['overwritten']:>9}{r['retries']:>9}")
+    print("(read: us, age: ms since publish, undet.: torn reads not caught by the sequence check,\n"
+          " overwr.: views overwritten while being checked, retries: reads that hit a slot being written)")
+
+
+if __name__ == '__main__':
+    main()
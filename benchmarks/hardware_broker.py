@@ -0,0 +1,129 @@
+"""
+하드웨어 브로커 호출 지연 벤치마크
+
+서버 프로세스(여기서는 별도 프로세스)가 가진 가짜 Findee를 사용자 코드 프로세스(이 프로세스)에서 호출할 때의 왕복 시간을 잰다.
+- broker: HardwareBroker + robot_proxy.Findee (호출은 JSON 메시지, 프레임은 연결별 공유 메모리)
+- pickle: 같은 요청을 multiprocessing Pipe로 보내고 프레임을 피클로 복사해 받는 방식 (비교 기준)
+프레임은 해상도별로 get_frame() 1회(복사본 반환)의 왕복 시간이다.
+
+사용법:
+    python benchmarks/hardware_broker.py
+    python benchmarks/hardware_broker.py --calls 2000 --resolutions 320x240,1280x720 --json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit import robot_proxy
+from findee_kit.broker import HardwareBroker
+from findee_kit.hardware import SUBSYSTEMS, RobotProvider
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def summary(samples) -> dict:
+    return {'p50_us': round(percentile(samples, 50), 1), 'p95_us': round(percentile(samples, 95), 1)}
+
+
+def timed(call, count: int) -> list:
+    call()  # 연결 / 첫 프레임 준비
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+#-서버 프로세스-#
+def _provider(resolution) -> RobotProvider:
+    return RobotProvider(SUBSYSTEMS, resolution, fake=True)
+
+
+def broker_server(resolution, ready, done) -> None:
+    broker = HardwareBroker(_provider(resolution))
+    ready.put(broker.start())
+    done.wait()
+    broker.close()
+
+
+def pipe_server(resolution, conn) -> None:
+    provider = _provider(resolution)
+    camera = provider.acquire_camera()
+    while True:
+        method = conn.recv()
+        if method is None:
+            return
+        conn.send(camera.get_frame() if method == 'frame' else provider.ultrasonic().get_distance())
+
+
+#-측정-#
+def measure_broker(context, resolution, calls: int, frames: int) -> dict:
+    ready, done = context.Queue(), context.Event()
+    server = context.Process(target=broker_server, args=(resolution, ready, done))
+    server.start()
+    robot = robot_proxy.Findee(broker=ready.get())
+    try:
+        return {'call': summary(timed(robot.ultrasonic.get_distance, calls)),
+                'frame': summary(timed(robot.camera.get_frame, frames))}
+    finally:
+        robot.cleanup()
+        done.set()
+        server.join()
+
+
+def measure_pipe(context, resolution, calls: int, frames: int) -> dict:
+    conn, child = context.Pipe()
+    server = context.Process(target=pipe_server, args=(resolution, child))
+    server.start()
+
+    def request(method):
+        conn.send(method)
+        return conn.recv()
+
+    try:
+        return {'call': summary(timed(lambda: request('distance'), calls)),
+                'frame': summary(timed(lambda: request('frame'), frames))}
+    finally:
+        conn.send(None)  # 서버 종료
+        server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='하드웨어 브로커: 호출 / 프레임 왕복 시간 (broker vs pickle)')
+    parser.add_argument('--calls', type=int, default=1000, help='get_distance 호출 수')
+    parser.add_argument('--frames', type=int, default=200, help='해상도별 get_frame 호출 수')
+    parser.add_argument('--resolutions', default='320x240,640x480,1280x720', help='프레임 해상도 (쉼표로 구분)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('fork')
+    results = []
+    for value in args.resolutions.split(','):
+        resolution = tuple(int(n) for n in value.split('x'))
+        for mode, measure in (('broker', measure_broker), ('pickle', measure_pipe)):
+            results.append({'resolution': value, 'mode': mode,
+                            **measure(context, resolution, args.calls, args.frames)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.calls} get_distance calls, {args.frames} get_frame calls per resolution, {os.cpu_count()} CPU(s)")
+    print(f"{'resolution':>11}{'mode':>8}{'call p50':>10}{'call p95':>10}{'frame p50':>11}{'frame p95':>11}  (us)")
+    for r in results:
+        print(f"{r['resolution']:>11}{r['mode']:>8}{r['call']['p50_us']:>10.1f}{r['call']['p95_us']:>10.1f}"
+              f"{r['frame']['p50_us']:>11.1f}{r['frame']['p95_us']:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
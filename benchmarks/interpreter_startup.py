@@ -0,0 +1,85 @@
+"""
+WebEditor 코드 실행 시작 시간 벤치마크 (새 인터프리터 vs 포크 서버)
+
+실행 요청부터 첫 출력(stdout 첫 바이트)까지의 시간과 실행 완료까지의 시간을 비교한다.
+- cold: 실행마다 `python -u`를 새로 띄움 (기존 방식)
+- warm: findee / numpy / OpenCV를 미리 import한 포크 서버에서 fork (findee_kit.interpreters)
+
+사용자 코드는 Findee 예제처럼 무거운 모듈을 import한 뒤 한 줄을 출력한다.
+
+사용법:
+    python benchmarks/interpreter_startup.py --runs 10
+    python benchmarks/interpreter_startup.py --code "print('hello')"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.interpreters import InterpreterPool
+
+
+DEFAULT_CODE = """\
+try:
+    from findee import Findee
+except ImportError:
+    pass
+import numpy as np
+import cv2
+print('ready', np.__version__, cv2.__version__)
+"""
+
+
+def measure(pool: InterpreterPool, code: str, runs: int) -> dict:
+    first_output, total = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = pool.spawn(code)
+        process.stdout.read(1)
+        first_output.append(time.perf_counter() - start)
+        process.stdout.read()
+        process.stderr.read()
+        process.wait()
+        total.append(time.perf_counter() - start)
+
+    return {
+        'first_output_ms': statistics.median(first_output) * 1000,
+        'first_output_max_ms': max(first_output) * 1000,
+        'total_ms': statistics.median(total) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='코드 실행 첫 출력까지의 시간: 새 인터프리터 vs 포크 서버')
+    parser.add_argument('--runs', type=int, default=10, help='방식별 실행 횟수')
+    parser.add_argument('--code', default=DEFAULT_CODE, help='실행할 코드')
+    parser.add_argument('--preload', default='findee,numpy,cv2', help='포크 서버가 미리 import할 모듈')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = {}
+    for mode, warm in (('cold', False), ('warm', True)):
+        pool = InterpreterPool(preload=args.preload.split(','), warm=warm)
+        pool.start()
+        try:
+            pool.spawn('pass').wait()  # 포크 서버 준비 대기 + 디스크 캐시 데우기
+            results[mode] = measure(pool, args.code, args.runs)
+        finally:
+            pool.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.runs}회 실행 (중앙값)")
+    print(f"{'mode':>6}{'first output ms':>17}{'max ms':>10}{'total ms':>11}")
+    for mode, r in results.items():
+        print(f"{mode:>6}{r['first_output_ms']:>17.1f}{r['first_output_max_ms']:>10.1f}{r['total_ms']:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+WebEditor 커널 모드 재실행 시간 벤치마크
+
+"준비 코드 + 조금 고친 제어 루프"를 반복 실행할 때, 실행 1건이 끝날 때까지의 시간을 잰다.
+- cold: 실행마다 새 인터프리터 (`forkserver.py --run`) - 준비 코드 + 루프
+- warm: 포크 서버에서 fork한 새 자식 (미리 import한 numpy / cv2 공유) - 준비 코드 + 루프
+- kernel: 세션 커널에서 준비 코드는 처음 한 번만, 이후 실행은 루프만
+준비 코드는 Findee() 생성(브로커 연결)과 카메라 보정 맵 / 색상 분류 테이블 계산, 루프는 거리 측정 + 작은 프레임 처리 몇 번이다.
+
+사용법:
+    python benchmarks/kernel_mode.py
+    python benchmarks/kernel_mode.py --runs 50 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.broker import HardwareBroker
+from findee_kit.hardware import SUBSYSTEMS, RobotProvider
+from findee_kit.interpreters import InterpreterPool
+from findee_kit.kernels import KernelManager
+
+SETUP = """
+import cv2
+import numpy as np
+from findee import Findee
+
+robot = Findee()
+# 카메라 보정 맵 + BGR → 색상 분류 테이블 (라인 트레이싱 등에서 실행 전에 한 번 계산하는 값)
+camera = np.array([[500, 0, 320], [0, 500, 240], [0, 0, 1]], np.float32)
+map_x, map_y = cv2.initUndistortRectifyMap(camera, np.array([-0.2, 0.05, 0, 0]), None, camera, (640, 480), cv2.CV_32FC1)
+b, g, r = np.meshgrid(*[np.arange(0, 256, 2, dtype=np.int16)] * 3, indexing='ij')
+color_table = ((r > g + 40) & (r > b + 40)).astype(np.uint8)
+"""
+
+LOOP = """
+speed = {speed}
+for _ in range(5):
+    distance = robot.ultrasonic.get_distance()
+    frame = cv2.remap(np.zeros((480, 640, 3), np.uint8), map_x, map_y, cv2.INTER_LINEAR)
+    red = color_table[frame[::8, ::8, 0] // 2, frame[::8, ::8, 1] // 2, frame[::8, ::8, 2] // 2].sum()
+print(speed, distance is not None, red)
+"""
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def finish(process) -> int:
+    """출력을 끝까지 읽고 종료 코드 반환 (WebEditor의 출력 전송과 같이 EOF까지)"""
+    process.stdout.read()
+    error = process.stderr.read()
+    returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(error.decode(errors='replace'))
+    return returncode
+
+
+def measure(execute, runs: int) -> dict:
+    samples = []
+    for index in range(runs + 1):
+        start = time.perf_counter()
+        finish(execute(index))
+        if index:  # 첫 실행(포크 서버 / 커널 시작)은 제외
+            samples.append((time.perf_counter() - start) * 1000)
+    return {'p50_ms': round(percentile(samples, 50), 2), 'p95_ms': round(percentile(samples, 95), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='커널 모드: 고친 루프를 다시 실행하는 시간 (cold / warm / kernel)')
+    parser.add_argument('--runs', type=int, default=20, help='모드별 반복 실행 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    broker = HardwareBroker(RobotProvider(SUBSYSTEMS, (640, 480), fake=True))
+    path = broker.start()
+    cold = InterpreterPool(warm=False)
+    warm = InterpreterPool(preload=('findee', 'numpy', 'cv2'))
+    warm.start()
+    kernels = KernelManager(warm, broker=broker, idle_seconds=None, memory_budget_mb=None)
+
+    def script(index):
+        return SETUP + LOOP.format(speed=index)
+
+    def run_kernel(index):
+        return kernels.execute('bench', (SETUP if index == 0 else '') + LOOP.format(speed=index))
+
+    try:
+        results = [
+            {'mode': 'cold', **measure(lambda index: cold.spawn(script(index), broker=path), args.runs)},
+            {'mode': 'warm', **measure(lambda index: warm.spawn(script(index), broker=path), args.runs)},
+            {'mode': 'kernel', **measure(run_kernel, args.runs)},
+        ]
+    finally:
+        kernels.shutdown()
+        warm.close()
+        broker.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.runs} re-runs per mode, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':>8}{'p50':>10}{'p95':>10}  (ms)")
+    for r in results:
+        print(f"{r['mode']:>8}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+"""
+다중 클라이언트 부하 테스트
+
+가짜 Findee로 앱(A / B / C / 통합)을 띄우고 대시보드 사용자를 흉내 내는 클라이언트 N개를 붙인다.
+앱이 제공하는 토픽(/api/topics)에 따라 클라이언트 하나가 하는 일:
+- Socket.IO 세션 1개: 제공되는 토픽 구독, motor가 있으면 조작자처럼 motor_control 전송 (--rate Hz)
+- MJPEG 뷰어 1개 (video 토픽이 있을 때, --viewers 비율만큼)
+- REST 폴링 (--poll-interval초마다 상태 / 센서 / 해상도 API)
+
+보고 항목
+- 서버 처리량: 초당 HTTP 요청 수, Socket.IO emit 수, 모터 명령 수 (서버 /metrics 기준)
+- emit p95: 서버 측 Socket.IO emit 호출 시간 (히스토그램 버킷 상한)
+- 제어 왕복 p50 / p95: motor_control → motor_feedback (클라이언트 측)
+- 유실: 응답이 오지 않은 모터 명령 + 실패한 REST 요청 + 끊긴 Socket.IO 세션
+- 서버 프로세스 최대 RSS / OS 스레드 수, MJPEG 프레임 수
+
+사용법:
+    python benchmarks/load_test.py --clients 1,5,10,20 --seconds 20
+    python benchmarks/load_test.py --app 1.Flask_Test/A_Motor_Flask/app.py --clients 10 --rate 5
+    python benchmarks/load_test.py --async-mode gevent --clients 50 --viewers 0.2
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from async_mode_clients import percentile, process_stats, view_stream
+from startup_time import REPO_ROOT, wait_for_port
+
+
+DIRECTIONS = ('forward', 'backward', 'rotate-left', 'rotate-right', 'forward-left', 'forward-right')
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_metrics(text: str) -> dict:
+    """Prometheus 텍스트 → {(이름, ((라벨, 값), ...)): 값}"""
+    samples = {}
+    for line in text.splitlines():
+        match = _SAMPLE.match(line)
+        if match:
+            name, labels, value = match.groups()
+            samples[(name, tuple(sorted(_LABEL.findall(labels or ''))))] = float(value)
+    return samples
+
+
+def metric_total(samples: dict, name: str, **labels) -> float:
+    """라벨 조건에 맞는 샘플 합계"""
+    return sum(value for (sample, sample_labels), value in samples.items()
+               if sample == name and all((key, val) in sample_labels for key, val in labels.items()))
+
+
+def histogram_quantile(before: dict, after: dict, name: str, q: float):
+    """두 스크랩 사이 구간의 히스토그램 분위수 (해당 버킷 상한, 모든 라벨 합산)"""
+    buckets = defaultdict(float)
+    for samples, sign in ((after, 1), (before, -1)):
+        for (sample, labels), value in samples.items():
+            if sample == f'{name}_bucket':
+                buckets[float(dict(labels)['le'])] += sign * value
+    if not buckets:
+        return None
+    ordered = sorted(buckets.items())
+    total = ordered[-1][1]
+    if total <= 0:
+        return None
+    for upper, count in ordered:
+        if count >= q * total:
+            return upper
+    return ordered[-1][0]
+
+
+def fetch(url: str, data: dict = None, timeout: float = 5.0) -> bytes:
+    request = urllib.request.Request(
+        url, method='POST' if data is not None else 'GET',
+        data=json.dumps(data).encode() if data is not None else None,
+        headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+class DashboardClient:
+    """대시보드 사용자 한 명 - Socket.IO 세션 + REST 폴링"""
+
+    def __init__(self, url: str, topics: list, args):
+        import socketio
+
+        self.url = url
+        self.topics = [topic for topic in topics if topic != 'motor']
+        self.motor = 'motor' in topics
+        self.args = args
+        self.sio = socketio.Client(reconnection=False)
+        self.sent = []
+        self.round_trips = []
+        self.received = defaultdict(int)
+        self.polls = 0
+        self.poll_errors = 0
+        self.disconnected = False  # 측정 중 서버가 세션을 끊었는지
+        self._closing = False
+        self.sio.on('motor_feedback', self._on_feedback)
+        self.sio.on('batch', self._on_batch)
+        self.sio.on('disconnect', self._on_disconnect)
+        for event in ('ultrasonic_data', 'dashboard_snapshot', 'dashboard_delta', 'video_stats'):
+            self.sio.on(event, lambda data, event=event: self._count(event))
+
+    def _count(self, event: str):
+        self.received[event] += 1
+
+    def _on_feedback(self, data):
+        self._count('motor_feedback')
+        if self.sent:
+            self.round_trips.append(time.perf_counter() - self.sent.pop(0))
+
+    def _on_batch(self, messages):
+        for event, _ in messages:
+            self._count(event)
+
+    def _on_disconnect(self, *args):
+        if not self._closing:
+            self.disconnected = True
+
+    def run_socket(self, stop: threading.Event):
+        self.sio.connect(self.url, transports=['websocket'])
+        if self.topics:
+            self.sio.emit('subscribe', {'topics': self.topics})
+        try:
+            while not stop.is_set():
+                if self.motor:
+                    # 조작자처럼 방향을 바꾸다 가끔 정지
+                    direction = 'stop' if random.random() < 0.2 else random.choice(DIRECTIONS)
+                    self.sent.append(time.perf_counter())
+                    self.sio.emit('motor_control', {'direction': direction, 'speed': random.randint(30, 80)})
+                # 전송 간격에 ±30% 흔들림
+                stop.wait(random.uniform(0.7, 1.3) / self.args.rate)
+        finally:
+            self._closing = True
+            self.sio.disconnect()
+
+    def run_polling(self, stop: threading.Event, endpoints: list):
+        while not stop.is_set():
+            for endpoint in endpoints:
+                try:
+                    fetch(self.url + endpoint)
+                    self.polls += 1
+                except Exception:
+                    self.poll_errors += 1
+            stop.wait(random.uniform(0.7, 1.3) * self.args.poll_interval)
+
+
+def poll_endpoints(topics: list) -> list:
+    endpoints = ['/api/status', '/api/system_info']
+    if 'ultrasonic' in topics:
+        endpoints.append('/api/ultrasonic/data')
+    if 'video' in topics:
+        endpoints.append('/api/resolutions')
+    return endpoints
+
+
+def start_server(args, port: int) -> subprocess.Popen:
+    env = dict(os.environ,
+               FINDEE_KIT_PORT=str(port), FINDEE_KIT_DEBUG='false', FINDEE_KIT_FAKE='true',
+               FINDEE_KIT_ASYNC_MODE=args.async_mode)
+    app_path = os.path.join(REPO_ROOT, args.app)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.basename(app_path)],
+        cwd=os.path.dirname(app_path), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    if not wait_for_port(port, time.monotonic() + 30, proc):
+        proc.kill()
+        raise RuntimeError(f"{args.app} did not start")
+    return proc
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    time.sleep(0.5)  # 포트 해제 대기
+
+
+def run_case(clients: int, args) -> dict:
+    port = args.port
+    url = f'http://127.0.0.1:{port}'
+    proc = start_server(args, port)
+    stop = threading.Event()
+    try:
+        topics = sorted(json.loads(fetch(url + '/api/topics')))
+        if 'ultrasonic' in topics:
+            fetch(url + '/api/ultrasonic/start', {})
+
+        users = [DashboardClient(url, topics, args) for _ in range(clients)]
+        endpoints = poll_endpoints(topics)
+        viewers = round(clients * args.viewers) if 'video' in topics else 0
+        frame_counts = [0] * viewers
+
+        workers = []
+        for user in users:
+            workers.append(threading.Thread(target=user.run_socket, args=(stop,), daemon=True))
+            workers.append(threading.Thread(target=user.run_polling, args=(stop, endpoints), daemon=True))
+        workers += [threading.Thread(target=view_stream, args=(port, stop, frame_counts, i), daemon=True)
+                    for i in range(viewers)]
+        for worker in workers:
+            worker.start()
+
+        time.sleep(args.warmup)
+        before = parse_metrics(fetch(url + '/metrics').decode())
+        sent_start = sum(len(u.round_trips) + len(u.sent) for u in users)
+        frames_start = sum(frame_counts)
+        peak = process_stats(proc.pid)
+
+        deadline = time.monotonic() + args.seconds
+        while time.monotonic() < deadline:
+            stats = process_stats(proc.pid)
+            peak = {key: max(peak[key], stats[key]) for key in peak}
+            time.sleep(0.5)
+
+        after = parse_metrics(fetch(url + '/metrics').decode())
+        frames = sum(frame_counts) - frames_start
+        stop.set()
+        time.sleep(args.grace)  # 전송 중인 motor_feedback 수신 대기
+
+        def rate(name: str) -> float:
+            return (metric_total(after, name) - metric_total(before, name)) / args.seconds
+
+        round_trips = [rt for u in users for rt in u.round_trips]
+        lost_commands = sum(len(u.sent) for u in users)
+        received = defaultdict(int)
+        for user in users:
+            for event, count in user.received.items():
+                received[event] += count
+        emit_p95 = histogram_quantile(before, after, 'findee_socketio_emit_duration_seconds', 0.95)
+
+        return {
+            'app': args.app,
+            'async_mode': args.async_mode,
+            'clients': clients,
+            'viewers': viewers,
+            'topics': topics,
+            'http_per_s': rate('findee_http_request_duration_seconds_count'),
+            'emits_per_s': rate('findee_socketio_emit_duration_seconds_count'),
+            'motor_commands_per_s': rate('findee_motor_commands_total'),
+            'emit_p95_ms': emit_p95 * 1000 if emit_p95 is not None else None,
+            'rtt_p50_ms': (percentile(round_trips, 50) or 0) * 1000,
+            'rtt_p95_ms': (percentile(round_trips, 95) or 0) * 1000,
+            'commands_sent': sum(len(u.round_trips) + len(u.sent) for u in users) - sent_start,
+            'dropped_commands': lost_commands,
+            'poll_errors': sum(u.poll_errors for u in users),
+            'disconnects': sum(1 for u in users if u.disconnected),
+            'frames_per_s': frames / args.seconds,
+            'events_received': dict(received),
+            'rss_mb': peak['rss_mb'],
+            'threads': peak['threads'],
+        }
+    finally:
+        stop.set()
+        stop_server(proc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 Findee 대상 다중 클라이언트 부하 테스트')
+    parser.add_argument('--app', default='2.Integrated_Flask/app.py', help='저장소 루트 기준 앱 경로')
+    parser.add_argument('--async-mode', default='threading', choices=('threading', 'gevent'))
+    parser.add_argument('--clients', default='1,5,10', help='동시 클라이언트 수 목록')
+    parser.add_argument('--rate', type=float, default=4.0, help='클라이언트당 motor_control 전송 주기 (Hz)')
+    parser.add_argument('--viewers', type=float, default=1.0, help='MJPEG를 보는 클라이언트 비율 (0~1)')
+    parser.add_argument('--poll-interval', type=float, default=3.0, help='REST 폴링 주기 (초)')
+    parser.add_argument('--seconds', type=float, default=15.0, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=3.0, help='측정 전 대기 시간 (초)')
+    parser.add_argument('--grace', type=float, default=1.0, help='측정 후 응답 대기 시간 (초)')
+    parser.add_argument('--port', type=int, default=5096)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = [run_case(int(n), args) for n in args.clients.split(',')]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.app} ({args.async_mode}, topics: {', '.join(results[0]['topics'])})")
+    print(f"{'clients':>8}{'http/s':>8}{'emit/s':>8}{'cmd/s':>8}{'emit p95':>10}{'rtt p50':>9}{'rtt p95':>9}"
+          f"{'dropped':>9}{'frames/s':>10}{'RSS MB':>8}{'threads':>9}")
+    for r in results:
+        emit_p95 = f"{r['emit_p95_ms']:.1f}" if r['emit_p95_ms'] is not None else '-'
+        dropped = r['dropped_commands'] + r['poll_errors'] + r['disconnects']
+        print(f"{r['clients']:>8}{r['http_per_s']:>8.1f}{r['emits_per_s']:>8.1f}{r['motor_commands_per_s']:>8.1f}"
+              f"{emit_p95:>10}{r['rtt_p50_ms']:>9.1f}{r['rtt_p95_ms']:>9.1f}"
+              f"{dropped:>9}{r['frames_per_s']:>10.1f}{r['rss_mb']:>8.1f}{r['threads']:>9}")
+
+
+if __name__ == '__main__':
+    main()
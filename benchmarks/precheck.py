@@ -0,0 +1,132 @@
+"""
+WebEditor 사전 검사 벤치마크
+
+1) 문법 오류가 있는 코드를 실행했을 때 오류 위치를 알기까지 걸리는 시간
+   - cold: 새 인터프리터 (`forkserver.py --run`)를 띄우고 stderr 트레이스백을 받을 때까지
+   - warm: 포크 서버에서 fork한 자식의 stderr 트레이스백을 받을 때까지
+   - precheck: 서버 프로세스 안의 사전 검사 (CodeChecker.check)
+2) 오류가 없는 코드에 사전 검사가 더하는 시간 (코드 길이별, 처음 / 같은 코드 다시 - 입력 중 검사 후 실행 버튼)
+
+사용법:
+    python benchmarks/precheck.py
+    python benchmarks/precheck.py --runs 50 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.interpreters import InterpreterPool
+from findee_kit.precheck import CodeChecker, has_errors
+
+BROKEN = """
+import numpy as np
+from findee import Findee
+
+robot = Findee()
+for _ in range(10):
+    distance = robot.ultrasonic.get_distance()
+    if distance < 20
+        robot.motor.stop()
+"""
+
+FUNCTION = """
+def step_{index}(robot, speed):
+    distance = robot.ultrasonic.get_distance()
+    if distance is not None and distance < {index} % 30 + 10:
+        robot.motor.turn_left(speed)
+    else:
+        robot.motor.move_forward(speed)
+    return distance
+"""
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def summary(samples) -> dict:
+    return {'p50_ms': round(percentile(samples, 50), 3), 'p95_ms': round(percentile(samples, 95), 3)}
+
+
+def traceback_time(pool: InterpreterPool, runs: int) -> dict:
+    samples = []
+    for index in range(runs + 1):
+        start = time.perf_counter()
+        process = pool.spawn(BROKEN)
+        process.stdout.read()
+        error = process.stderr.read()
+        process.wait()
+        if b'SyntaxError' not in error:
+            raise RuntimeError(error.decode(errors='replace'))
+        if index:  # 첫 실행(포크 서버 준비)은 제외
+            samples.append((time.perf_counter() - start) * 1000)
+    return summary(samples)
+
+
+def check_time(code: str, path: list, runs: int, cached: bool) -> tuple:
+    """검사 시간 - cached면 같은 CodeChecker로 반복 (첫 검사 제외), 아니면 매번 새 CodeChecker"""
+    samples = []
+    checker = CodeChecker(search_path=path)  # 검색 경로는 서버 시작 시 한 번 구함 (warm_up)
+    if cached:
+        checker.check(code)
+    for _ in range(runs):
+        if not cached:
+            checker = CodeChecker(search_path=path)
+        start = time.perf_counter()
+        diagnostics = checker.check(code)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summary(samples), diagnostics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사전 검사: 문법 오류를 알기까지의 시간과 정상 코드의 검사 비용')
+    parser.add_argument('--runs', type=int, default=20, help='항목별 반복 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    path = CodeChecker().search_path()
+    cold = InterpreterPool(warm=False)
+    warm = InterpreterPool(preload=('numpy', 'cv2'))
+    warm.start()
+    try:
+        errors = [
+            {'mode': 'cold', **traceback_time(cold, args.runs)},
+            {'mode': 'warm', **traceback_time(warm, args.runs)},
+        ]
+    finally:
+        warm.close()
+    stats, diagnostics = check_time(BROKEN, path, args.runs, cached=False)
+    if not has_errors(diagnostics):
+        raise RuntimeError('사전 검사가 문법 오류를 찾지 못함')
+    errors.append({'mode': 'precheck', **stats})
+
+    overhead = []
+    for functions in (10, 100, 500):
+        code = 'import numpy as np\nfrom findee import Findee\n' + ''.join(FUNCTION.format(index=i) for i in range(functions))
+        first, _ = check_time(code, path, args.runs, cached=False)
+        again, _ = check_time(code, path, args.runs, cached=True)
+        overhead.append({'lines': code.count('\n'), 'first': first, 'cached': again})
+
+    if args.json:
+        print(json.dumps({'syntax_error': errors, 'overhead': overhead}, indent=2))
+        return
+
+    print(f"syntax error → location, {args.runs} runs, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':>10}{'p50':>10}{'p95':>10}  (ms)")
+    for r in errors:
+        print(f"{r['mode']:>10}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}")
+    print()
+    print("pre-check cost on valid code")
+    print(f"{'lines':>8}{'first p50':>12}{'cached p50':>12}  (ms)")
+    for r in overhead:
+        print(f"{r['lines']:>8}{r['first']['p50_ms']:>12.3f}{r['cached']['p50_ms']:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+WebEditor 프로파일러 오버헤드 벤치마크
+
+같은 제어 루프(거리 측정 + 작은 계산 + sleep)를 프로파일러 없이 / sampling / cprofile로 실행해
+루프 1회 시간과 실행 1건 시간을 비교한다. 루프 시간은 사용자 코드가 직접 재서 출력한다.
+- none: 프로파일러 없음
+- sampling: 기본 간격(5 ms) 스택 샘플링 - 루프 주기가 거의 그대로여야 함
+- cprofile: 모든 Python 호출 기록 - 계산이 많은 루프일수록 느려짐
+
+사용법:
+    python benchmarks/profiler_overhead.py
+    python benchmarks/profiler_overhead.py --runs 20 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.broker import HardwareBroker
+from findee_kit.hardware import SUBSYSTEMS, RobotProvider
+from findee_kit.interpreters import InterpreterPool
+
+SCRIPT = """
+import time
+from findee import Findee
+
+robot = Findee()
+
+def control(distance):
+    return sum(i * i for i in range(int(distance or 10) * 200)) % 100
+
+samples = []
+for _ in range(50):
+    start = time.perf_counter()
+    control(robot.ultrasonic.get_distance())
+    time.sleep(0.002)
+    samples.append(time.perf_counter() - start)
+samples.sort()
+print(samples[len(samples) // 2] * 1000)
+"""
+
+PROFILE_INTERVAL = 0.005
+PROFILE_REPORT = 1.0
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def finish(process) -> float:
+    """출력 / 프로파일 보고를 끝까지 읽고 루프 1회 시간(ms, 사용자 코드가 출력) 반환"""
+    output = process.stdout.read()
+    if process.profile is not None:
+        reports = process.profile.read().splitlines()
+        if not reports or not json.loads(reports[-1])['final']:
+            raise RuntimeError('프로파일 최종 보고 없음')
+    error = process.stderr.read()
+    if process.wait() != 0:
+        raise RuntimeError(error.decode(errors='replace'))
+    return float(output.split()[-1])
+
+
+def measure(pool, path, mode, runs: int) -> dict:
+    profile = {'mode': mode, 'interval': PROFILE_INTERVAL, 'report': PROFILE_REPORT} if mode else None
+    loops, totals = [], []
+    for index in range(runs + 1):
+        start = time.perf_counter()
+        loop = finish(pool.spawn(SCRIPT, broker=path, profile=profile))
+        if index:  # 첫 실행(포크 서버 준비)은 제외
+            loops.append(loop)
+            totals.append((time.perf_counter() - start) * 1000)
+    return {'mode': mode or 'none', 'loop_p50_ms': round(percentile(loops, 50), 3),
+            'run_p50_ms': round(percentile(totals, 50), 2), 'run_p95_ms': round(percentile(totals, 95), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='프로파일러 오버헤드: 제어 루프 주기 / 실행 시간 (none / sampling / cprofile)')
+    parser.add_argument('--runs', type=int, default=10, help='모드별 실행 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    broker = HardwareBroker(RobotProvider(SUBSYSTEMS, (640, 480), fake=True))
+    path = broker.start()
+    pool = InterpreterPool(preload=('findee',))
+    pool.start()
+    try:
+        results = [measure(pool, path, mode, args.runs) for mode in (None, 'sampling', 'cprofile')]
+    finally:
+        pool.close()
+        broker.close()
+
+    base = results[0]['loop_p50_ms']
+    for r in results:
+        r['loop_overhead_pct'] = round((r['loop_p50_ms'] / base - 1) * 100, 1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.runs} runs x 50 loops per mode, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':>10}{'loop p50':>10}{'overhead':>10}{'run p50':>10}{'run p95':>10}  (ms)")
+    for r in results:
+        print(f"{r['mode']:>10}{r['loop_p50_ms']:>10.3f}{r['loop_overhead_pct']:>9.1f}%"
+              f"{r['run_p50_ms']:>10.2f}{r['run_p95_ms']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+WebEditor 실행 격리 벤치마크 (nice 유무에 따른 제어 루프 지연)
+
+CPU를 계속 쓰는 사용자 코드(`while True: pass`)를 여러 개 실행한 상태에서, 이 프로세스가 제어 서버처럼
+10 ms마다 깨어나 --work-ms만큼 CPU 작업(JPEG 인코딩, 센서 처리 등 대신)을 하는 루프를 돌며
+작업이 끝난 시각이 예정 시각보다 늦은 시간(지연)을 잰다.
+- none: 사용자 코드 없음
+- nice 0: 자원 제한 없이 실행 (기존 방식)
+- nice N: RunLimits(nice=N) 적용
+
+사용법:
+    python benchmarks/run_isolation.py --runs 2 --seconds 5
+    python benchmarks/run_isolation.py --nice 0,10,19 --json
+"""
+
+import argparse
+import json
+import math
+import os
+import signal
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from findee_kit.interpreters import InterpreterPool, signal_group
+from findee_kit.runs import RunLimits
+
+
+BUSY_CODE = "while True:\n    pass\n"
+PERIOD = 0.01  # 제어 루프 주기 (초)
+
+
+def percentile(samples, q: int) -> float:
+    samples = sorted(samples)
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1]
+
+
+def control_loop(seconds: float, work: float) -> dict:
+    """PERIOD마다 깨어나 work초 CPU 작업 - 예정 시각 + work 대비 작업이 끝난 시각의 지연(ms) 측정"""
+    lateness = []
+    deadline = time.perf_counter() + PERIOD
+    end = time.perf_counter() + seconds
+    while deadline < end:
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+        cpu_end = time.process_time() + work
+        while time.process_time() < cpu_end:
+            pass
+        lateness.append((time.perf_counter() - deadline - work) * 1000)
+        # 늦어진 주기는 건너뜀 (제어 루프가 밀린 주기를 몰아서 실행하지 않도록)
+        deadline += PERIOD * max(1, math.ceil((time.perf_counter() - deadline) / PERIOD))
+    return {
+        'p50_ms': round(percentile(lateness, 50), 2),
+        'p95_ms': round(percentile(lateness, 95), 2),
+        'p99_ms': round(percentile(lateness, 99), 2),
+        'max_ms': round(max(lateness), 2),
+    }
+
+
+def measure(pool: InterpreterPool, runs: int, nice, seconds: float, work: float) -> dict:
+    processes = []
+    if nice is not None:
+        limits = RunLimits(nice=nice).rlimits()
+        processes = [pool.spawn(BUSY_CODE, limits) for _ in range(runs)]
+        time.sleep(0.5)  # 사용자 코드가 CPU를 쓰기 시작할 때까지
+    try:
+        return control_loop(seconds, work)
+    finally:
+        for process in processes:
+            signal_group(process, signal.SIGKILL)
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WebEditor 실행 격리: 바쁜 사용자 코드가 제어 루프 지연에 주는 영향')
+    parser.add_argument('--runs', type=int, default=2, help='동시에 실행할 바쁜 사용자 코드 수')
+    parser.add_argument('--nice', default='0,10', help='비교할 nice 값 (쉼표로 구분)')
+    parser.add_argument('--seconds', type=float, default=5.0, help='조건별 측정 시간 (초)')
+    parser.add_argument('--work-ms', type=float, default=3.0, help='제어 루프 주기마다 하는 CPU 작업 (ms)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    pool = InterpreterPool(preload=())
+    pool.start()
+    pool.spawn('pass').wait()  # 포크 서버 준비
+    try:
+        work = args.work_ms / 1000
+        results = [{'mode': 'none', **measure(pool, 0, None, args.seconds, work)}]
+        for nice in (int(value) for value in args.nice.split(',')):
+            results.append({'mode': f'nice {nice}', **measure(pool, args.runs, nice, args.seconds, work)})
+    finally:
+        pool.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.runs} busy run(s), {PERIOD * 1000:.0f} ms control loop with {args.work_ms:g} ms of work, "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"{'mode':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for r in results:
+        print(f"{r['mode']:>8}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['max_ms']:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
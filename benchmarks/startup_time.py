@@ -0,0 +1,166 @@
+"""
+앱 시작 시간 벤치마크
+
+앱 프로세스를 띄우고 다음 시점을 측정한다.
+- listen: 프로세스 시작 → TCP 포트 접속 가능
+- first_response: 프로세스 시작 → 첫 /api/status 응답 (지연 초기화되는 하드웨어 생성 포함)
+
+--imports 옵션은 PYTHONPROFILEIMPORTTIME으로 listen 시점까지의 모듈별 import 비용을
+기록하고 최상위 패키지별로 합산해 출력한다.
+
+사용법:
+    python benchmarks/startup_time.py --app 2.Integrated_Flask/app.py --runs 5
+    python benchmarks/startup_time.py --app 1.Flask_Test/B_Camera_Flask/app.py --fake
+    python benchmarks/startup_time.py --fake --runs 1 --imports --top 15
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_for_port(port: int, deadline: float, proc: subprocess.Popen) -> bool:
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.01)
+    return False
+
+
+def parse_importtime(lines) -> list:
+    """
+    -X importtime 출력 파싱
+
+    형식: "import time: <self us> | <cumulative us> | <들여쓰기 + 모듈명>"
+    Returns: [(모듈명, self_us, cumulative_us), ...]
+    """
+    costs = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 헤더 행
+        costs.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return costs
+
+
+def import_cost_by_package(costs: list) -> dict:
+    """최상위 패키지별 self 시간 합계 (us) - 누적 시간과 달리 중복 합산되지 않음"""
+    totals = defaultdict(int)
+    for module, self_us, _ in costs:
+        totals[module.split('.')[0]] += self_us
+    return dict(totals)
+
+
+def measure_once(app_path: str, port: int, fake: bool, debug: bool, timeout: float,
+                 imports: bool = False) -> dict:
+    env = dict(os.environ, FINDEE_KIT_PORT=str(port), FINDEE_KIT_DEBUG='true' if debug else 'false')
+    if fake:
+        env['FINDEE_KIT_FAKE'] = 'true'
+    if imports:
+        env['PYTHONPROFILEIMPORTTIME'] = '1'
+
+    start = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.basename(app_path)],
+        cwd=os.path.dirname(app_path),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE if imports else subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        if not wait_for_port(port, start + timeout, proc):
+            raise RuntimeError(f"{app_path} did not start listening on port {port}")
+        listen = time.monotonic() - start
+
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/api/status', timeout=timeout) as response:
+            response.read()
+        first_response = time.monotonic() - start
+    finally:
+        proc.terminate()
+        try:
+            _, stderr = proc.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            _, stderr = proc.communicate()
+
+    result = {'listen': listen, 'first_response': first_response}
+    if imports:
+        result['imports'] = parse_importtime(stderr.splitlines())
+    return result
+
+
+def summarize(values: list) -> dict:
+    return {
+        'min': min(values),
+        'median': statistics.median(values),
+        'max': max(values),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='앱 시작 → 포트 listen / 첫 응답 시간 측정')
+    parser.add_argument('--app', default='2.Integrated_Flask/app.py', help='저장소 루트 기준 앱 경로')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--fake', action='store_true', help='가짜 하드웨어 사용 (FINDEE_KIT_FAKE)')
+    parser.add_argument('--debug', action='store_true', help='debug 리로더 포함')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--imports', action='store_true', help='패키지별 import 비용 기록 (마지막 실행 기준)')
+    parser.add_argument('--top', type=int, default=10, help='--imports 출력 패키지 수')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    app_path = os.path.join(REPO_ROOT, args.app)
+    runs = [measure_once(app_path, args.port, args.fake, args.debug, args.timeout, args.imports)
+            for _ in range(args.runs)]
+
+    result = {
+        'app': args.app,
+        'runs': args.runs,
+        'fake': args.fake,
+        'listen': summarize([r['listen'] for r in runs]),
+        'first_response': summarize([r['first_response'] for r in runs]),
+    }
+    if args.imports:
+        by_package = import_cost_by_package(runs[-1]['imports'])
+        result['import_total_ms'] = sum(by_package.values()) / 1000
+        result['imports_ms'] = {
+            package: us / 1000
+            for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]
+        }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['app']} ({result['runs']}회, {'가짜' if args.fake else '실제'} 하드웨어)")
+    for key, label in (('listen', '포트 listen'), ('first_response', '첫 응답')):
+        stats = result[key]
+        print(f"  {label:<10}: median {stats['median'] * 1000:7.1f} ms  "
+              f"(min {stats['min'] * 1000:.1f}, max {stats['max'] * 1000:.1f})")
+
+    if args.imports:
+        print(f"  import 합계 : {result['import_total_ms']:7.1f} ms")
+        for package, ms in result['imports_ms'].items():
+            print(f"    {package:<24} {ms:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Findee Kit 공용 모듈
+
+각 Flask 애플리케이션이 함께 사용하는 유틸리티 모음
+- latency: 제어 명령 단계별 지연 시간 추적
+- sampler: 구독자 기반 공유 시스템 정보 샘플러 (TTL 캐시)
+- delta: 버전 관리 상태와 필드 단위 델타 인코딩
+- snapshot: 사전 직렬화된 상태 스냅샷과 ETag / 304 응답
+- metrics: 경량 메트릭 레지스트리와 Prometheus 텍스트 출력
+- stream: 메트릭이 기록되는 MJPEG 스트리밍
+- governor: 온도 / CPU 기반 부하 조절 거버너
+- app / blueprints: 앱 팩토리와 서브시스템별 블루프린트 (flask 필요, 직접 import)
+- hardware / fake: 지연 초기화 하드웨어 제공자와 가짜 Findee
+- executor: async 모드(threading / gevent)와 블로킹 하드웨어 호출 실행기
+- pools: 작업 종류별 제한된 워커 풀과 거부 정책
+- batching: 방(room)별 Socket.IO 이벤트 묶음 전송
+- topics: 토픽 구독자 수에 따른 생산자 시작 / 중지
+- logs: 큐 기반 비동기 로깅, 호출 위치별 속도 제한, 최근 로그 링
+- interpreters / forkserver: 무거운 모듈을 미리 import한 포크 서버로 사용자 코드 실행
+- output: 사용자 코드 출력 묶음 전송, 세션별 줄 수 제한, ack 기반 역압
+- completion: 세션별 Jedi 자동완성 (디바운스, LRU 캐시, jedi 필요 시 지연 import)
+- runs: 세션별 실행 대기열, 프로세스 그룹 중지, rlimit / nice 자원 제한
+- kernels: 세션별로 네임스페이스를 유지하는 커널 (중지, 재시작, 유휴 / 메모리 예산 정리)
+- profiler: 사용자 코드 sampling / cProfile 프로파일러 (실행 프로세스 안에서 JSON 줄로 보고, 표준 라이브러리만)
+- precheck: 실행 전 / 입력 중 사용자 코드 사전 검사 (문법, 최상위 import, 편집기 마커용 진단)
+- broker / robot_proxy: 사용자 코드가 서버의 Findee를 쓰는 하드웨어 브로커와 Findee 호환 프록시
+- framering: 앱 밖의 프로세스로 카메라 프레임을 내보내는 공유 메모리 링 (seqlock, 복사 없는 NumPy 뷰)
+- fleet: 여러 로봇을 모으는 플릿 게이트웨이 (flask / python-socketio 클라이언트 필요, 직접 import)
+"""
+
+#-gevent 모드는 다른 모듈이 threading / socket을 import하기 전에 패치해야 함-#
+from .executor import async_mode_from_env, patch_for_async_mode
+patch_for_async_mode(async_mode_from_env())
+
+from .latency import RollingHistogram, LatencyTracker, ControlTrace
+from .sampler import SystemInfoSampler
+from .delta import VersionedState, apply_delta, diff_state
+from .snapshot import Snapshot, SnapshotCache, snapshot_response
+from .metrics import REGISTRY, MetricsRegistry, PeriodMonitor, instrument_flask, instrument_socketio
+from .stream import MJPEG_MIMETYPE, ClientStreamSettings, StreamSettings, mjpeg_frames
+from .governor import GovernorLevel, LoadGovernor
+from .pools import PoolRejected, WorkerPool
+from .batching import EmitBatcher
+from .topics import TopicRegistry, topic_room
+from .logs import AsyncLogging, LogRing, setup_async_logging
+from .interpreters import InterpreterPool
+from .output import OutputStream, SessionRateLimits
+from .completion import CompletionService
+from .precheck import CodeChecker
+from .runs import RunLimits, RunRejected, RunScheduler
+from .kernels import KernelManager, KernelUnavailable
+from .broker import HardwareBroker
+from .framering import Frame, FramePublisher, FrameReader, FrameRing
+
+__all__ = [
+    'RollingHistogram',
+    'LatencyTracker',
+    'ControlTrace',
+    'SystemInfoSampler',
+    'VersionedState',
+    'diff_state',
+    'apply_delta',
+    'Snapshot',
+    'SnapshotCache',
+    'snapshot_response',
+    'REGISTRY',
+    'MetricsRegistry',
+    'PeriodMonitor',
+    'instrument_flask',
+    'instrument_socketio',
+    'MJPEG_MIMETYPE',
+    'StreamSettings',
+    'ClientStreamSettings',
+    'mjpeg_frames',
+    'GovernorLevel',
+    'LoadGovernor',
+    'PoolRejected',
+    'WorkerPool',
+    'EmitBatcher',
+    'TopicRegistry',
+    'topic_room',
+    'AsyncLogging',
+    'LogRing',
+    'setup_async_logging',
+    'InterpreterPool',
+    'OutputStream',
+    'SessionRateLimits',
+    'CompletionService',
+    'CodeChecker',
+    'RunLimits',
+    'RunRejected',
+    'RunScheduler',
+    'KernelManager',
+    'KernelUnavailable',
+    'HardwareBroker',
+    'Frame',
+    'FrameRing',
+    'FrameReader',
+    'FramePublisher',
+]
@@ -0,0 +1,100 @@
+"""
+Findee Kit 애플리케이션 팩토리
+
+create_app()이 Flask 앱과 Socket.IO를 만들고, 활성화된 서브시스템의
+블루프린트만 등록한다. 하드웨어(Findee)는 첫 요청 시점에 생성된다.
+
+    app, socketio = create_app(subsystems=('motor', 'camera'), root_path=os.path.dirname(__file__))
+    run_app(app, socketio)
+"""
+
+import os
+import socket
+from typing import Iterable, Tuple
+
+from flask import Flask, render_template
+from flask_socketio import SocketIO
+
+from .blueprints import load_blueprint
+from .config import Config
+from .context import KitContext
+from .executor import ASYNC_MODES, is_patched
+from .hardware import SUBSYSTEMS
+from .metrics import instrument_flask, instrument_socketio
+
+
+def create_base_app(import_name: str, root_path: str = None, **config) -> Tuple[Flask, SocketIO]:
+    """설정 / 메트릭 / Socket.IO만 갖춘 Flask 앱 (하드웨어 없음 - 플릿 게이트웨이도 사용)"""
+    # Flask 앱 초기화
+    app = Flask(import_name, root_path=root_path or os.getcwd())
+    app.config.from_object(Config)
+    app.config.update(config)
+    app.config.from_prefixed_env('FINDEE_KIT')  # 예: FINDEE_KIT_FAKE=true, FINDEE_KIT_PORT=5001
+    instrument_flask(app)  # 라우트별 요청 시간 + /metrics
+
+    async_mode = app.config['ASYNC_MODE']
+    if async_mode not in ASYNC_MODES:
+        raise ValueError(f"Unknown ASYNC_MODE: {async_mode} (expected one of {ASYNC_MODES})")
+    if not is_patched(async_mode):
+        raise RuntimeError(f"ASYNC_MODE={async_mode} requires FINDEE_KIT_ASYNC_MODE={async_mode} "
+                           "to be set before findee_kit is imported")
+
+    # Socket.IO 초기화
+    socketio = SocketIO(
+        app,
+        cors_allowed_origins="*",
+        async_mode=async_mode,
+        logger=False,
+        engineio_logger=False,
+        ping_timeout=app.config['SOCKET_TIMEOUT'],
+        ping_interval=app.config['SOCKET_PING_INTERVAL'],
+        async_handlers=app.config['SOCKETIO_ASYNC_HANDLERS'],  # 기본값: 연결별로 이벤트를 순서대로 처리
+        transports=['websocket', 'polling']  # WebSocket 우선, polling 백업
+    )
+    instrument_socketio(socketio)  # emit 시간 + 대기 중인 emit 수
+    return app, socketio
+
+
+def create_app(subsystems: Iterable[str] = SUBSYSTEMS, root_path: str = None,
+               import_name: str = 'findee_kit', **config) -> Tuple[Flask, SocketIO]:
+    """
+    Args:
+        subsystems: 활성화할 서브시스템 ('motor', 'camera', 'ultrasonic')
+        root_path: templates / static 폴더가 있는 앱 디렉토리
+        **config: Config 기본값 덮어쓰기 (예: SECRET_KEY='...')
+    """
+    subsystems = tuple(subsystems)
+    unknown = set(subsystems) - set(SUBSYSTEMS)
+    if unknown:
+        raise ValueError(f"Unknown subsystems: {sorted(unknown)}")
+
+    app, socketio = create_base_app(import_name, root_path, **config)
+
+    ctx = KitContext(app, socketio, subsystems)
+    app.extensions['findee_kit'] = ctx
+    app.before_request(ctx.ensure_started)
+
+    @app.route('/')
+    def index():
+        """메인 페이지"""
+        return render_template('index.html')
+
+    for name in ('system',) + subsystems:
+        load_blueprint(name).init_app(app, socketio, ctx)
+
+    return app, socketio
+
+
+def run_app(app: Flask, socketio: SocketIO) -> None:
+    ctx = app.extensions['findee_kit']
+    port = app.config['PORT']
+    ctx.logger.info(f"📡 {app.config['SERVER_TITLE']} server available at: http://{socket.gethostname()}:{port}"
+                    f" ({app.config['ASYNC_MODE']})")
+    ctx.logger.info("=" * 60)
+
+    try:
+        socketio.run(app, host='0.0.0.0', port=port, debug=app.config['DEBUG'], allow_unsafe_werkzeug=True)
+    except KeyboardInterrupt:
+        ctx.logger.info("\n🛑 Server shutdown requested...")
+    finally:
+        ctx.shutdown()
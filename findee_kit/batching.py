@@ -0,0 +1,148 @@
+"""
+Socket.IO 이벤트 묶음 전송
+
+짧은 틱(기본 30 ms) 동안 같은 방(room)으로 나가는 이벤트를 모아 하나의 'batch' 이벤트로
+전송한다. 센서 값이나 편집기 출력처럼 자주 나가는 이벤트의 패킷 수와 인코딩 비용을 줄인다.
+- 묶을 이벤트와 이벤트별 틱은 events로 지정 (목록에 없는 이벤트는 바로 전송)
+- 바로 전송하는 이벤트는 같은 방에 쌓인 묶음을 먼저 보내 순서를 유지
+- 클라이언트: socket.on('batch', msgs => msgs.forEach(([event, data]) =>
+  socket.listeners(event).forEach(fn => fn(data))))
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_EVENT = 'batch'
+
+#-묶음 전송 메트릭-#
+BATCHED_EVENTS = REGISTRY.counter('findee_socketio_batched_events', '묶음으로 전송된 이벤트 수', ('event',))
+BATCH_SIZE = REGISTRY.histogram(
+    'findee_socketio_batch_size', '묶음 하나에 담긴 이벤트 수',
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500))
+
+
+class _PendingBatch:
+    __slots__ = ('messages', 'due', 'namespace')
+
+    def __init__(self, due: float, namespace: Optional[str]):
+        self.messages: List[Tuple[str, object]] = []
+        self.due = due
+        self.namespace = namespace
+
+
+class EmitBatcher:
+    """방(room)별로 이벤트를 모아 틱마다 한 번에 전송"""
+
+    def __init__(self, socketio, events: Dict[str, float], tick: float = 0.03,
+                 enabled: bool = True, max_batch: int = 500):
+        """
+        Args:
+            events: 묶을 이벤트 이름 → 최대 지연 시간 (초, 0이면 바로 전송)
+            tick: 묶음 전송 스레드의 최대 확인 주기 (가장 짧은 이벤트 지연 시간보다 길면 그 값 사용)
+            enabled: False면 모든 이벤트를 바로 전송 (비교 측정용)
+            max_batch: 묶음이 이 크기에 도달하면 틱을 기다리지 않고 전송
+        """
+        self.socketio = socketio
+        self.events = {event: delay for event, delay in events.items() if delay > 0}
+        self.tick = min([tick] + list(self.events.values()))
+        self.enabled = enabled
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._pending: Dict[Optional[str], _PendingBatch] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def batched(self, event: str) -> bool:
+        return self.enabled and event in self.events
+
+    def emit(self, event: str, data=None, to: Optional[str] = None, namespace: Optional[str] = None) -> None:
+        """이벤트 전송 - 묶음 대상이면 방별 대기열에 추가, 아니면 쌓인 묶음을 먼저 보내고 바로 전송"""
+        if not self.batched(event) or self._stopped:
+            self.flush(to)
+            self.socketio.emit(event, data, to=to, namespace=namespace)
+            return
+
+        full = None
+        with self._lock:
+            due = time.monotonic() + self.events[event]
+            batch = self._pending.get(to)
+            if batch is None or batch.namespace != namespace:
+                if batch is not None:
+                    full = self._pending.pop(to)
+                batch = self._pending[to] = _PendingBatch(due, namespace)
+            batch.messages.append((event, data))
+            batch.due = min(batch.due, due)
+            if len(batch.messages) >= self.max_batch and full is None:
+                full = self._pending.pop(to)
+            self._ensure_thread_locked()
+
+        if full is not None:
+            self._send(to, full)
+        self._wakeup.set()
+
+    def flush(self, to: Optional[str] = None) -> None:
+        """해당 방에 쌓인 묶음을 즉시 전송"""
+        with self._lock:
+            batch = self._pending.pop(to, None)
+        if batch is not None:
+            self._send(to, batch)
+
+    def discard(self, to: str) -> None:
+        """연결이 끊긴 클라이언트 방의 대기 묶음 폐기"""
+        with self._lock:
+            self._pending.pop(to, None)
+
+    def stop(self) -> None:
+        """남은 묶음을 모두 전송하고 묶음 전송 스레드 종료"""
+        self._stopped = True
+        self._wakeup.set()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for to, batch in pending.items():
+            self._send(to, batch)
+
+    #-묶음 전송 스레드-#
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='emit-batcher', daemon=True)
+            self._thread.start()
+
+    def _send(self, to: Optional[str], batch: _PendingBatch) -> None:
+        for event, _ in batch.messages:
+            BATCHED_EVENTS.labels(event).inc()
+        BATCH_SIZE.observe(len(batch.messages))
+        self.socketio.emit(BATCH_EVENT, batch.messages, to=to, namespace=batch.namespace)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            with self._lock:
+                earliest = min((batch.due for batch in self._pending.values()), default=None)
+            if earliest is None:
+                # 대기 중인 묶음이 없으면 다음 emit까지 잠듦
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            # 가장 먼저 보낼 묶음의 시각까지 (최대 tick) 대기
+            delay = earliest - time.monotonic()
+            if delay > 0:
+                time.sleep(min(delay, self.tick))
+            now = time.monotonic()
+            with self._lock:
+                ready = [(to, batch) for to, batch in self._pending.items() if batch.due <= now]
+                for to, _ in ready:
+                    del self._pending[to]
+            for to, batch in ready:
+                try:
+                    self._send(to, batch)
+                except Exception as e:
+                    logger.warning(f"⚠️ Batched emit failed ({to or 'broadcast'}): {e}")
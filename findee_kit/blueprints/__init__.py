@@ -0,0 +1,21 @@
+"""
+Findee Kit 블루프린트
+
+서브시스템마다 하나의 블루프린트와 init_app(app, socketio, ctx)를 둔다.
+- system: 상태 / 시스템 정보 / 거버너 API, Socket.IO 연결 관리 (항상 등록)
+- motor: 모터 제어 Socket.IO 이벤트와 제어 지연 시간 API
+- camera: MJPEG 스트림과 해상도 API
+- ultrasonic: 초음파 센서 측정 API
+
+비활성화된 서브시스템의 모듈은 import하지 않는다.
+"""
+
+import importlib
+
+
+def load_blueprint(name: str):
+    """블루프린트 모듈 import ('system', 'motor', 'camera', 'ultrasonic')"""
+    return importlib.import_module(f'.{name}', __name__)
+
+
+__all__ = ['load_blueprint']
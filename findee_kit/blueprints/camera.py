@@ -0,0 +1,187 @@
+"""
+카메라 블루프린트
+
+- /video_feed MJPEG 스트림 (거버너 단계에 따라 fps / 품질 조절, 시청자가 없으면 캡처 중지)
+  ?fps=&quality=&width=로 클라이언트별 상한 지정 (예: 썸네일 /video_feed?fps=2&width=160)
+- /api/resolutions, /api/resolution
+- video 토픽: 구독자가 있을 때만 video_stats 이벤트를 주기적으로 전송
+- FRAME_RING 설정 시 원본 프레임을 공유 메모리로 내보냄 (앱 밖의 프로세스가 FrameReader로 읽음)
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+from flask import Blueprint, Response, jsonify, request
+
+from ..context import KitContext, get_context
+from ..framering import FramePublisher
+from ..pools import PoolRejected
+from ..snapshot import SnapshotCache, snapshot_response
+from ..stream import MJPEG_MIMETYPE, ClientStreamSettings, mjpeg_frames
+from ..topics import topic_room
+
+
+bp = Blueprint('camera', __name__)
+
+
+def format_resolution(resolution) -> dict:
+    """해상도 항목을 {'value': '640x480', 'label': ...} 형태로 변환"""
+    if isinstance(resolution, dict):
+        if 'value' in resolution:
+            return {'value': resolution['value'], 'label': resolution.get('label', resolution['value'])}
+        if 'width' in resolution and 'height' in resolution:
+            value = f"{resolution['width']}x{resolution['height']}"
+            return {'value': value, 'label': value}
+    if isinstance(resolution, (list, tuple)) and len(resolution) == 2:
+        value = f"{resolution[0]}x{resolution[1]}"
+        return {'value': value, 'label': value}
+    return {'value': str(resolution), 'label': str(resolution)}
+
+
+def build_resolutions(ctx: KitContext) -> dict:
+    """사용 가능한 해상도 목록 + 현재 해상도"""
+    camera = ctx.hardware.camera()
+    return {
+        'resolutions': [format_resolution(r) for r in camera.get_available_resolutions()],
+        'current': camera.get_current_resolution()
+    }
+
+
+class VideoStats:
+    """video 토픽 생산자 - 시청자 수, 캡처 상태, 스트림 설정을 주기적으로 전송"""
+
+    def __init__(self, ctx: KitContext):
+        self.ctx = ctx
+        self.interval = ctx.config['VIDEO_STATS_INTERVAL']
+        self._future: Optional[Future] = None
+        self._stop_event = threading.Event()
+
+    def snapshot(self) -> dict:
+        hardware = self.ctx.hardware
+        camera_fps = None
+        if hardware.initialized and hardware.available('camera'):
+            camera_fps = self.ctx.executor.call(hardware.camera().get_fps)
+        return {
+            'viewers': hardware.camera_viewers,
+            'capturing': hardware.camera_viewers > 0,
+            'camera_fps': camera_fps,
+            'stream_fps': self.ctx.stream_settings.fps,
+            'stream_quality': self.ctx.stream_settings.quality
+        }
+
+    def _loop(self, stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                self.ctx.emitter.emit('video_stats', self.snapshot(), to=topic_room('video'))
+            except Exception as e:
+                self.ctx.logger.error(f"❌ Video stats error: {e}")
+            stop_event.wait(self.interval)
+
+    def start(self) -> None:
+        if self._future is not None and not self._future.done() and not self._stop_event.is_set():
+            return
+        stop_event = threading.Event()
+        try:
+            self._future = self.ctx.jobs.submit(self._loop, stop_event)
+        except PoolRejected as e:
+            self.ctx.logger.warning(f"⚠️ video_stats 전송을 시작할 수 없습니다: {e}")
+            return
+        self._stop_event = stop_event
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+@bp.route('/video_feed')
+def video_feed():
+    """비디오 스트리밍 엔드포인트"""
+    ctx = get_context()
+    if not ctx.hardware.available('camera'):
+        return "Camera not available", 503
+
+    fps = request.args.get('fps', type=float)
+    quality = request.args.get('quality', type=int)
+    width = request.args.get('width', type=int)
+    settings = ctx.stream_settings
+    if fps or quality:
+        settings = ClientStreamSettings(settings, fps=fps or None, quality=quality or None)
+
+    def frames():
+        # 스트림이 실제로 시작될 때 시청자 등록, 연결 종료(GeneratorExit) 시 해제
+        camera = ctx.hardware.acquire_camera()
+        try:
+            yield from mjpeg_frames(camera, settings, call=ctx.encoder.call, width=width or None)
+        finally:
+            ctx.hardware.release_camera()
+
+    return Response(frames(), mimetype=MJPEG_MIMETYPE)
+
+
+@bp.route('/api/resolutions')
+def api_resolutions():
+    """사용 가능한 해상도 목록 API"""
+    ctx = get_context()
+    if not ctx.hardware.available('camera'):
+        return jsonify({'error': 'Camera not available'}), 503
+
+    try:
+        return snapshot_response(ctx.resolutions_snapshot)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/api/resolution', methods=['POST'])
+def api_change_resolution():
+    """해상도 변경 API"""
+    ctx = get_context()
+    if not ctx.hardware.available('camera'):
+        return jsonify({'error': 'Camera not available'}), 503
+
+    try:
+        data = request.get_json()
+        resolution = data.get('resolution')
+
+        if not resolution:
+            return jsonify({'error': 'Resolution not provided'}), 400
+
+        # 해상도 파싱 (예: "640x480")
+        try:
+            width, height = map(int, resolution.split('x'))
+        except ValueError:
+            return jsonify({'error': 'Invalid resolution format'}), 400
+
+        # Findee 모듈의 configure_resolution 사용
+        ctx.hardware.camera().configure_resolution((width, height))
+
+        return jsonify({
+            'success': True,
+            'resolution': f"{width}x{height}",
+            'message': f'해상도가 {width}x{height}로 변경되었습니다.'
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': '해상도 변경 중 오류가 발생했습니다.'
+        }), 500
+
+
+def init_app(app, socketio, ctx: KitContext):
+    ctx.resolutions_snapshot = SnapshotCache(
+        lambda: ctx.hardware.camera().get_current_resolution(),
+        lambda: build_resolutions(ctx)
+    )
+
+    video_stats = VideoStats(ctx)
+    ctx.topics.add_topic('video', start=video_stats.start, stop=video_stats.stop)
+    ctx.shutdown_hooks.append(video_stats.stop)
+
+    # 첫 요청 시 시작 (리로더 감시 프로세스에서는 카메라를 열지 않음)
+    if ctx.config['FRAME_RING']:
+        publisher = FramePublisher(ctx.hardware, ctx.config['FRAME_RING'], slots=ctx.config['FRAME_RING_SLOTS'],
+                                   fps=ctx.config['FRAME_RING_FPS'], call=ctx.encoder.call, pool=ctx.jobs)
+        ctx.start_hooks.append(publisher.start)
+        ctx.shutdown_hooks.append(publisher.stop)
+    app.register_blueprint(bp)
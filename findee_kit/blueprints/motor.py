@@ -0,0 +1,148 @@
+"""
+모터 블루프린트
+
+- motor_control Socket.IO 이벤트 (선택적 trace로 제어 지연 시간 측정)
+- latency_sync / latency_report, /api/latency
+- 클라이언트 연결 해제 시 안전 정지
+- motor 토픽: 다른 클라이언트가 보낸 명령의 motor_feedback을 구독자에게 전달
+"""
+
+import time
+
+from flask import Blueprint, jsonify, request
+from flask_socketio import emit
+
+from ..context import KitContext, get_context
+from ..latency import LatencyTracker
+from ..metrics import MOTOR_COMMANDS
+from ..topics import topic_room
+
+
+bp = Blueprint('motor', __name__)
+
+
+# 모터 제어 명령 매핑
+MOTOR_COMMAND_MAP = {
+    'forward': lambda motor, speed: motor.move_forward(speed),
+    'backward': lambda motor, speed: motor.move_backward(speed),
+    'rotate-left': lambda motor, speed: motor.turn_left(speed),
+    'rotate-right': lambda motor, speed: motor.turn_right(speed),
+    'forward-left': lambda motor, speed: motor.curve_left(speed, 30),
+    'forward-right': lambda motor, speed: motor.curve_right(speed, 30),
+    'backward-left': lambda motor, speed: motor.curve_left(-speed, 30),
+    'backward-right': lambda motor, speed: motor.curve_right(-speed, 30),
+    'stop': lambda motor, speed: motor.stop()
+}
+
+
+@bp.route('/api/latency', methods=['GET', 'DELETE'])
+def api_latency():
+    """제어 경로 단계별 지연 시간 (p50/p95/p99, ms) API"""
+    ctx = get_context()
+    if request.method == 'DELETE':
+        ctx.latency.reset()
+        return jsonify({'success': True, 'message': '지연 시간 통계가 초기화되었습니다.'})
+
+    return jsonify({
+        'success': True,
+        'stages': ctx.latency.snapshot()
+    })
+
+
+def handle_latency_sync(data=None):
+    """클라이언트 시계 보정용 서버 시각 응답 (ack)"""
+    return {'server_ts': time.time() * 1000}
+
+
+def handle_latency_report(data):
+    """클라이언트가 측정한 명령 왕복 시간 수신"""
+    get_context().latency.report_round_trip(data)
+
+
+def handle_motor_control(data):
+    """모터 제어 명령 처리"""
+    ctx = get_context()
+    trace = ctx.latency.begin(data.get('trace') if isinstance(data, dict) else None)
+    ctx.logger.info("🎮 Motor control received: %s", data)
+
+    # 데이터 유효성 검사
+    if not data or 'direction' not in data:
+        MOTOR_COMMANDS.labels('invalid', 'rejected').inc()
+        emit('motor_feedback', {
+            'success': False,
+            'error': 'Invalid command data'
+        })
+        return
+
+    direction = data['direction']
+    speed = data.get('speed', ctx.config['DEFAULT_SPEED'])
+
+    # 로봇 상태 확인
+    if not ctx.hardware.available('motor'):
+        emit('motor_feedback', {
+            'success': False,
+            'direction': direction,
+            'error': 'Robot motor not available'
+        })
+        return
+
+    # 명령 실행
+    try:
+        if direction not in MOTOR_COMMAND_MAP:
+            MOTOR_COMMANDS.labels('unknown', 'rejected').inc()
+            emit('motor_feedback', {
+                'success': False,
+                'direction': direction,
+                'error': f'Direction "{direction}" not implemented'
+            })
+            return
+
+        ctx.control.call(MOTOR_COMMAND_MAP[direction], ctx.hardware.motor(), speed)
+        trace.mark_gpio_return()
+        MOTOR_COMMANDS.labels(direction, 'ok').inc()
+
+        feedback = {
+            'success': True,
+            'direction': direction,
+            'speed': speed,
+            'trace': ctx.latency.finish(trace)
+        }
+        emit('motor_feedback', feedback)
+
+        # 다른 클라이언트의 조작을 지켜보는 구독자가 있을 때만 전달
+        if ctx.topics.count('motor'):
+            ctx.socketio.emit('motor_feedback', feedback, to=topic_room('motor'), skip_sid=request.sid)
+
+        ctx.logger.info("✅ Motor command executed: %s at %s%%", direction, speed)
+
+    except Exception as e:
+        MOTOR_COMMANDS.labels(direction, 'error').inc()
+        emit('motor_feedback', {
+            'success': False,
+            'direction': direction,
+            'error': str(e)
+        })
+        ctx.logger.error(f"❌ Motor control error: {e}")
+
+
+def stop_motor(ctx: KitContext, sid: str = None):
+    """안전을 위해 로봇 정지 (로봇이 아직 생성되지 않았으면 건너뜀)"""
+    if not ctx.hardware.initialized or not ctx.hardware.available('motor'):
+        return
+    try:
+        ctx.control.call(ctx.hardware.motor().stop)
+        ctx.logger.info("🛑 Robot stopped due to client disconnect")
+    except Exception as e:
+        ctx.logger.error(f"❌ Error stopping robot: {e}")
+
+
+def init_app(app, socketio, ctx: KitContext):
+    # 제어 지연 시간 추적 (클라이언트 emit → GPIO → 피드백)
+    ctx.latency = LatencyTracker(window=app.config['LATENCY_WINDOW'])
+    ctx.disconnect_hooks.append(lambda sid: stop_motor(ctx, sid))
+    ctx.topics.add_topic('motor')
+
+    socketio.on_event('motor_control', handle_motor_control)
+    socketio.on_event('latency_sync', handle_latency_sync)
+    socketio.on_event('latency_report', handle_latency_report)
+    app.register_blueprint(bp)
@@ -0,0 +1,233 @@
+"""
+시스템 블루프린트
+
+- /api/status, /api/system_info, /api/dashboard, /api/governor, /api/topics
+- Socket.IO 연결 / 해제, 토픽 구독(subscribe / unsubscribe)
+- system 토픽: 구독자가 있을 때만 시스템 정보를 샘플링해 대시보드 델타 전송
+"""
+
+import time
+
+from flask import Blueprint, jsonify, request
+from flask_socketio import emit, join_room, leave_room
+
+from ..context import KitContext, get_context
+from ..delta import VersionedState
+from ..snapshot import SnapshotCache, snapshot_response
+from ..topics import topic_room
+
+
+bp = Blueprint('system', __name__)
+
+
+def get_info_data(ctx: KitContext, speed: int = None) -> dict:
+    from ..models import Info  # pydantic은 첫 상태 조회 시 로드
+
+    try:
+        status = ctx.hardware.status()
+    except Exception:
+        return Info().model_dump()
+
+    camera = ctx.hardware.camera() if status['camera_status'] else None
+    return Info(
+        connected=True,
+        running=True,
+        motor_status=status['motor_status'],
+        camera_status=status['camera_status'],
+        ultrasonic_status=status['ultrasonic_status'],
+        camera_fps=int(camera.get_fps()) if camera else 0,
+        current_resolution=camera.get_current_resolution() if camera else 'N/A',
+        speed=speed or ctx.config['DEFAULT_SPEED'],
+        direction='stop'
+    ).model_dump()
+
+
+def status_snapshot_key(ctx: KitContext):
+    """상태 스냅샷 캐시 키 - 하위 상태가 바뀔 때만 Info 모델을 다시 빌드"""
+    status = ctx.hardware.status()
+    if not status['camera_status']:
+        return status, 0.0, 'N/A'
+    camera = ctx.hardware.camera()
+    return status, round(camera.get_fps(), 1), camera.get_current_resolution()
+
+
+def build_system_info(ctx: KitContext) -> dict:
+    """시스템 정보 (Findee get_system_info 키) + Findee 상태 정보"""
+    system_info = ctx.sampler.get()
+    status, camera_fps, current_resolution = status_snapshot_key(ctx)
+    hostname = ctx.hardware.get_hostname()
+
+    system_info.update(status)
+    system_info.update({
+        'hostname': hostname,
+        'ip_address': hostname if hostname and hostname != 'localhost' else '--',
+        'camera_fps': camera_fps,
+        'current_resolution': current_resolution
+    })
+    return system_info
+
+
+def broadcast_dashboard_data(ctx: KitContext, system_info: dict):
+    """system 토픽 구독자에게 대시보드 변경분 실시간 전송 (샘플러 리스너)"""
+    if not ctx.topics.count('system'):
+        return
+
+    try:
+        delta = ctx.dashboard_state.update({
+            'system_info': system_info,
+            'robot_status': get_info_data(ctx)
+        })
+        # 변경된 필드가 있을 때만 구독자에게 전송
+        if delta:
+            delta['timestamp'] = time.time()
+            ctx.emitter.emit('dashboard_delta', delta, to=topic_room('system'))
+
+    except Exception as e:
+        ctx.logger.error(f"Dashboard broadcast error: {e}")
+
+
+#-REST API-#
+@bp.route('/api/status')
+def api_status():
+    """상태 확인 API"""
+    return snapshot_response(get_context().status_snapshot)
+
+
+@bp.route('/api/system_info')
+def api_system_info():
+    """시스템 정보 API"""
+    try:
+        return snapshot_response(get_context().system_info_snapshot)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@bp.route('/api/dashboard')
+def api_dashboard():
+    """통합 대시보드 정보 - 시스템 정보 + 로봇 상태"""
+    ctx = get_context()
+    try:
+        system_info = ctx.sampler.get()
+    except Exception as e:
+        system_info = {'error': str(e)}
+
+    return jsonify({
+        'system_info': system_info,
+        'robot_status': get_info_data(ctx)
+    })
+
+
+@bp.route('/api/governor')
+def api_governor():
+    """부하 조절 거버너 상태 API"""
+    return jsonify(get_context().governor.status())
+
+
+@bp.route('/api/topics')
+def api_topics():
+    """토픽별 구독자 수 API"""
+    return jsonify(get_context().topics.counts())
+
+
+@bp.route('/api/logs')
+def api_logs():
+    """최근 로그 API - ?since=<seq>&level=WARNING&limit=100"""
+    try:
+        return jsonify(get_context().logs.query(
+            since=request.args.get('since', 0, type=int),
+            level=request.args.get('level'),
+            limit=request.args.get('limit', 100, type=int)
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+#-Socket.IO-#
+def handle_connect():
+    ctx = get_context()
+    ctx.ensure_started()
+    ctx.logger.info("🔌 Client connected: %s", request.sid)
+
+    emit('connection_status', {
+        'connected': True,
+        'message': f"Connected to {ctx.config['SERVER_TITLE']} server",
+        'robot_status': ctx.hardware.initialized
+    })
+    emit('robot_status', get_info_data(ctx))
+
+
+def _requested_topics(data) -> list:
+    topics = (data or {}).get('topics', [])
+    return [topics] if isinstance(topics, str) else list(topics)
+
+
+def handle_subscribe(data):
+    """토픽 구독 - {'topics': ['system', 'ultrasonic', ...]}, ack로 구독 결과 반환"""
+    ctx = get_context()
+    subscribed, unknown = [], []
+    for topic in _requested_topics(data):
+        if topic not in ctx.topics.topics:
+            unknown.append(topic)
+            continue
+        join_room(topic_room(topic))
+        ctx.topics.subscribe(topic, request.sid)
+        subscribed.append(topic)
+
+        if topic == 'system':
+            # 구독 직후 전체 스냅샷, 이후 dashboard_delta로 변경분만 전송
+            emit('dashboard_snapshot', ctx.dashboard_state.snapshot())
+
+    return {'subscribed': subscribed, 'unknown': unknown}
+
+
+def handle_unsubscribe(data):
+    """토픽 구독 해제 - {'topics': [...]}"""
+    ctx = get_context()
+    for topic in _requested_topics(data):
+        ctx.topics.unsubscribe(topic, request.sid)
+        leave_room(topic_room(topic))
+    return {'unsubscribed': _requested_topics(data)}
+
+
+def handle_dashboard_resync(data=None):
+    """델타 버전 불일치 시 클라이언트의 전체 스냅샷 재요청"""
+    emit('dashboard_snapshot', get_context().dashboard_state.snapshot())
+
+
+def handle_disconnect():
+    ctx = get_context()
+    ctx.logger.info("🔌 Client disconnected: %s", request.sid)
+
+    # 마지막 구독자가 빠진 토픽은 생산자 중지
+    ctx.topics.unsubscribe_all(request.sid)
+
+    for hook in ctx.disconnect_hooks:
+        hook(request.sid)
+
+
+def init_app(app, socketio, ctx: KitContext):
+    # 사전 직렬화된 상태 스냅샷 (ETag / 304 지원)
+    ctx.status_snapshot = SnapshotCache(
+        lambda: status_snapshot_key(ctx),
+        lambda: get_info_data(ctx)
+    )
+    ctx.system_info_snapshot = SnapshotCache(
+        lambda: (ctx.sampler.refresh(),) + status_snapshot_key(ctx),
+        lambda: build_system_info(ctx)
+    )
+
+    # 대시보드 상태 (변경된 필드만 델타로 전송)
+    ctx.dashboard_state = VersionedState()
+    ctx.sampler.add_listener(lambda system_info: broadcast_dashboard_data(ctx, system_info))
+    ctx.topics.add_topic(
+        'system',
+        start=lambda: ctx.sampler.subscribe('system'),
+        stop=lambda: ctx.sampler.unsubscribe('system')
+    )
+
+    socketio.on_event('connect', handle_connect)
+    socketio.on_event('subscribe', handle_subscribe)
+    socketio.on_event('unsubscribe', handle_unsubscribe)
+    socketio.on_event('dashboard_resync', handle_dashboard_resync)
+    socketio.on_event('disconnect', handle_disconnect)
+    app.register_blueprint(bp)
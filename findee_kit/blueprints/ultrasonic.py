@@ -0,0 +1,350 @@
+"""
+초음파 센서 블루프린트
+
+- /api/ultrasonic/{start,stop,clear,data,data/all,latest,config,status}
+- 측정값은 최근 N개를 보관하고 ultrasonic 토픽 구독자에게 ultrasonic_data 이벤트로도 전송
+- 측정 루프는 측정이 시작된 상태에서 구독자(Socket.IO 또는 최근 REST 조회)가 있을 때만 동작
+- 센서를 사용할 수 없으면 시뮬레이션 값으로 동작
+"""
+
+import random
+import threading
+from collections import deque
+from concurrent.futures import Future, wait
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+from flask import Blueprint, jsonify, request
+
+from ..context import KitContext, get_context
+from ..metrics import SENSOR_LOOP_JITTER_SECONDS, PeriodMonitor
+from ..pools import PoolRejected
+from ..topics import topic_room
+
+
+bp = Blueprint('ultrasonic', __name__, url_prefix='/api/ultrasonic')
+
+
+@dataclass
+class SensorReading:
+    """센서 읽기 데이터 클래스"""
+    distance: float
+    timestamp: str
+    status: str
+
+
+class UltrasonicMeasurement:
+    """초음파 센서 측정 루프와 최근 측정값 보관"""
+
+    def __init__(self, ctx: KitContext):
+        config = ctx.config
+        self.ctx = ctx
+        self.min_interval = config['ULTRASONIC_MIN_INTERVAL']
+        self.config = {
+            'interval': config['ULTRASONIC_INTERVAL'],
+            'close_threshold': config['ULTRASONIC_CLOSE_THRESHOLD'],
+            'far_threshold': config['ULTRASONIC_FAR_THRESHOLD']
+        }
+
+        self._readings = deque(maxlen=config['ULTRASONIC_MAX_DATA_POINTS'])
+        self._lock = threading.Lock()
+        self.enabled = False  # start / stop API로 지정한 측정 상태
+        self._future: Optional[Future] = None  # ctx.jobs 풀에서 실행 중인 측정 루프
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self.enabled
+
+    @property
+    def is_active(self) -> bool:
+        """측정 루프가 실제로 동작 중인지 (구독자가 없으면 측정이 시작된 상태여도 쉼)"""
+        return self._future is not None and not self._future.done() and not self._stop_event.is_set()
+
+    @property
+    def sensor_mode(self) -> str:
+        return 'hardware' if self.ctx.hardware.available('ultrasonic') else 'simulation'
+
+    def update_config(self, data: dict) -> dict:
+        """설정 변경 - 측정 루프는 매 주기마다 간격을 다시 읽으므로 재시작하지 않음"""
+        if 'interval' in data:
+            self.config['interval'] = max(self.min_interval, float(data['interval']))
+        if 'close_threshold' in data:
+            self.config['close_threshold'] = float(data['close_threshold'])
+        if 'far_threshold' in data:
+            self.config['far_threshold'] = float(data['far_threshold'])
+        return self.config
+
+    def determine_status(self, distance: float) -> str:
+        """거리에 따른 상태 결정"""
+        if distance < self.config['close_threshold']:
+            return 'close'
+        elif distance > self.config['far_threshold']:
+            return 'far'
+        else:
+            return 'normal'
+
+    def _get_distance(self) -> Optional[float]:
+        if self.ctx.hardware.available('ultrasonic'):
+            try:
+                return self.ctx.executor.call(self.ctx.hardware.ultrasonic().get_distance)
+            except Exception as e:
+                self.ctx.logger.error(f"❌ Ultrasonic sensor error: {e}")
+                return None
+        # 시뮬레이션 모드
+        return round(random.uniform(5.0, 200.0), 1)
+
+    def _loop(self, stop_event: threading.Event):
+        self.ctx.logger.info("📏 초음파 센서 측정 루프 시작")
+        period_monitor = PeriodMonitor(SENSOR_LOOP_JITTER_SECONDS)
+
+        while not stop_event.is_set():
+            # 마지막 구독자가 빠지면(REST 임대 만료 포함) 토픽 stop 콜백이 stop_event를 설정
+            watchers = self.ctx.topics.count('ultrasonic', leases=False)
+            if stop_event.is_set():
+                break
+
+            interval = self.config['interval']
+            period_monitor.tick(interval)
+            try:
+                distance = self._get_distance()
+                if distance is not None:
+                    reading = SensorReading(
+                        distance=distance,
+                        timestamp=datetime.now().strftime('%H:%M:%S'),
+                        status=self.determine_status(distance)
+                    )
+                    with self._lock:
+                        self._readings.append(reading)
+
+                    # Socket.IO 구독자가 있을 때만 실시간 데이터 전송 (REST 조회만 있으면 보관만)
+                    if watchers:
+                        self.ctx.emitter.emit('ultrasonic_data', asdict(reading), to=topic_room('ultrasonic'))
+
+                stop_event.wait(interval)
+
+            except Exception as e:
+                self.ctx.logger.error(f"❌ 측정 루프 중 오류: {e}")
+                stop_event.wait(1.0)  # 오류 시 1초 대기
+
+        self.ctx.logger.info("📏 초음파 센서 측정 루프 종료")
+
+    def resume(self) -> bool:
+        """측정이 시작된 상태이고 구독자가 있으면 측정 루프 실행 (ultrasonic 토픽 start 콜백)"""
+        if not self.enabled or self.is_active or not self.ctx.topics.count('ultrasonic'):
+            return True
+
+        stop_event = threading.Event()
+        try:
+            self._future = self.ctx.jobs.submit(self._loop, stop_event)
+        except PoolRejected as e:
+            self.ctx.logger.warning(f"⚠️ 초음파 센서 측정을 시작할 수 없습니다: {e}")
+            return False
+        self._stop_event = stop_event
+        self.ctx.govern('ultrasonic', True)
+        return True
+
+    def pause(self) -> None:
+        """측정 루프 중지 - 측정 상태는 유지 (ultrasonic 토픽 stop 콜백)"""
+        self._stop_event.set()
+        self.ctx.govern('ultrasonic', False)
+
+    def start(self) -> bool:
+        """측정 시작 (이미 측정 중이면 그대로 유지)"""
+        if self.enabled:
+            return True
+
+        self.enabled = True
+        if not self.resume():
+            self.enabled = False
+            return False
+        self.ctx.logger.info("✅ 초음파 센서 측정이 시작되었습니다.")
+        return True
+
+    def stop(self) -> bool:
+        """측정 중지"""
+        if not self.enabled:
+            return True
+
+        self.enabled = False
+        self.pause()
+        if self._future is not None:
+            wait([self._future], timeout=2)
+        self.ctx.logger.info("🛑 초음파 센서 측정이 중지되었습니다.")
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._readings.clear()
+        self.ctx.logger.info("🗑️ 센서 데이터가 초기화되었습니다.")
+
+    def latest(self) -> Optional[dict]:
+        with self._lock:
+            return asdict(self._readings[-1]) if self._readings else None
+
+    def all(self) -> list:
+        with self._lock:
+            return [asdict(reading) for reading in self._readings]
+
+    def __len__(self) -> int:
+        return len(self._readings)
+
+
+def _lease(ctx: KitContext) -> None:
+    """REST로 측정값을 조회하는 클라이언트를 ULTRASONIC_HTTP_LEASE초 동안 구독자로 취급"""
+    ctx.topics.subscribe('ultrasonic', 'http', ttl=ctx.config['ULTRASONIC_HTTP_LEASE'])
+
+
+def _error_response(message: str, e: Exception):
+    get_context().logger.error(f"❌ {message}: {e}")
+    return jsonify({
+        'success': False,
+        'message': f'오류가 발생했습니다: {str(e)}'
+    }), 500
+
+
+@bp.route('/start', methods=['POST'])
+def api_start_measurement():
+    """측정 시작 API"""
+    ctx = get_context()
+    measurement = ctx.ultrasonic
+    try:
+        _lease(ctx)
+        success = measurement.start()
+        return jsonify({
+            'success': success,
+            'message': '측정이 시작되었습니다.' if success else '측정 시작에 실패했습니다.',
+            'is_running': measurement.is_running
+        })
+    except Exception as e:
+        return _error_response('측정 시작 중 오류', e)
+
+
+@bp.route('/stop', methods=['POST'])
+def api_stop_measurement():
+    """측정 중지 API"""
+    measurement = get_context().ultrasonic
+    try:
+        success = measurement.stop()
+        return jsonify({
+            'success': success,
+            'message': '측정이 중지되었습니다.' if success else '측정 중지에 실패했습니다.',
+            'is_running': measurement.is_running
+        })
+    except Exception as e:
+        return _error_response('측정 중지 중 오류', e)
+
+
+@bp.route('/clear', methods=['POST'])
+def api_clear_data():
+    """데이터 초기화 API"""
+    try:
+        get_context().ultrasonic.clear()
+        return jsonify({
+            'success': True,
+            'message': '데이터가 초기화되었습니다.',
+            'data_count': 0
+        })
+    except Exception as e:
+        return _error_response('데이터 초기화 중 오류', e)
+
+
+@bp.route('/data')
+def api_get_data():
+    """실시간 데이터 조회 API - 최신 데이터만 전송"""
+    ctx = get_context()
+    _lease(ctx)
+    measurement = ctx.ultrasonic
+    return jsonify({
+        'success': True,
+        'data': measurement.latest(),  # 최신 1개만
+        'count': len(measurement),
+        'is_running': measurement.is_running,
+        'config': measurement.config
+    })
+
+
+@bp.route('/data/all')
+def api_get_all_data():
+    """전체 데이터 조회 API - 초기 로드 시에만 사용"""
+    ctx = get_context()
+    _lease(ctx)
+    measurement = ctx.ultrasonic
+    data = measurement.all()
+    return jsonify({
+        'success': True,
+        'data': data,
+        'count': len(data),
+        'is_running': measurement.is_running,
+        'config': measurement.config
+    })
+
+
+@bp.route('/latest')
+def api_get_latest():
+    """최신 측정값 조회 API"""
+    ctx = get_context()
+    _lease(ctx)
+    measurement = ctx.ultrasonic
+    latest = measurement.latest()
+    if latest:
+        return jsonify({'success': True, 'data': latest, 'is_running': measurement.is_running})
+    return jsonify({
+        'success': False,
+        'message': '측정 데이터가 없습니다.',
+        'is_running': measurement.is_running
+    })
+
+
+@bp.route('/config', methods=['GET', 'POST'])
+def api_handle_config():
+    """설정 조회/변경 API"""
+    measurement = get_context().ultrasonic
+    if request.method == 'GET':
+        return jsonify({'success': True, 'config': measurement.config})
+
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({
+                'success': False,
+                'message': '요청 데이터가 없습니다.'
+            }), 400
+
+        return jsonify({
+            'success': True,
+            'message': '설정이 업데이트되었습니다.',
+            'config': measurement.update_config(data)
+        })
+    except Exception as e:
+        return _error_response('설정 변경 중 오류', e)
+
+
+@bp.route('/status')
+def api_get_status():
+    """센서 상태 조회 API"""
+    ctx = get_context()
+    measurement = ctx.ultrasonic
+    try:
+        return jsonify({
+            'success': True,
+            'system': {
+                'is_running': measurement.is_running,
+                'is_active': measurement.is_active,
+                'subscribers': ctx.topics.count('ultrasonic'),
+                'sensor_mode': measurement.sensor_mode,
+                'data_count': len(measurement),
+                'findee_status': ctx.hardware.status()
+            },
+            'config': measurement.config
+        })
+    except Exception as e:
+        return _error_response('상태 조회 중 오류', e)
+
+
+def init_app(app, socketio, ctx: KitContext):
+    ctx.ultrasonic = UltrasonicMeasurement(ctx)
+    ctx.topics.add_topic('ultrasonic', start=ctx.ultrasonic.resume, stop=ctx.ultrasonic.pause)
+    ctx.shutdown_hooks.append(ctx.ultrasonic.stop)
+    app.register_blueprint(bp)
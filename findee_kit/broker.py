@@ -0,0 +1,245 @@
+"""
+사용자 코드용 하드웨어 브로커
+
+WebEditor에서 실행되는 사용자 코드가 각자 `Findee()`를 만들면 서버 프로세스와 GPIO / 카메라를 두고 다투고,
+실행마다 하드웨어를 다시 초기화한다. HardwareBroker는 서버의 RobotProvider(Findee 하나)를
+AF_UNIX 소켓으로 열어 두고, 사용자 코드 프로세스의 findee.Findee는 프록시(findee_kit/robot_proxy.py)로 바뀐다.
+- 연결 1개 = 'broker' 풀 워커 1개 (max_clients개까지, 넘으면 오류 응답 후 연결 종료)
+- 호출 1건 = 요청 / 응답 메시지 1개씩 (JSON), 하드웨어 호출은 앱의 실행기(BlockingExecutor)에서 실행
+- 허용된 메서드만 호출 가능 (motor / ultrasonic / camera 조회, 상태 조회)
+- 카메라 프레임은 연결별 공유 메모리(memfd)에 쓰고 크기 / dtype만 응답 (피클 복사 없음)
+- 연결이 끊기면(실행 종료 / 중지 / 강제 종료) 그 연결이 움직인 모터는 정지, 카메라 시청자에서 제외
+"""
+
+import logging
+import mmap
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from . import robot_proxy
+from .metrics import REGISTRY
+from .pools import REJECT, PoolRejected, WorkerPool
+
+
+logger = logging.getLogger(__name__)
+
+BROKER_CALLS = REGISTRY.counter('findee_broker_calls', '브로커를 통한 하드웨어 호출 수', ('method',))
+BROKER_CALL_SECONDS = REGISTRY.histogram('findee_broker_call_seconds', '브로커 호출 처리 시간', ('method',))
+BROKER_CLIENTS = REGISTRY.gauge('findee_broker_clients', '브로커에 연결된 사용자 코드 수')
+
+# 사용자 코드가 부를 수 있는 메서드 (서브시스템, 메서드 이름)
+METHODS = {
+    'motor.move_forward', 'motor.move_backward', 'motor.turn_left', 'motor.turn_right',
+    'motor.curve_left', 'motor.curve_right', 'motor.stop',
+    'ultrasonic.get_distance',
+    'camera.get_frame', 'camera.get_fps', 'camera.get_current_resolution', 'camera.get_available_resolutions',
+    'robot.get_status', 'robot.get_system_info', 'robot.get_hostname',
+}
+FIRST_FRAME_TIMEOUT = 2.0  # 캡처를 시작한 뒤 첫 프레임을 기다리는 최대 시간 (초)
+
+
+def _call_directly(func, *args):
+    return func(*args)
+
+
+class _Client:
+    """연결 1개의 상태 - 정리할 자원과 프레임 공유 메모리"""
+
+    def __init__(self, conn: socket.socket):
+        self.conn = conn
+        self.moved = False
+        self.camera = False
+        self.frame_fd: Optional[int] = None
+        self.frame_buffer: Optional[mmap.mmap] = None
+
+    def frame_memory(self, size: int) -> Optional[int]:
+        """size바이트 이상인 공유 메모리 준비 - 새로 만들었으면 클라이언트에 보낼 fd"""
+        if self.frame_buffer is not None and len(self.frame_buffer) >= size:
+            return None
+        self.close_frame_memory()
+        if hasattr(os, 'memfd_create'):
+            fd = os.memfd_create('findee-frame', os.MFD_CLOEXEC)
+        else:
+            with tempfile.TemporaryFile() as file:
+                fd = os.dup(file.fileno())
+        os.ftruncate(fd, size)
+        self.frame_fd = fd
+        self.frame_buffer = mmap.mmap(fd, size)
+        return fd
+
+    def close_frame_memory(self) -> None:
+        if self.frame_buffer is not None:
+            self.frame_buffer.close()
+            os.close(self.frame_fd)
+            self.frame_buffer = self.frame_fd = None
+
+
+class HardwareBroker:
+    """RobotProvider를 사용자 코드 프로세스에 제공하는 로컬 IPC 서버"""
+
+    def __init__(self, provider, logger: logging.Logger = None, executor=None, control=None,
+                 max_clients: int = 8):
+        """
+        Args:
+            provider: 하드웨어 제공자 (findee_kit.hardware.RobotProvider - 비활성화된 서브시스템은 호출 거부)
+            executor: 하드웨어 호출 실행기 (BlockingExecutor, None이면 연결 스레드에서 직접 호출)
+            control: 모터 명령 / 정지 실행기 (None이면 executor)
+            max_clients: 동시에 연결할 수 있는 사용자 코드 수
+        """
+        self.provider = provider
+        self.logger = logger or logging.getLogger(__name__)
+        self.supported = hasattr(socket, 'AF_UNIX') and hasattr(socket, 'send_fds')
+        self._call_hardware = executor.call if executor is not None else _call_directly
+        self._call_control = control.call if control is not None else self._call_hardware
+        self.max_clients = max_clients
+        self._pool: Optional[WorkerPool] = None
+        self._lock = threading.Lock()
+        self._server: Optional[socket.socket] = None
+        self._dir: Optional[str] = None
+        self._clients = set()
+
+    @property
+    def path(self) -> Optional[str]:
+        return os.path.join(self._dir, 'broker.sock') if self._dir else None
+
+    def start(self) -> Optional[str]:
+        """브로커 시작 (이미 시작했으면 그대로) - 소켓 경로 반환, 쓸 수 없는 환경(Windows)이면 None"""
+        if not self.supported:
+            return None
+        with self._lock:
+            if self._server is None:
+                self._dir = tempfile.mkdtemp(prefix='findee-broker-')  # 0700: 같은 사용자만 접속 가능
+                self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._server.bind(self.path)
+                self._server.listen(16)
+                self._pool = WorkerPool('broker', self.max_clients, policy=REJECT)
+                threading.Thread(target=self._accept, args=(self._server,), name='broker-accept',
+                                 daemon=True).start()
+                self.logger.info(f"🔌 Hardware broker listening on {self.path}")
+            return self.path
+
+    def close(self) -> None:
+        with self._lock:
+            server, self._server = self._server, None
+            clients = list(self._clients)
+        if server is None:
+            return
+        server.close()
+        for client in clients:
+            try:
+                client.conn.shutdown(socket.SHUT_RDWR)  # 연결 워커가 정리
+            except OSError:
+                pass
+        self._pool.shutdown()
+        shutil.rmtree(self._dir, ignore_errors=True)
+        self._dir = None
+
+    #-연결-#
+    def _accept(self, server: socket.socket) -> None:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return  # close()
+            client = _Client(conn)
+            with self._lock:
+                self._clients.add(client)
+            BROKER_CLIENTS.inc()
+            try:
+                self._pool.submit(self._serve, client)
+            except (PoolRejected, RuntimeError) as e:
+                # 사용자 코드의 첫 호출이 이 응답을 받아 BrokerError로 알림
+                self.logger.warning(f"⚠️ Hardware broker connection rejected: {e}")
+                try:
+                    robot_proxy.send_message(conn, {
+                        'error': 'BrokerError',
+                        'message': f'too many programs using the robot (max {self.max_clients})'
+                    })
+                except OSError:
+                    pass
+                self._disconnect(client)
+
+    def _serve(self, client: _Client) -> None:
+        try:
+            while True:
+                message, fds = robot_proxy.recv_message(client.conn)
+                for fd in fds:
+                    os.close(fd)
+                if message is None:
+                    return
+                reply, fd = self._call(client, message.get('method'), message.get('args') or [])
+                robot_proxy.send_message(client.conn, reply, [fd] if fd is not None else ())
+        except (OSError, ValueError):
+            pass  # 사용자 코드 종료 / 강제 종료
+        finally:
+            self._disconnect(client)
+
+    def _disconnect(self, client: _Client) -> None:
+        with self._lock:
+            self._clients.discard(client)
+        BROKER_CLIENTS.dec()
+        client.conn.close()
+        client.close_frame_memory()
+        # 중지되거나 예외로 끝난 코드가 모터를 돌린 채 남기지 않도록
+        if client.moved:
+            try:
+                self._call_control(self.provider.motor().stop)
+            except Exception as e:
+                self.logger.error(f"❌ Error stopping motor after run: {e}")
+        if client.camera:
+            try:
+                self._call_hardware(self.provider.release_camera)
+            except Exception as e:
+                self.logger.error(f"❌ Error releasing camera after run: {e}")
+
+    #-호출-#
+    def _call(self, client: _Client, method, args: list):
+        """(응답, 함께 보낼 fd)"""
+        start = time.perf_counter()
+        fd = None
+        try:
+            if method not in METHODS:
+                raise AttributeError(f"Findee has no method {method!r}")
+            subsystem, name = method.split('.')
+            if subsystem != 'robot' and subsystem not in self.provider.subsystems:
+                raise RuntimeError(f"{subsystem} is disabled on this robot")
+            if method == 'camera.get_frame':
+                result, fd = self._frame(client)
+            elif method == 'robot.get_status':
+                result = self._call_hardware(self.provider.status)  # 비활성화된 서브시스템은 False
+            elif subsystem == 'robot':
+                result = self._call_hardware(getattr(self.provider, name), *args)
+            elif subsystem == 'motor':
+                client.moved = True
+                result = self._call_control(getattr(self.provider.motor(), name), *args)
+            else:
+                result = self._call_hardware(getattr(getattr(self.provider, subsystem)(), name), *args)
+            reply = {'result': result}
+        except Exception as e:
+            reply = {'error': type(e).__name__, 'message': str(e)}
+        label = method if method in METHODS else 'unknown'  # 사용자 코드가 보낸 이름으로 라벨이 늘어나지 않도록
+        BROKER_CALLS.labels(label).inc()
+        BROKER_CALL_SECONDS.labels(label).observe(time.perf_counter() - start)
+        return reply, fd
+
+    def _frame(self, client: _Client):
+        """최신 프레임을 연결별 공유 메모리에 복사 - (shape / dtype, 새 공유 메모리 fd)"""
+        import numpy as np
+
+        if not client.camera:
+            camera = self._call_hardware(self.provider.acquire_camera)
+            client.camera = True
+            deadline = time.monotonic() + FIRST_FRAME_TIMEOUT
+            while self._call_hardware(camera.get_frame) is None and time.monotonic() < deadline:
+                time.sleep(0.02)
+        frame = self._call_hardware(self.provider.camera().get_frame)
+        if frame is None:
+            return None, None
+        fd = client.frame_memory(frame.nbytes)
+        np.ndarray(frame.shape, dtype=frame.dtype, buffer=client.frame_buffer)[...] = frame
+        return {'shape': list(frame.shape), 'dtype': frame.dtype.str}, fd
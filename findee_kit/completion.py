@@ -0,0 +1,316 @@
+"""
+Jedi 기반 코드 자동완성 서비스
+
+WebEditor의 Socket.IO complete / signature / goto 요청을 Jedi로 처리한다.
+- 세션별 jedi.Project와 고정 가상 경로: parso가 이전 파싱 결과를 재사용(diff 파싱)
+- 시작 시 findee / numpy / cv2 분석을 미리 해 둠 (첫 자동완성에서 수 초 걸리는 부분)
+- 디바운스: 세션별로 마지막 요청 후 debounce 초를 기다렸다가 가장 최근 요청만 처리,
+  그 사이 밀려난 요청은 cancelled로 응답 (Jedi 계산은 중간에 멈출 수 없으므로 시작 전에 취소)
+- LRU: 세션 수(max_sessions)와 세션별 결과 캐시(cache_size) 제한, 밀려난 세션의 파싱 캐시도 삭제
+- 처리 시간은 작업별 롤링 p50 / p95 / p99와 /metrics 히스토그램으로 기록
+
+jedi는 선택 의존성: 설치되어 있지 않으면 모든 요청에 error로 응답하고 편집기는 기본 키워드 자동완성을 사용한다.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+
+from .latency import RollingHistogram
+from .metrics import REGISTRY
+from .pools import REJECT, PoolRejected, WorkerPool
+
+
+logger = logging.getLogger(__name__)
+
+COMPLETE = 'complete'
+SIGNATURE = 'signature'
+GOTO = 'goto'
+OPERATIONS = (COMPLETE, SIGNATURE, GOTO)
+
+COMPLETION_SECONDS = REGISTRY.histogram('findee_completion_duration_seconds', 'Jedi 요청 처리 시간', ('op',))
+COMPLETION_REQUESTS = REGISTRY.counter(
+    'findee_completion_requests', 'Jedi 요청 수 (result: ok / cached / cancelled / rejected / error)', ('op', 'result'))
+COMPLETION_SESSIONS = REGISTRY.gauge('findee_completion_sessions', 'Jedi 프로젝트를 가진 세션 수')
+
+
+class _Session:
+    __slots__ = ('project', 'path', 'results', 'pending', 'last_request', 'scheduled')
+
+    def __init__(self, project, path: str):
+        self.project = project
+        self.path = path
+        self.results: OrderedDict = OrderedDict()  # (op, 코드 해시, 줄, 열) → 결과
+        self.pending: Dict[str, dict] = {}  # op → 가장 최근 요청
+        self.last_request = 0.0
+        self.scheduled = False
+
+
+class CompletionService:
+    """세션별 Jedi 프로젝트 + 디바운스 + LRU 캐시"""
+
+    def __init__(self, send: Callable[[str, dict], None], preload: Iterable[str] = ('findee', 'numpy', 'cv2'),
+                 debounce: float = 0.03, max_sessions: int = 8, cache_size: int = 64,
+                 max_items: int = 200, max_typed: int = 50, max_code: int = 200_000, workers: int = 1, max_queue: int = 16):
+        """
+        Args:
+            send: (sid, 응답) → 클라이언트로 전송
+            preload: 시작 시 미리 분석할 모듈
+            debounce: 세션의 마지막 요청 후 처리 시작까지 기다리는 시간 (초)
+            max_sessions: Jedi 프로젝트를 유지할 세션 수 (넘으면 가장 오래 쓰지 않은 세션 삭제)
+            cache_size: 세션별 결과 캐시 크기
+            max_items: 자동완성 결과 최대 개수
+            max_typed: 결과가 이 개수 이하일 때만 항목 종류(type) 계산 (항목마다 추론이 필요해 수 ms씩 걸림)
+            max_code: 처리할 코드의 최대 길이 (글자)
+            workers: Jedi 작업 스레드 수 (Jedi / parso 캐시는 스레드 안전하지 않아 기본 1)
+        """
+        self.send = send
+        self.preload = tuple(preload)
+        self.debounce = debounce
+        self.max_sessions = max_sessions
+        self.cache_size = cache_size
+        self.max_items = max_items
+        self.max_typed = max_typed
+        self.max_code = max_code
+
+        self.pool = WorkerPool('completion', workers, max_queue=max_queue, policy=REJECT)
+        self.latency = {op: RollingHistogram(500) for op in OPERATIONS}
+        self.hits = 0
+        self.misses = 0
+        self._jedi = None
+        self._error: Optional[str] = None
+        self._sessions: 'OrderedDict[str, _Session]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._root = os.path.join(tempfile.gettempdir(), 'findee-editor')
+        self._paths = 0
+        self._warming = False
+
+    #-시작 / 종료-#
+    def warm_up(self) -> None:
+        """Jedi import와 preload 모듈 분석을 작업 스레드에서 시작 (여러 번 호출해도 한 번만)"""
+        if self._warming:
+            return
+        self._warming = True
+        try:
+            self.pool.submit(self._warm_up)
+        except PoolRejected:
+            pass
+
+    def _warm_up(self) -> None:
+        jedi = self._load_jedi()
+        if jedi is None:
+            return
+        start = time.perf_counter()
+        for name in self.preload:
+            try:
+                jedi.Script(f"import {name}\n{name}.", path=os.path.join(self._root, '_warm_up.py')).complete(2, len(name) + 1)
+            except Exception as e:
+                logger.warning(f"⚠️ Jedi preload failed for {name}: {e}")
+        self._forget_parse(os.path.join(self._root, '_warm_up.py'))
+        logger.info(f"🧠 Jedi ready ({', '.join(self.preload)} analyzed in {time.perf_counter() - start:.1f}s)")
+
+    def _load_jedi(self):
+        if self._jedi is None and self._error is None:
+            try:
+                import jedi
+                self._jedi = jedi
+            except ImportError as e:
+                self._error = f"jedi is not installed: {e}"
+        return self._jedi
+
+    def shutdown(self) -> None:
+        self.pool.shutdown()
+
+    #-요청-#
+    def request(self, sid: str, op: str, data: dict) -> None:
+        """요청 접수 (Socket.IO 핸들러에서 호출, 바로 반환) - 결과는 send로 전송"""
+        request_id = data.get('id')
+        if op not in OPERATIONS:
+            self.send(sid, {'id': request_id, 'op': op, 'error': f"Unknown operation: {op}"})
+            return
+        code = data.get('code', '')
+        if not isinstance(code, str) or len(code) > self.max_code:
+            self.send(sid, {'id': request_id, 'op': op, 'error': 'code too large'})
+            return
+
+        with self._lock:
+            session = self._session_locked(sid)
+            superseded = session.pending.get(op)
+            session.pending[op] = data
+            session.last_request = time.monotonic()
+            schedule = not session.scheduled
+            session.scheduled = True
+
+        if superseded is not None:
+            self._reply_cancelled(sid, op, superseded)
+        if schedule:
+            try:
+                self.pool.submit(self._process, sid)
+            except PoolRejected:
+                with self._lock:
+                    session.scheduled = False
+                    pending, session.pending = session.pending, {}
+                for op, data in pending.items():
+                    COMPLETION_REQUESTS.labels(op, 'rejected').inc()
+                    self.send(sid, {'id': data.get('id'), 'op': op, 'error': 'busy'})
+
+    def discard(self, sid: str) -> None:
+        """연결이 끊긴 세션 삭제"""
+        with self._lock:
+            session = self._sessions.pop(sid, None)
+            COMPLETION_SESSIONS.set(len(self._sessions))
+        if session is not None:
+            self._forget_parse(session.path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            sessions = len(self._sessions)
+        lookups = self.hits + self.misses
+        return {
+            'ready': self._jedi is not None,
+            'error': self._error,
+            'sessions': sessions,
+            'cache_hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            'latency_ms': {op: {**hist.percentiles(), 'count': hist.count} for op, hist in self.latency.items()},
+        }
+
+    #-세션-#
+    def _session_locked(self, sid: str) -> _Session:
+        session = self._sessions.get(sid)
+        if session is not None:
+            self._sessions.move_to_end(sid)
+            return session
+
+        while len(self._sessions) >= self.max_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._forget_parse(evicted.path)
+
+        self._paths += 1
+        # 세션마다 고정된 가상 파일 경로 - 같은 경로의 이전 파싱 결과를 parso가 재사용
+        path = os.path.join(self._root, f'session-{self._paths}.py')
+        session = self._sessions[sid] = _Session(None, path)
+        COMPLETION_SESSIONS.set(len(self._sessions))
+        return session
+
+    def _forget_parse(self, path: str) -> None:
+        """파일 경로별 parso 파싱 캐시 삭제 (세션 삭제 시 메모리 반환)"""
+        try:
+            from pathlib import Path
+            from parso.cache import parser_cache
+        except ImportError:
+            return
+        for cache in list(parser_cache.values()):
+            cache.pop(Path(path), None)
+
+    #-처리 (작업 스레드)-#
+    def _process(self, sid: str) -> None:
+        while True:
+            with self._lock:
+                session = self._sessions.get(sid)
+                if session is None:
+                    return
+                wait = session.last_request + self.debounce - time.monotonic()
+                if wait <= 0:
+                    pending, session.pending = session.pending, {}
+                    if not pending:
+                        session.scheduled = False
+                        return
+            if wait > 0:
+                time.sleep(wait)  # 디바운스 - 그 사이 들어온 요청이 이전 요청을 대체
+                continue
+
+            for op, data in pending.items():
+                self.send(sid, self._handle(session, op, data))
+
+    def _handle(self, session: _Session, op: str, data: dict) -> dict:
+        reply = {'id': data.get('id'), 'op': op}
+        jedi = self._load_jedi()
+        if jedi is None:
+            COMPLETION_REQUESTS.labels(op, 'error').inc()
+            reply['error'] = self._error
+            return reply
+
+        code = data.get('code', '')
+        try:
+            line = int(data.get('line', 1))
+            column = int(data.get('column', 0))
+        except (TypeError, ValueError):
+            COMPLETION_REQUESTS.labels(op, 'error').inc()
+            reply['error'] = 'invalid position'
+            return reply
+
+        key = (op, hashlib.sha1(code.encode('utf-8', 'surrogatepass')).hexdigest(), line, column)
+        cached = session.results.get(key)
+        if cached is not None:
+            session.results.move_to_end(key)
+            self.hits += 1
+            COMPLETION_REQUESTS.labels(op, 'cached').inc()
+            reply['result'] = cached
+            return reply
+        self.misses += 1
+
+        start = time.perf_counter()
+        try:
+            if session.project is None:
+                session.project = jedi.Project(self._root, smart_sys_path=False)
+            script = jedi.Script(code, path=session.path, project=session.project)
+            result = getattr(self, f'_{op}')(script, line, column, session)
+        except Exception as e:
+            # 잘못된 위치(편집 중 코드 변경) 등 - 빈 결과 대신 오류로 알림
+            COMPLETION_REQUESTS.labels(op, 'error').inc()
+            reply['error'] = str(e)
+            return reply
+        elapsed = time.perf_counter() - start
+
+        COMPLETION_SECONDS.labels(op).observe(elapsed)
+        self.latency[op].observe(elapsed * 1000)
+        COMPLETION_REQUESTS.labels(op, 'ok').inc()
+        session.results[key] = result
+        while len(session.results) > self.cache_size:
+            session.results.popitem(last=False)
+        reply['result'] = result
+        reply['ms'] = round(elapsed * 1000, 1)
+        return reply
+
+    def _reply_cancelled(self, sid: str, op: str, data: dict) -> None:
+        COMPLETION_REQUESTS.labels(op, 'cancelled').inc()
+        self.send(sid, {'id': data.get('id'), 'op': op, 'cancelled': True})
+
+    #-작업별 결과 형식 (JSON)-#
+    def _complete(self, script, line: int, column: int, session: _Session) -> list:
+        completions = script.complete(line, column)
+        # 'np.'처럼 목록이 길면 종류 없이 바로 응답 - 다음 글자를 입력해 목록이 줄면 종류 포함
+        typed = len(completions) <= self.max_typed
+        return [
+            {'name': c.name, 'type': c.type if typed else None, 'complete': c.complete}
+            for c in completions[:self.max_items]
+        ]
+
+    def _signature(self, script, line: int, column: int, session: _Session) -> list:
+        return [
+            {
+                'label': s.to_string(),
+                'params': [p.to_string() for p in s.params],
+                'index': s.index,
+                'doc': s.docstring(raw=True)[:1000],
+            }
+            for s in script.get_signatures(line, column)
+        ]
+
+    def _goto(self, script, line: int, column: int, session: _Session) -> list:
+        return [
+            {
+                'name': d.name,
+                'module': d.module_name,
+                'line': d.line,
+                'column': d.column,
+                'in_editor': d.module_path is not None and str(d.module_path) == session.path,
+            }
+            for d in script.goto(line, column, follow_imports=True)
+            if d.line is not None
+        ]
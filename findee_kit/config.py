@@ -0,0 +1,95 @@
+"""
+Findee Kit 앱 기본 설정
+
+create_app()에서 app.config로 읽어들이며, 앱별 인자나
+FINDEE_KIT_ 접두사 환경 변수(예: FINDEE_KIT_PORT=5001)로 덮어쓸 수 있다.
+"""
+
+
+class Config:
+    SECRET_KEY = 'Pathfinder-Findee'
+    PORT = 5000
+    DEBUG = True
+    FAKE = False  # True면 하드웨어 대신 findee_kit.fake.FakeFindee 사용
+    SERVER_TITLE = 'Pathfinder'
+
+    # 하드웨어
+    DEFAULT_SPEED = 60
+    CAMERA_RESOLUTION = (640, 480)
+
+    # 서버 동시성 모델 ('threading' 또는 'gevent')
+    # gevent는 FINDEE_KIT_ASYNC_MODE=gevent 환경 변수로 지정해야 import 전에 패치됨
+    ASYNC_MODE = 'threading'
+
+    # 작업 종류별 워커 풀 (findee_kit.pools)
+    HARDWARE_WORKERS = 2  # 블로킹 Findee 호출을 동시에 실행하는 스레드 수
+    HARDWARE_QUEUE = 32  # 대기 가능한 하드웨어 호출 수 (초과 시 호출자가 대기)
+    CONTROL_WORKERS = 1  # 모터 명령 / 정지 전용 스레드 수 (1이면 명령 순서 보장)
+    CONTROL_QUEUE = 16  # 대기 가능한 모터 명령 수 (초과 시 호출자가 대기)
+    CAMERA_WORKERS = 2  # 프레임 획득 / 축소 / JPEG 인코딩 스레드 수 (MJPEG 시청자 전체가 공유)
+    CAMERA_QUEUE = 32  # 대기 가능한 프레임 작업 수 (초과 시 호출자가 대기)
+    JOB_WORKERS = 4  # 백그라운드 작업(센서 측정 루프 등) 스레드 수
+    JOB_QUEUE = 0  # 대기 가능한 백그라운드 작업 수 (초과 시 거부)
+    SOCKETIO_ASYNC_HANDLERS = False  # True면 Socket.IO 이벤트마다 스레드 생성
+
+    # Socket.IO
+    SOCKET_TIMEOUT = 60
+    SOCKET_PING_INTERVAL = 25
+
+    # Socket.IO 묶음 전송 (findee_kit.batching) - 목록에 없는 이벤트는 바로 전송
+    EMIT_BATCHING = True
+    EMIT_BATCH_TICK = 0.03  # 묶음 전송 확인 주기 (초)
+    EMIT_BATCH_EVENTS = {  # 이벤트별 최대 지연 시간 (초)
+        'ultrasonic_data': 0.05,
+        'dashboard_delta': 0.03,
+    }
+
+    # 시스템 정보 / 대시보드 (system 토픽 구독자가 있을 때 dashboard_delta 전송)
+    UPDATE_INTERVAL = 1  # 실시간 업데이트 주기 (초)
+    SYSTEM_INFO_TTL = 1  # 시스템 정보 캐시 유효 시간 (초)
+
+    # 카메라 스트리밍
+    STREAM_QUALITY = 100  # MJPEG JPEG 품질
+    STREAM_FPS = 30  # MJPEG 최대 전송 fps
+    VIDEO_STATS_INTERVAL = 1.0  # video 토픽 video_stats 전송 주기 (초)
+
+    # 공유 메모리 프레임 링 (findee_kit.framering) - 앱 밖의 비전 스크립트 / 녹화기가 FrameReader로 읽음
+    FRAME_RING = None  # 공유 메모리 이름 (예: 'findee-camera'), None이면 내보내지 않음
+    FRAME_RING_SLOTS = 3  # 슬롯 수 (복사 없는 뷰는 슬롯 - 1 프레임 동안 유효)
+    FRAME_RING_FPS = 30  # 새 프레임을 확인하는 최대 빈도
+
+    # 부하 조절 거버너
+    GOVERNOR_CPU_BUDGET = 85  # 부하 조절 시작 CPU 사용률 (%)
+    GOVERNOR_TEMP_BUDGET = 75  # 부하 조절 시작 CPU 온도 (°C)
+    GOVERNOR_CPU_RECOVER = None  # 복구 시작 CPU 사용률 (%), None이면 예산 - 20
+    GOVERNOR_TEMP_RECOVER = None  # 복구 시작 CPU 온도 (°C), None이면 예산 - 7
+
+    # 비동기 로깅 (findee_kit.logs) - 최근 레코드는 /api/logs
+    LOG_QUEUE_SIZE = 1000  # 기록을 기다릴 수 있는 레코드 수 (초과 시 버림)
+    LOG_RING_SIZE = 500  # /api/logs로 보관하는 최근 레코드 수
+    LOG_RATE = 1.0  # 호출 위치별 초당 로그 수 (0이면 제한 없음)
+    LOG_BURST = 5  # 호출 위치별 연속으로 허용하는 로그 수
+    LOG_RATE_LIMIT_LEVEL = 'INFO'  # 이 단계 이하만 속도 제한 (경고 / 오류는 항상 기록)
+
+    # 모터 제어 지연 시간
+    LATENCY_WINDOW = 500  # 단계별 지연 시간 샘플 보관 개수
+
+    # 초음파 센서
+    ULTRASONIC_INTERVAL = 1.0
+    ULTRASONIC_MIN_INTERVAL = 0.1
+    ULTRASONIC_CLOSE_THRESHOLD = 10.0
+    ULTRASONIC_FAR_THRESHOLD = 100.0
+    ULTRASONIC_MAX_DATA_POINTS = 50
+    ULTRASONIC_HTTP_LEASE = 5.0  # REST로 측정값을 읽은 클라이언트를 구독자로 보는 시간 (초)
+
+    # 플릿 게이트웨이 (findee_kit.fleet, 3.Fleet_Gateway)
+    FLEET_ROBOTS = []  # 로봇 목록 - 'http://host:5000' 또는 '이름=http://host:5000'
+    FLEET_TOPICS = ['system', 'ultrasonic']  # 로봇마다 구독할 토픽
+    FLEET_UPDATE_INTERVAL = 0.5  # fleet_delta 전송 주기 (초)
+    FLEET_CONNECT_TIMEOUT = 5.0  # 로봇 접속 대기 시간 (초)
+    FLEET_RECONNECT_DELAY = 1.0  # 재접속 대기 시간 (초, 실패할 때마다 2배)
+    FLEET_RECONNECT_MAX = 30.0  # 재접속 대기 시간 상한 (초)
+    FLEET_THUMBNAIL_FPS = 2  # 로봇에 요청하는 썸네일 fps
+    FLEET_THUMBNAIL_WIDTH = 160  # 썸네일 폭 (px, 로봇에서 축소 후 인코딩)
+    FLEET_THUMBNAIL_QUALITY = 60  # 썸네일 JPEG 품질
+    FLEET_THUMBNAIL_LEASE = 5.0  # REST로 썸네일을 읽은 클라이언트를 구독자로 보는 시간 (초)
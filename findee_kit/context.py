@@ -0,0 +1,168 @@
+"""
+앱 컨텍스트
+
+create_app() 하나가 공유하는 하드웨어 제공자와 백그라운드 서비스 묶음.
+블루프린트와 Socket.IO 핸들러는 get_context()로 접근한다.
+"""
+
+import logging
+import threading
+from typing import Callable, List
+
+from flask import current_app
+
+from .batching import EmitBatcher
+from .executor import BlockingExecutor
+from .governor import GovernorLevel, LoadGovernor
+from .hardware import RobotProvider, get_logger
+from .logs import setup_async_logging
+from .pools import REJECT, WorkerPool
+from .sampler import SystemInfoSampler
+from .stream import StreamSettings
+from .topics import TopicRegistry
+
+
+def log_options(config) -> dict:
+    """app.config의 LOG_* 설정 → setup_async_logging 인자"""
+    return {
+        'queue_size': config['LOG_QUEUE_SIZE'],
+        'ring_size': config['LOG_RING_SIZE'],
+        'rate': config['LOG_RATE'],
+        'burst': config['LOG_BURST'],
+        'rate_limit_level': logging.getLevelName(config['LOG_RATE_LIMIT_LEVEL'].upper()),
+    }
+
+
+class KitContext:
+    """하드웨어와 공유 서비스 - 백그라운드 작업은 첫 요청 시 시작"""
+
+    def __init__(self, app, socketio, subsystems):
+        config = app.config
+        self.config = config
+        self.socketio = socketio
+        self.subsystems = frozenset(subsystems)
+        self.logger = get_logger()
+        self.logs = setup_async_logging(self.logger, **log_options(config))
+
+        # 자주 나가는 이벤트는 틱 단위로 묶어 전송 (모터 피드백 등 지연에 민감한 이벤트는 바로 전송)
+        self.emitter = EmitBatcher(
+            socketio,
+            events=config['EMIT_BATCH_EVENTS'],
+            tick=config['EMIT_BATCH_TICK'],
+            enabled=config['EMIT_BATCHING']
+        )
+
+        # 작업 종류별 제한된 워커 풀 - 하드웨어 I/O(가득 차면 대기), 백그라운드 작업(가득 차면 거부)
+        self.executor = BlockingExecutor(
+            config['ASYNC_MODE'],
+            max_workers=config['HARDWARE_WORKERS'],
+            max_queue=config['HARDWARE_QUEUE']
+        )
+        # 모터 명령은 전용 워커, 프레임 인코딩은 별도 풀 - 스트림이 늘어도 모터 제어가 밀리지 않음
+        self.control = BlockingExecutor(
+            config['ASYNC_MODE'],
+            max_workers=config['CONTROL_WORKERS'],
+            max_queue=config['CONTROL_QUEUE'],
+            name='control'
+        )
+        self.encoder = BlockingExecutor(
+            config['ASYNC_MODE'],
+            max_workers=config['CAMERA_WORKERS'],
+            max_queue=config['CAMERA_QUEUE'],
+            name='camera'
+        )
+        self.jobs = WorkerPool('jobs', config['JOB_WORKERS'], max_queue=config['JOB_QUEUE'], policy=REJECT)
+
+        self.hardware = RobotProvider(
+            self.subsystems,
+            camera_resolution=config['CAMERA_RESOLUTION'],
+            fake=config['FAKE'],
+            logger=self.logger,
+            executor=self.executor
+        )
+
+        # 시스템 정보 공유 샘플러 (대시보드 클라이언트와 부하 조절 거버너가 구독)
+        self.sampler = SystemInfoSampler(
+            lambda: self.executor.call(self.hardware.get_system_info),
+            period=config['UPDATE_INTERVAL'],
+            ttl=config['SYSTEM_INFO_TTL']
+        )
+
+        # 온도 / CPU 기반 부하 조절 (카메라 fps·품질 → 대시보드 브로드캐스트 주기 순)
+        self.stream_settings = StreamSettings(
+            base_quality=config['STREAM_QUALITY'],
+            base_fps=config['STREAM_FPS']
+        )
+        self.governor = LoadGovernor(
+            cpu_budget=config['GOVERNOR_CPU_BUDGET'],
+            temp_budget=config['GOVERNOR_TEMP_BUDGET'],
+            cpu_recover=config['GOVERNOR_CPU_RECOVER'],
+            temp_recover=config['GOVERNOR_TEMP_RECOVER']
+        )
+        self.governor.add_listener(self._apply_load_level)
+        self.sampler.add_listener(self.governor.on_sample)
+        self.hardware.capture_listeners.append(lambda capturing: self.govern('camera', capturing))
+
+        # 토픽 구독 (블루프린트가 토픽과 생산자 start / stop을 등록)
+        self.topics = TopicRegistry()
+
+        # 블루프린트가 init_app에서 채우는 서비스
+        self.status_snapshot = None
+        self.system_info_snapshot = None
+        self.dashboard_state = None
+        self.latency = None
+        self.resolutions_snapshot = None
+        self.ultrasonic = None
+
+        # 블루프린트가 등록하는 훅
+        self.start_hooks: List[Callable[[], None]] = []
+        self.disconnect_hooks: List[Callable[[str], None]] = []
+        self.shutdown_hooks: List[Callable[[], None]] = []
+
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def _apply_load_level(self, level: GovernorLevel) -> None:
+        """거버너 단계 변경 시 스트림 설정과 브로드캐스트 주기 반영"""
+        self.stream_settings.limit(quality=level.stream_quality, fps=level.stream_fps)
+        self.sampler.period = max(self.config['UPDATE_INTERVAL'], level.broadcast_interval or 0)
+
+    def govern(self, producer: str, active: bool) -> None:
+        """조절 대상 생산자(카메라 캡처, 센서 루프)가 도는 동안에만 거버너가 샘플을 받음"""
+        if active:
+            self.sampler.subscribe(('governor', producer))
+        else:
+            self.sampler.unsubscribe(('governor', producer))
+
+    def ensure_started(self) -> None:
+        """첫 요청 시 백그라운드 서비스 시작 (리로더 감시 프로세스에서는 실행되지 않음)"""
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            for hook in self.start_hooks:
+                try:
+                    hook()
+                except Exception as e:
+                    self.logger.error(f"❌ Start hook error: {e}")
+            self._started = True
+
+    def shutdown(self) -> None:
+        for hook in self.shutdown_hooks:
+            try:
+                hook()
+            except Exception as e:
+                self.logger.error(f"❌ Shutdown hook error: {e}")
+        self.sampler.stop()
+        self.jobs.shutdown()
+        self.emitter.stop()
+        self.hardware.cleanup()
+        self.executor.shutdown()
+        self.control.shutdown()
+        self.encoder.shutdown()
+        self.logs.stop()  # 남은 로그 기록
+
+
+def get_context() -> KitContext:
+    return current_app.extensions['findee_kit']
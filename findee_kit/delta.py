@@ -0,0 +1,90 @@
+"""
+버전 관리 상태와 필드 단위 델타 인코딩
+
+대시보드처럼 주기적으로 전체 상태를 보내는 대신
+- 접속 시 전체 스냅샷 (version 포함)
+- 이후 변경된 키만 담은 델타 (version, base 포함)
+를 보내고, 클라이언트는 base가 자신의 version과 다르면 재동기화를 요청한다.
+"""
+
+import copy
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any],
+               path: Tuple[str, ...] = ()) -> Tuple[Dict[str, Any], List[List[str]]]:
+    """중첩 dict 비교 - (변경된 키만 담은 dict, 삭제된 키 경로 목록) 반환"""
+    changes: Dict[str, Any] = {}
+    removed: List[List[str]] = []
+
+    for key, value in new.items():
+        if key not in old:
+            changes[key] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            sub_changes, sub_removed = diff_state(old[key], value, path + (key,))
+            if sub_changes:
+                changes[key] = sub_changes
+            removed.extend(sub_removed)
+        elif old[key] != value:
+            changes[key] = value
+
+    for key in old:
+        if key not in new:
+            removed.append(list(path + (key,)))
+
+    return changes, removed
+
+
+class VersionedState:
+    """변경이 있을 때만 버전이 올라가는 상태 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+        self.version = 0
+
+    def update(self, new_state: Dict[str, Any]) -> Optional[dict]:
+        """새 상태 반영 - 변경이 있으면 델타, 없으면 None 반환"""
+        with self._lock:
+            changes, removed = diff_state(self._state, new_state)
+            if not changes and not removed:
+                return None
+
+            self._state = copy.deepcopy(new_state)
+            self.version += 1
+
+            delta = {
+                'version': self.version,
+                'base': self.version - 1,
+                'changes': changes
+            }
+            if removed:
+                delta['removed'] = removed
+            return delta
+
+    def snapshot(self) -> dict:
+        """전체 상태 스냅샷 (접속 시 / 재동기화 시 사용)"""
+        with self._lock:
+            return {
+                'version': self.version,
+                'state': copy.deepcopy(self._state)
+            }
+
+
+def apply_delta(state: Dict[str, Any], delta: dict) -> None:
+    """diff_state / VersionedState.update 결과를 상태에 반영 (델타를 받는 쪽, 예: 플릿 게이트웨이)"""
+    def merge(target: Dict[str, Any], changes: Dict[str, Any]) -> None:
+        for key, value in changes.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                merge(target[key], value)
+            else:
+                target[key] = value
+
+    merge(state, delta.get('changes', {}))
+    for path in delta.get('removed', []):
+        parent = state
+        for key in path[:-1]:
+            parent = parent.get(key) if isinstance(parent, dict) else None
+        if isinstance(parent, dict):
+            parent.pop(path[-1], None)
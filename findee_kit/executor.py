@@ -0,0 +1,80 @@
+"""
+블로킹 호출 실행기 (하드웨어 I/O 풀)
+
+GPIO / 카메라 / OpenCV / psutil처럼 C 확장 안에서 블로킹되는 Findee 호출을
+크기가 제한된 워커 풀에서 실행한다. 앱은 작업 종류별로 따로 둔다 (findee_kit.context).
+- hardware: 일반 Findee 호출 (초음파 측정, 상태 조회, psutil 등)
+- control: 모터 명령 / 정지 - 다른 호출 뒤에서 기다리지 않도록 전용 워커 사용
+- camera: 프레임 획득, 축소, JPEG 인코딩 (시청자 수만큼 늘어나는 작업)
+- threading 모드: 동시에 하드웨어에 접근하는 스레드 수를 max_workers로 제한
+- gevent 모드: 요청 / 스트림 / 측정 루프가 그린렛이므로, 허브(이벤트 루프)를 멈추지 않도록
+  워커가 실제 OS 스레드 풀(gevent ThreadPool)에서 호출을 실행
+"""
+
+import os
+
+from .pools import BLOCK, WorkerPool
+
+
+ASYNC_MODES = ('threading', 'gevent')
+ASYNC_MODE_ENV = 'FINDEE_KIT_ASYNC_MODE'
+
+
+def async_mode_from_env() -> str:
+    return os.environ.get(ASYNC_MODE_ENV, 'threading').strip().strip('"') or 'threading'
+
+
+def patch_for_async_mode(async_mode: str) -> None:
+    """gevent 모드 - 다른 모듈보다 먼저 표준 라이브러리를 협력형으로 패치"""
+    if async_mode == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+
+
+def is_patched(async_mode: str) -> bool:
+    if async_mode != 'gevent':
+        return True
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+
+class BlockingExecutor(WorkerPool):
+    """하드웨어 호출용 워커 풀 - 대기열이 가득 차면 호출자가 자리가 날 때까지 대기"""
+
+    def __init__(self, async_mode: str = 'threading', max_workers: int = 2,
+                 max_queue: int = 32, policy: str = BLOCK, name: str = 'hardware'):
+        if async_mode not in ASYNC_MODES:
+            raise ValueError(f"Unknown async mode: {async_mode} (expected one of {ASYNC_MODES})")
+        super().__init__(name, max_workers, max_queue=max_queue, policy=policy)
+        self.async_mode = async_mode
+        self._native_pool = None
+
+    @property
+    def cooperative(self) -> bool:
+        return self.async_mode != 'threading'
+
+    def _run(self, fn, args, kwargs):
+        if not self.cooperative or getattr(self._local, 'native', False):
+            return fn(*args, **kwargs)
+
+        # 그린렛 워커 수 = 실제 스레드 수이므로 gevent ThreadPool도 max_workers로 제한
+        if self._native_pool is None:
+            from gevent.threadpool import ThreadPool
+            self._native_pool = ThreadPool(self.max_workers)
+        return self._native_pool.apply(self._call_native, (fn, args, kwargs))
+
+    def _call_native(self, fn, args, kwargs):
+        # 실제 스레드 안에서 다시 call()하면(예: 첫 조회 시 로봇 생성) 같은 풀을 기다리며 교착되므로
+        # 이 스레드도 워커로 표시해 중첩 호출은 그 자리에서 실행
+        self._local.worker = True
+        self._local.native = True
+        return fn(*args, **kwargs)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        super().shutdown(cancel_pending)
+        if self._native_pool is not None:
+            self._native_pool.kill()
+            self._native_pool = None
@@ -0,0 +1,168 @@
+"""
+가짜 Findee 하드웨어
+
+라즈베리파이 없이 앱, 부하 테스트, 벤치마크를 실행하기 위한 Findee 호환 객체.
+FINDEE_KIT_FAKE=true 환경 변수로 앱에서 사용한다.
+"""
+
+import os
+import random
+import socket
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class FakeMotor:
+    """명령을 기록만 하는 모터 (gpio_delay로 GPIO 호출 시간 흉내)"""
+
+    def __init__(self, gpio_delay: float = 0.0):
+        self.gpio_delay = gpio_delay
+        self.last_command: Tuple = ('stop',)
+        self.command_count = 0
+        self._lock = threading.Lock()
+
+    def _command(self, *command) -> None:
+        if self.gpio_delay:
+            time.sleep(self.gpio_delay)
+        with self._lock:
+            self.last_command = command
+            self.command_count += 1
+
+    def move_forward(self, speed, duration=None):
+        self._command('forward', speed, duration)
+
+    def move_backward(self, speed, duration=None):
+        self._command('backward', speed, duration)
+
+    def turn_left(self, speed, duration=None):
+        self._command('turn_left', speed, duration)
+
+    def turn_right(self, speed, duration=None):
+        self._command('turn_right', speed, duration)
+
+    def curve_left(self, speed, angle, duration=None):
+        self._command('curve_left', speed, angle, duration)
+
+    def curve_right(self, speed, angle, duration=None):
+        self._command('curve_right', speed, angle, duration)
+
+    def stop(self):
+        self._command('stop')
+
+
+class FakeUltrasonic:
+    """랜덤 워크 거리값을 돌려주는 초음파 센서 (read_delay로 측정 시간 흉내)"""
+
+    def __init__(self, read_delay: float = 0.0, seed: Optional[int] = None):
+        self.read_delay = read_delay
+        self._rng = random.Random(seed)
+        self._distance = 50.0
+
+    def get_distance(self) -> float:
+        if self.read_delay:
+            time.sleep(self.read_delay)
+        self._distance = min(200.0, max(2.0, self._distance + self._rng.uniform(-3.0, 3.0)))
+        return round(self._distance, 1)
+
+    def start_distance_measurement(self, interval: float = 1.0) -> None:
+        pass
+
+    def stop_distance_measurement(self) -> None:
+        pass
+
+
+class FakeCamera:
+    """fps 주기마다 새 프레임(움직이는 막대)을 만드는 카메라"""
+
+    RESOLUTIONS = ((320, 240), (640, 480), (800, 600), (1280, 720))
+
+    def __init__(self, resolution: Tuple[int, int] = (640, 480), fps: float = 30.0):
+        self.resolution = tuple(resolution)
+        self.fps = fps
+        self._frame = None
+        self._frame_time = 0.0
+        self._frame_index = 0
+        self._lock = threading.Lock()
+        self.capturing = False
+
+    def start_frame_capture(self) -> None:
+        self.capturing = True
+
+    def stop_frame_capture(self) -> None:
+        self.capturing = False
+
+    def get_frame(self):
+        import numpy as np
+
+        now = time.monotonic()
+        with self._lock:
+            # 캡처 중이 아니면 새 프레임을 만들지 않음 (실제 카메라와 같이 마지막 프레임 유지)
+            if self.capturing and (self._frame is None or now - self._frame_time >= 1.0 / self.fps):
+                width, height = self.resolution
+                frame = np.zeros((height, width, 3), dtype=np.uint8)
+                x = (self._frame_index * 8) % width
+                frame[:, x:x + 16] = (0, 200, 255)
+                self._frame = frame
+                self._frame_time = now
+                self._frame_index += 1
+            return self._frame
+
+    def get_fps(self) -> float:
+        return self.fps
+
+    def get_current_resolution(self) -> str:
+        return f"{self.resolution[0]}x{self.resolution[1]}"
+
+    def get_available_resolutions(self) -> list:
+        return [{'value': f"{w}x{h}", 'label': f"{w}x{h}"} for w, h in self.RESOLUTIONS]
+
+    def configure_resolution(self, resolution: Tuple[int, int]) -> None:
+        with self._lock:
+            self.resolution = tuple(resolution)
+            self._frame = None
+
+
+class FakeFindee:
+    """Findee와 같은 인터페이스의 가짜 로봇"""
+
+    def __init__(self, safe_mode: bool = True, camera_resolution: Tuple[int, int] = (640, 480)):
+        self.motor = FakeMotor(gpio_delay=float(os.environ.get('FINDEE_FAKE_GPIO_DELAY', 0)))
+        self.ultrasonic = FakeUltrasonic(read_delay=float(os.environ.get('FINDEE_FAKE_SONIC_DELAY', 0)))
+        self.camera = FakeCamera(camera_resolution)
+
+    def get_status(self) -> dict:
+        return {
+            'motor_status': True,
+            'camera_status': True,
+            'ultrasonic_status': True,
+        }
+
+    def get_system_info(self) -> dict:
+        try:
+            import psutil
+        except ImportError:
+            return {
+                'hostname': self.get_hostname(),
+                'cpu_percent': 0.0,
+                'cpu_temperature': 0.0,
+                'memory_percent': 0.0,
+                'num_cpu_cores': os.cpu_count() or 1,
+                'cpu_cores_percent': [],
+            }
+
+        cores = psutil.cpu_percent(percpu=True)
+        return {
+            'hostname': self.get_hostname(),
+            'cpu_percent': round(sum(cores) / len(cores), 1) if cores else 0.0,
+            'cpu_temperature': 0.0,
+            'memory_percent': psutil.virtual_memory().percent,
+            'num_cpu_cores': len(cores),
+            'cpu_cores_percent': cores,
+        }
+
+    def get_hostname(self) -> str:
+        return socket.gethostname()
+
+    def cleanup(self) -> None:
+        self.motor.stop()
@@ -0,0 +1,553 @@
+"""
+플릿 게이트웨이
+
+여러 대의 통합 앱(2.Integrated_Flask) 로봇을 대시보드 하나로 모은다.
+- 로봇마다 Socket.IO 연결 1개(RobotLink)를 유지하고 system / ultrasonic 토픽을 구독
+  (끊기면 지수 백오프로 재접속)
+- 로봇 요약을 플릿 상태(VersionedState) 하나로 합쳐 FLEET_UPDATE_INTERVAL마다 계산한 델타를
+  fleet 토픽 방에 한 번만 전송 → 시청자가 늘어도 로봇 쪽 부하는 그대로
+- 썸네일: thumbnails 토픽 구독자(또는 최근 REST 조회)가 있을 때만 로봇마다 축소 MJPEG 연결
+  1개(/video_feed?fps=2&width=160)를 열고, 받은 JPEG을 thumbnail 이벤트로 모든 시청자에게 전달
+  (base64 문자열 - 여러 스레드가 바이너리 첨부 패킷을 같은 방에 보내면 패킷 순서가 섞일 수 있음)
+
+    app, socketio = create_gateway(robots=['http://robot-1:5000', 'robot-2=http://10.0.0.12:5000'])
+    run_gateway(app, socketio)
+"""
+
+import base64
+import copy
+import socket
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flask import Flask, Response, current_app, jsonify, render_template, request
+from flask_socketio import SocketIO, emit, join_room, leave_room
+
+from .app import create_base_app
+from .batching import EmitBatcher
+from .context import log_options
+from .delta import VersionedState, apply_delta
+from .hardware import get_logger
+from .logs import setup_async_logging
+from .metrics import REGISTRY
+from .pools import REJECT, PoolRejected, WorkerPool
+from .topics import TopicRegistry, topic_room
+
+
+FLEET_ROBOTS_CONNECTED = REGISTRY.gauge('findee_fleet_robots_connected', '게이트웨이에 연결된 로봇 수')
+FLEET_UPSTREAM_EVENTS = REGISTRY.counter('findee_fleet_upstream_events', '로봇에서 받은 Socket.IO 이벤트 수',
+                                         ('event',))
+FLEET_RECONNECTS = REGISTRY.counter('findee_fleet_reconnects', '로봇 재접속 시도 수', ('robot',))
+FLEET_THUMBNAILS = REGISTRY.counter('findee_fleet_thumbnails', '로봇에서 받은 썸네일 프레임 수')
+
+# 플릿 상태에 넣는 시스템 정보 키 (코어별 사용률 등 큰 값은 제외)
+SYSTEM_FIELDS = ('hostname', 'cpu_percent', 'cpu_temperature', 'memory_percent')
+
+
+def parse_robots(robots) -> List[Tuple[str, str]]:
+    """로봇 목록을 [(이름, URL)]로 변환 - 'http://host:5000', '이름=http://host:5000', 쉼표 구분 문자열"""
+    if isinstance(robots, str):
+        robots = [entry for entry in robots.split(',') if entry.strip()]
+
+    parsed = []
+    for entry in robots:
+        if isinstance(entry, dict):
+            url = entry['url']
+            name = entry.get('name')
+        else:
+            name, _, url = entry.strip().rpartition('=')
+        url = url.rstrip('/')
+        if not name:
+            name = urllib.parse.urlsplit(url).netloc or url
+        parsed.append((name, url))
+
+    names = [name for name, _ in parsed]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate robot names: {duplicates}")
+    return parsed
+
+
+def read_mjpeg(stream) -> Iterator[bytes]:
+    """multipart MJPEG 응답에서 JPEG 추출 (파트마다 Content-Length 필요 - findee_kit.stream 형식)"""
+    while True:
+        line = stream.readline()
+        if not line:
+            return
+        if not line.startswith(b'--'):
+            continue
+
+        length = None
+        while True:
+            header = stream.readline()
+            if not header:
+                return
+            if not header.strip():
+                break
+            name, _, value = header.partition(b':')
+            if name.strip().lower() == b'content-length':
+                length = int(value)
+        if length is None:
+            raise ValueError("MJPEG part without Content-Length")
+
+        data = stream.read(length)
+        if len(data) < length:
+            return
+        yield data
+
+
+class RobotLink:
+    """로봇 1대와의 지속 Socket.IO 연결 - 구독한 토픽의 최신 상태를 보관"""
+
+    def __init__(self, name: str, url: str, topics: Iterable[str], on_change: Callable[[], None],
+                 connect_timeout: float = 5.0, reconnect_delay: float = 1.0, reconnect_max: float = 30.0,
+                 logger=None):
+        import socketio  # python-socketio 클라이언트는 게이트웨이에서만 필요
+
+        self.name = name
+        self.url = url
+        self.topics = list(topics)
+        self.on_change = on_change
+        self.connect_timeout = connect_timeout
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_max = reconnect_max
+        self.logger = logger or get_logger()
+
+        self.connected = False
+        self.error: Optional[str] = None
+        self.reconnects = 0
+        self.robot_status: dict = {}
+        self.dashboard: dict = {}
+        self.dashboard_version: Optional[int] = None
+        self.ultrasonic: Optional[dict] = None
+        self._resync_pending = False
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()  # 이벤트 핸들러(클라이언트 스레드)와 상태 발행 루프 사이
+
+        # 재접속은 run()에서 직접 처리 (첫 접속 실패도 같은 백오프로 재시도)
+        self.sio = socketio.Client(reconnection=False, handle_sigint=False)
+        self._handlers = {
+            'robot_status': self._on_robot_status,
+            'dashboard_snapshot': self._on_dashboard_snapshot,
+            'dashboard_delta': self._on_dashboard_delta,
+            'ultrasonic_data': self._on_ultrasonic_data,
+        }
+        for event in self._handlers:
+            self.sio.on(event, lambda data, event=event: self._dispatch(event, data))
+        self.sio.on('batch', self._on_batch)
+        self.sio.on('connect', self._on_connect)
+        self.sio.on('disconnect', self._on_disconnect)
+
+    def state(self) -> dict:
+        """플릿 상태에 들어가는 로봇 요약"""
+        with self._lock:
+            system_info = self.dashboard.get('system_info') or {}
+            return {
+                'url': self.url,
+                'connected': self.connected,
+                'error': self.error,
+                'reconnects': self.reconnects,
+                'robot_status': copy.deepcopy(self.dashboard.get('robot_status') or self.robot_status),
+                'system': {key: system_info.get(key) for key in SYSTEM_FIELDS},
+                'ultrasonic': self.ultrasonic,
+            }
+
+    #-연결-#
+    def run(self, stop_event: threading.Event) -> None:
+        """접속 → 끊길 때까지 대기 → 백오프 후 재접속 (fleet 풀 워커에서 실행)"""
+        self._stop_event = stop_event
+        delay = self.reconnect_delay
+        while not stop_event.is_set():
+            try:
+                self.sio.connect(self.url, transports=['websocket'], wait_timeout=self.connect_timeout)
+            except Exception as e:
+                self._set_error(str(e) or type(e).__name__)
+            else:
+                delay = self.reconnect_delay
+                self.sio.wait()  # 연결이 끊길 때까지
+
+            if stop_event.wait(delay):
+                break
+            delay = min(delay * 2, self.reconnect_max)
+            self.reconnects += 1
+            FLEET_RECONNECTS.labels(self.name).inc()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        try:
+            self.sio.disconnect()
+        except Exception:
+            pass
+
+    def _set_error(self, error: Optional[str]) -> None:
+        if error != self.error:
+            self.error = error
+            if error:
+                self.logger.warning(f"⚠️ Robot {self.name} unreachable: {error}")
+            self.on_change()
+
+    def _on_connect(self):
+        self.logger.info(f"🔗 Robot connected: {self.name} ({self.url})")
+        self.connected = True
+        self.error = None
+        self._resync_pending = False
+        FLEET_ROBOTS_CONNECTED.inc()
+        self.sio.emit('subscribe', {'topics': self.topics})
+        self.on_change()
+
+    def _on_disconnect(self, *args):
+        if self.connected:
+            self.logger.warning(f"🔌 Robot disconnected: {self.name}")
+            FLEET_ROBOTS_CONNECTED.dec()
+        self.connected = False
+        self.dashboard_version = None  # 재접속 시 구독 응답 스냅샷부터 다시 받음
+        self.on_change()
+
+    #-로봇 이벤트-#
+    def _dispatch(self, event: str, data) -> None:
+        FLEET_UPSTREAM_EVENTS.labels(event).inc()
+        self._handlers[event](data)
+
+    def _on_batch(self, messages):
+        for event, data in messages:
+            if event in self._handlers:
+                self._dispatch(event, data)
+
+    def _on_robot_status(self, data):
+        with self._lock:
+            self.robot_status = data
+        self.on_change()
+
+    def _on_dashboard_snapshot(self, data):
+        with self._lock:
+            # 늦게 도착한 오래된 스냅샷은 무시
+            if self.dashboard_version is not None and data['version'] < self.dashboard_version:
+                return
+            self.dashboard = data.get('state') or {}
+            self.dashboard_version = data['version']
+            self._resync_pending = False
+        self.on_change()
+
+    def _on_dashboard_delta(self, data):
+        with self._lock:
+            resync = data['base'] != self.dashboard_version
+            if not resync:
+                apply_delta(self.dashboard, data)
+                self.dashboard_version = data['version']
+            elif self._resync_pending:
+                return
+            else:
+                self._resync_pending = True
+
+        if resync:
+            # 중간 버전 누락 - 전체 스냅샷 재요청
+            self.sio.emit('dashboard_resync', {'version': self.dashboard_version})
+        else:
+            self.on_change()
+
+    def _on_ultrasonic_data(self, data):
+        with self._lock:
+            self.ultrasonic = data
+        self.on_change()
+
+
+class ThumbnailFeed:
+    """로봇 1대의 썸네일 - 시청자가 있을 때만 축소 MJPEG 연결 1개를 열고 최신 JPEG만 보관"""
+
+    def __init__(self, name: str, url: str, on_frame: Callable[['ThumbnailFeed'], None],
+                 fps: float = 2, width: int = 160, quality: int = 60, reconnect_delay: float = 1.0,
+                 timeout: float = 10.0):
+        query = urllib.parse.urlencode({'fps': fps, 'width': width, 'quality': quality})
+        self.name = name
+        self.feed_url = f'{url}/video_feed?{query}'
+        self.on_frame = on_frame
+        self.reconnect_delay = reconnect_delay
+        self.timeout = timeout
+        self.jpeg: Optional[bytes] = None
+        self.seq = 0
+        self.updated: Optional[float] = None
+
+    def run(self, stop_event: threading.Event) -> None:
+        """stop_event가 설정될 때까지 스트림을 읽음 (연결을 닫으면 로봇도 캡처를 멈춤)"""
+        while not stop_event.is_set():
+            try:
+                with urllib.request.urlopen(self.feed_url, timeout=self.timeout) as response:
+                    for jpeg in read_mjpeg(response):
+                        if stop_event.is_set():
+                            return
+                        self.jpeg = jpeg
+                        self.seq += 1
+                        self.updated = time.time()
+                        FLEET_THUMBNAILS.inc()
+                        self.on_frame(self)
+            except Exception:
+                pass  # 카메라 없음 / 연결 실패 - 잠시 후 재시도
+            stop_event.wait(self.reconnect_delay)
+
+
+class FleetGateway:
+    """로봇 연결, 플릿 상태, 썸네일 팬아웃"""
+
+    def __init__(self, app: Flask, socketio: SocketIO, robots):
+        config = app.config
+        self.config = config
+        self.socketio = socketio
+        self.logger = get_logger()
+        self.logs = setup_async_logging(self.logger, **log_options(config))
+        self.robots = parse_robots(robots)
+        self.interval = config['FLEET_UPDATE_INTERVAL']
+
+        self.emitter = EmitBatcher(
+            socketio,
+            events=config['EMIT_BATCH_EVENTS'],
+            tick=config['EMIT_BATCH_TICK'],
+            enabled=config['EMIT_BATCHING']
+        )
+        self.topics = TopicRegistry()
+        self.state = VersionedState()
+        self._dirty = threading.Event()
+
+        self.links: Dict[str, RobotLink] = {
+            name: RobotLink(
+                name, url, config['FLEET_TOPICS'], self._dirty.set,
+                connect_timeout=config['FLEET_CONNECT_TIMEOUT'],
+                reconnect_delay=config['FLEET_RECONNECT_DELAY'],
+                reconnect_max=config['FLEET_RECONNECT_MAX'],
+                logger=self.logger
+            )
+            for name, url in self.robots
+        }
+        self.thumbnails: Dict[str, ThumbnailFeed] = {
+            name: ThumbnailFeed(
+                name, url, self._on_thumbnail,
+                fps=config['FLEET_THUMBNAIL_FPS'],
+                width=config['FLEET_THUMBNAIL_WIDTH'],
+                quality=config['FLEET_THUMBNAIL_QUALITY'],
+                reconnect_delay=config['FLEET_RECONNECT_DELAY']
+            )
+            for name, url in self.robots
+        }
+
+        # 로봇 연결 + 썸네일 스트림(구독을 빠르게 껐다 켜면 이전 스트림이 끝나기 전까지 2개) + 상태 발행 루프
+        self.pool = WorkerPool('fleet', 3 * len(self.robots) + 1, policy=REJECT)
+        self._stop_event = threading.Event()
+        self._thumbnail_stop: Optional[threading.Event] = None
+
+        self.topics.add_topic('fleet')
+        self.topics.add_topic('thumbnails', start=self._start_thumbnails, stop=self._stop_thumbnails)
+
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    #-수명 주기-#
+    def ensure_started(self) -> None:
+        """첫 요청 시 로봇 연결과 상태 발행 시작 (리로더 감시 프로세스에서는 실행되지 않음)"""
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            for link in self.links.values():
+                self.pool.submit(link.run, self._stop_event)
+            self.pool.submit(self._publish_loop, self._stop_event)
+            self._started = True
+            self.logger.info(f"🚚 Fleet gateway connecting to {len(self.links)} robots")
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        self._stop_thumbnails()
+        for link in self.links.values():
+            link.stop()
+        self.pool.shutdown()
+        self.emitter.stop()
+        self.logs.stop()  # 남은 로그 기록
+
+    #-플릿 상태-#
+    def fleet_state(self) -> dict:
+        robots = {name: link.state() for name, link in self.links.items()}
+        for name, feed in self.thumbnails.items():
+            robots[name]['thumbnail'] = feed.seq
+        return {
+            'robots': robots,
+            'connected': sum(1 for link in self.links.values() if link.connected),
+            'total': len(self.links)
+        }
+
+    def _publish_loop(self, stop_event: threading.Event) -> None:
+        """변경이 있을 때만 플릿 델타 계산 - 구독자가 있으면 fleet 방에 한 번 전송"""
+        while not stop_event.wait(self.interval):
+            if not self._dirty.is_set():
+                continue
+            self._dirty.clear()
+            try:
+                delta = self.state.update(self.fleet_state())
+                if delta and self.topics.count('fleet'):
+                    delta['timestamp'] = time.time()
+                    self.emitter.emit('fleet_delta', delta, to=topic_room('fleet'))
+            except Exception as e:
+                self.logger.error(f"❌ Fleet publish error: {e}")
+
+    #-썸네일-#
+    def _start_thumbnails(self) -> None:
+        stop_event = threading.Event()
+        self._thumbnail_stop = stop_event
+        try:
+            for feed in self.thumbnails.values():
+                self.pool.submit(feed.run, stop_event)
+        except PoolRejected as e:
+            self.logger.warning(f"⚠️ 썸네일 스트림을 시작할 수 없습니다: {e}")
+
+    def _stop_thumbnails(self) -> None:
+        if self._thumbnail_stop is not None:
+            self._thumbnail_stop.set()
+            self._thumbnail_stop = None
+
+    def _on_thumbnail(self, feed: ThumbnailFeed) -> None:
+        self.emitter.emit('thumbnail', {
+            'robot': feed.name,
+            'seq': feed.seq,
+            'jpeg': base64.b64encode(feed.jpeg).decode('ascii')
+        }, to=topic_room('thumbnails'))
+        self._dirty.set()
+
+
+def get_gateway() -> FleetGateway:
+    return current_app.extensions['findee_fleet']
+
+
+#-REST API-#
+def api_robots():
+    """플릿 상태 API - 로봇별 연결 상태 / 시스템 정보 / 센서 값"""
+    return jsonify(get_gateway().fleet_state())
+
+
+def api_thumbnail(name: str):
+    """로봇 최신 썸네일 (JPEG) - 조회하면 FLEET_THUMBNAIL_LEASE초 동안 썸네일 스트림 유지"""
+    gateway = get_gateway()
+    feed = gateway.thumbnails.get(name)
+    if feed is None:
+        return jsonify({'error': f'Unknown robot: {name}'}), 404
+
+    gateway.topics.subscribe('thumbnails', 'http', ttl=gateway.config['FLEET_THUMBNAIL_LEASE'])
+    if feed.jpeg is None:
+        return '', 204
+
+    etag = f'"{name}-{feed.seq}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    response = Response(feed.jpeg, mimetype='image/jpeg')
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def api_topics():
+    """토픽별 구독자 수 API"""
+    return jsonify(get_gateway().topics.counts())
+
+
+def api_logs():
+    """최근 로그 API - ?since=<seq>&level=WARNING&limit=100"""
+    try:
+        return jsonify(get_gateway().logs.query(
+            since=request.args.get('since', 0, type=int),
+            level=request.args.get('level'),
+            limit=request.args.get('limit', 100, type=int)
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+#-Socket.IO-#
+def _requested_topics(data) -> list:
+    topics = (data or {}).get('topics', [])
+    return [topics] if isinstance(topics, str) else list(topics)
+
+
+def handle_subscribe(data):
+    """토픽 구독 - {'topics': ['fleet', 'thumbnails']}, ack로 구독 결과 반환"""
+    gateway = get_gateway()
+    subscribed, unknown = [], []
+    for topic in _requested_topics(data):
+        if topic not in gateway.topics.topics:
+            unknown.append(topic)
+            continue
+        join_room(topic_room(topic))
+        gateway.topics.subscribe(topic, request.sid)
+        subscribed.append(topic)
+
+        if topic == 'fleet':
+            # 구독 직후 전체 스냅샷, 이후 fleet_delta로 변경분만 전송
+            emit('fleet_snapshot', gateway.state.snapshot())
+
+    return {'subscribed': subscribed, 'unknown': unknown}
+
+
+def handle_unsubscribe(data):
+    """토픽 구독 해제 - {'topics': [...]}"""
+    gateway = get_gateway()
+    for topic in _requested_topics(data):
+        gateway.topics.unsubscribe(topic, request.sid)
+        leave_room(topic_room(topic))
+    return {'unsubscribed': _requested_topics(data)}
+
+
+def handle_fleet_resync(data=None):
+    """델타 버전 불일치 시 클라이언트의 전체 스냅샷 재요청"""
+    emit('fleet_snapshot', get_gateway().state.snapshot())
+
+
+def handle_disconnect():
+    gateway = get_gateway()
+    gateway.topics.unsubscribe_all(request.sid)
+    gateway.emitter.discard(request.sid)
+
+
+def create_gateway(robots=None, root_path: str = None, import_name: str = 'findee_kit.fleet',
+                   **config) -> Tuple[Flask, SocketIO]:
+    """
+    Args:
+        robots: 로봇 목록 (없으면 FLEET_ROBOTS 설정 / FINDEE_KIT_FLEET_ROBOTS 환경 변수)
+        root_path: templates / static 폴더가 있는 앱 디렉토리
+        **config: Config 기본값 덮어쓰기
+    """
+    app, socketio = create_base_app(import_name, root_path, **config)
+    gateway = FleetGateway(app, socketio, robots if robots is not None else app.config['FLEET_ROBOTS'])
+    app.extensions['findee_fleet'] = gateway
+    app.before_request(gateway.ensure_started)
+
+    @app.route('/')
+    def index():
+        """플릿 대시보드"""
+        return render_template('index.html')
+
+    app.add_url_rule('/api/robots', view_func=api_robots)
+    app.add_url_rule('/api/robots/<name>/thumbnail.jpg', view_func=api_thumbnail)
+    app.add_url_rule('/api/topics', view_func=api_topics)
+    app.add_url_rule('/api/logs', view_func=api_logs)
+
+    socketio.on_event('connect', gateway.ensure_started)
+    socketio.on_event('subscribe', handle_subscribe)
+    socketio.on_event('unsubscribe', handle_unsubscribe)
+    socketio.on_event('fleet_resync', handle_fleet_resync)
+    socketio.on_event('disconnect', handle_disconnect)
+
+    return app, socketio
+
+
+def run_gateway(app: Flask, socketio: SocketIO) -> None:
+    gateway = app.extensions['findee_fleet']
+    port = app.config['PORT']
+    gateway.logger.info(f"📡 {app.config['SERVER_TITLE']} gateway available at: http://{socket.gethostname()}:{port}"
+                        f" ({len(gateway.robots)} robots, {app.config['ASYNC_MODE']})")
+    gateway.logger.info("=" * 60)
+
+    try:
+        socketio.run(app, host='0.0.0.0', port=port, debug=app.config['DEBUG'], allow_unsafe_werkzeug=True)
+    except KeyboardInterrupt:
+        gateway.logger.info("\n🛑 Server shutdown requested...")
+    finally:
+        gateway.shutdown()
@@ -0,0 +1,413 @@
+"""
+사용자 코드 실행용 포크 서버 (템플릿 인터프리터)
+
+findee / numpy / OpenCV를 미리 import한 인터프리터 하나를 띄워 두고, 실행 요청마다 fork한 자식에서
+코드를 실행한다. 자식은 매번 새로 만들어지고 실행이 끝나면 종료되므로 실행 간 상태가 섞이지 않으며,
+미리 import한 모듈의 메모리는 copy-on-write로 공유된다.
+
+프로토콜 (AF_UNIX 스트림 소켓, 요청 1건 = 연결 1개)
+- 클라이언트 → 서버: 4바이트 길이 + JSON {'code': ..., 'limits': {...}, 'broker': ...}, SCM_RIGHTS로 stdout / stderr 파이프 쓰기 끝 전달
+- 서버 → 클라이언트: {"pid": ...} 줄, 자식 종료 후 {"returncode": ...} 줄
+'broker'가 있으면 사용자 코드의 findee.Findee는 서버 하드웨어 브로커 프록시(robot_proxy.py)로 바뀐다.
+'kernel'이면 세 번째 파일 디스크립터(제어 소켓)를 함께 받아 코드 없이 커널로 시작한다 (run_kernel 참고).
+'profile'이면 세 번째 파일 디스크립터(파이프)로 프로파일러(profiler.py) 보고를 보낸다.
+
+이 파일은 패키지 밖에서 스크립트로 실행되므로(findee_kit import 시 gevent 패치 등이 따라오지 않도록)
+표준 라이브러리만 사용한다.
+
+사용법:
+    python findee_kit/forkserver.py <socket_path> --preload findee,numpy,cv2
+    python findee_kit/forkserver.py --run < request.json  (포크 서버 없이 요청 1건 실행 / 커널 시작)
+"""
+
+import argparse
+import builtins
+import contextlib
+import gc
+import importlib
+import importlib.util
+import io
+import json
+import linecache
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import time
+import traceback
+import types
+from typing import List, Optional, Tuple
+
+
+CODE_FILENAME = '<editor>'  # 트레이스백에 표시되는 사용자 코드 파일 이름
+REQUEST_TIMEOUT = 5.0  # 요청 본문을 받는 최대 시간 (초)
+CPU_GRACE = 2  # CPU 시간 제한(SIGXCPU) 후 SIGKILL까지의 여유 (초)
+HEADER = struct.Struct('!I')
+
+
+#-클라이언트 쪽 (findee_kit.interpreters에서 사용)-#
+def send_request(sock: socket.socket, request: dict, fds: List[int]) -> None:
+    payload = json.dumps(request).encode('utf-8')
+    socket.send_fds(sock, [HEADER.pack(len(payload))], fds)
+    sock.sendall(payload)
+
+
+#-서버 쪽-#
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError('request truncated')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_request(conn: socket.socket, timeout: Optional[float] = REQUEST_TIMEOUT) -> Tuple[dict, List[int]]:
+    """(요청, [stdout, stderr] 또는 커널이면 [stdout, stderr, 제어 소켓]) - timeout이 None이면 요청이 올 때까지 대기"""
+    conn.settimeout(timeout)
+    header, fds, _, _ = socket.recv_fds(conn, HEADER.size, 3)
+    if not header and not fds:
+        raise ConnectionError('connection closed')
+    if len(header) < HEADER.size:
+        header += _recv_exact(conn, HEADER.size - len(header))
+    if len(fds) not in (2, 3):
+        for fd in fds:
+            os.close(fd)
+        raise ConnectionError('stdout / stderr descriptors missing')
+    try:
+        (size,) = HEADER.unpack(header)
+        return json.loads(_recv_exact(conn, size)), fds
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def _send_line(conn: socket.socket, message: dict) -> None:
+    try:
+        conn.sendall(json.dumps(message).encode('utf-8') + b'\n')
+    except OSError:
+        pass  # 클라이언트가 먼저 끊은 경우
+
+
+def preload(modules: List[str]) -> dict:
+    """모듈 미리 import - 모듈별 소요 시간 (없는 모듈은 None)"""
+    timings = {}
+    for name in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception:
+            timings[name] = None
+            continue
+        timings[name] = round(time.perf_counter() - start, 3)
+    return timings
+
+
+def _remove_socket(path: str) -> None:
+    """소켓 파일과 (비어 있으면) 소켓 디렉토리 삭제"""
+    try:
+        os.unlink(path)
+        os.rmdir(os.path.dirname(path))
+    except OSError:
+        pass
+
+
+def serve(path: str) -> Optional[Tuple[dict, List[int]]]:
+    """
+    요청마다 fork - 부모는 계속 요청을 받고, 자식에서는 (요청, 파일 디스크립터) 반환
+    stdin이 닫히면(앱 종료) None 반환
+    """
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(16)
+
+    # SIGCHLD는 wakeup fd로 받아 select 루프에서 처리 (시그널 핸들러 안에서는 아무것도 하지 않음)
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    # 터미널의 Ctrl+C는 앱이 처리하고 stdin을 닫아 알려 줌, SIGTERM은 정리 후 종료
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: (_remove_socket(path), sys.exit(0)))
+
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+    selector.register(wakeup_r, selectors.EVENT_READ)
+    selector.register(sys.stdin, selectors.EVENT_READ)
+    children = {}  # pid → 종료 코드를 기다리는 연결
+
+    print('ready', flush=True)
+
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is sys.stdin:
+                if not sys.stdin.buffer.read1(4096):
+                    # 앱이 종료됨 (비정상 종료 포함)
+                    server.close()
+                    _remove_socket(path)
+                    return None
+            elif key.fileobj is wakeup_r:
+                os.read(wakeup_r, 4096)
+            else:
+                conn, _ = server.accept()
+                try:
+                    request, fds = _recv_request(conn)
+                except (OSError, ValueError) as e:
+                    print(f"forkserver: bad request: {e}", file=sys.stderr, flush=True)
+                    conn.close()
+                    continue
+
+                pid = os.fork()
+                if pid == 0:
+                    # 자식: 서버 자원 정리 후 사용자 코드 실행으로
+                    selector.close()
+                    signal.set_wakeup_fd(-1)
+                    for sock in (server, conn, *children.values()):
+                        sock.close()
+                    os.close(wakeup_r)
+                    os.close(wakeup_w)
+                    return request, fds
+
+                for fd in fds:
+                    os.close(fd)
+                _send_line(conn, {'pid': pid})
+                children[pid] = conn
+
+        # 종료된 자식 회수
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            conn = children.pop(pid, None)
+            if conn is not None:
+                _send_line(conn, {'returncode': os.waitstatus_to_exitcode(status)})
+                conn.close()
+
+
+def _lower_limit(kind: int, soft: int, hard: int) -> None:
+    """setrlimit - 이미 더 낮은 hard 제한이 있으면 그 값을 넘지 않게"""
+    import resource
+
+    _, current = resource.getrlimit(kind)
+    if current != resource.RLIM_INFINITY:
+        soft, hard = min(soft, current), min(hard, current)
+    resource.setrlimit(kind, (soft, hard))
+
+
+def apply_limits(limits: dict) -> None:
+    """
+    실행 제한 적용 (run_code에서 사용자 코드 실행 전에 호출)
+    - cpu_seconds: CPU 시간 (넘으면 SIGXCPU, CPU_GRACE초 뒤 SIGKILL)
+    - memory_bytes: 주소 공간 (넘는 할당은 MemoryError)
+    - file_bytes: 쓸 수 있는 파일 크기 (SD 카드 보호)
+    - nice: 제어 서버보다 낮은 CPU 우선순위
+    """
+    import resource
+
+    if limits.get('cpu_seconds'):
+        cpu = int(limits['cpu_seconds'])
+        _lower_limit(resource.RLIMIT_CPU, cpu, cpu + CPU_GRACE)
+    for key, kind in (('memory_bytes', resource.RLIMIT_AS), ('file_bytes', resource.RLIMIT_FSIZE)):
+        if limits.get(key):
+            _lower_limit(kind, int(limits[key]), int(limits[key]))
+    _lower_limit(resource.RLIMIT_CORE, 0, 0)  # CPU 제한으로 죽을 때 코어 파일을 남기지 않음
+    if limits.get('nice'):
+        os.nice(int(limits['nice']))
+
+
+def _exit_code(exc: SystemExit) -> int:
+    """python 인터프리터와 같은 SystemExit 처리"""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _load_module(name: str) -> types.ModuleType:
+    """findee_kit/<name>.py를 파일 경로로 불러옴 (findee_kit 패키지를 import하지 않도록) - 모듈 이름은 findee_<name>"""
+    module = sys.modules.get(f'findee_{name}')
+    if module is not None:
+        return module
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f'{name}.py')
+    spec = importlib.util.spec_from_file_location(f'findee_{name}', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _start_profiler(options: Optional[dict], fds: List[int]):
+    """options가 있으면 fds[0](프로파일 파이프)에 보고하는 프로파일러 시작 - stop()할 객체 또는 None"""
+    if not options or not fds:
+        for fd in fds:
+            os.close(fd)
+        return None
+    return _load_module('profiler').start(options, fds[0])
+
+
+def _prepare(request: dict, fds: List[int]) -> None:
+    """fork된 자식(또는 --run)을 `python -u script.py`와 같은 환경으로 맞춤 - 제한, 시그널, 표준 입출력, 브로커"""
+    if os.name == 'posix':
+        # 실행 단위로 프로세스 그룹을 나눠 자식 프로세스까지 한 번에 종료할 수 있게 (--run은 이미 새 세션)
+        if os.getpgid(0) != os.getpid():
+            os.setpgid(0, 0)
+        apply_limits(request.get('limits') or {})
+        for signum in (signal.SIGCHLD, signal.SIGTERM):
+            signal.signal(signum, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    _redirect_output(fds)
+
+    # -u 와 같은 버퍼링 없는 출력
+    sys.stdin = open(0, 'r', closefd=False)
+    sys.stdout = io.TextIOWrapper(io.FileIO(1, 'w', closefd=False), encoding='utf-8',
+                                  errors='backslashreplace', write_through=True)
+    sys.stderr = io.TextIOWrapper(io.FileIO(2, 'w', closefd=False), encoding='utf-8',
+                                  errors='backslashreplace', write_through=True)
+
+    # 템플릿에서 미리 import한 numpy 난수 상태가 모든 실행에서 같지 않도록 (random 모듈은 fork 시 자동)
+    numpy = sys.modules.get('numpy')
+    if numpy is not None:
+        numpy.random.seed()
+
+    # 서버가 가진 Findee를 브로커로 사용 (GPIO / 카메라를 직접 초기화하지 않음)
+    if request.get('broker'):
+        _load_module('robot_proxy').install(request['broker'])
+
+
+def _redirect_output(fds: List[int]) -> None:
+    """fds[0] / fds[1]을 stdout / stderr(1 / 2)로 옮김 (받은 파일 디스크립터는 닫음)"""
+    for target, fd in zip((1, 2), fds):
+        if fd != target:
+            os.dup2(fd, target)
+            os.close(fd)
+
+
+def _main_module() -> types.ModuleType:
+    main = types.ModuleType('__main__')
+    main.__builtins__ = builtins
+    main.__file__ = CODE_FILENAME
+    sys.modules['__main__'] = main
+    sys.argv = [CODE_FILENAME]
+    return main
+
+
+def _exec(code: str, filename: str, namespace: dict) -> int:
+    """코드 실행 - 종료 코드 (예외는 트레이스백 출력 후 1)"""
+    linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+    try:
+        exec(compile(code, filename, 'exec'), namespace)
+    except SystemExit as e:
+        return _exit_code(e)
+    except BaseException:
+        etype, value, tb = sys.exc_info()
+        traceback.print_exception(etype, value, tb.tb_next)  # _exec 프레임은 제외
+        return 1
+    return 0
+
+
+def run_code(request: dict, fds: List[int]) -> int:
+    """fork된 자식(또는 --run)에서 사용자 코드 실행 - fds: [stdout, stderr, (프로파일 파이프)]"""
+    _prepare(request, fds[:2])
+    main = _main_module()
+    profiler = _start_profiler(request.get('profile'), fds[2:])
+    try:
+        return _exec(request['code'], CODE_FILENAME, main.__dict__)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+
+
+def run_kernel(request: dict, fds: List[int]) -> int:
+    """
+    fork된 자식(또는 --run)에서 커널 실행 - 제어 소켓(fds[2])으로 받는 코드를 같은 __main__ 네임스페이스에서 차례로 실행
+    - 실행 요청: 4바이트 길이 + JSON {'code': ..., 'profile': ...}, SCM_RIGHTS로 이번 실행의 stdout / stderr
+      (+ 프로파일 파이프) 쓰기 끝
+    - 응답: {"pid": ...} 줄, 실행이 끝나면 출력 파이프를 닫고(EOF) {"returncode": ...} 줄
+    - SIGINT는 실행 중에만 KeyboardInterrupt (대기 중에는 무시), 제어 소켓이 닫히면 종료
+    실행 사이의 출력(사용자 코드가 만든 스레드 등)은 버려진다.
+    """
+    control = socket.socket(fileno=fds[2])
+    _prepare(request, fds[:2])
+    robot_proxy = sys.modules.get('findee_robot_proxy')  # 브로커를 쓰면 실행이 끝날 때마다 모터 정지
+    sink = os.open(os.devnull, os.O_WRONLY)
+    _redirect_output([os.dup(sink), os.dup(sink)])
+    main = _main_module()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    cell = 0
+    while True:
+        try:
+            job, output = _recv_request(control, timeout=None)
+        except (OSError, ValueError):
+            return 0  # 커널 종료 (재시작 / 유휴 정리 / 앱 종료)
+        cell += 1
+        _redirect_output(output[:2])
+        _send_line(control, {'pid': os.getpid()})
+        profiler = _start_profiler(job.get('profile'), output[2:])
+        returncode = 1
+        try:
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            # 셀마다 다른 파일 이름 - 앞 셀에서 정의한 함수의 트레이스백도 올바른 줄을 보여 줌
+            returncode = _exec(job['code'], f'{CODE_FILENAME[:-1]}:{cell}>', main.__dict__)
+        except KeyboardInterrupt:
+            print('KeyboardInterrupt', file=sys.stderr)  # 트레이스백 출력 중에 들어온 중지 요청
+        finally:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            if profiler is not None:
+                profiler.stop()
+        if robot_proxy is not None:
+            robot_proxy.stop_motors()
+        _redirect_output([os.dup(sink), os.dup(sink)])  # 출력 파이프 EOF → 서버가 출력 전송을 마침
+        _send_line(control, {'returncode': returncode})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사용자 코드 실행용 포크 서버')
+    parser.add_argument('socket_path', nargs='?')
+    parser.add_argument('--preload', default='', help='미리 import할 모듈 (쉼표 구분)')
+    parser.add_argument('--run', action='store_true', help='stdin의 요청(JSON) 1건을 이 프로세스에서 실행')
+    args = parser.parse_args()
+
+    # 스크립트 디렉토리(findee_kit)가 sys.path[0]이면 사용자 코드의 import config 등이 가로채지므로,
+    # 기존 실행 방식(임시 파일을 python으로 실행)처럼 임시 디렉토리로 바꿈
+    sys.path[0] = tempfile.gettempdir()
+
+    if args.run:
+        # 포크 서버를 쓸 수 없을 때 (새 인터프리터) - 출력은 이미 파이프에 연결된 stdout / stderr
+        request = json.loads(sys.stdin.buffer.read())
+        fds = [1, 2] + [request[key] for key in ('control', 'profile_fd') if key in request]
+        sys.exit((run_kernel if request.get('kernel') else run_code)(request, fds))
+    if not args.socket_path:
+        parser.error('socket_path is required')
+
+    # import 중 출력은 stderr로 - stdout은 앱에 'ready'를 알리는 용도
+    with contextlib.redirect_stdout(sys.stderr):
+        timings = preload([name for name in args.preload.split(',') if name])
+    print(f"forkserver: preloaded {timings}", file=sys.stderr, flush=True)
+
+    # 미리 import한 객체를 GC 대상에서 빼 두면 자식의 GC가 공유 페이지를 건드리지 않음 (copy-on-write 유지)
+    gc.freeze()
+
+    child = serve(args.socket_path)
+    if child is None:
+        return
+    request, fds = child
+    sys.exit(run_kernel(request, fds) if request.get('kernel') else run_code(request, fds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+"""
+공유 메모리 카메라 프레임 링
+
+카메라는 한 프로세스만 열 수 있으므로, Flask 앱 밖의 비전 스크립트 / 녹화기 / 컴포넌트 테스트는
+서버가 공유 메모리(multiprocessing.shared_memory)에 내보내는 프레임을 읽는다.
+- FrameRing: 쓰는 쪽 - 슬롯 N개를 돌아가며 원본 프레임(numpy 배열)을 복사
+- FrameReader: 읽는 쪽 - 최신 프레임을 복사 없이 numpy 뷰로 제공
+- FramePublisher: 서버의 캡처 루프 (앱에서는 jobs 풀) - 새 프레임이 나올 때마다 FrameRing에 기록
+
+메모리 구조 (리틀 엔디언)
+- 헤더 64바이트: magic, 버전, 상태(열림 / 닫힘), 슬롯 수, 슬롯 크기, 최신 프레임 번호
+- 슬롯마다 헤더 64바이트 + 데이터: 시퀀스, 타임스탬프(time.time()), 차원 / shape, dtype, 바이트 수
+슬롯 시퀀스는 seqlock - 쓰는 중에는 홀수(2n - 1), 프레임 n을 다 쓰면 짝수(2n).
+읽는 쪽은 읽기 전후의 시퀀스가 같고 짝수일 때만 프레임을 사용하므로 쓰는 중인 슬롯을 읽지 않는다.
+복사 없는 뷰는 쓰는 쪽이 링을 한 바퀴 돌아 같은 슬롯을 덮어쓸 때까지(슬롯 - 1 프레임) 유효하며,
+처리 후 Frame.intact()로 덮어쓰이지 않았는지 확인할 수 있다.
+
+사용 예 (서버 설정 FRAME_RING = 'findee-camera'):
+    reader = FrameReader('findee-camera')
+    frame = reader.wait(timeout=1.0)
+    if frame is not None:
+        gray = cv2.cvtColor(frame.array, cv2.COLOR_BGR2GRAY)
+"""
+
+import logging
+import struct
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Optional
+
+from .metrics import REGISTRY
+from .pools import PoolRejected
+
+
+logger = logging.getLogger(__name__)
+
+FRAMES_PUBLISHED = REGISTRY.counter('findee_frame_ring_published', '공유 메모리에 내보낸 카메라 프레임 수')
+FRAME_PUBLISH_SECONDS = REGISTRY.histogram('findee_frame_ring_publish_seconds', '프레임 1개를 공유 메모리에 쓰는 시간')
+
+MAGIC = b'FDKR'
+VERSION = 1
+OPEN = 1
+CLOSED = 2  # 쓰는 쪽이 종료했거나 더 큰 슬롯으로 다시 만듦 - 읽는 쪽은 다시 연결
+
+# magic, 버전, 상태, 슬롯 수, 슬롯 데이터 크기, 최신 프레임 번호
+HEADER = struct.Struct('<4sIIIQQ')
+HEADER_SIZE = 64
+# 시퀀스, 타임스탬프, 차원 수, shape (최대 4차원), dtype, 바이트 수
+SLOT_HEADER = struct.Struct('<QdI4I8sQ')
+SLOT_HEADER_SIZE = 64
+MAX_DIMS = 4
+
+_STATE_OFFSET = 8
+_LATEST_OFFSET = 24
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+def _slot_offset(index: int, slot_bytes: int) -> int:
+    return HEADER_SIZE + index * (SLOT_HEADER_SIZE + slot_bytes)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """기존 공유 메모리에 연결 - 읽는 프로세스가 종료될 때 resource_tracker가 지우지 않도록 등록 해제"""
+    shm = shared_memory.SharedMemory(name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    except Exception:
+        pass
+    return shm
+
+
+#-쓰는 쪽-#
+class FrameRing:
+    """프레임을 공유 메모리 링에 기록 (쓰는 프로세스 / 스레드는 하나)"""
+
+    def __init__(self, name: str, slot_bytes: int, slots: int = 3, start: int = 0):
+        """
+        Args:
+            name: 공유 메모리 이름 (읽는 쪽이 같은 이름으로 연결, 리눅스에서는 /dev/shm/<name>)
+            slot_bytes: 슬롯 하나에 들어가는 최대 프레임 크기 (바이트)
+            slots: 슬롯 수 - 복사 없는 뷰는 slots - 1 프레임 동안 유효
+            start: 이전 링의 마지막 프레임 번호 (다시 만든 링에서도 번호가 이어지도록)
+        """
+        self.name = name
+        self.slot_bytes = slot_bytes
+        self.slots = slots
+        self._frames = start
+        size = _slot_offset(slots, slot_bytes)
+        try:
+            self._shm = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            # 이전 서버가 비정상 종료하며 남긴 공유 메모리
+            stale = _attach(name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name, create=True, size=size)
+        self._buf = self._shm.buf
+        HEADER.pack_into(self._buf, 0, MAGIC, VERSION, OPEN, slots, slot_bytes, 0)
+
+    @property
+    def frames(self) -> int:
+        """지금까지 기록한 프레임 수 (= 최신 프레임 번호)"""
+        return self._frames
+
+    def publish(self, frame, timestamp: Optional[float] = None) -> int:
+        """프레임 기록 - 프레임 번호 반환 (슬롯보다 큰 프레임은 ValueError)"""
+        import numpy as np
+
+        if frame.nbytes > self.slot_bytes:
+            raise ValueError(f"frame of {frame.nbytes} bytes does not fit a {self.slot_bytes}-byte slot")
+        if frame.ndim > MAX_DIMS:
+            raise ValueError(f"frames with more than {MAX_DIMS} dimensions are not supported")
+
+        number = self._frames + 1
+        offset = _slot_offset((number - 1) % self.slots, self.slot_bytes)
+        shape = tuple(frame.shape) + (0,) * (MAX_DIMS - frame.ndim)
+        _U64.pack_into(self._buf, offset, 2 * number - 1)  # 쓰는 중
+        SLOT_HEADER.pack_into(self._buf, offset, 2 * number - 1, time.time() if timestamp is None else timestamp,
+                              frame.ndim, *shape, frame.dtype.str.encode('ascii'), frame.nbytes)
+        np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._buf, offset=offset + SLOT_HEADER_SIZE)[...] = frame
+        _U64.pack_into(self._buf, offset, 2 * number)  # 다 씀
+        _U64.pack_into(self._buf, _LATEST_OFFSET, number)
+        self._frames = number
+        return number
+
+    def close(self) -> None:
+        """링 닫기 - 읽는 쪽에 종료를 알리고 공유 메모리 삭제 (이미 연결된 읽는 쪽의 매핑은 유지)"""
+        if self._shm is None:
+            return
+        _U32.pack_into(self._buf, _STATE_OFFSET, CLOSED)
+        self._buf = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+#-읽는 쪽-#
+@dataclass(frozen=True)
+class Frame:
+    """링에서 읽은 프레임 - array는 공유 메모리 뷰 (copy=True로 읽었으면 복사본)"""
+    number: int
+    timestamp: float
+    array: object
+    _reader: 'FrameReader' = field(repr=False)
+    _sequence: int = field(repr=False)
+    _offset: int = field(repr=False)
+
+    def intact(self) -> bool:
+        """뷰가 가리키는 슬롯이 아직 덮어쓰이지 않았는지 (복사본은 항상 True)"""
+        if self.array.base is None or self._reader._buf is None:
+            return True
+        return _U64.unpack_from(self._reader._buf, self._offset)[0] == self._sequence
+
+
+class FrameReader:
+    """공유 메모리 링의 최신 프레임 읽기 (쓰는 쪽이 다시 만들면 자동으로 다시 연결)"""
+
+    def __init__(self, name: str, retries: int = 100):
+        """
+        Args:
+            name: FrameRing과 같은 공유 메모리 이름
+            retries: 쓰는 중인 슬롯을 만났을 때 다시 시도하는 횟수 (넘으면 None)
+        """
+        self.name = name
+        self.retries = retries
+        self.torn = 0  # 쓰는 중이라 다시 읽은 횟수 (벤치마크 / 진단용)
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._buf = None
+        self._connect()
+
+    def _connect(self) -> None:
+        shm = _attach(self.name)
+        magic, version, _, slots, slot_bytes, _ = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError(f"{self.name!r} is not a Findee frame ring")
+        self.close()
+        self._shm = shm
+        self._buf = shm.buf
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+
+    @property
+    def latest_number(self) -> int:
+        """쓰는 쪽이 마지막으로 다 쓴 프레임 번호 (0이면 아직 없음)"""
+        return _U64.unpack_from(self._buf, _LATEST_OFFSET)[0]
+
+    def _check_open(self) -> None:
+        if _U32.unpack_from(self._buf, _STATE_OFFSET)[0] == CLOSED:
+            try:
+                self._connect()
+            except FileNotFoundError:
+                pass  # 쓰는 쪽이 링을 다시 만드는 중이거나 종료됨 - 마지막 프레임 유지, 다음 호출에서 다시 시도
+
+    def latest(self, copy: bool = False) -> Optional[Frame]:
+        """
+        최신 프레임 (아직 없으면 None)
+
+        Args:
+            copy: True면 복사본 - 슬롯이 덮어쓰여도 안전 (복사 중 덮어쓰이면 다시 읽음)
+        """
+        import numpy as np
+
+        self._check_open()
+        for _ in range(self.retries):
+            number = self.latest_number
+            if number == 0:
+                return None
+            offset = _slot_offset((number - 1) % self.slots, self.slot_bytes)
+            sequence, timestamp, ndim, *fields = SLOT_HEADER.unpack_from(self._buf, offset)
+            shape, dtype = tuple(fields[:ndim]), fields[MAX_DIMS].rstrip(b'\0').decode('ascii')
+            if sequence != 2 * number:
+                self.torn += 1  # 쓰는 중이거나 그 사이 링이 한 바퀴 돎
+                continue
+            array = np.ndarray(shape, dtype=dtype, buffer=self._buf, offset=offset + SLOT_HEADER_SIZE)
+            if copy:
+                array = array.copy()
+            if _U64.unpack_from(self._buf, offset)[0] != sequence:
+                self.torn += 1
+                continue
+            return Frame(number, timestamp, array, self, sequence, offset)
+        return None
+
+    def wait(self, after: int = 0, timeout: Optional[float] = None, copy: bool = False,
+             poll: float = 0.001) -> Optional[Frame]:
+        """after보다 새 프레임이 나올 때까지 대기 (timeout이 지나면 None)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self.latest_number > after:
+                frame = self.latest(copy)
+                if frame is not None and frame.number > after:
+                    return frame
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll)
+            self._check_open()
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._buf = None
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # 사용자가 아직 뷰를 가지고 있음 - 매핑은 프로세스 종료 시 해제
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+#-서버 캡처 루프-#
+class FramePublisher:
+    """카메라 최신 프레임을 FrameRing으로 내보내는 루프 (실행 중에는 카메라 시청자 1명으로 계산)"""
+
+    def __init__(self, provider, name: str, slots: int = 3, fps: float = 30.0, call=None, pool=None):
+        """
+        Args:
+            provider: RobotProvider (acquire_camera / release_camera)
+            name: 공유 메모리 이름
+            fps: 새 프레임을 확인하는 최대 빈도
+            call: 프레임 획득 실행 함수 - 앱에서는 camera 풀(ctx.encoder.call)
+            pool: 루프를 실행할 WorkerPool (앱에서는 ctx.jobs, None이면 전용 스레드)
+        """
+        self.provider = provider
+        self.name = name
+        self.slots = slots
+        self.fps = fps
+        self.call = call or (lambda func, *args: func(*args))
+        self.pool = pool
+        self.ring: Optional[FrameRing] = None
+        self._future: Optional[Future] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        if self._stop_event.is_set():
+            return False
+        if self._future is not None:
+            return not self._future.done()
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        stop_event = threading.Event()
+        if self.pool is None:
+            self._thread = threading.Thread(target=self._loop, args=(stop_event,), name='frame-publisher',
+                                            daemon=True)
+            self._thread.start()
+        else:
+            try:
+                self._future = self.pool.submit(self._loop, stop_event)
+            except PoolRejected as e:
+                logger.warning(f"⚠️ Frame publisher could not start: {e}")
+                return
+        self._stop_event = stop_event
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._future is not None:
+            wait([self._future], timeout=2)
+        elif self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def _loop(self, stop_event: threading.Event) -> None:
+        camera = self.provider.acquire_camera()
+        logger.info(f"📤 Publishing camera frames to shared memory {self.name!r}")
+        last = None
+        try:
+            while not stop_event.is_set():
+                tick = time.monotonic()
+                try:
+                    frame = self.call(camera.get_frame)
+                    # get_frame은 새 프레임이 없으면 같은 객체를 돌려줌
+                    if frame is not None and frame is not last:
+                        last = frame
+                        self._publish(frame)
+                except Exception as e:
+                    logger.error(f"❌ Frame publish error: {e}")
+                    stop_event.wait(1.0)
+                stop_event.wait(max(0.001, 1.0 / self.fps - (time.monotonic() - tick)))
+        finally:
+            if self.ring is not None:
+                self.ring.close()
+                self.ring = None
+            self.provider.release_camera()
+
+    def _publish(self, frame) -> None:
+        if self.ring is None or frame.nbytes > self.ring.slot_bytes:
+            # 첫 프레임 또는 해상도가 커짐 - 새 링 (읽는 쪽은 CLOSED를 보고 다시 연결)
+            start = 0
+            if self.ring is not None:
+                start = self.ring.frames
+                self.ring.close()
+            self.ring = FrameRing(self.name, frame.nbytes, self.slots, start)
+        start = time.perf_counter()
+        self.ring.publish(frame)  # 공유 메모리로 복사만 하므로 루프에서 바로 실행
+        FRAME_PUBLISH_SECONDS.observe(time.perf_counter() - start)
+        FRAMES_PUBLISHED.inc()
@@ -0,0 +1,170 @@
+"""
+온도 / CPU 기반 부하 조절 거버너
+
+공유 시스템 정보 샘플러의 cpu_percent, cpu_temperature를 감시하다가
+예산을 넘으면 우선순위에 따라 부하를 줄이고, 충분히 내려가면 히스테리시스를 두고 복구한다.
+(복구 기준을 따로 주지 않으면 예산 - RECOVER_MARGIN)
+1. 카메라 fps / JPEG 품질 감소
+2. 대시보드 브로드캐스트 주기 증가
+모터 제어와 안전 관련 루프(초음파 측정 등)는 건드리지 않는다.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional, Sequence
+
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+GOVERNOR_LEVEL = REGISTRY.gauge('findee_governor_level', '부하 조절 거버너 단계 (0 = 정상)')
+GOVERNOR_TRANSITIONS = REGISTRY.counter(
+    'findee_governor_transitions', '부하 조절 단계 전환 수', ('direction',))
+
+# 복구 기준 = 예산 - 여유 (히스테리시스 폭)
+CPU_RECOVER_MARGIN = 20.0
+TEMP_RECOVER_MARGIN = 7.0
+
+
+@dataclass(frozen=True)
+class GovernorLevel:
+    """부하 조절 단계 - None 항목은 앱 기본 설정 유지"""
+    name: str
+    stream_fps: Optional[float] = None
+    stream_quality: Optional[int] = None
+    broadcast_interval: Optional[float] = None
+
+
+# 우선순위: 카메라 → 대시보드 브로드캐스트
+DEFAULT_LEVELS = (
+    GovernorLevel('normal'),
+    GovernorLevel('camera-reduced', stream_fps=15, stream_quality=75),
+    GovernorLevel('camera-minimal', stream_fps=5, stream_quality=50),
+    GovernorLevel('broadcast-reduced', stream_fps=5, stream_quality=50, broadcast_interval=3.0),
+)
+
+
+class LoadGovernor:
+    """시스템 정보 샘플을 받아 부하 조절 단계를 결정"""
+
+    def __init__(self, levels: Sequence[GovernorLevel] = DEFAULT_LEVELS,
+                 cpu_budget: float = 85.0, temp_budget: float = 75.0,
+                 cpu_recover: Optional[float] = None, temp_recover: Optional[float] = None,
+                 shed_after: float = 3.0, recover_after: float = 15.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.levels = tuple(levels)
+        self.cpu_budget = cpu_budget
+        self.temp_budget = temp_budget
+        self.cpu_recover = cpu_budget - CPU_RECOVER_MARGIN if cpu_recover is None else cpu_recover
+        self.temp_recover = temp_budget - TEMP_RECOVER_MARGIN if temp_recover is None else temp_recover
+        self.shed_after = shed_after
+        self.recover_after = recover_after
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._index = 0
+        self._over_since: Optional[float] = None
+        self._under_since: Optional[float] = None
+        self._last_sample: dict = {}
+        self._listeners: List[Callable[[GovernorLevel], None]] = []
+        self.transitions = deque(maxlen=20)
+
+        GOVERNOR_LEVEL.set(0)
+
+    @property
+    def level(self) -> GovernorLevel:
+        return self.levels[self._index]
+
+    def add_listener(self, callback: Callable[[GovernorLevel], None]) -> None:
+        """단계가 바뀔 때마다 새 단계로 호출될 콜백 등록"""
+        self._listeners.append(callback)
+
+    def on_sample(self, system_info: dict) -> None:
+        """SystemInfoSampler 리스너 - 샘플마다 예산 초과 여부 판단"""
+        if not system_info or 'error' in system_info:
+            return
+
+        cpu = system_info.get('cpu_percent')
+        temp = system_info.get('cpu_temperature')
+        now = self._clock()
+
+        over = (cpu is not None and cpu > self.cpu_budget) or \
+               (temp is not None and temp > self.temp_budget)
+        under = (cpu is None or cpu < self.cpu_recover) and \
+                (temp is None or temp < self.temp_recover)
+
+        new_index = None
+        with self._lock:
+            self._last_sample = {'cpu_percent': cpu, 'cpu_temperature': temp}
+
+            if over:
+                self._under_since = None
+                if self._over_since is None:
+                    self._over_since = now
+                if now - self._over_since >= self.shed_after and self._index < len(self.levels) - 1:
+                    new_index = self._index + 1
+                    self._over_since = now  # 다음 단계까지 다시 shed_after 대기
+            elif under:
+                self._over_since = None
+                if self._under_since is None:
+                    self._under_since = now
+                if now - self._under_since >= self.recover_after and self._index > 0:
+                    new_index = self._index - 1
+                    self._under_since = now
+            else:
+                # 히스테리시스 구간 - 현재 단계 유지
+                self._over_since = None
+                self._under_since = None
+
+            if new_index is None:
+                return
+            old_level = self.levels[self._index]
+            shed = new_index > self._index
+            self._index = new_index
+            level = self.levels[new_index]
+            self.transitions.append({
+                'time': time.time(),
+                'from': old_level.name,
+                'to': level.name,
+                'cpu_percent': cpu,
+                'cpu_temperature': temp,
+            })
+
+        self._announce(old_level, level, new_index, cpu, temp, shed)
+
+    def _announce(self, old_level: GovernorLevel, level: GovernorLevel, index: int,
+                  cpu: Optional[float], temp: Optional[float], shed: bool) -> None:
+        GOVERNOR_LEVEL.set(index)
+        GOVERNOR_TRANSITIONS.labels('shed' if shed else 'recover').inc()
+
+        message = f"{old_level.name} → {level.name} (CPU {cpu}%, {temp}°C)"
+        if shed:
+            logger.warning(f"🔥 부하 조절 단계 상승: {message}")
+        else:
+            logger.info(f"❄️ 부하 조절 단계 복구: {message}")
+
+        for callback in self._listeners:
+            try:
+                callback(level)
+            except Exception as e:
+                logger.error(f"❌ 거버너 리스너 오류: {e}")
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                'level': self._index,
+                'name': self.level.name,
+                'settings': asdict(self.level),
+                'budget': {
+                    'cpu_percent': self.cpu_budget,
+                    'cpu_temperature': self.temp_budget,
+                    'cpu_recover': self.cpu_recover,
+                    'temp_recover': self.temp_recover,
+                },
+                'last_sample': dict(self._last_sample),
+                'transitions': list(self.transitions),
+            }
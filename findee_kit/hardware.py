@@ -0,0 +1,190 @@
+"""
+지연 초기화 하드웨어 제공자
+
+Findee 객체를 모듈 import 시점이 아니라 첫 사용 시점에 생성한다.
+- debug 리로더의 감시 프로세스는 하드웨어를 건드리지 않음
+- 비활성화된 서브시스템은 시작하지 않고 상태를 False로 보고
+- 카메라 프레임 캡처는 카메라를 처음 사용할 때 시작
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Tuple
+
+
+SUBSYSTEMS = ('motor', 'camera', 'ultrasonic')
+
+
+@dataclass
+class FlaskMessage:
+    robot_init_start: str = "로봇 초기화 시작"
+    robot_init_success: str = "로봇 초기화 성공"
+    robot_init_failure: str = "로봇 초기화 실패: {error}"
+
+
+def get_logger() -> logging.Logger:
+    """
+    앱 로거
+
+    FindeeFormatter를 쓰려면 findee(OpenCV / picamera2 포함)를 import해야 하므로
+    서버가 listen하기 전에는 표준 logging으로 같은 형식의 로거를 만든다.
+    """
+    logger = logging.getLogger('findee_kit')
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    # FindeeFormatter.disable_flask_logger()와 같은 효과 (요청 로그 숨김)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    return logger
+
+
+class RobotProvider:
+    """첫 사용 시 Findee를 생성하고 활성화된 서브시스템만 노출"""
+
+    def __init__(self, subsystems: Iterable[str], camera_resolution: Tuple[int, int] = (640, 480),
+                 fake: bool = False, logger: logging.Logger = None, executor=None):
+        self.subsystems = frozenset(subsystems)
+        self.camera_resolution = tuple(camera_resolution)
+        self.fake = fake
+        self.logger = logger or logging.getLogger(__name__)
+        self.executor = executor
+
+        # 생성 담당을 정하는 동안만 잡는 잠금 - 생성을 기다리는 동안에는 잡지 않음 (워커 풀 교착 방지)
+        self._init_lock = threading.Lock()
+        self._creating = False
+        self._created = Future()  # 생성 완료 / 실패를 기다리는 호출자용 (실패하면 새 Future로 바꿔 재시도)
+        self._camera_lock = threading.Lock()
+        self._robot = None
+        self._camera_viewers = 0
+        self.capture_listeners: List[Callable[[bool], None]] = []  # 프레임 캡처 시작(True) / 중지(False) 시 호출
+
+    @property
+    def initialized(self) -> bool:
+        return self._robot is not None
+
+    @property
+    def robot(self):
+        if self._robot is None:
+            created = self._created
+            # Findee 생성(카메라 / GPIO 초기화)은 수 초간 블로킹됨 - 이미 워커 안이면 그 자리에서 생성,
+            # 아니면 실행기에 맡김. 워커 안의 호출자가 아직 시작되지 않은 생성 작업을 기다리지 않도록
+            # 먼저 생성 담당을 가져간 쪽이 생성하고 나머지는 완료만 기다림
+            if self.executor is None or self.executor.in_worker():
+                self._create_once()
+            elif not self._creating:
+                self.executor.submit(self._create_once)
+            created.result()
+        return self._robot
+
+    def _create_once(self) -> None:
+        with self._init_lock:
+            if self._creating or self._robot is not None:
+                return
+            self._creating = True
+            created = self._created
+        try:
+            robot = self._create()
+        except BaseException as e:
+            with self._init_lock:
+                self._creating = False
+                self._created = Future()  # 다음 접근에서 다시 시도
+            created.set_exception(e)
+            return
+        self._robot = robot
+        created.set_result(robot)
+
+    def _create(self):
+        self.logger.info(FlaskMessage.robot_init_start)
+        start = time.perf_counter()  # findee / OpenCV import 시간 포함
+        try:
+            if self.fake:
+                from .fake import FakeFindee as Findee
+            else:
+                from findee import Findee
+            robot = Findee(safe_mode=True, camera_resolution=self.camera_resolution)
+        except Exception as e:
+            self.logger.error(FlaskMessage.robot_init_failure.format(error=e))
+            raise
+
+        self.logger.info(f"{FlaskMessage.robot_init_success} ({time.perf_counter() - start:.2f}s)")
+        return robot
+
+    #-상태 조회-#
+    def status(self) -> dict:
+        """robot.get_status() - 비활성화된 서브시스템은 False"""
+        status = dict(self.robot.get_status())
+        for name in SUBSYSTEMS:
+            key = f'{name}_status'
+            status[key] = bool(status.get(key)) and name in self.subsystems
+        return status
+
+    def available(self, name: str) -> bool:
+        return name in self.subsystems and self.status()[f'{name}_status']
+
+    def get_system_info(self) -> dict:
+        return self.robot.get_system_info()
+
+    def get_hostname(self) -> str:
+        return self.robot.get_hostname()
+
+    #-서브시스템-#
+    def motor(self):
+        return self.robot.motor
+
+    def ultrasonic(self):
+        return self.robot.ultrasonic
+
+    def camera(self):
+        """카메라 (상태 조회 / 설정용 - 프레임 캡처는 acquire_camera()로 시작)"""
+        return self.robot.camera
+
+    @property
+    def camera_viewers(self) -> int:
+        return self._camera_viewers
+
+    def acquire_camera(self):
+        """영상 시청자 추가 - 첫 시청자일 때 프레임 캡처 시작"""
+        camera = self.robot.camera
+        with self._camera_lock:
+            if self._camera_viewers == 0:
+                camera.start_frame_capture()
+                self.logger.info("📹 카메라 프레임 캡처 시작됨")
+                self._notify_capture(True)
+            self._camera_viewers += 1
+        return camera
+
+    def release_camera(self) -> None:
+        """영상 시청자 제거 - 마지막 시청자가 나가면 프레임 캡처 중지"""
+        with self._camera_lock:
+            if self._camera_viewers == 0:
+                return
+            self._camera_viewers -= 1
+            if self._camera_viewers == 0:
+                try:
+                    self._robot.camera.stop_frame_capture()
+                    self.logger.info("📹 시청자가 없어 카메라 프레임 캡처 중지됨")
+                except Exception as e:
+                    self.logger.error(f"❌ Error stopping frame capture: {e}")
+                self._notify_capture(False)
+
+    def _notify_capture(self, capturing: bool) -> None:
+        for callback in self.capture_listeners:
+            try:
+                callback(capturing)
+            except Exception as e:
+                self.logger.error(f"❌ Capture listener error: {e}")
+
+    def cleanup(self) -> None:
+        if self._robot is None:
+            return
+        try:
+            self._robot.cleanup()
+        except Exception as e:
+            self.logger.error(f"❌ Error cleaning up robot: {e}")
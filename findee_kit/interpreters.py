@@ -0,0 +1,259 @@
+"""
+미리 데워 둔 인터프리터로 사용자 코드 실행
+
+실행마다 `python -u script.py`를 새로 띄우면 인터프리터 시작 + findee / numpy / OpenCV import가
+매번 반복된다(라즈베리파이에서 수 초). InterpreterPool은 무거운 모듈을 미리 import한 포크 서버
+(findee_kit/forkserver.py)를 하나 띄워 두고, 실행마다 fork한 새 자식에 코드를 파이프(소켓)로 넘긴다.
+- 자식은 실행 1건만 처리하고 종료 (실행 간 격리)
+- stdout / stderr는 호출자가 만든 파이프로 바로 연결 (subprocess.Popen과 같은 인터페이스)
+- 포크 서버를 쓸 수 없으면(Windows, 서버 비정상 종료 직후 등) 새 인터프리터로 실행
+- 두 방식 모두 실행마다 새 프로세스 그룹 + 실행 제한(forkserver.apply_limits) 적용
+- 두 방식 모두 브로커 경로를 받으면 사용자 코드의 findee.Findee가 서버 하드웨어를 쓰는 프록시로 바뀜
+- profile을 받으면 프로파일 보고(findee_kit/profiler.py)를 받을 파이프를 하나 더 연결 (process.profile)
+- spawn_kernel: 코드 1건 대신 제어 소켓으로 여러 번 실행하는 커널 프로세스 (findee_kit.kernels)
+"""
+
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Iterable, Optional
+
+from . import forkserver
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+INTERPRETER_STARTS = REGISTRY.counter('findee_interpreter_starts', '사용자 코드 실행 프로세스 시작 수', ('mode',))
+INTERPRETER_SPAWN_SECONDS = REGISTRY.histogram(
+    'findee_interpreter_spawn_seconds', '실행 요청부터 프로세스 pid를 받을 때까지의 시간', ('mode',))
+FORKSERVER_RESTARTS = REGISTRY.counter('findee_forkserver_restarts', '포크 서버 재시작 수')
+
+WARM = 'warm'
+COLD = 'cold'
+
+
+def signal_group(process, signum: int) -> bool:
+    """실행 프로세스의 그룹 전체에 시그널 전달 (사용자 코드가 만든 자식 프로세스 포함) - 그룹이 없으면 False"""
+    if os.name != 'posix':
+        process.send_signal(signum)
+        return True
+    try:
+        os.killpg(process.pid, signum)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+class WarmProcess:
+    """포크 서버 자식 - subprocess.Popen에서 실행 코드가 쓰는 부분(pid, stdout, stderr, wait, kill)만 제공"""
+
+    def __init__(self, conn: socket.socket, stdout, stderr):
+        self._conn = conn
+        self._replies = conn.makefile('r', encoding='utf-8')
+        self.stdout = stdout
+        self.stderr = stderr
+        self.profile = None  # 프로파일 보고 파이프 (InterpreterPool.spawn에서 설정)
+        self.returncode: Optional[int] = None
+        self.pid = json.loads(self._replies.readline())['pid']
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            line = self._replies.readline()
+            # 포크 서버가 먼저 죽으면 종료 코드를 받을 수 없음
+            self.returncode = json.loads(line)['returncode'] if line else -signal.SIGKILL
+            self._replies.close()
+            self._conn.close()
+        return self.returncode
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def send_signal(self, signum: int) -> None:
+        # 자식은 자기 프로세스 그룹을 가지므로 사용자 코드가 만든 프로세스까지 함께 전달
+        signal_group(self, signum)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+class InterpreterPool:
+    """무거운 모듈을 미리 import한 포크 서버로 사용자 코드 실행"""
+
+    def __init__(self, preload: Iterable[str] = ('findee', 'numpy', 'cv2'), ready_timeout: float = 30.0,
+                 warm: bool = True):
+        """
+        Args:
+            preload: 포크 서버가 미리 import할 모듈 (없는 모듈은 건너뜀)
+            ready_timeout: 실행 요청 시 포크 서버 준비를 기다리는 최대 시간 (초, 넘으면 새 인터프리터로 실행)
+            warm: False면 포크 서버 없이 항상 새 인터프리터로 실행 (기존 방식)
+        """
+        self.preload = tuple(preload)
+        self.ready_timeout = ready_timeout
+        self.supported = warm and hasattr(os, 'fork') and hasattr(socket, 'send_fds')
+        self._lock = threading.Lock()
+        self._server: Optional[subprocess.Popen] = None
+        self._ready = threading.Event()
+        self._dir: Optional[str] = None
+        self._closed = False
+
+    @property
+    def socket_path(self) -> str:
+        return os.path.join(self._dir, 'forkserver.sock')
+
+    #-포크 서버-#
+    def start(self) -> None:
+        """포크 서버 시작 (모듈 import는 서버 프로세스에서 진행되므로 바로 반환)"""
+        if not self.supported:
+            return
+        with self._lock:
+            if self._closed or (self._server is not None and self._server.poll() is None):
+                return
+            if self._server is not None:
+                FORKSERVER_RESTARTS.inc()
+                logger.warning(f"⚠️ Fork server exited ({self._server.returncode}), restarting")
+            self._cleanup_dir()
+            self._dir = tempfile.mkdtemp(prefix='findee-forkserver-')  # 0700: 같은 사용자만 접속 가능
+            self._ready = threading.Event()
+            self._server = subprocess.Popen(
+                [sys.executable, forkserver.__file__, self.socket_path, '--preload', ','.join(self.preload)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            threading.Thread(target=self._wait_ready, args=(self._server, self._ready),
+                             name='forkserver-ready', daemon=True).start()
+
+    def _wait_ready(self, server: subprocess.Popen, ready: threading.Event) -> None:
+        # 미리 import한 모듈이 stdout에 출력했을 수 있으므로 'ready' 줄이 나오거나 EOF까지 읽음
+        for line in server.stdout:
+            if line.strip() == b'ready':
+                ready.set()
+                logger.info(f"🔥 Fork server ready (preloaded: {', '.join(self.preload)})")
+                return
+
+    def close(self) -> None:
+        """포크 서버 종료 (실행 중인 자식은 끝까지 실행)"""
+        with self._lock:
+            self._closed = True
+            server, self._server = self._server, None
+            if server is not None:
+                server.stdin.close()  # stdin EOF → 서버 종료
+                try:
+                    server.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    server.kill()
+                server.stdout.close()
+            self._cleanup_dir()
+
+    def _cleanup_dir(self) -> None:
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    #-실행-#
+    def spawn(self, code: str, limits: Optional[dict] = None, broker: Optional[str] = None,
+              profile: Optional[dict] = None):
+        """
+        코드 실행 프로세스 시작 - stdout / stderr(/ profile) 파이프를 가진 Popen 호환 객체 반환
+        포크 서버가 준비되지 않았거나 실패하면 새 인터프리터로 실행
+
+        Args:
+            limits: 실행 제한 (forkserver.apply_limits 참고, None이면 제한 없음)
+            broker: 하드웨어 브로커 소켓 경로 (findee_kit.broker 참고, None이면 사용자 코드가 Findee를 직접 생성)
+            profile: 프로파일러 설정 (findee_kit.profiler.start 참고, None이면 프로파일링하지 않음)
+        """
+        start = time.perf_counter()
+        request = {'code': code, 'limits': limits, 'broker': broker, 'profile': profile}
+        profile_r, profile_w = os.pipe() if profile else (None, None)
+        extra_fds = [profile_w] if profile else []
+        try:
+            process = self._spawn_warm(request, extra_fds) if self.supported else None
+            mode = WARM
+            if process is None:
+                if profile:
+                    request['profile_fd'] = profile_w
+                process = self._spawn_cold(request, pass_fds=extra_fds)
+                mode = COLD
+        except BaseException:
+            if profile:
+                os.close(profile_r)
+            raise
+        finally:
+            if profile:
+                os.close(profile_w)
+        process.profile = open(profile_r, 'rb', buffering=0) if profile else None
+        INTERPRETER_STARTS.labels(mode).inc()
+        INTERPRETER_SPAWN_SECONDS.labels(mode).observe(time.perf_counter() - start)
+        return process
+
+    def spawn_kernel(self, limits: Optional[dict] = None, broker: Optional[str] = None):
+        """
+        커널 프로세스 시작 (forkserver.run_kernel) - (Popen 호환 객체, 제어 소켓)
+        커널은 실행마다 제어 소켓으로 받은 파이프에 출력하므로 반환된 객체의 stdout / stderr는 쓰이지 않음
+        """
+        start = time.perf_counter()
+        control, theirs = socket.socketpair()
+        request = {'kernel': True, 'limits': limits, 'broker': broker}
+        try:
+            process = self._spawn_warm(request, [theirs.fileno()]) if self.supported else None
+            mode = WARM
+            if process is None:
+                process = self._spawn_cold(dict(request, control=theirs.fileno()), pass_fds=(theirs.fileno(),))
+                mode = COLD
+        except BaseException:
+            control.close()
+            raise
+        finally:
+            theirs.close()  # 커널만 가져야 커널 종료가 제어 소켓 EOF로 전달됨
+        INTERPRETER_STARTS.labels(mode).inc()
+        INTERPRETER_SPAWN_SECONDS.labels(mode).observe(time.perf_counter() - start)
+        return process, control
+
+    def _spawn_warm(self, request: dict, extra_fds: Iterable[int] = ()) -> Optional[WarmProcess]:
+        self.start()  # 처음 실행이거나 서버가 죽었으면 다시 시작
+        if not self._ready.wait(self.ready_timeout):
+            return None
+
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.socket_path)
+            forkserver.send_request(conn, request, [out_w, err_w, *extra_fds])
+            return WarmProcess(conn, open(out_r, 'rb', buffering=0), open(err_r, 'rb', buffering=0))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ Fork server request failed, running cold: {e}")
+            conn.close()
+            os.close(out_r)
+            os.close(err_r)
+            return None
+        finally:
+            # 쓰기 끝은 자식만 가져야 EOF가 전달됨
+            os.close(out_w)
+            os.close(err_w)
+
+    def _spawn_cold(self, request: dict, pass_fds: Iterable[int] = ()) -> subprocess.Popen:
+        """새 인터프리터로 실행 - 요청은 stdin 파이프로 전달 (`forkserver.py --run`, 포크 서버 자식과 같은 run_code)"""
+        process = subprocess.Popen(
+            [sys.executable, '-u', forkserver.__file__, '--run'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,  # 버퍼링 완전 비활성화
+            start_new_session=os.name == 'posix',  # 포크 서버 자식처럼 실행마다 프로세스 그룹
+            pass_fds=tuple(pass_fds)
+        )
+        # 인터프리터는 stdin을 끝까지 읽은 뒤 실행하므로 출력 파이프가 막히기 전에 쓰기가 끝남
+        process.stdin.write(json.dumps(request).encode('utf-8'))
+        process.stdin.close()
+        return process
@@ -0,0 +1,346 @@
+"""
+WebEditor 커널 모드 (세션별로 오래 사는 인터프리터)
+
+일반 실행은 매번 새 프로세스에서 시작하므로, 같은 코드를 조금 고쳐 다시 실행할 때마다 라이브러리 import와
+초기화(모델 로드, 보정값 계산 등)를 반복한다. 커널 모드에서는 세션마다 커널 프로세스(forkserver.run_kernel)
+하나가 __main__ 네임스페이스를 유지하고, 실행할 때마다 코드만 보내 이어서 실행한다 (노트북 셀과 같은 방식).
+- 실행 1건 = 커널에 보낸 코드 1개 - 출력 파이프 / 종료 코드는 일반 실행과 같은 Popen 호환 객체(KernelExecution)
+- 중지: 커널 프로세스 그룹에 SIGINT → 실행 중인 코드만 KeyboardInterrupt (네임스페이스 유지)
+  끝나지 않아 SIGKILL되면 커널이 종료되고, 다음 실행에서 새 커널로 시작
+- 재시작: 커널 종료 → 다음 실행에서 새 커널
+- 정리: idle_seconds 동안 쓰지 않은 커널, 전체 메모리(PSS)가 memory_budget_mb를 넘으면 오래 쓰지 않은 커널부터 종료
+  (실행 중인 커널은 정리하지 않음)
+- 커널 수가 max_kernels면 가장 오래 쓰지 않은 유휴 커널을 종료하고 시작 (모두 실행 중이면 KernelUnavailable)
+"""
+
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from . import forkserver
+from .interpreters import InterpreterPool, signal_group
+from .metrics import REGISTRY
+from .runs import RunLimits
+
+
+logger = logging.getLogger(__name__)
+
+#-커널 종료 이유 (kernel 이벤트의 reason)-#
+RESTART = 'restart'        # 사용자가 재시작
+IDLE = 'idle'              # idle_seconds 동안 사용하지 않음
+MEMORY = 'memory'          # memory_budget_mb 초과
+CAPACITY = 'capacity'      # max_kernels 초과 - 다른 세션의 커널 시작
+DIED = 'died'              # 커널이 종료됨 (중지 시 강제 종료, 메모리 부족 등)
+DISCONNECTED = 'disconnected'  # 세션 연결 끊김
+SHUTDOWN = 'shutdown'      # 앱 종료
+
+KERNELS = REGISTRY.gauge('findee_kernels', '실행 중인 커널 수')
+KERNEL_STARTS = REGISTRY.counter('findee_kernel_starts', '커널 시작 수')
+KERNEL_EXITS = REGISTRY.counter('findee_kernel_exits', '종료된 커널 수 (reason: restart / idle / memory / died / ...)',
+                                ('reason',))
+KERNEL_MEMORY = REGISTRY.gauge('findee_kernel_memory_bytes', '커널 메모리(PSS) 합계')
+
+
+class KernelUnavailable(RuntimeError):
+    """모든 커널이 실행 중이라 새 커널을 시작할 수 없음"""
+
+
+def _memory(pid: int) -> Optional[int]:
+    """
+    프로세스 메모리 (바이트, Linux 외에는 None)
+    포크 서버에서 fork한 커널은 미리 import한 모듈 페이지를 공유하므로 RSS 대신 PSS(공유 페이지를 나눠 계산)
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as file:
+            for line in file:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(f'/proc/{pid}/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class KernelExecution:
+    """커널에서 실행 중인 코드 1건 - subprocess.Popen에서 실행 코드가 쓰는 부분(pid, stdout, stderr, wait, kill)만 제공"""
+
+    def __init__(self, kernel: 'Kernel', stdout, stderr, profile=None):
+        self.kernel = kernel
+        self.stdout = stdout
+        self.stderr = stderr
+        self.profile = profile
+        self.returncode: Optional[int] = None
+        line = kernel.replies.readline()
+        if not line:
+            raise ConnectionError('kernel exited')
+        self.pid = json.loads(line)['pid']
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            line = self.kernel.replies.readline()
+            if line:
+                self.returncode = json.loads(line)['returncode']
+            else:
+                # 실행 중에 커널이 종료됨 (중지 후 SIGKILL, 메모리 부족 등) - 네임스페이스도 사라졌음을 바로 알림
+                self.kernel.alive = False
+                self.returncode = self.kernel.exit_code()
+                self.kernel.on_exit(self.kernel)
+            self.kernel.finish()
+        return self.returncode
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def send_signal(self, signum: int) -> None:
+        # 커널의 프로세스 그룹 - 사용자 코드가 만든 프로세스에도 전달
+        signal_group(self, signum)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+class Kernel:
+    """세션 하나의 커널 프로세스"""
+
+    def __init__(self, sid: str, process, control, on_exit: Callable[['Kernel'], None]):
+        self.sid = sid
+        self.process = process
+        self.control = control
+        self.on_exit = on_exit  # 실행 중에 커널이 종료됐을 때
+        self.replies = control.makefile('r', encoding='utf-8')
+        self.pid = process.pid
+        self.started = self.last_used = time.monotonic()
+        self.executions = 0
+        self.busy = False
+        self.alive = True
+        self._exit_lock = threading.Lock()  # 실행 스레드와 재시작 / 정리 스레드가 함께 기다리는 경우
+
+    def execute(self, code: str, profile: Optional[dict] = None) -> KernelExecution:
+        """코드 1건 실행 시작 - 출력(과 프로파일 보고)은 이번 실행용 파이프로 받음 (실행이 끝나면 커널이 닫아 EOF)"""
+        pipes = [os.pipe() for _ in range(3 if profile else 2)]
+        readers = [open(r, 'rb', buffering=0) for r, _ in pipes]
+        try:
+            forkserver.send_request(self.control, {'code': code, 'profile': profile}, [w for _, w in pipes])
+            execution = KernelExecution(self, *readers)
+        except (OSError, ValueError, KeyError):
+            self.alive = False
+            for reader in readers:
+                reader.close()
+            raise
+        finally:
+            for _, w in pipes:
+                os.close(w)
+        self.executions += 1
+        return execution
+
+    def finish(self) -> None:
+        self.busy = False
+        self.last_used = time.monotonic()
+
+    def memory(self) -> Optional[int]:
+        return _memory(self.pid) if self.alive else None
+
+    def exit_code(self) -> int:
+        with self._exit_lock:
+            return self.process.wait()
+
+    def close(self) -> None:
+        """커널 종료 - 실행 중인 코드와 사용자 코드가 만든 프로세스까지 (네임스페이스는 버려짐)"""
+        self.alive = False
+        # 먼저 종료해야 실행 스레드가 읽고 있는 제어 소켓이 EOF로 끝남
+        signal_group(self.process, signal.SIGKILL)
+        self.exit_code()
+        self.replies.close()
+        self.control.close()
+        for pipe in (self.process.stdout, self.process.stderr):
+            if pipe is not None:
+                pipe.close()
+
+    def info(self) -> dict:
+        now = time.monotonic()
+        memory = self.memory()
+        return {
+            'pid': self.pid,
+            'busy': self.busy,
+            'executions': self.executions,
+            'uptime_seconds': round(now - self.started, 1),
+            'idle_seconds': 0 if self.busy else round(now - self.last_used, 1),
+            'memory_mb': round(memory / 1024 / 1024, 1) if memory is not None else None,
+        }
+
+
+class KernelManager:
+    """세션별 커널 - 시작 / 실행 / 재시작 / 유휴·메모리 정리"""
+
+    def __init__(self, interpreters: InterpreterPool, notify: Callable[[str, dict], None] = None,
+                 limits: RunLimits = RunLimits(), broker=None, idle_seconds: float = 600,
+                 memory_budget_mb: Optional[float] = 768, max_kernels: int = 4, check_interval: float = 5.0):
+        """
+        Args:
+            interpreters: 커널 프로세스를 만드는 InterpreterPool
+            notify: (세션, {'state', 'reason', ...}) → 커널 시작 / 종료 알림
+            limits: 커널 프로세스의 자원 제한 (cpu_seconds는 커널 수명 전체에 누적되므로 적용하지 않음)
+            broker: 사용자 코드에 서버의 Findee를 제공하는 HardwareBroker (셀 실행이 끝날 때마다 모터 정지)
+            idle_seconds: 이 시간 동안 실행하지 않은 커널은 종료 (None이면 유지)
+            memory_budget_mb: 전체 커널 메모리 합계 상한 (None이면 제한 없음, 커널 하나의 상한은 limits.memory_mb)
+            max_kernels: 동시에 유지하는 커널 수
+            check_interval: 유휴 / 메모리 확인 주기 (초)
+        """
+        self.interpreters = interpreters
+        self.notify = notify or (lambda sid, event: None)
+        self.limits = limits
+        self.broker = broker
+        self.idle_seconds = idle_seconds
+        self.memory_budget_mb = memory_budget_mb
+        self.max_kernels = max_kernels
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._kernels: Dict[str, Kernel] = {}
+        self._closed = threading.Event()
+        self._collector: Optional[threading.Thread] = None
+
+    #-실행-#
+    def execute(self, sid: str, code: str, profile: Optional[dict] = None) -> KernelExecution:
+        """세션 커널에서 코드 실행 (커널이 없거나 종료됐으면 새로 시작) - Popen 호환 객체 반환"""
+        kernel = self._acquire(sid)
+        try:
+            return kernel.execute(code, profile)
+        except (OSError, ValueError, KeyError):
+            # 유휴 중에 종료된 커널 (메모리 부족 등) - 새 커널에서 한 번 더
+            self._remove(sid, kernel, DIED)
+            kernel = self._acquire(sid)
+            try:
+                return kernel.execute(code, profile)
+            except BaseException:
+                self._remove(sid, kernel, DIED)
+                raise
+
+    def _acquire(self, sid: str) -> Kernel:
+        with self._lock:
+            kernel = self._kernels.get(sid)
+            if kernel is not None and kernel.alive:
+                kernel.busy = True
+                return kernel
+        if kernel is not None:
+            self._remove(sid, kernel, DIED)
+
+        self._make_room()
+        broker = self.broker.start() if self.broker is not None else None
+        limits = dict(self.limits.rlimits(), cpu_seconds=None)
+        process, control = self.interpreters.spawn_kernel(limits, broker)
+        kernel = Kernel(sid, process, control, lambda kernel: self._remove(sid, kernel, DIED))
+        kernel.busy = True
+        with self._lock:
+            self._kernels[sid] = kernel
+            KERNELS.set(len(self._kernels))
+            if self._collector is None and not self._closed.is_set():
+                self._collector = threading.Thread(target=self._collect_loop, name='kernel-collector', daemon=True)
+                self._collector.start()
+        KERNEL_STARTS.inc()
+        logger.info(f"🧠 Kernel started for {sid} (pid {kernel.pid})")
+        self.notify(sid, {'state': 'started', 'pid': kernel.pid})
+        return kernel
+
+    def _make_room(self) -> None:
+        """커널 수가 max_kernels면 가장 오래 쓰지 않은 유휴 커널 종료"""
+        with self._lock:
+            if len(self._kernels) < self.max_kernels:
+                return
+            idle = [kernel for kernel in self._kernels.values() if not kernel.busy]
+        if not idle:
+            raise KernelUnavailable('실행 중인 커널이 너무 많습니다. 잠시 후 다시 시도하거나 일반 실행을 사용해주세요.')
+        oldest = min(idle, key=lambda kernel: kernel.last_used)
+        self._remove(oldest.sid, oldest, CAPACITY)
+
+    #-관리-#
+    def restart(self, sid: str) -> bool:
+        """세션 커널 종료 - 다음 실행은 새 커널에서 (커널이 없었으면 False)"""
+        kernel = self._kernels.get(sid)
+        return kernel is not None and self._remove(sid, kernel, RESTART)
+
+    def discard(self, sid: str) -> None:
+        """연결이 끊긴 세션의 커널 종료"""
+        kernel = self._kernels.get(sid)
+        if kernel is not None:
+            self._remove(sid, kernel, DISCONNECTED, notify=False)
+
+    def status(self, sid: str) -> Optional[dict]:
+        kernel = self._kernels.get(sid)
+        return kernel.info() if kernel is not None and kernel.alive else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            kernels = {sid: kernel.info() for sid, kernel in self._kernels.items()}
+        memory = [info['memory_mb'] for info in kernels.values() if info['memory_mb'] is not None]
+        return {
+            'kernels': list(kernels.values()),
+            'memory_mb': round(sum(memory), 1),
+            'memory_budget_mb': self.memory_budget_mb,
+            'idle_seconds': self.idle_seconds,
+            'max_kernels': self.max_kernels,
+        }
+
+    def shutdown(self) -> None:
+        self._closed.set()
+        with self._lock:
+            kernels = list(self._kernels.items())
+        for sid, kernel in kernels:
+            self._remove(sid, kernel, SHUTDOWN, notify=False)
+
+    def _remove(self, sid: str, kernel: Kernel, reason: str, notify: bool = True) -> bool:
+        with self._lock:
+            if self._kernels.get(sid) is not kernel:
+                return False  # 다른 스레드가 이미 정리
+            del self._kernels[sid]
+            KERNELS.set(len(self._kernels))
+        kernel.close()
+        KERNEL_EXITS.labels(reason).inc()
+        logger.info(f"🧹 Kernel for {sid} closed ({reason}, {kernel.executions} executions)")
+        if notify:
+            self.notify(sid, {'state': 'closed', 'reason': reason})
+        return True
+
+    #-유휴 / 메모리 정리-#
+    def collect(self) -> List[str]:
+        """유휴 커널과 메모리 예산을 넘게 한 커널 종료 - 종료한 세션 목록"""
+        now = time.monotonic()
+        with self._lock:
+            kernels = list(self._kernels.values())
+        removed = []
+        # 오래 쓰지 않은 순서로 - 메모리 예산을 넘으면 여기서부터 종료
+        kernels.sort(key=lambda kernel: kernel.last_used)
+        memory = {kernel.sid: kernel.memory() or 0 for kernel in kernels}
+        total = sum(memory.values())
+        KERNEL_MEMORY.set(total)
+        budget = self.memory_budget_mb * 1024 * 1024 if self.memory_budget_mb else None
+        for kernel in kernels:
+            if kernel.busy:
+                continue
+            if self.idle_seconds is not None and now - kernel.last_used > self.idle_seconds:
+                reason = IDLE
+            elif budget is not None and total > budget:
+                reason = MEMORY
+            else:
+                continue
+            if self._remove(kernel.sid, kernel, reason):
+                total -= memory[kernel.sid]
+                removed.append(kernel.sid)
+        KERNEL_MEMORY.set(total)
+        return removed
+
+    def _collect_loop(self) -> None:
+        while not self._closed.wait(self.check_interval):
+            try:
+                self.collect()
+            except Exception as e:
+                logger.error(f"❌ Kernel collector error: {e}")
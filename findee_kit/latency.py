@@ -0,0 +1,131 @@
+"""
+제어 지연 시간 추적
+
+브라우저 클릭 → Socket.IO 수신/핸들러 시작 → GPIO 호출 반환 → 피드백 수신까지
+각 단계의 지연 시간을 롤링 윈도우로 보관하고 p50/p95/p99를 계산한다.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, Optional
+
+
+# 단계 이름 (표시 순서 유지)
+CONTROL_STAGES = (
+    'uplink',       # 클라이언트 emit → 서버 핸들러 시작 (Socket.IO 수신 포함, 시계 보정)
+    'gpio',         # 핸들러 시작 → GPIO 호출 반환
+    'server',       # 핸들러 시작 → 피드백 emit
+    'round_trip',   # 클라이언트 emit → 클라이언트 피드백 수신 (클라이언트 보고)
+)
+
+# 시계 오차나 잘못된 보고값을 걸러내기 위한 상한 (ms)
+MAX_SAMPLE_MS = 60_000.0
+
+
+class RollingHistogram:
+    """최근 N개 샘플(ms)을 보관하는 롤링 히스토그램"""
+
+    def __init__(self, size: int = 500):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def observe(self, value_ms: float) -> None:
+        with self._lock:
+            self._samples.append(value_ms)
+            self.count += 1
+
+    def percentiles(self, quantiles: Iterable[int] = (50, 95, 99)) -> Dict[str, Optional[float]]:
+        """nearest-rank 방식 백분위 계산"""
+        with self._lock:
+            samples = sorted(self._samples)
+
+        result: Dict[str, Optional[float]] = {}
+        for q in quantiles:
+            if not samples:
+                result[f'p{q}'] = None
+                continue
+            rank = max(1, math.ceil(q / 100 * len(samples)))
+            result[f'p{q}'] = round(samples[rank - 1], 2)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self.count = 0
+
+
+@dataclass
+class ControlTrace:
+    """단일 제어 명령의 단계별 타임스탬프 (epoch ms)"""
+    trace_id: Optional[str] = None
+    client_ts: Optional[float] = None
+    handler_start: float = field(default_factory=lambda: time.time() * 1000)
+    gpio_return: Optional[float] = None
+
+    def mark_gpio_return(self) -> None:
+        self.gpio_return = time.time() * 1000
+
+
+class LatencyTracker:
+    """단계별 롤링 히스토그램 묶음"""
+
+    def __init__(self, stages: Iterable[str] = CONTROL_STAGES, window: int = 500):
+        self._histograms: Dict[str, RollingHistogram] = {
+            stage: RollingHistogram(window) for stage in stages
+        }
+
+    def observe(self, stage: str, value_ms: float) -> None:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            return
+        # 클라이언트가 보낸 값(latency_report)은 숫자가 아니거나 NaN / inf일 수 있음 - 정렬과 JSON 출력이 깨지므로 버림
+        if isinstance(value_ms, bool) or not isinstance(value_ms, (int, float)):
+            return
+        if not math.isfinite(value_ms) or value_ms < 0 or value_ms > MAX_SAMPLE_MS:
+            return
+        histogram.observe(value_ms)
+
+    def begin(self, trace: Optional[dict]) -> ControlTrace:
+        """motor_control 이벤트의 trace 필드로부터 추적 시작"""
+        trace = trace if isinstance(trace, dict) else {}
+        try:
+            client_ts = float(trace['client_ts']) if 'client_ts' in trace else None
+        except (TypeError, ValueError):
+            client_ts = None
+        return ControlTrace(trace_id=trace.get('id'), client_ts=client_ts)
+
+    def finish(self, trace: ControlTrace) -> dict:
+        """피드백 emit 직전 호출 - 서버측 단계를 기록하고 클라이언트에 돌려줄 정보를 반환"""
+        feedback_emit = time.time() * 1000
+
+        if trace.client_ts is not None:
+            self.observe('uplink', trace.handler_start - trace.client_ts)
+        if trace.gpio_return is not None:
+            self.observe('gpio', trace.gpio_return - trace.handler_start)
+        self.observe('server', feedback_emit - trace.handler_start)
+
+        return {
+            'id': trace.trace_id,
+            'handler_start': trace.handler_start,
+            'gpio_return': trace.gpio_return,
+            'feedback_emit': feedback_emit,
+        }
+
+    def report_round_trip(self, data: Optional[dict]) -> None:
+        """클라이언트가 측정한 왕복 시간 보고 처리"""
+        if isinstance(data, dict):
+            self.observe('round_trip', data.get('round_trip'))
+
+    def snapshot(self) -> dict:
+        return {
+            stage: {'count': histogram.count, **histogram.percentiles()}
+            for stage, histogram in self._histograms.items()
+        }
+
+    def reset(self) -> None:
+        for histogram in self._histograms.values():
+            histogram.reset()
@@ -0,0 +1,198 @@
+"""
+비동기 로깅
+
+motor_control, Socket.IO 연결 / 해제처럼 자주 호출되는 경로의 로그가 느린 SD 카드에 쓰는 동안
+요청 스레드를 막지 않도록
+- 호출 스레드: 호출 위치별 속도 제한 필터 + 크기가 제한된 큐에 레코드만 넣음 (가득 차면 버림)
+- 기록 스레드(QueueListener): 메시지 포맷, 콘솔 출력, 최근 레코드 메모리 링(/api/logs) 보관
+생략된 레코드 수는 다음으로 통과한 레코드에 '(+N건 생략)'으로 붙는다.
+"""
+
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import REGISTRY
+
+
+LOG_RECORDS = REGISTRY.counter('findee_log_records', '기록 스레드가 처리한 로그 레코드 수', ('level',))
+LOG_DROPPED = REGISTRY.counter('findee_log_dropped', '큐가 가득 차 버린 로그 레코드 수')
+LOG_SUPPRESSED = REGISTRY.counter('findee_log_suppressed', '호출 위치별 속도 제한으로 생략한 로그 레코드 수')
+LOG_QUEUE_DEPTH = REGISTRY.gauge('findee_log_queue_depth', '기록을 기다리는 로그 레코드 수')
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+
+
+class RateLimitFilter(logging.Filter):
+    """호출 위치(파일, 줄)별 토큰 버킷 - max_level 이하 레코드만 제한, 경고 / 오류는 항상 통과"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 5, max_level: int = logging.INFO):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.max_level = max_level
+        self._lock = threading.Lock()
+        self._sites: Dict[Tuple[str, int], Tuple[float, float, int]] = {}  # 위치 → (토큰, 갱신 시각, 생략 수)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.rate <= 0:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            tokens, last, suppressed = self._sites.get(key, (self.burst, now, 0))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self._sites[key] = (tokens, now, suppressed + 1)
+                LOG_SUPPRESSED.inc()
+                return False
+            self._sites[key] = (tokens - 1, now, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버림 - 메시지 포맷은 기록 스레드에서"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 안의 큐이므로 QueueHandler.prepare의 포맷 / 복사를 건너뜀
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.inc()
+
+
+class SuppressedFormatter(logging.Formatter):
+    """기존 포매터 결과 뒤에 생략된 레코드 수를 표시"""
+
+    def __init__(self, inner: Optional[logging.Formatter] = None):
+        super().__init__()
+        self.inner = inner or logging.Formatter(LOG_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = self.inner.format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        return f"{text} (+{suppressed}건 생략)" if suppressed else text
+
+
+class LogRing(logging.Handler):
+    """최근 로그 레코드 메모리 링 - 기록 스레드에서 채우고 /api/logs가 읽음"""
+
+    def __init__(self, capacity: int = 500, log_queue: Optional[queue.Queue] = None):
+        super().__init__()
+        self.log_queue = log_queue
+        self._records = deque(maxlen=capacity)
+        self._seq = 0
+        self._ring_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        LOG_RECORDS.labels(record.levelname).inc()
+        if self.log_queue is not None:
+            LOG_QUEUE_DEPTH.set(self.log_queue.qsize())
+        try:
+            entry = {
+                'timestamp': record.created,
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+                'site': f"{record.module}:{record.lineno}",
+            }
+            if getattr(record, 'suppressed', 0):
+                entry['suppressed'] = record.suppressed
+            if record.exc_info:
+                entry['exception'] = logging.Formatter().formatException(record.exc_info)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._ring_lock:
+            self._seq += 1
+            entry['seq'] = self._seq
+            self._records.append(entry)
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def records(self, since: int = 0, level: Optional[str] = None, limit: int = 100) -> List[dict]:
+        """since 이후 레코드 (level 이상만, 최근 limit개)"""
+        min_level = logging.getLevelName(level.upper()) if level else logging.NOTSET
+        if not isinstance(min_level, int):
+            raise ValueError(f"Unknown log level: {level}")
+        with self._ring_lock:
+            records = [r for r in self._records
+                       if r['seq'] > since and logging.getLevelName(r['level']) >= min_level]
+        return records[-limit:] if limit > 0 else records
+
+
+class AsyncLogging:
+    """로거의 핸들러를 큐 핸들러 하나로 바꾸고, 원래 핸들러 + 메모리 링을 기록 스레드에서 실행"""
+
+    def __init__(self, logger: logging.Logger, queue_size: int = 1000, ring_size: int = 500,
+                 rate: float = 1.0, burst: int = 5, rate_limit_level: int = logging.INFO):
+        self.logger = logger
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.ring = LogRing(ring_size, log_queue=self.queue)
+        self.rate_limit = RateLimitFilter(rate=rate, burst=burst, max_level=rate_limit_level)
+
+        # 기존 핸들러(콘솔 등)는 기록 스레드로 이동
+        self.handlers = list(logger.handlers) or [logging.StreamHandler()]
+        for handler in self.handlers:
+            logger.removeHandler(handler)
+            if not isinstance(handler.formatter, SuppressedFormatter):
+                handler.setFormatter(SuppressedFormatter(handler.formatter))
+
+        self.queue_handler = DroppingQueueHandler(self.queue)
+        self.queue_handler.addFilter(self.rate_limit)
+        self.listener = logging.handlers.QueueListener(self.queue, *self.handlers, self.ring,
+                                                       respect_handler_level=True)
+        logger.addHandler(self.queue_handler)
+        self.listener.start()
+        self.running = True
+
+    def query(self, since: int = 0, level: Optional[str] = None, limit: int = 100) -> dict:
+        """/api/logs 응답 - 레코드 + 큐 / 속도 제한 상태 (알 수 없는 level이면 ValueError)"""
+        return {
+            'records': self.ring.records(since=since, level=level, limit=limit),
+            'last_seq': self.ring.last_seq,
+            'queued': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'rate_limit': {'rate': self.rate_limit.rate, 'burst': self.rate_limit.burst,
+                           'max_level': logging.getLevelName(self.rate_limit.max_level)},
+        }
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 기록하고 로거를 동기 핸들러로 되돌림"""
+        if not self.running:
+            return
+        self.running = False
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+
+
+_async_logging: Dict[str, AsyncLogging] = {}
+_setup_lock = threading.Lock()
+
+
+def setup_async_logging(logger: logging.Logger, **options) -> AsyncLogging:
+    """로거에 비동기 로깅 설치 (같은 로거에 다시 호출하면 기존 설정의 속도 제한만 갱신)"""
+    with _setup_lock:
+        current = _async_logging.get(logger.name)
+        if current is not None and current.running:
+            current.rate_limit.rate = options.get('rate', current.rate_limit.rate)
+            current.rate_limit.burst = options.get('burst', current.rate_limit.burst)
+            return current
+        current = _async_logging[logger.name] = AsyncLogging(logger, **options)
+        return current
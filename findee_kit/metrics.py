@@ -0,0 +1,331 @@
+"""
+런타임 메트릭 레지스트리와 Prometheus 텍스트 출력
+
+Pi Zero 2 W에서 상시 켜둘 수 있도록 가볍게 구현한 카운터 / 게이지 / 히스토그램
+- 관측 1회 = 락 1회 + 버킷 이분 탐색
+- 라벨 조합별 자식 메트릭을 dict로 캐시
+- /metrics 엔드포인트에서 Prometheus text format (0.0.4)으로 출력
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 기본 히스토그램 버킷 (초) - 1ms ~ 5s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨별 자식 메트릭을 관리하는 기본 클래스"""
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values) -> object:
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 개수 불일치 {self.labelnames} != {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def remove(self, *values) -> None:
+        with self._lock:
+            self._children.pop(tuple(str(value) for value in values), None)
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type_name}',
+        ]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class _ValueChild:
+    __slots__ = ('_lock', 'value')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    type_name = 'counter'
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self) -> List[str]:
+        return [
+            f'{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(child.value)}'
+            for key, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+    type_name = 'gauge'
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _samples(self) -> List[str]:
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}'
+            for key, child in list(self._children.items())
+        ]
+
+
+class _HistogramChild:
+    __slots__ = ('_lock', '_upper_bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # 마지막 칸 = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> '_Timer':
+        return _Timer(self)
+
+
+class _Timer:
+    """with 블록 실행 시간을 히스토그램에 기록"""
+    __slots__ = ('_child', '_start')
+
+    def __init__(self, child: _HistogramChild):
+        self._child = child
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._child.observe(time.perf_counter() - self._start)
+        return False
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램"""
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total, count = child.sum, child.count
+
+            cumulative = 0
+            for upper, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(upper)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class PeriodMonitor:
+    """주기 루프의 실제 주기와 설정 주기의 차이(지터)를 기록"""
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+        self._last: Optional[float] = None
+
+    def tick(self, expected: float) -> None:
+        now = time.perf_counter()
+        if self._last is not None:
+            self._histogram.observe(abs((now - self._last) - expected))
+        self._last = now
+
+    def reset(self) -> None:
+        self._last = None
+
+
+class MetricsRegistry:
+    """이름으로 메트릭을 등록/조회하는 레지스트리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, cls, name: str, documentation: str, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"메트릭 '{name}'이 다른 타입으로 이미 등록되어 있습니다.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames=labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames=labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames=labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# 프로세스 전역 기본 레지스트리
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+#-공통 메트릭 정의-#
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'findee_http_request_duration_seconds', 'HTTP 요청 처리 시간 (라우트별)',
+    ('route', 'method', 'status'))
+SOCKETIO_EMIT_SECONDS = REGISTRY.histogram(
+    'findee_socketio_emit_duration_seconds', 'Socket.IO emit 호출 시간 (이벤트별)', ('event',))
+SOCKETIO_EMIT_IN_FLIGHT = REGISTRY.gauge(
+    'findee_socketio_emit_queue_depth', '진행 중이거나 대기 중인 Socket.IO emit 수')
+FRAME_CAPTURE_SECONDS = REGISTRY.histogram(
+    'findee_frame_capture_duration_seconds', '카메라 프레임 획득 시간')
+FRAME_ENCODE_SECONDS = REGISTRY.histogram(
+    'findee_frame_encode_duration_seconds', 'JPEG 인코딩 시간')
+STREAM_FPS = REGISTRY.gauge(
+    'findee_stream_fps', 'MJPEG 스트림 클라이언트별 전송 fps', ('client',))
+STREAM_CLIENTS = REGISTRY.gauge(
+    'findee_stream_clients', '현재 MJPEG 스트림 시청자 수')
+SENSOR_LOOP_JITTER_SECONDS = REGISTRY.histogram(
+    'findee_sensor_loop_jitter_seconds', '센서 측정 루프 주기 오차 (|실제 - 설정|)',
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+MOTOR_COMMANDS = REGISTRY.counter(
+    'findee_motor_commands', '처리한 모터 제어 명령 수', ('direction', 'result'))
+
+
+def instrument_flask(app, registry: MetricsRegistry = REGISTRY, endpoint: str = '/metrics') -> None:
+    """라우트별 요청 시간 기록 훅과 /metrics 엔드포인트 등록"""
+    from flask import Response, g, request
+
+    @app.before_request
+    def _metrics_start_timer():
+        g._metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _metrics_record(response):
+        start = getattr(g, '_metrics_start', None)
+        if start is not None:
+            # 라우트 규칙 단위로 기록해 라벨 수를 제한 (예: /static/<path:filename>)
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            HTTP_REQUEST_SECONDS.labels(route, request.method, response.status_code).observe(
+                time.perf_counter() - start)
+        return response
+
+    def metrics():
+        return Response(registry.render(), mimetype=None, content_type=PROMETHEUS_CONTENT_TYPE)
+
+    app.add_url_rule(endpoint, 'metrics', metrics)
+
+
+def instrument_socketio(socketio) -> None:
+    """SocketIO.emit을 감싸 이벤트별 emit 시간과 대기 중인 emit 수를 기록
+
+    flask_socketio.emit()도 내부적으로 socketio.emit을 호출하므로 핸들러 안의 emit도 포함된다.
+    """
+    original_emit = socketio.emit
+
+    def emit(event, *args, **kwargs):
+        SOCKETIO_EMIT_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            return original_emit(event, *args, **kwargs)
+        finally:
+            SOCKETIO_EMIT_SECONDS.labels(event).observe(time.perf_counter() - start)
+            SOCKETIO_EMIT_IN_FLIGHT.dec()
+
+    socketio.emit = emit
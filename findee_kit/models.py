@@ -0,0 +1,19 @@
+"""
+API 응답 모델
+
+pydantic import 비용이 커서 blueprints.system은 첫 상태 조회 시 이 모듈을 import한다.
+"""
+
+from pydantic import BaseModel
+
+
+class Info(BaseModel):
+    connected: bool = False
+    running: bool = False
+    motor_status: bool = False
+    camera_status: bool = False
+    ultrasonic_status: bool = False
+    camera_fps: int = 0
+    current_resolution: str = 'N/A'
+    speed: int = 60
+    direction: str = 'stop'
@@ -0,0 +1,200 @@
+"""
+사용자 코드 출력 스트리밍
+
+실행 중인 프로세스의 stdout / stderr를 줄마다 이벤트 하나로 보내지 않고 묶음('output' 이벤트)으로 전송한다.
+- 묶음: 첫 줄이 쌓인 뒤 window 초가 지나거나 max_bytes에 도달하면 전송
+- 순서: 같은 스트림의 연속된 줄은 청크 하나로 합치고, 청크마다 실행 안에서의 순번(seq)을 붙임
+- 속도 제한: 세션별 초당 줄 수(토큰 버킷)를 넘는 줄은 버리고 그 자리에 생략된 줄 수 표시
+- 역압: ack를 받지 못한 묶음이 max_in_flight개면 전송을 멈추고 모아 둠 (max_buffer를 넘으면 버림)
+
+묶음 형식: {'run': 실행 ID, 'seq': 묶음 순번, 'chunks': [[seq, stream, text], ...]}
+- stream: 'stdout' | 'stderr' | 'dropped' (dropped의 text는 생략된 줄 수)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from .metrics import REGISTRY
+
+
+DROPPED = 'dropped'
+
+OUTPUT_LINES = REGISTRY.counter('findee_output_lines', '클라이언트로 전송한 출력 줄 수', ('stream',))
+OUTPUT_DROPPED = REGISTRY.counter('findee_output_dropped_lines', '전송하지 않고 버린 출력 줄 수', ('reason',))
+OUTPUT_MESSAGE_BYTES = REGISTRY.histogram(
+    'findee_output_message_bytes', 'output 묶음 하나의 텍스트 크기',
+    buckets=(64, 256, 1024, 4096, 16384, 65536))
+
+
+class LineRateLimiter:
+    """세션별 출력 줄 수 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class SessionRateLimits:
+    """세션(sid)별 LineRateLimiter - 같은 세션의 연속 실행은 버킷을 공유"""
+
+    def __init__(self, rate: float = 1000.0, burst: int = 5000):
+        self.rate = rate
+        self.burst = burst
+        self._limiters: Dict[str, LineRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> LineRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(sid)
+            if limiter is None:
+                limiter = self._limiters[sid] = LineRateLimiter(self.rate, self.burst)
+            return limiter
+
+    def discard(self, sid: str) -> None:
+        with self._lock:
+            self._limiters.pop(sid, None)
+
+
+class OutputStream:
+    """실행 1건의 출력 묶음 - add / flush_due / close는 출력을 읽는 스레드 하나에서 호출"""
+
+    def __init__(self, send: Callable[[dict, Callable], None], run_id=None,
+                 limiter: Optional[LineRateLimiter] = None, window: float = 0.05, max_bytes: int = 16384,
+                 max_buffer: int = 262144, max_in_flight: int = 4, ack_timeout: float = 5.0):
+        """
+        Args:
+            send: (묶음, ack 콜백) → 전송 (socketio.emit(..., callback=ack))
+            run_id: 묶음에 붙는 실행 ID (같은 세션의 여러 실행 구분)
+            limiter: 세션별 줄 수 제한 (None이면 제한 없음)
+            window: 첫 줄이 쌓인 뒤 묶음을 보내기까지의 최대 시간 (초)
+            max_bytes: 묶음 하나의 최대 텍스트 크기 (도달하면 바로 전송)
+            max_buffer: 역압으로 전송을 멈춘 동안 모아 둘 최대 텍스트 크기
+            max_in_flight: ack를 기다리는 묶음 수 상한
+            ack_timeout: 이 시간 안에 ack가 없으면 잃어버린 것으로 보고 다음 묶음 전송 (초)
+        """
+        self.send = send
+        self.run_id = run_id
+        self.limiter = limiter
+        self.window = window
+        self.max_bytes = max_bytes
+        self.max_buffer = max_buffer
+        self.max_in_flight = max_in_flight
+        self.ack_timeout = ack_timeout
+
+        self._chunks: List[list] = []
+        self._buffered = 0
+        self._first_at: Optional[float] = None
+        self._chunk_seq = 0
+        self._message_seq = 0
+        self._dropped = 0
+        self._in_flight = deque()  # 전송 시각 (ack마다 가장 오래된 것부터 제거)
+        self._lock = threading.Lock()
+        self.dropped_total = 0
+
+    def add(self, stream: str, line: str) -> None:
+        """출력 한 줄 추가 (줄바꿈 제외)"""
+        if self.limiter is not None and not self.limiter.take():
+            self._drop('rate')
+            return
+        if self._buffered + len(line) > self.max_buffer:
+            self._drop('buffer')
+            return
+
+        self._mark_dropped()
+        last = self._chunks[-1] if self._chunks else None
+        if last is not None and last[1] == stream and len(last[2]) + len(line) < self.max_bytes:
+            last[2] += '\n' + line
+        else:
+            self._append(stream, line)
+        self._buffered += len(line) + 1
+        OUTPUT_LINES.labels(stream).inc()
+        if self._first_at is None:
+            self._first_at = time.monotonic()
+
+    def due(self) -> Optional[float]:
+        """다음 묶음 전송까지 남은 시간 (초, 쌓인 출력이 없으면 None) - select 타임아웃으로 사용"""
+        if self._first_at is None:
+            return None
+        return max(0.0, self._first_at + self.window - time.monotonic())
+
+    def flush_due(self) -> None:
+        """window가 지났거나 max_bytes만큼 쌓였으면 전송 (ack 대기 묶음이 가득 차면 다음 기회로)"""
+        if self._first_at is None:
+            return
+        if self._buffered < self.max_bytes and time.monotonic() < self._first_at + self.window:
+            return
+        while self._chunks and self._can_send():
+            self._send_message()
+        if self._chunks:
+            self._first_at = time.monotonic()  # ack를 기다렸다가 window 뒤에 다시 시도
+
+    def close(self) -> None:
+        """남은 출력과 생략 표시를 모두 전송 (실행 종료 시)"""
+        self._mark_dropped()
+        while self._chunks:
+            self._send_message()
+
+    #-내부-#
+    def _append(self, stream: str, text) -> None:
+        self._chunk_seq += 1
+        self._chunks.append([self._chunk_seq, stream, text])
+
+    def _drop(self, reason: str) -> None:
+        self._dropped += 1
+        self.dropped_total += 1
+        OUTPUT_DROPPED.labels(reason).inc()
+
+    def _mark_dropped(self) -> None:
+        # 버린 줄이 있던 자리에 생략 표시를 넣어 앞뒤 출력 순서를 유지
+        if self._dropped:
+            self._append(DROPPED, self._dropped)
+            self._dropped = 0
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+
+    def _can_send(self) -> bool:
+        with self._lock:
+            expired = time.monotonic() - self.ack_timeout
+            while self._in_flight and self._in_flight[0] < expired:
+                self._in_flight.popleft()
+            return len(self._in_flight) < self.max_in_flight
+
+    def _on_ack(self, *args) -> None:
+        with self._lock:
+            if self._in_flight:
+                self._in_flight.popleft()
+
+    def _send_message(self) -> None:
+        # max_bytes 단위로 나눠 전송 (역압으로 쌓인 출력이 한 묶음에 몰리지 않도록)
+        chunks, size = [], 0
+        while self._chunks and (not chunks or size < self.max_bytes):
+            chunk = self._chunks.pop(0)
+            if chunk[1] != DROPPED:
+                size += len(chunk[2]) + 1
+            chunks.append(chunk)
+
+        self._buffered = max(0, self._buffered - size)
+        if not self._chunks:
+            self._first_at = None
+        self._message_seq += 1
+        with self._lock:
+            self._in_flight.append(time.monotonic())
+        OUTPUT_MESSAGE_BYTES.observe(size)
+        self.send({'run': self.run_id, 'seq': self._message_seq, 'chunks': chunks}, self._on_ack)
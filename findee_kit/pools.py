@@ -0,0 +1,224 @@
+"""
+작업 종류별 제한된 워커 풀
+
+요청마다 threading.Thread를 새로 만들지 않고 작업 종류(하드웨어 I/O, 서브프로세스 I/O,
+백그라운드 작업)마다 최대 워커 수와 대기열 길이가 정해진 풀을 공유한다.
+- 워커는 필요할 때 max_workers까지 생성되고 idle_timeout 동안 놀면 종료
+- 대기열이 가득 차면 거부 정책(reject / block / caller_runs / drop_oldest) 적용
+- 풀별 워커 수, 사용률, 대기열 길이, 대기 시간, 거부 수를 메트릭으로 기록
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Tuple
+
+from .metrics import REGISTRY
+
+
+REJECT = 'reject'            # PoolRejected 예외
+BLOCK = 'block'              # 대기열에 자리가 날 때까지 호출자 대기
+CALLER_RUNS = 'caller_runs'  # 호출한 스레드에서 바로 실행
+DROP_OLDEST = 'drop_oldest'  # 가장 오래 기다린 작업을 PoolRejected로 취소하고 새 작업 추가
+POLICIES = (REJECT, BLOCK, CALLER_RUNS, DROP_OLDEST)
+
+
+#-풀 메트릭-#
+POOL_WORKERS = REGISTRY.gauge('findee_pool_workers', '풀별 현재 워커 스레드 수', ('pool',))
+POOL_UTILIZATION = REGISTRY.gauge('findee_pool_utilization', '풀별 작업 중인 워커 비율 (busy / max_workers)', ('pool',))
+POOL_QUEUE_DEPTH = REGISTRY.gauge('findee_pool_queue_depth', '풀별 워커를 기다리는 작업 수', ('pool',))
+POOL_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    'findee_pool_queue_wait_seconds', '작업 제출부터 워커가 꺼낼 때까지의 대기 시간', ('pool',))
+POOL_TASK_SECONDS = REGISTRY.histogram('findee_pool_task_duration_seconds', '풀 작업 실행 시간', ('pool',))
+POOL_REJECTED = REGISTRY.counter('findee_pool_rejected', '대기열이 가득 차 거부된 작업 수', ('pool', 'policy'))
+
+
+class PoolRejected(RuntimeError):
+    """대기열이 가득 차 작업이 거부됨"""
+
+
+_Task = Tuple[Future, Callable, tuple, dict, float]
+
+
+class WorkerPool:
+    """최대 워커 수와 대기열 길이가 제한된 스레드 풀"""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 0,
+                 policy: str = REJECT, idle_timeout: float = 30.0):
+        """
+        Args:
+            max_workers: 동시에 실행되는 작업 수 상한
+            max_queue: 모든 워커가 바쁠 때 기다릴 수 있는 작업 수 (0이면 대기 없음)
+            policy: 대기열이 가득 찼을 때의 처리 방식 (POLICIES)
+            idle_timeout: 일이 없는 워커가 종료되기까지의 시간 (초)
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy} (expected one of {POLICIES})")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.policy = policy
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)   # 워커: 새 작업 대기
+        self._space = threading.Condition(self._lock)  # BLOCK 정책 제출자: 대기열 자리 대기
+        self._tasks: Deque[_Task] = deque()
+        self._workers = 0
+        self._busy = 0
+        self._shutdown = False
+        self._local = threading.local()
+        self.completed = 0
+        self.rejected = 0
+
+        self._workers_gauge = POOL_WORKERS.labels(name)
+        self._utilization_gauge = POOL_UTILIZATION.labels(name)
+        self._queue_gauge = POOL_QUEUE_DEPTH.labels(name)
+        self._queue_wait = POOL_QUEUE_WAIT_SECONDS.labels(name)
+        self._task_seconds = POOL_TASK_SECONDS.labels(name)
+
+    #-상태-#
+    @property
+    def queued(self) -> int:
+        """빈 워커가 없어 기다리는 작업 수"""
+        return max(0, len(self._tasks) - (self._workers - self._busy))
+
+    def _full_locked(self) -> bool:
+        return len(self._tasks) - (self._workers - self._busy) >= self.max_queue
+
+    def in_worker(self) -> bool:
+        """현재 스레드가 이 풀의 워커인지"""
+        return getattr(self._local, 'worker', False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'name': self.name,
+                'policy': self.policy,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'workers': self._workers,
+                'busy': self._busy,
+                'queued': self.queued,
+                'completed': self.completed,
+                'rejected': self.rejected,
+            }
+
+    def _update_gauges(self) -> None:
+        self._workers_gauge.set(self._workers)
+        self._utilization_gauge.set(round(self._busy / self.max_workers, 3))
+        self._queue_gauge.set(self.queued)
+
+    #-작업 제출-#
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """작업 제출 - 대기열이 가득 차면 정책에 따라 처리"""
+        future = Future()
+        dropped = None
+        run_in_caller = False
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f"pool '{self.name}' is shut down")
+
+            # 빈 워커가 없으면 max_workers까지 새 워커 생성
+            if self._workers - self._busy <= len(self._tasks) and self._workers < self.max_workers:
+                self._spawn_locked()
+
+            while self._full_locked():
+                if self.policy == BLOCK:
+                    self._space.wait()
+                    if self._shutdown:
+                        raise RuntimeError(f"pool '{self.name}' is shut down")
+                    continue
+
+                self.rejected += 1
+                POOL_REJECTED.labels(self.name, self.policy).inc()
+                if self.policy == DROP_OLDEST and self._tasks:
+                    dropped = self._tasks.popleft()
+                elif self.policy == CALLER_RUNS:
+                    run_in_caller = True
+                else:
+                    raise PoolRejected(f"pool '{self.name}' is full "
+                                       f"({self.max_workers} workers, {self.max_queue} queued)")
+                break
+
+            if not run_in_caller:
+                self._tasks.append((future, fn, args, kwargs, time.perf_counter()))
+                self._work.notify()
+                self._update_gauges()
+
+        if dropped is not None:
+            dropped[0].set_exception(PoolRejected(f"dropped from pool '{self.name}' by a newer task"))
+        if run_in_caller:
+            self._execute(future, fn, args, kwargs)
+        return future
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """작업을 제출하고 결과를 기다림 (워커 안에서 다시 호출하면 바로 실행해 교착 방지)"""
+        if self.in_worker():
+            return self._run(fn, args, kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._tasks) if cancel_pending else []
+            if cancel_pending:
+                self._tasks.clear()
+            self._work.notify_all()
+            self._space.notify_all()
+            self._update_gauges()
+        for future, *_ in pending:
+            future.cancel()
+
+    #-워커-#
+    def _spawn_locked(self) -> None:
+        self._workers += 1
+        thread = threading.Thread(target=self._worker, name=f'{self.name}-worker', daemon=True)
+        thread.start()
+
+    def _run(self, fn: Callable, args: tuple, kwargs: dict):
+        """작업 실행 방식 (하위 클래스에서 재정의)"""
+        return fn(*args, **kwargs)
+
+    def _execute(self, future: Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        start = time.perf_counter()
+        try:
+            result = self._run(fn, args, kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self._task_seconds.observe(time.perf_counter() - start)
+
+    def _worker(self) -> None:
+        self._local.worker = True
+        while True:
+            with self._lock:
+                while not self._tasks and not self._shutdown:
+                    if not self._work.wait(self.idle_timeout) and not self._tasks:
+                        break  # 유휴 시간 초과
+                if not self._tasks:
+                    self._workers -= 1
+                    self._update_gauges()
+                    return
+
+                future, fn, args, kwargs, submitted = self._tasks.popleft()
+                self._busy += 1
+                self._update_gauges()
+
+            self._queue_wait.observe(time.perf_counter() - submitted)
+            self._execute(future, fn, args, kwargs)
+
+            with self._lock:
+                self._busy -= 1
+                self.completed += 1
+                self._update_gauges()
+                self._space.notify()  # BLOCK 정책으로 기다리는 제출자 깨우기
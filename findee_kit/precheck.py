@@ -0,0 +1,262 @@
+"""
+사용자 코드 사전 검사 (실행 프로세스를 띄우기 전에 서버 프로세스 안에서)
+
+문법 오류가 있는 코드도 지금까지는 포크 / 인터프리터 시작을 거친 뒤 stderr 트레이스백으로만 보였다.
+- 문법: ast.parse + compile (ast.parse만으로는 안 잡히는 'return' outside function 등도 포함),
+  SyntaxWarning ("is" with a literal 등)은 경고
+- import: 모듈 최상위의 import 문을 실행 프로세스와 같은 검색 경로에서 찾아봄 (모듈을 import하지는 않음)
+  - if / try / 함수 안의 import는 검사하지 않음 (조건부 import, ImportError 처리 등)
+  - 코드가 sys.path를 바꾸거나 커널 모드(앞선 셀이 바꿨을 수 있음)이면 못 찾은 모듈은 오류 대신 경고
+  - 패키지는 있고 하위 모듈만 못 찾으면 경고
+  - provided(브로커 프록시로 제공하는 findee)는 설치되어 있지 않아도 통과
+오류가 하나라도 있으면 실행하지 않는다. 편집기는 입력할 때마다 같은 검사 결과로 마커를 표시한다.
+
+진단 1건: {'line', 'column', 'end_line', 'end_column', 'severity': 'error' | 'warning', 'source': 'syntax' | 'import', 'message'}
+(줄 / 열은 1부터, 끝 열은 포함하지 않음 - Monaco 마커와 같음)
+"""
+
+import ast
+import hashlib
+import importlib.machinery
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+FILENAME = '<editor>'  # forkserver.CODE_FILENAME과 같은 이름 (SyntaxWarning 구분)
+ERROR = 'error'
+WARNING = 'warning'
+FOUND, MISSING, UNKNOWN = 'found', 'missing', 'unknown'
+
+PRECHECK_SECONDS = REGISTRY.histogram('findee_precheck_duration_seconds', '사용자 코드 사전 검사 시간 (op: check / run)', ('op',))
+PRECHECK_RESULTS = REGISTRY.counter(
+    'findee_precheck_results', '사용자 코드 사전 검사 결과 (result: ok / warning / error, op=run의 error는 실행하지 않음)', ('op', 'result'))
+
+# catch_warnings는 전역 경고 필터를 바꾸므로 한 번에 하나만
+_WARNINGS_LOCK = threading.Lock()
+
+
+class _Parsed:
+    """코드 하나의 문법 검사 결과 (같은 코드는 다시 파싱하지 않음)"""
+    __slots__ = ('diagnostics', 'imports', 'changes_path')
+
+    def __init__(self, diagnostics: List[dict], imports: List[tuple], changes_path: bool):
+        self.diagnostics = diagnostics
+        self.imports = imports  # (모듈 이름, 상대 import 단계, 위치)
+        self.changes_path = changes_path
+
+
+def _diagnostic(position: tuple, severity: str, source: str, message: str) -> dict:
+    line, column, end_line, end_column = position
+    return {'line': line, 'column': column, 'end_line': end_line, 'end_column': end_column,
+            'severity': severity, 'source': source, 'message': message}
+
+
+def _column(lines: List[str], line: int, offset: int) -> int:
+    """ast의 col_offset(UTF-8 바이트) → 1부터 세는 글자 위치"""
+    text = lines[line - 1] if 0 < line <= len(lines) else ''
+    return len(text.encode('utf-8')[:offset].decode('utf-8', 'ignore')) + 1
+
+
+def _node_position(lines: List[str], node) -> tuple:
+    end_line = node.end_lineno or node.lineno
+    end_offset = node.end_col_offset if node.end_col_offset is not None else node.col_offset + 1
+    return (node.lineno, _column(lines, node.lineno, node.col_offset),
+            end_line, _column(lines, end_line, end_offset))
+
+
+def _line_position(lines: List[str], line: int) -> tuple:
+    text = lines[line - 1] if 0 < line <= len(lines) else ''
+    return line, len(text) - len(text.lstrip()) + 1, line, len(text) + 1
+
+
+def _syntax_error(lines: List[str], error: SyntaxError) -> dict:
+    line = error.lineno or 1
+    column = error.offset or 1
+    end_line, end_column = error.end_lineno, error.end_offset
+    # end_offset은 0 / -1이거나 시작보다 앞일 수 있음 (닫히지 않은 괄호, 들여쓰기 오류 등)
+    if not end_line or not end_column or end_column < 1 or (end_line, end_column) <= (line, column):
+        end_line, end_column = line, column + 1
+    return _diagnostic((line, column, end_line, end_column), ERROR, 'syntax', f"{type(error).__name__}: {error.msg}")
+
+
+def _changes_path(tree: ast.Module) -> bool:
+    """sys.path / site.addsitedir / importlib을 쓰는 코드 - 정적으로는 import 가능 여부를 알 수 없음"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr in ('path', 'addsitedir') \
+                and isinstance(node.value, ast.Name) and node.value.id in ('sys', 'site'):
+            return True
+        if isinstance(node, ast.Name) and node.id in ('importlib', '__import__'):
+            return True
+    return False
+
+
+def parse(code: str) -> _Parsed:
+    """문법 검사 + 최상위 import 목록"""
+    lines = code.splitlines()
+    with _WARNINGS_LOCK, warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', SyntaxWarning)
+        warnings.simplefilter('always', DeprecationWarning)  # 3.11: 잘못된 이스케이프 ('\d')
+        try:
+            tree = ast.parse(code, FILENAME)
+            compile(tree, FILENAME, 'exec', dont_inherit=True)
+        except SyntaxError as e:
+            return _Parsed([_syntax_error(lines, e)], [], False)
+        except ValueError as e:  # 널 문자 등
+            return _Parsed([_diagnostic((1, 1, 1, 2), ERROR, 'syntax', f"SyntaxError: {e}")], [], False)
+
+    diagnostics = [
+        _diagnostic(_line_position(lines, w.lineno), WARNING, 'syntax', f"{w.category.__name__}: {w.message}")
+        for w in caught if w.filename == FILENAME and issubclass(w.category, (SyntaxWarning, DeprecationWarning))
+    ]
+    imports = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, 0, _node_position(lines, alias)) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module != '__future__':
+            imports.append((node.module or '', node.level, _node_position(lines, node)))
+    return _Parsed(diagnostics, imports, _changes_path(tree))
+
+
+def has_errors(diagnostics: Iterable[dict]) -> bool:
+    return any(d['severity'] == ERROR for d in diagnostics)
+
+
+def describe(diagnostic: dict) -> str:
+    """출력 패널용 한 줄 ('3번째 줄, 5열: SyntaxError: invalid syntax')"""
+    return f"{diagnostic['line']}번째 줄, {diagnostic['column']}열: {diagnostic['message']}"
+
+
+class CodeChecker:
+    """실행 전 / 입력 중 사전 검사 - 파싱 결과는 코드 해시별 LRU로 재사용"""
+
+    def __init__(self, provided: Iterable[str] = ('findee',), cache_size: int = 32, max_code: int = 200_000,
+                 search_path: Optional[List[str]] = None):
+        """
+        Args:
+            provided: 설치되어 있지 않아도 실행 프로세스에서 import되는 모듈 (브로커 프록시)
+            cache_size: 파싱 결과를 유지할 코드 수 (입력 중 검사 → 실행 버튼은 같은 코드)
+            max_code: 검사할 코드의 최대 길이 (글자, 넘으면 검사 없이 실행)
+            search_path: 실행 프로세스의 모듈 검색 경로 (None이면 인터프리터를 한 번 띄워 구함)
+        """
+        self.provided = frozenset(provided)
+        self.cache_size = cache_size
+        self.max_code = max_code
+        self._cache: 'OrderedDict[bytes, _Parsed]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._path = list(search_path) if search_path is not None else None
+        self._path_lock = threading.Lock()
+        self._warming = False
+
+    #-검색 경로-#
+    def warm_up(self) -> None:
+        """실행 프로세스의 모듈 검색 경로를 백그라운드에서 미리 구함 (여러 번 호출해도 한 번만, 바로 반환)"""
+        if self._warming:
+            return
+        self._warming = True
+        threading.Thread(target=self.search_path, name='precheck-path', daemon=True).start()
+
+    def search_path(self) -> List[str]:
+        """실행 프로세스의 sys.path - 포크 서버처럼 sys.path[0]은 임시 디렉토리, 나머지는 인터프리터 기본값
+        (서버 프로세스의 sys.path에는 앱 디렉토리 / 저장소 루트가 들어 있어 그대로 쓰면 안 됨)"""
+        with self._path_lock:
+            if self._path is None:
+                try:
+                    output = subprocess.run(
+                        [sys.executable, '-c', 'import json, sys; print(json.dumps(sys.path[1:]))'],
+                        capture_output=True, timeout=10, check=True
+                    ).stdout
+                    self._path = [tempfile.gettempdir()] + json.loads(output)
+                except (OSError, subprocess.SubprocessError, ValueError) as e:
+                    logger.warning(f"⚠️ Could not read the interpreter search path, using the server's: {e}")
+                    self._path = [tempfile.gettempdir()] + sys.path[1:]
+            return self._path
+
+    #-검사-#
+    def check(self, code: str, kernel: bool = False, op: str = 'check') -> List[dict]:
+        """
+        진단 목록 반환 (오류가 없으면 빈 목록 또는 경고만)
+
+        Args:
+            kernel: 커널 모드 셀 - 앞선 셀이 sys.path / sys.modules를 바꿨을 수 있어 못 찾은 모듈은 경고
+            op: 메트릭 라벨 (check: 입력 중, run: 실행 전)
+        """
+        if len(code) > self.max_code:
+            return []
+        start = time.perf_counter()
+        parsed = self._parse(code)
+        diagnostics = list(parsed.diagnostics)
+        severity = WARNING if kernel or parsed.changes_path else ERROR
+        for name, level, position in parsed.imports:
+            if level:
+                diagnostics.append(_diagnostic(position, ERROR, 'import',
+                                               'ImportError: 에디터 코드에서는 상대 import를 쓸 수 없습니다'))
+            elif self.find(name) == MISSING:
+                # 패키지는 있는데 하위 모듈만 없으면 경고 (패키지가 import될 때 sys.modules에 넣는 경우가 있음)
+                top_missing = '.' not in name or self.find(name.partition('.')[0]) == MISSING
+                diagnostics.append(_diagnostic(position, severity if top_missing else WARNING, 'import',
+                                               f"ModuleNotFoundError: '{name}' 모듈을 찾을 수 없습니다"))
+
+        diagnostics.sort(key=lambda d: (d['line'], d['column']))
+
+        PRECHECK_SECONDS.labels(op).observe(time.perf_counter() - start)
+        result = ERROR if has_errors(diagnostics) else WARNING if diagnostics else 'ok'
+        PRECHECK_RESULTS.labels(op, result).inc()
+        return diagnostics
+
+    def _parse(self, code: str) -> _Parsed:
+        key = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            parsed = self._cache.get(key)
+            if parsed is not None:
+                self._cache.move_to_end(key)
+                return parsed
+        parsed = parse(code)
+        with self._lock:
+            self._cache[key] = parsed
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return parsed
+
+    def find(self, name: str) -> str:
+        """
+        모듈을 import하지 않고 찾기 - FOUND / MISSING / UNKNOWN(정적으로 알 수 없음, 예: os.path)
+
+        파일 시스템 검색 결과는 importlib의 디렉토리 캐시(mtime 확인)를 쓰므로 서버 실행 중에 설치한 패키지도 보인다.
+        """
+        parts = name.split('.')
+        top = parts[0]
+        if top in self.provided:
+            return FOUND
+        if top in sys.builtin_module_names or importlib.machinery.FrozenImporter.find_spec(top) is not None:
+            return FOUND if len(parts) == 1 else UNKNOWN
+        spec = importlib.machinery.PathFinder.find_spec(top, self.search_path()) or self._find_editable(top)
+        for index in range(1, len(parts)):
+            if spec is None:
+                break
+            if spec.submodule_search_locations is None:
+                return UNKNOWN  # 패키지가 아닌 모듈이 sys.modules에 넣는 하위 모듈 (os.path 등)
+            spec = importlib.machinery.PathFinder.find_spec('.'.join(parts[:index + 1]),
+                                                            list(spec.submodule_search_locations))
+        return FOUND if spec is not None else MISSING
+
+    @staticmethod
+    def _find_editable(name: str):
+        """pip install -e로 설치한 패키지 (site가 sys.meta_path에 넣는 매핑 finder - 코드를 실행하지 않음)"""
+        for finder in sys.meta_path:
+            if getattr(finder, '__module__', '').startswith('__editable__'):
+                spec = finder.find_spec(name, None)
+                if spec is not None:
+                    return spec
+        return None
@@ -0,0 +1,220 @@
+"""
+사용자 코드 프로파일러 (WebEditor "프로파일러로 실행")
+
+실행 프로세스 안에서 사용자 코드를 프로파일링하고 집계 결과를 JSON 줄로 보고한다.
+- sampling: 스레드가 interval초마다 사용자 코드 스레드의 스택을 읽어 스택별 샘플 수를 집계 (기본)
+  벽시계 기준이라 sleep / 브로커 호출 대기도 보임 - 제어 루프가 목표 주기를 못 맞추는 이유 찾기용, 오버헤드 낮음
+  report초마다 그때까지의 누적 결과 보고
+  프로파일링하는 동안 GIL 전환 간격(sys.setswitchinterval)을 interval / 20으로 줄임 - 기본 5 ms 간격이면
+  샘플러가 GIL을 늦게 받아 짧은 CPU 구간은 건너뛰고 sleep 직후만 샘플링하게 됨
+  (그래도 1 ms보다 짧게 끝나는 CPU 구간은 실제보다 적게 잡힘 - 그런 구간이 문제면 cprofile)
+- cprofile: cProfile로 함수별 호출 수 / 자체 시간 / 누적 시간 (모든 호출을 기록하므로 느려짐, 끝날 때 한 번 보고)
+
+보고 1건 = JSON 한 줄
+    {'mode', 'final', 'elapsed', 'samples', 'interval',
+     'functions': [{'name', 'file', 'line', 'self', 'total', 'calls'}, ...],  (sampling은 샘플 수, cprofile은 초)
+     'lines': [{'name', 'file', 'line', 'self'}, ...],  (샘플 시점에 실행 중이던 줄 - sleep / C 함수 호출 구분, sampling만)
+     'stacks': [['함수 (파일:줄);...', 샘플 수], ...]}  (루트 → 리프, flame graph용 - sampling만)
+스택은 사용자 코드(<editor...>) 프레임부터 기록한다 (실행 준비 코드는 제외).
+
+포크 서버 자식에서 findee_kit 패키지 없이 불러오므로(forkserver.py 참고) 표준 라이브러리만 사용한다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Optional
+
+
+SAMPLING = 'sampling'
+CPROFILE = 'cprofile'
+MODES = (SAMPLING, CPROFILE)
+
+USER_FILENAME = '<editor'  # 사용자 코드 파일 이름 (forkserver.CODE_FILENAME, 커널 셀은 '<editor:N>')
+MAX_FUNCTIONS = 50  # 보고에 담는 함수 수
+MAX_LINES = 30  # 보고에 담는 줄 수
+MAX_STACKS = 200  # 보고에 담는 스택 수 (나머지는 OTHER 하나로 합침)
+MAX_DEPTH = 128  # 스택 깊이 (재귀가 깊으면 리프 쪽만)
+OTHER = '(other)'
+RUNNER_FILES = ('forkserver.py', 'profiler.py')  # cprofile 결과에서 뺄 실행 준비 코드
+
+
+def _label(code) -> str:
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _function(code, **values) -> dict:
+    return {'name': getattr(code, 'co_qualname', code.co_name), 'file': os.path.basename(code.co_filename),
+            'line': code.co_firstlineno, **values}
+
+
+class SamplingProfiler:
+    """스택 샘플링 - 별도 스레드에서 interval초마다 대상 스레드의 프레임을 읽음"""
+
+    def __init__(self, report: Callable[[dict], None], interval: float = 0.005, report_interval: float = 1.0,
+                 thread_id: Optional[int] = None):
+        self.report = report
+        self.interval = interval
+        self.report_interval = report_interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()  # (code, ...) 루트 → 리프 → 샘플 수
+        self.lines = Counter()  # (리프 code, 줄 번호) → 샘플 수
+        self.samples = 0
+        self.started = None
+        self._switch_interval = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='findee-profiler', daemon=True)
+
+    def start(self) -> None:
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 20))
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        self.report(self.snapshot(final=True))
+
+    def _run(self) -> None:
+        next_report = time.monotonic() + self.report_interval
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= next_report:
+                next_report += self.report_interval
+                self.report(self.snapshot(final=False))
+
+    def sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        line = frame.f_lineno
+        codes = []
+        while frame is not None and len(codes) < MAX_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        # 루트 쪽부터 첫 사용자 코드 프레임 찾기 (없으면 아직 실행 전 / 이미 끝남)
+        for index in range(len(codes) - 1, -1, -1):
+            if codes[index].co_filename.startswith(USER_FILENAME):
+                self.stacks[tuple(reversed(codes[:index + 1]))] += 1
+                self.lines[codes[0], line] += 1
+                self.samples += 1
+                return
+
+    def snapshot(self, final: bool) -> dict:
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for code in set(stack):
+                total[code] += count
+        functions = sorted(total, key=lambda code: (own[code], total[code]), reverse=True)[:MAX_FUNCTIONS]
+        stacks = self.stacks.most_common(MAX_STACKS)
+        rest = self.samples - sum(count for _, count in stacks)
+        collapsed = [[';'.join(_label(code) for code in stack), count] for stack, count in stacks]
+        if rest:
+            collapsed.append([OTHER, rest])
+        return {
+            'mode': SAMPLING,
+            'final': final,
+            'elapsed': round(time.perf_counter() - self.started, 3),
+            'samples': self.samples,
+            'interval': self.interval,
+            'functions': [_function(code, self=own[code], total=total[code], calls=None) for code in functions],
+            'lines': [dict(_function(code, self=count), line=line)
+                      for (code, line), count in self.lines.most_common(MAX_LINES)],
+            'stacks': collapsed,
+        }
+
+
+class CProfileProfiler:
+    """cProfile - 함수별 호출 수 / 자체 시간 / 누적 시간 (끝날 때 한 번 보고)"""
+
+    def __init__(self, report: Callable[[dict], None], **_):
+        import cProfile
+
+        self.report = report
+        self.profile = cProfile.Profile()
+        self.started = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self.profile.enable()
+
+    def stop(self) -> None:
+        import pstats
+
+        self.profile.disable()
+        elapsed = time.perf_counter() - self.started
+        stats = pstats.Stats(self.profile).stats  # (파일, 줄, 함수) → (기본 호출 수, 호출 수, 자체 시간, 누적 시간, 호출자)
+        entries = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+        functions = []
+        for (filename, line, name), (_, calls, own, cumulative, _) in entries:
+            if os.path.basename(filename) in RUNNER_FILES or '_lsprof.Profiler' in name:
+                continue  # 실행 준비 코드와 이 stop()의 disable 호출
+            functions.append({'name': name, 'file': os.path.basename(filename), 'line': line,
+                              'self': round(own, 6), 'total': round(cumulative, 6), 'calls': calls})
+            if len(functions) == MAX_FUNCTIONS:
+                break
+        self.report({'mode': CPROFILE, 'final': True, 'elapsed': round(elapsed, 3), 'samples': None,
+                     'interval': None, 'functions': functions, 'lines': [], 'stacks': []})
+
+
+class _Reporter:
+    """보고를 파일 디스크립터에 JSON 줄로 씀 - 서버가 먼저 닫으면(실행 중지 등) 이후 보고는 버림"""
+
+    def __init__(self, fd: int):
+        self.file = open(fd, 'w', encoding='utf-8')
+        self.lock = threading.Lock()
+
+    def __call__(self, report: dict) -> None:
+        with self.lock:
+            if self.file is None:
+                return
+            try:
+                self.file.write(json.dumps(report) + '\n')
+                self.file.flush()
+            except (OSError, ValueError):
+                self.close()
+
+    def close(self) -> None:
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+
+class Profiling:
+    """start()가 반환 - stop()은 마지막 결과를 보고하고 보고 파일을 닫음"""
+
+    def __init__(self, profiler, reporter: _Reporter):
+        self.profiler = profiler
+        self.reporter = reporter
+
+    def stop(self) -> None:
+        try:
+            self.profiler.stop()
+        finally:
+            with self.reporter.lock:
+                self.reporter.close()
+
+
+def start(options: dict, fd: int) -> Profiling:
+    """
+    현재 스레드(사용자 코드를 실행할 스레드) 프로파일링 시작
+
+    Args:
+        options: {'mode': 'sampling' | 'cprofile', 'interval': 샘플 간격(초), 'report': 중간 보고 간격(초)}
+        fd: 보고를 쓸 파이프 (stop()에서 닫힘)
+    """
+    reporter = _Reporter(fd)
+    profiler_class = CProfileProfiler if options.get('mode') == CPROFILE else SamplingProfiler
+    profiler = profiler_class(reporter, interval=options.get('interval') or 0.005,
+                              report_interval=options.get('report') or 1.0)
+    profiler.start()
+    return Profiling(profiler, reporter)
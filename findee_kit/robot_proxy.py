@@ -0,0 +1,297 @@
+"""
+Findee 호환 하드웨어 브로커 클라이언트
+
+WebEditor에서 실행되는 사용자 코드가 `Findee()`를 만들면 GPIO / 카메라를 직접 초기화하지 않고
+서버가 가진 Findee 하나를 브로커(findee_kit/broker.py)를 통해 사용한다.
+- 호출 1건 = AF_UNIX 소켓으로 요청 / 응답 메시지 1개씩 (4바이트 길이 + JSON)
+- 카메라 프레임은 피클로 복사해 보내지 않고, 서버가 만든 공유 메모리(memfd)에 쓰면 클라이언트가 읽음
+  (공유 메모리 파일 디스크립터는 처음 한 번 SCM_RIGHTS로 받음)
+
+사용자 코드 실행 프로세스에서 install(path)을 호출하면 `from findee import Findee`가 이 모듈의 Findee를 가리킨다.
+포크 서버 자식에서 findee_kit 패키지 없이 불러오므로(gevent 패치 등이 따라오지 않도록) 표준 라이브러리만 사용한다
+(numpy는 get_frame에서만 import).
+"""
+
+import builtins
+import importlib.abc
+import importlib.util
+import json
+import mmap
+import os
+import socket
+import struct
+import sys
+import threading
+import weakref
+from typing import Any, List, Optional, Tuple
+
+
+BROKER_ENV = 'FINDEE_BROKER'  # 사용자 코드가 띄운 하위 프로세스도 브로커를 찾을 수 있도록
+HEADER = struct.Struct('!I')
+_CLIENTS = weakref.WeakSet()  # stop_motors 대상
+
+
+#-메시지 (서버 / 클라이언트 공용)-#
+def send_message(sock: socket.socket, message: dict, fds: List[int] = ()) -> None:
+    payload = json.dumps(message, default=str).encode('utf-8')  # get_system_info 등의 날짜 / 경로 값
+    if fds:
+        socket.send_fds(sock, [HEADER.pack(len(payload)) + payload], list(fds))
+    else:
+        sock.sendall(HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError('broker connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Tuple[Optional[dict], List[int]]:
+    """메시지 1개와 함께 받은 파일 디스크립터 - 연결이 끊기면 (None, [])"""
+    data, fds, _, _ = socket.recv_fds(sock, 65536, 1)
+    if not data:
+        return None, fds
+    if len(data) < HEADER.size:
+        data += _recv_exact(sock, HEADER.size - len(data))
+    (size,) = HEADER.unpack_from(data)
+    body = data[HEADER.size:]
+    if len(body) < size:
+        body += _recv_exact(sock, size - len(body))
+    return json.loads(body), fds
+
+
+class BrokerError(RuntimeError):
+    """브로커 호출 실패 (서버에서 난 예외 중 내장 예외가 아닌 것)"""
+
+
+#-클라이언트-#
+class BrokerClient:
+    """브로커 연결 1개 - 여러 스레드에서 호출해도 요청 / 응답 순서 유지"""
+
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.environ.get(BROKER_ENV)
+        if not path:
+            raise BrokerError(f"{BROKER_ENV} is not set (not running inside the WebEditor)")
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(path)
+        self._lock = threading.Lock()
+        self._frame_buffer: Optional[mmap.mmap] = None
+        self.moved = False
+        _CLIENTS.add(self)
+
+    def call(self, method: str, *args) -> Any:
+        with self._lock:
+            if method.startswith('motor.'):
+                self.moved = method != 'motor.stop'
+            send_message(self._sock, {'method': method, 'args': args})
+            reply, fds = recv_message(self._sock)
+            if fds:
+                self._attach_frame_buffer(fds[0])
+        if reply is None:
+            raise BrokerError('broker connection closed')
+        if 'error' in reply:
+            error = getattr(builtins, reply['error'], None)
+            if not (isinstance(error, type) and issubclass(error, Exception)):
+                error = BrokerError
+            raise error(reply['message'])
+        return reply.get('result')
+
+    def _attach_frame_buffer(self, fd: int) -> None:
+        # 프레임 크기가 커지면 서버가 새 버퍼를 보냄
+        try:
+            buffer = mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        if self._frame_buffer is not None:
+            self._frame_buffer.close()
+        self._frame_buffer = buffer
+
+    def frame(self, copy: bool = True):
+        """최신 카메라 프레임 (numpy 배열, 카메라가 아직 준비되지 않았으면 None)"""
+        import numpy as np
+
+        with self._lock:
+            send_message(self._sock, {'method': 'camera.get_frame', 'args': []})
+            reply, fds = recv_message(self._sock)
+            if fds:
+                self._attach_frame_buffer(fds[0])
+            if reply is None:
+                raise BrokerError('broker connection closed')
+            if 'error' in reply:
+                raise BrokerError(reply['message'])
+            info = reply.get('result')
+            if info is None:
+                return None
+            view = np.ndarray(tuple(info['shape']), dtype=info['dtype'], buffer=self._frame_buffer)
+            # 다음 get_frame이 같은 버퍼를 덮어쓰므로 기본은 복사본 (실제 Findee처럼 프레임을 보관해도 안전)
+            return view.copy() if copy else view
+
+    def close(self) -> None:
+        with self._lock:
+            self._sock.close()
+            if self._frame_buffer is not None:
+                self._frame_buffer.close()
+                self._frame_buffer = None
+
+
+#-Findee 호환 프록시-#
+class _Proxy:
+    def __init__(self, client: BrokerClient, prefix: str):
+        self._client = client
+        self._prefix = prefix
+
+    def _call(self, name: str, *args):
+        return self._client.call(f'{self._prefix}.{name}', *args)
+
+
+class Motor(_Proxy):
+    def move_forward(self, speed, duration=None):
+        return self._call('move_forward', speed, duration)
+
+    def move_backward(self, speed, duration=None):
+        return self._call('move_backward', speed, duration)
+
+    def turn_left(self, speed, duration=None):
+        return self._call('turn_left', speed, duration)
+
+    def turn_right(self, speed, duration=None):
+        return self._call('turn_right', speed, duration)
+
+    def curve_left(self, speed, angle, duration=None):
+        return self._call('curve_left', speed, angle, duration)
+
+    def curve_right(self, speed, angle, duration=None):
+        return self._call('curve_right', speed, angle, duration)
+
+    def stop(self):
+        return self._call('stop')
+
+
+class Ultrasonic(_Proxy):
+    def get_distance(self) -> float:
+        return self._call('get_distance')
+
+    def start_distance_measurement(self, interval: float = 1.0) -> None:
+        pass  # 서버가 측정 주기를 관리 - get_distance는 항상 최신 값을 돌려줌
+
+    def stop_distance_measurement(self) -> None:
+        pass
+
+
+class Camera(_Proxy):
+    def get_frame(self, copy: bool = True):
+        return self._client.frame(copy)
+
+    def get_fps(self) -> float:
+        return self._call('get_fps')
+
+    def get_current_resolution(self) -> str:
+        return self._call('get_current_resolution')
+
+    def get_available_resolutions(self) -> list:
+        return self._call('get_available_resolutions')
+
+    def start_frame_capture(self) -> None:
+        pass  # 첫 get_frame에서 서버가 캡처 시작, 연결이 끊기면 시청자에서 제외
+
+    def stop_frame_capture(self) -> None:
+        pass
+
+
+class Findee:
+    """
+    서버가 가진 Findee를 쓰는 프록시 - motor / ultrasonic / camera와 상태 조회 메서드 제공
+    safe_mode / camera_resolution 등 생성 인자는 서버 설정을 따르므로 무시
+    """
+
+    def __init__(self, *args, broker: Optional[str] = None, **kwargs):
+        self._client = BrokerClient(broker)
+        self.motor = Motor(self._client, 'motor')
+        self.ultrasonic = Ultrasonic(self._client, 'ultrasonic')
+        self.camera = Camera(self._client, 'camera')
+
+    def get_status(self) -> dict:
+        return self._client.call('robot.get_status')
+
+    def get_system_info(self) -> dict:
+        return self._client.call('robot.get_system_info')
+
+    def get_hostname(self) -> str:
+        return self._client.call('robot.get_hostname')
+
+    def cleanup(self) -> None:
+        """모터 정지 후 연결 종료 (서버의 하드웨어는 정리하지 않음)"""
+        try:
+            self.motor.stop()
+        except (OSError, BrokerError):
+            pass
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
+
+
+def stop_motors() -> None:
+    """이 프로세스에서 모터를 움직인 연결마다 정지 요청 (연결은 유지 - 커널 모드에서 셀 실행이 끝날 때 사용)"""
+    for client in list(_CLIENTS):
+        if client.moved:
+            try:
+                client.call('motor.stop')
+            except (OSError, BrokerError):
+                pass
+
+
+#-findee.Findee 교체-#
+class _PatchingLoader(importlib.abc.Loader):
+    """실제 findee 모듈을 불러온 뒤 Findee만 프록시로 교체"""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        module.Findee = Findee
+
+
+class _ProxyOnlyLoader(importlib.abc.Loader):
+    """findee가 설치되지 않은 PC - Findee만 있는 findee 모듈"""
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        module.Findee = Findee
+
+
+class _FindeeFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name != 'findee':
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec('findee')
+        if spec is None:
+            return importlib.util.spec_from_loader('findee', _ProxyOnlyLoader())
+        spec.loader = _PatchingLoader(spec.loader)
+        return spec
+
+
+def install(path: str) -> None:
+    """이 프로세스에서 `from findee import Findee`가 브로커 프록시를 쓰도록 설정 (사용자 코드 실행 전에 호출)"""
+    os.environ[BROKER_ENV] = path
+    module = sys.modules.get('findee')
+    if module is not None:
+        # 포크 서버가 미리 import한 실제 findee - crop_image 등 다른 함수는 그대로 사용
+        module.Findee = Findee
+    else:
+        sys.meta_path.insert(0, _FindeeFinder())
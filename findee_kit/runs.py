@@ -0,0 +1,374 @@
+"""
+WebEditor 코드 실행 스케줄러
+
+학생 코드 하나가 로봇의 제어 서버를 굶기지 않도록 실행을 줄 세우고 자원을 제한한다.
+- 세션별 대기열: 세션마다 한 번에 하나만 실행, 나머지는 순서대로 대기 (max_session_queue까지)
+- 전체 제한: 동시 실행 max_concurrent개('subprocess' 풀), 시작을 기다리는 실행 max_queued개
+- 중지: 프로세스 그룹 전체에 SIGINT(KeyboardInterrupt로 모터 정지 등 정리 기회) → stop_grace초 뒤 SIGKILL
+- 제한: CPU 시간 / 주소 공간 / 파일 크기 rlimit, nice, 출력 크기, 실행 시간 (RunLimits)
+- 실행이 끝나면 프로세스 그룹에 남은 프로세스(백그라운드 자식)도 종료
+- 커널 모드 실행은 세션 커널(findee_kit.kernels)에서 실행 - 중지는 같은 방식, 끝나도 커널은 유지
+- 프로파일러로 실행하면 프로파일 보고 파이프(process.profile)가 함께 연결됨 (findee_kit.profiler)
+- 대기 시간 / 실행 시간 / 결과별 실행 수를 메트릭으로 기록
+"""
+
+import signal
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, Optional
+
+from .interpreters import InterpreterPool, signal_group
+from .latency import RollingHistogram
+from .metrics import REGISTRY
+from .pools import REJECT, PoolRejected, WorkerPool
+from .profiler import MODES as PROFILE_MODES
+
+
+#-실행 결과 (finished 이벤트의 reason)-#
+OK = 'ok'                      # 종료 코드 0
+ERROR = 'error'                # 예외 / 0이 아닌 종료 코드
+STOPPED = 'stopped'            # 사용자가 중지
+CANCELLED = 'cancelled'        # 시작 전에 취소
+DISCONNECTED = 'disconnected'  # 세션 연결 끊김
+TIMEOUT = 'timeout'            # wall_seconds 초과
+OUTPUT = 'output'              # output_mb 초과
+CPU = 'cpu'                    # cpu_seconds 초과 (SIGXCPU)
+KILLED = 'killed'              # 중지 요청 없이 SIGKILL (메모리 부족 등)
+
+RUN_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    'findee_run_queue_wait_seconds', '실행 요청부터 프로세스 시작까지의 대기 시간',
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300))
+RUN_SECONDS = REGISTRY.histogram(
+    'findee_run_duration_seconds', '사용자 코드 실행 시간', ('reason',),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900))
+RUNS = REGISTRY.counter('findee_runs', '끝난 실행 수 (reason: ok / error / stopped / timeout / cpu / ...)', ('reason',))
+RUNS_REJECTED = REGISTRY.counter('findee_runs_rejected', '대기열이 가득 차 거부된 실행 요청 수', ('scope',))
+RUNS_RUNNING = REGISTRY.gauge('findee_runs_running', '실행 중인 사용자 코드 수')
+RUNS_WAITING = REGISTRY.gauge('findee_runs_waiting', '시작을 기다리는 실행 수')
+
+
+@dataclass(frozen=True)
+class RunLimits:
+    """실행 1건의 자원 제한 (None / 0이면 제한 없음)"""
+    cpu_seconds: Optional[int] = 300  # CPU 시간 (sleep으로 기다리는 시간은 포함되지 않음)
+    memory_mb: Optional[int] = 1024  # 주소 공간 (미리 import한 numpy / cv2 포함)
+    file_mb: Optional[int] = 64  # 사용자 코드가 쓰는 파일 하나의 최대 크기
+    output_mb: Optional[float] = 10  # stdout + stderr 총량 (넘으면 중지)
+    wall_seconds: Optional[float] = None  # 실행 시간 (로봇 제어 루프는 오래 돌 수 있어 기본 제한 없음)
+    nice: int = 10  # 제어 서버보다 낮은 CPU 우선순위
+
+    def rlimits(self) -> dict:
+        """프로세스에 적용할 제한 (forkserver.apply_limits 형식)"""
+        mb = 1024 * 1024
+        return {
+            'cpu_seconds': self.cpu_seconds,
+            'memory_bytes': self.memory_mb * mb if self.memory_mb else None,
+            'file_bytes': self.file_mb * mb if self.file_mb else None,
+            'nice': self.nice,
+        }
+
+
+class RunRejected(PoolRejected):
+    """세션 / 전체 대기열이 가득 차 실행 요청이 거부됨"""
+
+
+class Run:
+    """실행 1건"""
+
+    def __init__(self, run_id: int, sid: str, code: str, kernel: bool = False, profile: Optional[dict] = None):
+        self.id = run_id
+        self.sid = sid
+        self.code = code
+        self.kernel = kernel  # 세션 커널에서 실행 (네임스페이스 유지)
+        self.profile = profile  # 프로파일러 설정 (findee_kit.profiler.start 참고)
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.process = None
+        self.returncode: Optional[int] = None
+        self.reason: Optional[str] = None  # 중지 이유 (실행 중 설정) → 끝나면 결과
+        self.error: Optional[str] = None  # 프로세스를 시작하지 못한 경우
+        self.output_bytes = 0
+
+    @property
+    def seconds(self) -> Optional[float]:
+        if self.started is None:
+            return None
+        return (self.finished or time.monotonic()) - self.started
+
+    def info(self) -> dict:
+        return {
+            'run': self.id,
+            'kernel': self.kernel,
+            'profile': self.profile['mode'] if self.profile else None,
+            'returncode': self.returncode,
+            'reason': self.reason,
+            'seconds': round(self.seconds, 3) if self.seconds is not None else None,
+            'error': self.error,
+        }
+
+
+class RunScheduler:
+    """세션별 대기열 + 전체 동시 실행 제한 + 중지 + 자원 제한"""
+
+    def __init__(self, interpreters: InterpreterPool, execute: Callable[[Run], None],
+                 notify: Callable[[str, Run], None], limits: RunLimits = RunLimits(),
+                 max_concurrent: int = 4, max_queued: int = 4, max_session_queue: int = 2,
+                 stop_grace: float = 2.0, broker=None, kernels=None):
+        """
+        Args:
+            interpreters: 실행 프로세스를 만드는 InterpreterPool
+            execute: 프로세스 시작 후 호출 (출력 스트리밍, 출력이 끝날 때까지 반환하지 않음)
+            notify: (이벤트, 실행) → 'queued' / 'started' / 'finished' 알림
+            limits: 실행마다 적용할 자원 제한
+            max_concurrent: 동시에 실행되는 프로세스 수
+            max_queued: 시작을 기다릴 수 있는 전체 실행 수 (넘으면 RunRejected)
+            max_session_queue: 세션별로 실행 중인 것 외에 기다릴 수 있는 실행 수
+            stop_grace: 중지 시 SIGINT 후 SIGKILL까지 기다리는 시간 (초)
+            broker: 사용자 코드에 서버의 Findee를 제공하는 HardwareBroker (None이면 코드가 Findee를 직접 생성)
+            kernels: 커널 모드 실행에 쓰는 KernelManager (None이면 커널 모드 요청은 ValueError)
+        """
+        self.interpreters = interpreters
+        self.execute = execute
+        self.notify = notify
+        self.limits = limits
+        self.max_queued = max_queued
+        self.max_session_queue = max_session_queue
+        self.stop_grace = stop_grace
+        self.broker = broker
+        self.kernels = kernels
+
+        # 세션마다 풀에 들어가는 실행은 최대 1개 - 풀 대기열은 전체 대기 수(max_queued)로 제한됨
+        self.pool = WorkerPool('subprocess', max_concurrent, max_queue=max_queued, policy=REJECT)
+        self.queue_wait = RollingHistogram(200)
+        self._ids = 0
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[Run]] = {}  # 세션 → 앞 실행이 끝나기를 기다리는 실행
+        self._active: Dict[str, Run] = {}  # 세션 → 풀에 제출된 실행 (대기 중 또는 실행 중)
+        self._waiting = 0  # 시작 전인 실행 수 (세션 대기열 + 풀 대기열)
+
+    #-요청-#
+    def submit(self, sid: str, code: str, kernel: bool = False, profile: Optional[dict] = None) -> Run:
+        """
+        실행 요청 - 세션이 비어 있으면 바로 풀에 제출, 아니면 세션 대기열에 추가
+        kernel이면 세션 커널에서 실행, profile({'mode', 'interval', 'report'})이 있으면 프로파일러로 실행
+        """
+        if kernel and self.kernels is None:
+            raise ValueError('kernel mode is not enabled')
+        if profile and profile.get('mode') not in PROFILE_MODES:
+            raise ValueError(f"unknown profiler {profile.get('mode')!r}")
+        with self._lock:
+            queue = self._queues.setdefault(sid, deque())
+            if len(queue) >= self.max_session_queue:
+                RUNS_REJECTED.labels('session').inc()
+                raise RunRejected('이 세션에서 이미 실행을 기다리는 코드가 있습니다. 이전 실행을 중지하거나 끝날 때까지 기다려주세요.')
+            if self._waiting >= self.max_queued:
+                RUNS_REJECTED.labels('global').inc()
+                raise RunRejected('동시에 실행 중인 코드가 너무 많습니다. 잠시 후 다시 시도해주세요.')
+
+            self._ids += 1
+            run = Run(self._ids, sid, code, kernel, profile)
+            self._waiting += 1
+            RUNS_WAITING.set(self._waiting)
+            if sid in self._active:
+                queue.append(run)
+                queued = True
+            else:
+                self._active[sid] = run
+                try:
+                    self.pool.submit(self._execute, run)
+                except Exception:
+                    # 종료된 풀 등 - 세션이 없는 실행에 막히지 않도록 되돌림
+                    del self._active[sid]
+                    self._waiting -= 1
+                    RUNS_WAITING.set(self._waiting)
+                    raise
+                queued = self.pool.queued > 0  # 다른 세션의 실행으로 풀이 가득 참
+
+        if queued:
+            self.notify('queued', run)
+        return run
+
+    def stop(self, sid: str, run_id: Optional[int] = None, reason: str = STOPPED) -> bool:
+        """
+        세션의 실행 중지 - run_id가 없으면 실행 중인 것과 대기 중인 것 모두
+        대기 중인 실행은 바로 취소, 실행 중인 실행은 프로세스 그룹에 SIGINT → stop_grace초 뒤 SIGKILL
+        이미 중지 중인 실행을 다시 중지하면 유예 없이 바로 SIGKILL
+        """
+        with self._lock:
+            queue = self._queues.get(sid, ())
+            cancelled = [run for run in queue if run_id is None or run.id == run_id]
+            for run in cancelled:
+                queue.remove(run)
+                self._waiting -= 1
+            RUNS_WAITING.set(self._waiting)
+            active = self._active.get(sid)
+            if active is not None and (run_id is not None and active.id != run_id or active.finished is not None):
+                active = None
+            process = pending = None
+            escalate = False
+            if active is not None and active.reason is not None:
+                # 이미 중지 중 (SIGINT 유예, 시간 / 출력 제한) - 시작 전에 취소된 실행은 이미 알림을 보냄
+                if active.started is None:
+                    active = None
+                else:
+                    escalate = True
+                    process = active.process
+            elif active is not None:
+                active.reason = reason
+                process = active.process
+                # 아직 풀에서 기다리는 중 - 바로 취소 알림, 풀 워커는 꺼낸 뒤 건너뜀
+                pending = active if active.started is None else None
+
+        for run in cancelled + ([pending] if pending is not None else []):
+            self._finish(run, CANCELLED if reason == STOPPED else reason)
+        if active is None:
+            return bool(cancelled)
+        if escalate:
+            # 프로세스를 받기 전이면 _execute가 받은 직후 SIGINT (유예 후 SIGKILL)
+            if process is not None:
+                signal_group(process, signal.SIGKILL)
+            return True
+        if process is not None:
+            self._interrupt(active, process)
+        # 시작 중이라 process가 아직 없으면 _execute가 프로세스를 받은 직후 중지
+        return True
+
+    def discard(self, sid: str) -> None:
+        """연결이 끊긴 세션의 실행 모두 중지"""
+        self.stop(sid, reason=DISCONNECTED)
+        with self._lock:
+            if not self._queues.get(sid) and sid not in self._active:
+                self._queues.pop(sid, None)
+
+    def add_output(self, run: Run, size: int) -> None:
+        """출력 바이트 수 기록 - output_mb를 넘으면 중지"""
+        run.output_bytes += size
+        limit = self.limits.output_mb
+        if limit and run.output_bytes > limit * 1024 * 1024 and run.reason is None:
+            self.stop(run.sid, run.id, OUTPUT)
+
+    def stats(self) -> dict:
+        with self._lock:
+            running = [run.info() for run in self._active.values() if run.started is not None]
+            waiting = self._waiting
+        return {
+            'running': running,
+            'waiting': waiting,
+            'limits': asdict(self.limits),
+            'queue_wait_ms': self.queue_wait.percentiles(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            sids = list(self._active) + list(self._queues)
+        for sid in set(sids):
+            self.stop(sid, reason=CANCELLED)
+        self.pool.shutdown()
+
+    #-실행 (풀 워커)-#
+    def _execute(self, run: Run) -> None:
+        with self._lock:
+            self._waiting -= 1
+            RUNS_WAITING.set(self._waiting)
+            skipped = run.reason is not None  # 풀에서 기다리는 동안 중지됨
+            if not skipped:
+                run.started = time.monotonic()
+
+        if skipped:
+            self._next(run.sid)  # 취소 알림은 stop()에서 보냄
+            return
+
+        wait = run.started - run.submitted
+        RUN_QUEUE_WAIT_SECONDS.observe(wait)
+        self.queue_wait.observe(wait * 1000)
+        RUNS_RUNNING.inc()
+        self.notify('started', run)
+
+        timer = None
+        try:
+            if run.kernel:
+                process = self.kernels.execute(run.sid, run.code, run.profile)
+            else:
+                broker = self.broker.start() if self.broker is not None else None
+                process = self.interpreters.spawn(run.code, self.limits.rlimits(), broker, run.profile)
+            with self._lock:
+                run.process = process
+                stopping = run.reason is not None
+            if stopping:
+                self._interrupt(run, process)
+            if self.limits.wall_seconds:
+                timer = threading.Timer(self.limits.wall_seconds, self.stop, (run.sid, run.id, TIMEOUT))
+                timer.daemon = True
+                timer.start()
+
+            self.execute(run)
+            run.returncode = process.wait()
+        except Exception as e:
+            run.reason = run.reason or ERROR
+            run.error = str(e)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if run.process is not None and not run.kernel:
+                # 출력 파이프를 닫고 남아 있는 백그라운드 자식까지 종료 (커널은 다음 실행을 위해 유지)
+                signal_group(run.process, signal.SIGKILL)
+            RUNS_RUNNING.dec()
+
+        self._finish(run, run.reason or self._classify(run.returncode))
+        self._next(run.sid)
+
+    def _classify(self, returncode: Optional[int]) -> str:
+        if returncode == 0:
+            return OK
+        if returncode == -signal.SIGXCPU:
+            return CPU
+        if returncode == -signal.SIGKILL:
+            return KILLED
+        return ERROR
+
+    def _interrupt(self, run: Run, process) -> None:
+        """SIGINT로 KeyboardInterrupt를 일으켜 정리 기회를 주고, stop_grace초 안에 끝나지 않으면 SIGKILL"""
+        signal_group(process, signal.SIGINT)
+
+        def kill():
+            if run.finished is None:
+                signal_group(process, signal.SIGKILL)
+
+        timer = threading.Timer(self.stop_grace, kill)
+        timer.daemon = True
+        timer.start()
+
+    def _finish(self, run: Run, reason: str) -> None:
+        run.reason = reason
+        run.finished = time.monotonic()
+        RUNS.labels(reason).inc()
+        if run.started is not None:
+            RUN_SECONDS.labels(reason).observe(run.finished - run.started)
+        self.notify('finished', run)
+
+    def _next(self, sid: str) -> None:
+        """세션의 다음 실행 제출 (풀이 종료되어 제출할 수 없으면 남은 실행은 취소)"""
+        cancelled = []
+        with self._lock:
+            queue = self._queues.get(sid)
+            while queue:
+                run = queue.popleft()
+                try:
+                    self.pool.submit(self._execute, run)
+                except RuntimeError:
+                    self._waiting -= 1
+                    cancelled.append(run)
+                    continue
+                self._active[sid] = run
+                break
+            else:
+                self._active.pop(sid, None)
+                if queue is not None:
+                    self._queues.pop(sid, None)
+            RUNS_WAITING.set(self._waiting)
+
+        for run in cancelled:
+            self._finish(run, CANCELLED)
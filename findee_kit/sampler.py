@@ -0,0 +1,121 @@
+"""
+공유 시스템 정보 샘플러
+
+robot.get_system_info()(CPU, 코어별 사용률, 온도, 메모리)를 하나의 백그라운드
+스레드에서 주기적으로 수집하고 마지막 샘플을 TTL 캐시로 제공한다.
+- 구독자가 있을 때만 샘플링 스레드가 동작
+- HTTP / Socket.IO 소비자는 캐시된 스냅샷을 읽음
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Hashable, List, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+class SystemInfoSampler:
+    """구독자 수에 따라 시작/중지되는 시스템 정보 샘플러"""
+
+    def __init__(self, collect: Callable[[], dict], period: float = 1.0,
+                 ttl: Optional[float] = None):
+        self._collect = collect
+        self.period = period
+        self.ttl = period if ttl is None else ttl
+
+        self._lock = threading.Lock()         # 구독자/스레드 상태 보호
+        self._sample_lock = threading.Lock()  # 동시 psutil 측정 방지
+        self._snapshot: Optional[dict] = None
+        self._sampled_at = 0.0
+        self.version = 0  # 새 샘플마다 증가 (스냅샷 캐시 키로 사용)
+
+        self._subscribers: Set[Hashable] = set()
+        self._listeners: List[Callable[[dict], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[threading.Event] = None
+
+    #-구독 관리-#
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, key: Hashable) -> None:
+        """구독자 추가 - 첫 구독자일 때 샘플링 시작"""
+        with self._lock:
+            self._subscribers.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._stop_event,), daemon=True
+                )
+                self._thread.start()
+                logger.info("📡 시스템 정보 샘플링 시작")
+
+    def unsubscribe(self, key: Hashable) -> None:
+        """구독자 제거 - 마지막 구독자일 때 샘플링 중지"""
+        with self._lock:
+            self._subscribers.discard(key)
+            if not self._subscribers:
+                self._stop_locked()
+
+    def add_listener(self, callback: Callable[[dict], None]) -> None:
+        """샘플링 스레드가 새 샘플을 수집할 때마다 호출될 콜백 등록"""
+        self._listeners.append(callback)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._subscribers.clear()
+            self._stop_locked()
+
+    def _stop_locked(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
+            logger.info("📡 시스템 정보 샘플링 중지")
+        self._stop_event = None
+        self._thread = None
+
+    #-스냅샷 조회-#
+    def get(self) -> dict:
+        """캐시된 스냅샷 반환 - TTL이 지난 경우에만 새로 측정"""
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - self._sampled_at > self.ttl:
+            snapshot = self._sample()
+        return dict(snapshot)
+
+    def refresh(self) -> int:
+        """TTL이 지났으면 새로 측정하고 현재 샘플 버전 반환"""
+        if self._snapshot is None or time.monotonic() - self._sampled_at > self.ttl:
+            self._sample()
+        return self.version
+
+    def _sample(self, force: bool = False) -> dict:
+        with self._sample_lock:
+            # 대기하는 동안 다른 스레드가 측정을 마쳤으면 그 결과를 재사용
+            if not force and self._snapshot is not None \
+                    and time.monotonic() - self._sampled_at <= self.ttl:
+                return self._snapshot
+            try:
+                snapshot = self._collect()
+            except Exception as e:
+                logger.error(f"❌ 시스템 정보 수집 오류: {e}")
+                snapshot = {'error': str(e)}
+            self._snapshot = snapshot
+            self._sampled_at = time.monotonic()
+            self.version += 1
+            return snapshot
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            snapshot = self._sample(force=True)
+            for callback in self._listeners:
+                try:
+                    callback(dict(snapshot))
+                except Exception as e:
+                    logger.error(f"❌ 시스템 정보 리스너 오류: {e}")
+            stop_event.wait(self.period)
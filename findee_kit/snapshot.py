@@ -0,0 +1,78 @@
+"""
+사전 직렬화된 상태 스냅샷과 ETag / 304 응답
+
+폴링되는 상태 API가 매 요청마다 모델 생성과 직렬화를 반복하지 않도록
+- 입력 키(하위 상태)가 바뀔 때만 다시 빌드하고
+- JSON 본문과 ETag를 미리 만들어 두며
+- If-None-Match가 일치하면 304로 응답한다.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """직렬화가 끝난 상태 스냅샷"""
+    version: int
+    etag: str
+    body: bytes
+
+
+class SnapshotCache:
+    """key_func 결과가 바뀔 때만 build_func를 다시 호출하는 스냅샷 캐시"""
+
+    def __init__(self, key_func: Callable[[], Any], build_func: Callable[[], Any]):
+        self._key_func = key_func
+        self._build_func = build_func
+        self._lock = threading.Lock()
+        self._key: Any = _MISSING
+        self._snapshot: Optional[Snapshot] = None
+        self.version = 0
+
+    def get(self) -> Snapshot:
+        key = self._key_func()
+        with self._lock:
+            if self._snapshot is not None and key == self._key:
+                return self._snapshot
+
+            payload = self._build_func()
+            body = json.dumps(payload, ensure_ascii=False, sort_keys=True,
+                              separators=(',', ':')).encode('utf-8')
+            etag = hashlib.sha1(body).hexdigest()[:20]
+            self._key = key
+
+            # 입력은 바뀌었지만 결과가 같으면 버전 유지
+            if self._snapshot is not None and etag == self._snapshot.etag:
+                return self._snapshot
+
+            self.version += 1
+            self._snapshot = Snapshot(version=self.version, etag=etag, body=body)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """다음 요청에서 강제로 다시 빌드"""
+        with self._lock:
+            self._key = _MISSING
+
+
+def snapshot_response(cache: SnapshotCache):
+    """스냅샷을 Flask 응답으로 변환 - If-None-Match 일치 시 304"""
+    from flask import Response, request
+
+    snapshot = cache.get()
+    if request.if_none_match.contains(snapshot.etag):
+        response = Response(status=304)
+    else:
+        response = Response(snapshot.body, mimetype='application/json')
+
+    response.set_etag(snapshot.etag)
+    response.headers['X-Snapshot-Version'] = str(snapshot.version)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
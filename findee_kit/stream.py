@@ -0,0 +1,127 @@
+"""
+MJPEG 스트리밍
+
+robot.camera.generate_frames() 대신 프레임 획득과 JPEG 인코딩을 직접 수행해
+단계별 시간과 클라이언트별 전송 fps를 메트릭으로 기록한다.
+클라이언트는 fps / 품질 / 폭 상한을 따로 요청할 수 있다 (예: 플릿 게이트웨이 썸네일).
+"""
+
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+from .metrics import FRAME_CAPTURE_SECONDS, FRAME_ENCODE_SECONDS, STREAM_CLIENTS, STREAM_FPS
+
+
+MJPEG_MIMETYPE = 'multipart/x-mixed-replace; boundary=frame'
+
+_client_ids = itertools.count(1)
+
+
+@dataclass
+class StreamSettings:
+    """스트림 품질 설정 - 스트리밍 중에도 매 프레임마다 다시 읽음"""
+    base_quality: int = 80
+    base_fps: float = 30.0
+    quality: int = field(init=False)
+    fps: float = field(init=False)
+
+    def __post_init__(self):
+        self.quality = self.base_quality
+        self.fps = self.base_fps
+
+    def limit(self, quality: Optional[int] = None, fps: Optional[float] = None) -> None:
+        """기본값을 상한으로 품질/fps 제한 (None이면 기본값으로 복원)"""
+        self.quality = self.base_quality if quality is None else min(self.base_quality, quality)
+        self.fps = self.base_fps if fps is None else min(self.base_fps, fps)
+
+
+class ClientStreamSettings:
+    """클라이언트별 fps / 품질 상한 - 공유 설정(거버너 단계)보다 높아지지 않음"""
+
+    def __init__(self, shared: StreamSettings, fps: Optional[float] = None, quality: Optional[int] = None):
+        self.shared = shared
+        self.max_fps = fps
+        self.max_quality = quality
+
+    @property
+    def fps(self) -> float:
+        return self.shared.fps if self.max_fps is None else min(self.shared.fps, self.max_fps)
+
+    @property
+    def quality(self) -> int:
+        return self.shared.quality if self.max_quality is None else min(self.shared.quality, self.max_quality)
+
+
+def _call_directly(func, *args):
+    return func(*args)
+
+
+def _resize(frame, width: int):
+    import cv2
+
+    height, frame_width = frame.shape[:2]
+    if frame_width <= width:
+        return frame
+    return cv2.resize(frame, (width, max(1, height * width // frame_width)), interpolation=cv2.INTER_AREA)
+
+
+def mjpeg_frames(camera, settings: StreamSettings, client: Optional[str] = None,
+                 call: Callable = None, width: Optional[int] = None) -> Iterator[bytes]:
+    """
+    카메라 최신 프레임을 JPEG로 인코딩해 multipart 청크로 생성
+
+    Args:
+        settings: StreamSettings 또는 ClientStreamSettings (fps / quality 속성)
+        call: 블로킹 호출(프레임 획득, 인코딩) 실행 함수 - 앱에서는 camera 풀(ctx.encoder.call)
+        width: 지정하면 인코딩 전에 이 폭으로 축소
+    """
+    import cv2
+
+    call = call or _call_directly
+    client = client or f'client-{next(_client_ids)}'
+    fps_gauge = STREAM_FPS.labels(client)
+    STREAM_CLIENTS.inc()
+
+    last_frame = None
+    sent = 0
+    window_start = time.monotonic()
+
+    try:
+        while True:
+            tick = time.monotonic()
+
+            start = time.perf_counter()
+            frame = call(camera.get_frame)
+            FRAME_CAPTURE_SECONDS.observe(time.perf_counter() - start)
+
+            # 아직 프레임이 없거나 이전과 같은 프레임이면 다시 인코딩하지 않음
+            if frame is not None and frame is not last_frame:
+                last_frame = frame
+
+                start = time.perf_counter()
+                if width:
+                    frame = call(_resize, frame, width)
+                ok, jpeg = call(cv2.imencode, '.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), int(settings.quality)])
+                FRAME_ENCODE_SECONDS.observe(time.perf_counter() - start)
+
+                if ok:
+                    data = jpeg.tobytes()
+                    yield (b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % len(data)
+                           + data + b'\r\n')
+                    sent += 1
+
+            now = time.monotonic()
+            if now - window_start >= 1.0:
+                fps_gauge.set(round(sent / (now - window_start), 1))
+                sent = 0
+                window_start = now
+
+            frame_interval = 1.0 / settings.fps if settings.fps else 0.0
+            remaining = frame_interval - (now - tick)
+            time.sleep(remaining if remaining > 0 else 0.001)
+    finally:
+        # 클라이언트 연결 종료 시 (GeneratorExit) 메트릭 정리
+        STREAM_CLIENTS.dec()
+        STREAM_FPS.remove(client)
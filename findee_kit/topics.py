@@ -0,0 +1,110 @@
+"""
+토픽 구독
+
+클라이언트는 관심 있는 토픽(system, ultrasonic, motor, video)만 구독하고, 서버는 토픽별
+구독자 수에 따라 데이터 생산자(센서 루프, 샘플러 등)를 시작 / 중지한다.
+- Socket.IO 클라이언트: 'subscribe' / 'unsubscribe' 이벤트로 topic:<이름> 방에 참여
+- REST 폴링 클라이언트: 요청마다 ttl초짜리 임대(lease) 구독을 갱신
+- 첫 구독자가 생기면 start, 마지막 구독자가 빠지면 stop 콜백 호출
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+TOPIC_SUBSCRIBERS = REGISTRY.gauge('findee_topic_subscribers', '토픽별 구독자 수 (REST 임대 포함)', ('topic',))
+
+
+def topic_room(topic: str) -> str:
+    """토픽 구독자가 참여하는 Socket.IO 방 이름"""
+    return f'topic:{topic}'
+
+
+class TopicRegistry:
+    """토픽별 구독자 관리와 생산자 시작 / 중지"""
+
+    def __init__(self):
+        # start / stop 콜백은 잠금 안에서 호출되므로 순서가 뒤바뀌지 않음 (빨리 반환해야 함)
+        self._lock = threading.RLock()
+        self._subscribers: Dict[str, Dict[str, Optional[float]]] = {}  # 토픽 → {구독자: 임대 만료 시각}
+        self._producers: Dict[str, List[Tuple[Optional[Callable], Optional[Callable]]]] = {}
+
+    def add_topic(self, topic: str, start: Optional[Callable[[], None]] = None,
+                  stop: Optional[Callable[[], None]] = None) -> None:
+        """토픽 등록 - start / stop은 구독자 수가 0 → 1, 1 → 0으로 바뀔 때 호출"""
+        with self._lock:
+            self._subscribers.setdefault(topic, {})
+            self._producers.setdefault(topic, []).append((start, stop))
+        TOPIC_SUBSCRIBERS.labels(topic).set(0)
+
+    @property
+    def topics(self) -> List[str]:
+        return list(self._subscribers)
+
+    def subscribe(self, topic: str, key: str, ttl: Optional[float] = None) -> bool:
+        """구독 추가 / 임대 갱신 (ttl=None이면 unsubscribe 전까지 유지) - 없는 토픽이면 False"""
+        with self._lock:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is None:
+                return False
+            was_idle = not self._prune_locked(topic)
+            subscribers[key] = None if ttl is None else time.monotonic() + ttl
+            if was_idle:
+                self._notify_locked(topic, started=True)
+            TOPIC_SUBSCRIBERS.labels(topic).set(len(subscribers))
+            return True
+
+    def unsubscribe(self, topic: str, key: str) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is None or subscribers.pop(key, False) is False:
+                return
+            if not self._prune_locked(topic):
+                self._notify_locked(topic, started=False)
+            TOPIC_SUBSCRIBERS.labels(topic).set(len(subscribers))
+
+    def unsubscribe_all(self, key: str) -> None:
+        """연결이 끊긴 클라이언트의 모든 구독 해제"""
+        with self._lock:
+            for topic in self.topics:
+                self.unsubscribe(topic, key)
+
+    def count(self, topic: str, leases: bool = True) -> int:
+        """구독자 수 (만료된 임대는 여기서 정리) - leases=False면 Socket.IO 구독자만"""
+        with self._lock:
+            if topic not in self._subscribers:
+                return 0
+            before = len(self._subscribers[topic])
+            count = self._prune_locked(topic)
+            if before and not count:
+                self._notify_locked(topic, started=False)
+            TOPIC_SUBSCRIBERS.labels(topic).set(count)
+            if leases:
+                return count
+            return sum(1 for expires in self._subscribers[topic].values() if expires is None)
+
+    def counts(self) -> Dict[str, int]:
+        return {topic: self.count(topic) for topic in self.topics}
+
+    def _prune_locked(self, topic: str) -> int:
+        subscribers = self._subscribers[topic]
+        now = time.monotonic()
+        for key in [key for key, expires in subscribers.items() if expires is not None and expires <= now]:
+            del subscribers[key]
+        return len(subscribers)
+
+    def _notify_locked(self, topic: str, started: bool) -> None:
+        for start, stop in self._producers[topic]:
+            callback = start if started else stop
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"❌ Topic '{topic}' {'start' if started else 'stop'} error: {e}")